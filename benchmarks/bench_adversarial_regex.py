@@ -0,0 +1,72 @@
+"""
+Kötü niyetli / patolojik girdilerde pattern süresi benchmark'ı
+
+Tüm doküman üzerinde çalışan imza, adres ve kurum ailelerini, geri izlemeli
+re motorunu en çok zorlayan girdilerle çalıştırır ve KB başına süreyi
+raporlar:
+  - noktalama içermeyen uzun küçük harfli metin
+  - art arda büyük harfle başlayan kelimeler
+  - sonek gelmeyen adres göstergesi (yaşıyor, yaşadığım, ...) tekrarları
+
+önce: re.compile, sonra: pattern kaydındaki (bounded_regex) nesneler.
+re motoru karesel büyüdüğü için yalnızca --re-max-kb'ye kadar ölçülür.
+
+çalıştırma:  python -m benchmarks.bench_adversarial_regex [--sizes 2 8 32 128] [--re-max-kb 2]
+"""
+import argparse
+import re
+import time
+from typing import Dict, List
+
+from src.bounded_regex import BoundedPattern
+from src.pattern_registry import get_pattern_registry
+
+ADVERSARIAL_UNITS = {
+    'lowercase_run': "ve bu konuda daha önce de defalarca başvuru yaptık ama sonuç alamadık ",
+    'capitalized_words': "Ali Veli Ayşe Fatma Mehmet Zeynep Hasan Elif ",
+    'indicator_flood': "yaşıyor yaşadığım,oturduğum,evim ikamet ",
+}
+
+
+def adversarial_text(kind: str, size_kb: int) -> str:
+    """verilen türde yaklaşık size_kb kilobaytlık tek parça metin (nokta / satır sonu yok)"""
+    unit = ADVERSARIAL_UNITS[kind]
+    return (unit * (size_kb * 1024 // len(unit) + 1))[:size_kb * 1024]
+
+
+def bounded_patterns() -> List[BoundedPattern]:
+    return [pattern for _, pattern in get_pattern_registry().iter_patterns() if isinstance(pattern, BoundedPattern)]
+
+
+def time_findall(patterns, text: str) -> float:
+    start = time.perf_counter()
+    for pattern in patterns:
+        pattern.findall(text)
+    return time.perf_counter() - start
+
+
+def ms_per_kb(patterns, kind: str, size_kb: int) -> float:
+    return time_findall(patterns, adversarial_text(kind, size_kb)) * 1000 / size_kb
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Patolojik girdilerde pattern süresi")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2, 8, 32, 128])
+    parser.add_argument('--re-max-kb', type=int, default=2)
+    args = parser.parse_args()
+
+    bounded = bounded_patterns()
+    original = [re.compile(pattern.pattern, pattern.flags) for pattern in bounded]
+    print(f"{len(bounded)} pattern (imza / adres / kurum aileleri)")
+
+    for kind in ADVERSARIAL_UNITS:
+        print(f"\n{kind}")
+        for size_kb in args.sizes:
+            row: Dict[str, str] = {'sonra': f"{ms_per_kb(bounded, kind, size_kb):9.3f}"}
+            row['önce'] = (f"{ms_per_kb(original, kind, size_kb):9.3f}"
+                           if size_kb <= args.re_max_kb else "   atlandı")
+            print(f"  {size_kb:>5} KB   önce (re) {row['önce']} ms/KB   sonra (bounded) {row['sonra']} ms/KB")
+
+
+if __name__ == "__main__":
+    main()
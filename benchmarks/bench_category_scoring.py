@@ -0,0 +1,54 @@
+"""
+Toplu konu sınıflandırması benchmark'ı: kategori döngüsü vs seyrek matris
+
+Aynı sentetik korpus için dokümanlar bir kez taranır (DocumentContext), sonra
+puanlama iki yolla yapılır:
+  - döngü  : _ultra_comprehensive_category_classification(details=False)
+  - matris : CategoryMatrix.classify_hits (terim sayısı × ağırlık matrisi)
+Tarama süresi ayrıca raporlanır; uçtan uca süre tarama + puanlamadır.
+Sonuçların birebir aynı olduğu da kontrol edilir.
+
+çalıştırma:  python -m benchmarks.bench_category_scoring [--docs 2000] [--seed 42]
+"""
+import argparse
+import time
+
+from benchmarks.corpus import generate_corpus
+
+
+def main():
+    from src.document_context import DocumentContext
+    from src.petition_analyzer import PetitionAnalyzer
+
+    parser = argparse.ArgumentParser(description="Toplu konu sınıflandırması")
+    parser.add_argument('--docs', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    analyzer = PetitionAnalyzer().warm_up()
+    texts = [petition.text for petition in generate_corpus(args.docs, seed=args.seed)]
+    analyzer.category_matrix
+
+    start = time.perf_counter()
+    contexts = [DocumentContext(text, analyzer.keyword_index).prepare() for text in texts]
+    scan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loop = [analyzer._ultra_comprehensive_category_classification(context.hits, context.sentence_keywords, False)
+            for context in contexts]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matrix = analyzer.category_matrix.classify_hits([context.hits for context in contexts],
+                                                    [context.sentence_keywords for context in contexts])
+    matrix_seconds = time.perf_counter() - start
+
+    print(f"{args.docs} doküman, sonuçlar aynı: {loop == matrix}")
+    print(f"{'yol':<8} {'puanlama s':>11} {'doküman/sn':>11} {'uçtan uca s':>12}")
+    for name, seconds in (('döngü', loop_seconds), ('matris', matrix_seconds)):
+        print(f"{name:<8} {seconds:>11.3f} {args.docs / seconds:>11.0f} {scan_seconds + seconds:>12.2f}")
+    print(f"tarama (her iki yol için ortak): {scan_seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
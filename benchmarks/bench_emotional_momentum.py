@@ -0,0 +1,52 @@
+"""
+Duygusal momentum benchmark'ı: cümle döngüsü vs NumPy toplu özyineleme
+
+Sentetik korpus bir kez taranır (DocumentContext), sonra momentum üç yolla
+hesaplanır:
+  - döngü         : doküman başına calculate_emotional_flow(include_flow=False)
+  - toplu         : calculate_emotional_flow_batch(include_flow=False) (yalnızca diziler)
+  - toplu+sözlük  : toplu + to_dict(include_flow=False) görünümleri
+Sonuçların birebir aynı olduğu da kontrol edilir.
+
+çalıştırma:  python -m benchmarks.bench_emotional_momentum [--docs 2000] [--seed 42]
+"""
+import argparse
+import time
+
+from benchmarks.corpus import generate_corpus
+
+
+def main():
+    from src.document_context import DocumentContext
+    from src.emotional_momentum_tracker import EmotionalMomentumTracker
+    from src.keyword_index import get_keyword_index
+
+    parser = argparse.ArgumentParser(description="Toplu duygusal momentum")
+    parser.add_argument('--docs', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    tracker = EmotionalMomentumTracker()
+    contexts = [DocumentContext(petition.text, get_keyword_index()).prepare()
+                for petition in generate_corpus(args.docs, seed=args.seed)]
+    sentence_keywords = [context.sentence_keywords for context in contexts]
+
+    start = time.perf_counter()
+    loop = [tracker.calculate_emotional_flow(context.sentences, context, include_flow=False) for context in contexts]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = tracker.calculate_emotional_flow_batch(sentence_keywords, include_flow=False)
+    batch_seconds = time.perf_counter() - start
+    views = [batch.to_dict(index, include_flow=False) for index in range(len(batch))]
+    views_seconds = time.perf_counter() - start
+
+    print(f"{args.docs} doküman, {int(batch.lengths.sum())} cümle (en uzun {int(batch.lengths.max())}), "
+          f"sonuçlar aynı: {loop == views}")
+    print(f"{'yol':<14} {'süre s':>8} {'doküman/sn':>11}")
+    for name, seconds in (('döngü', loop_seconds), ('toplu', batch_seconds), ('toplu+sözlük', views_seconds)):
+        print(f"{name:<14} {seconds:>8.3f} {args.docs / seconds:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
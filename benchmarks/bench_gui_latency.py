@@ -0,0 +1,89 @@
+"""
+GUI olay döngüsü gecikmesi benchmark'ı (ekran gerektirmez)
+
+Tk ana döngüsünü taklit eden bir döngü her 10 ms'de uyanır ve iş
+mesajlarını kuyruktan alır; uyanmadaki gecikme, bir olayın arayüzde
+işlenmesi için beklediği süredir. Büyük bir PDF'in okunması, analizi ve
+kaydı sırasında iki yöntem karşılaştırılır:
+  - thread : eski akış, tamamı ana süreçteki bir iş parçacığında
+  - job    : gui_jobs.AnalysisJob (okuma, analiz ve kayıt ayrı süreçte)
+
+çalıştırma:  python -m benchmarks.bench_gui_latency [--pages 200]
+"""
+import argparse
+import os
+import queue
+import tempfile
+import threading
+import time
+from typing import Callable, Dict
+
+from benchmarks.bench_pdf_extraction import synthetic_pages, write_text_pdf
+from src.stage_metrics import LatencyHistogram
+
+TICK_SECONDS = 0.01
+
+
+def measure_event_latency(start: Callable[[], threading.Thread], messages: queue.Queue) -> Dict:
+    """iş bitene kadar TICK_SECONDS aralıklı döngünün gecikme yüzdelikleri"""
+    histogram = LatencyHistogram()
+    began = time.perf_counter()
+    worker = start()
+    while worker.is_alive():
+        tick = time.perf_counter()
+        time.sleep(TICK_SECONDS)
+        histogram.record((time.perf_counter() - tick - TICK_SECONDS) * 1000)
+        while not messages.empty():
+            messages.get_nowait()
+    return {'seconds': time.perf_counter() - began, **histogram.summary(percentiles=(50, 99))}
+
+
+def main():
+    from src.gui_jobs import AnalysisJob, AnalysisWorker, write_to_sinks
+    from src.petition_analyzer import get_analyzer
+    from src.result_sinks import ResultSinks
+    from src.utils import pdf_to_text
+
+    parser = argparse.ArgumentParser(description="GUI olay döngüsü gecikmesi")
+    parser.add_argument('--pages', type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "buyuk.pdf")
+        write_text_pdf(path, synthetic_pages(args.pages))
+        data_folder = os.path.join(directory, "data")
+        sinks = ResultSinks(data_folder)
+        analyzer = get_analyzer()
+        messages: queue.Queue = queue.Queue()
+
+        def inline_flow():
+            text = pdf_to_text(path)
+            result = analyzer.analyze_petition_creative(text)
+            sinks.write(result, text, "buyuk")
+            messages.put('done')
+
+        def start_thread():
+            thread = threading.Thread(target=inline_flow)
+            thread.start()
+            return thread
+
+        worker = AnalysisWorker()
+        worker.warm_up()
+
+        def persist(result, text, source_name):
+            worker.call(write_to_sinks, data_folder, result, text, source_name)
+
+        def start_job():
+            job = AnalysisJob("buyuk", messages, worker, analyzer, persist, pdf_path=path)
+            job.start()
+            return job
+
+        print(f"{'yöntem':<8} {'süre s':>7} {'p50 ms':>7} {'p99 ms':>7} {'max ms':>7}")
+        for name, start in (('thread', start_thread), ('job', start_job)):
+            row = measure_event_latency(start, messages)
+            print(f"{name:<8} {row['seconds']:>7.2f} {row['p50_ms']:>7.2f} {row['p99_ms']:>7.2f} {row['max_ms']:>7.2f}")
+        worker.terminate()
+
+
+if __name__ == "__main__":
+    main()
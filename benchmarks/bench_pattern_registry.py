@@ -0,0 +1,64 @@
+"""
+Pattern kaydı benchmark'ı
+
+Aynı pattern ailelerini sentetik korpus (benchmarks.corpus) üzerinde iki şekilde çalıştırır:
+  - önce : ham string + re.findall (re modülünün iç önbelleğine güvenerek)
+  - sonra: pattern kaydındaki derlenmiş nesneler
+
+çalıştırma:  python -m benchmarks.bench_pattern_registry [--docs 1000] [--seed 42]
+"""
+import argparse
+import re
+import time
+from typing import List
+
+from benchmarks.corpus import generate_corpus
+from src.pattern_registry import get_pattern_registry
+
+SHORT_MIX = {'paragraph': 0.6, '1_page': 0.4}
+
+
+def run_string_patterns(patterns, corpus: List[str], purge: bool) -> float:
+    start = time.perf_counter()
+    for text in corpus:
+        if purge:
+            re.purge()
+        for pattern in patterns:
+            re.findall(pattern.pattern, text, pattern.flags)
+    return time.perf_counter() - start
+
+
+def run_compiled_patterns(patterns, corpus: List[str]) -> float:
+    start = time.perf_counter()
+    for text in corpus:
+        for pattern in patterns:
+            pattern.findall(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pattern kaydı önce/sonra benchmark'ı")
+    parser.add_argument('--docs', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    registry = get_pattern_registry()
+    patterns = [pattern for _, pattern in registry.iter_patterns()]
+    # derleme maliyeti çağrı başına ödenir: kısa dilekçeler bu farkı en iyi gösterir
+    corpus = [petition.text for petition in generate_corpus(args.docs, seed=args.seed, length_mix=SHORT_MIX)]
+
+    print(f"kural seti: {registry.version} ({len(patterns)} pattern, {len(corpus)} dilekçe)")
+
+    results = {
+        'önce (string, sıcak re önbelleği)': run_string_patterns(patterns, corpus, purge=False),
+        'önce (string, soğuk re önbelleği)': run_string_patterns(patterns, corpus, purge=True),
+        'sonra (derlenmiş kayıt)': run_compiled_patterns(patterns, corpus),
+    }
+
+    for label, elapsed in results.items():
+        per_doc_us = elapsed / len(corpus) * 1e6
+        print(f"  {label:<36} toplam {elapsed:8.3f} sn   dilekçe başına {per_doc_us:9.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
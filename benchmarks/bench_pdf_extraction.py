@@ -0,0 +1,112 @@
+"""
+PDF metin çıkarımı benchmark'ı: eski tek iş parçacıklı döngü ile
+utils.pdf_to_text (akan sayfa okuma, isteğe bağlı süreç havuzu)
+
+Sentetik korpus metinlerinden istenen sayfa sayısında PDF'ler üretir
+(write_text_pdf) ve her boyut için süreyi ve eski çıktıyla aynılığı raporlar.
+
+çalıştırma:  python -m benchmarks.bench_pdf_extraction [--pages 50 200 500] [--workers 4] [--repeat 3]
+"""
+import argparse
+import os
+import tempfile
+import textwrap
+import time
+from typing import List, Sequence
+
+import PyPDF2
+
+from benchmarks.corpus import generate_corpus
+
+# Helvetica (WinAnsi) Türkçe harfleri içermez; benchmark için ASCII'ye indirilir
+_ASCII_FOLD = str.maketrans('çğıöşüÇĞİÖŞÜ', 'cgiosuCGIOSU')
+_LINE_CHARS = 90
+_LINES_PER_PAGE = 48
+
+
+def write_text_pdf(path: str, pages: Sequence[str]):
+    """her metni ayrı bir sayfaya yazan, harici kütüphane gerektirmeyen en küçük PDF"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    page_ids = []
+    for page in pages:
+        lines = textwrap.wrap(page.translate(_ASCII_FOLD), _LINE_CHARS)[:_LINES_PER_PAGE] or ['']
+        body = "BT /F1 10 Tf 14 TL 50 780 Td " + " ".join(
+            "(" + line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') + ") Tj T*"
+            for line in lines
+        ) + " ET"
+        stream = body.encode('latin-1', errors='replace')
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects)))
+        page_ids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % page_id for page_id in page_ids), len(page_ids)
+    )
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    with open(path, 'wb') as f:
+        f.write(bytes(output))
+
+
+def synthetic_pages(count: int, seed: int = 42) -> List[str]:
+    """sayfa başına bir sentetik dilekçe paragrafı"""
+    corpus = generate_corpus(count, seed=seed, length_mix={'1_page': 1.0})
+    return [petition.text for petition in corpus]
+
+
+def legacy_pdf_to_text(path: str) -> str:
+    """eski uygulama: tüm sayfalar tek döngüde, text += ile"""
+    with open(path, 'rb') as f:
+        reader = PyPDF2.PdfReader(f)
+        text = ''
+        for page in reader.pages:
+            extracted = page.extract_text()
+            if extracted:
+                text += extracted
+    return text
+
+
+def _best_of(repeat: int, function, *args, **kwargs):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = function(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+def main():
+    from src.utils import pdf_to_text
+
+    parser = argparse.ArgumentParser(description="PDF metin çıkarımı süreleri")
+    parser.add_argument('--pages', type=int, nargs='+', default=[50, 200, 500])
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'sayfa':>6} {'eski s':>8} {'akan s':>8} {'paralel s':>10} {'ilk 10 sayfa s':>15} {'aynı':>5}")
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.pages:
+            path = os.path.join(directory, f"{count}.pdf")
+            write_text_pdf(path, synthetic_pages(count))
+
+            legacy_time, legacy = _best_of(args.repeat, legacy_pdf_to_text, path)
+            stream_time, streamed = _best_of(args.repeat, pdf_to_text, path)
+            parallel_time, parallel = _best_of(args.repeat, pdf_to_text, path, workers=args.workers)
+            capped_time, _ = _best_of(args.repeat, pdf_to_text, path, max_pages=10)
+            same = legacy == streamed == parallel
+            print(f"{count:>6} {legacy_time:>8.2f} {stream_time:>8.2f} {parallel_time:>10.2f} "
+                  f"{capped_time:>15.3f} {'evet' if same else 'HAYIR':>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Analiz profili (summary / standard / full) süre benchmark'ı
+
+Aynı sentetik korpusu her profil ile analiz eder ve uzunluk sınıfı başına
+ortalama süreyi ve full profile göre hızlanmayı raporlar. Profiller aynı
+analizörü paylaşır; sıra etkisi olmasın diye her doküman tüm profillerle
+art arda ölçülür.
+
+çalıştırma:  python -m benchmarks.bench_profiles [--docs 120] [--seed 42] [--repeat 3]
+"""
+import argparse
+import time
+from collections import defaultdict
+from typing import Dict
+
+from benchmarks.corpus import LENGTH_CLASSES, generate_corpus
+
+PROFILE_NAMES = ('full', 'standard', 'summary')
+
+
+def measure(docs: int, seed: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    """uzunluk sınıfı -> profil -> ortalama ms"""
+    from src.petition_analyzer import PetitionAnalyzer
+
+    analyzer = PetitionAnalyzer().warm_up()
+    totals: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    counts: Dict[str, int] = defaultdict(int)
+
+    for petition in generate_corpus(docs, seed=seed):
+        counts[petition.length_class] += 1
+        for profile in PROFILE_NAMES:
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                analyzer.analyze_petition_creative(petition.text, profile=profile)
+                best = min(best, time.perf_counter() - start)
+            totals[petition.length_class][profile] += best * 1000
+
+    return {
+        length_class: {profile: totals[length_class][profile] / counts[length_class] for profile in PROFILE_NAMES}
+        for length_class in LENGTH_CLASSES if counts[length_class]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analiz profili süreleri")
+    parser.add_argument('--docs', type=int, default=120)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'sınıf':<10} " + " ".join(f"{name + ' ms':>12}" for name in PROFILE_NAMES)
+          + f" {'standard x':>11} {'summary x':>10}")
+    for length_class, row in measure(args.docs, args.seed, args.repeat).items():
+        print(f"{length_class:<10} " + " ".join(f"{row[name]:>12.2f}" for name in PROFILE_NAMES)
+              + f" {row['full'] / row['standard']:>11.2f} {row['full'] / row['summary']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
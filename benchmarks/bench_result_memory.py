@@ -0,0 +1,84 @@
+"""
+Analiz sonucu başına bellek ve pickle boyutu benchmark'ı
+
+Sentetik korpusu analiz eder ve her uzunluk sınıfı için sonuç başına
+ortalama baytı raporlar:
+  - bellek : sonucun tuttuğu tüm nesnelerin sys.getsizeof toplamı (paylaşılan
+             nesneler bir kez sayılır; modül düzeyinde paylaşılan sabit
+             stringler de dahil, mutlak değer değil oran önemlidir)
+  - pickle : süreçler arası aktarımda / önbellekte giden bayt
+
+önce: sözlük ağacı, sonra: result_model.AnalysisResult (paketlenmiş)
+
+çalıştırma:  python -m benchmarks.bench_result_memory [--docs 200] [--seed 42]
+"""
+import argparse
+import pickle
+import sys
+from collections import defaultdict
+from typing import Dict, List
+
+from benchmarks.corpus import LENGTH_CLASSES, generate_corpus
+
+
+def deep_sizeof(obj, seen=None) -> int:
+    """nesne ağacının toplam boyutu (sözlük, liste, demet, küme, __slots__ ve __dict__ gezilir)"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    else:
+        for cls in type(obj).__mro__:
+            for name in getattr(cls, '__slots__', ()):
+                if hasattr(obj, name):
+                    size += deep_sizeof(getattr(obj, name), seen)
+        if hasattr(obj, '__dict__'):
+            size += deep_sizeof(vars(obj), seen)
+    return size
+
+
+def measure(docs: int, seed: int) -> Dict[str, Dict[str, float]]:
+    from src.petition_analyzer import PetitionAnalyzer
+    from src.result_model import AnalysisResult
+
+    analyzer = PetitionAnalyzer().warm_up()
+    samples: Dict[str, List[Dict[str, int]]] = defaultdict(list)
+    for petition in generate_corpus(docs, seed=seed):
+        result = analyzer.analyze_petition_creative(petition.text)
+        packed = AnalysisResult.from_dict(result)
+        samples[petition.length_class].append({
+            'memory_before': deep_sizeof(result),
+            'memory_after': deep_sizeof(packed),
+            'pickle_before': len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)),
+            'pickle_after': len(pickle.dumps(packed, protocol=pickle.HIGHEST_PROTOCOL)),
+        })
+
+    report = {}
+    for length_class in LENGTH_CLASSES:
+        rows = samples.get(length_class)
+        if rows:
+            report[length_class] = {key: sum(row[key] for row in rows) / len(rows) for key in rows[0]}
+            report[length_class]['count'] = len(rows)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sonuç başına bellek / pickle boyutu")
+    parser.add_argument('--docs', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'sınıf':<10} {'adet':>5} {'bellek önce':>12} {'bellek sonra':>13} {'pickle önce':>12} {'pickle sonra':>13}")
+    for length_class, row in measure(args.docs, args.seed).items():
+        print(f"{length_class:<10} {row['count']:>5} {row['memory_before']:>12,.0f} {row['memory_after']:>13,.0f}"
+              f" {row['pickle_before']:>12,.0f} {row['pickle_after']:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Analiz servisi yük testi (yalnızca localhost)
+
+Servisi aynı süreçte ayrı bir iş parçacığında başlatır ve kalıcı bağlantılı
+eşzamanlı istemcilerle /analyze isteği gönderir. Her eşzamanlılık düzeyi
+için saniyedeki başarılı istek, gecikme yüzdelikleri, 429 sayısı ve
+ortalama mikro grup boyutunu raporlar.
+
+çalıştırma:  python -m benchmarks.bench_service_load [--concurrency 1 8 32] [--requests 200]
+                                                     [--workers 2] [--batch-window-ms 5] [--queue-size 64]
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.corpus import generate_corpus
+from src.analysis_service import AnalysisService, BackgroundService
+from src.stage_metrics import LatencyHistogram
+
+
+async def _post(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, path: str,
+                payload: Dict) -> Tuple[int, Dict]:
+    """kalıcı bağlantı üzerinden tek bir POST isteği: (durum, gövde)"""
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+
+    head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+    status = int(head[0].split(' ')[1])
+    length = next(int(line.split(':', 1)[1]) for line in head if line.lower().startswith('content-length:'))
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def _client(port: int, texts: List[str], histogram: LatencyHistogram, counts: Dict[int, int]):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        for text in texts:
+            start = time.perf_counter()
+            status, _ = await _post(reader, writer, '/analyze', {'text': text})
+            counts[status] = counts.get(status, 0) + 1
+            if status == 200:
+                histogram.record((time.perf_counter() - start) * 1000)
+    finally:
+        writer.close()
+
+
+async def run_load(port: int, texts: List[str], concurrency: int) -> Dict:
+    histogram = LatencyHistogram()
+    counts: Dict[int, int] = {}
+    shares = [texts[index::concurrency] for index in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(port, share, histogram, counts) for share in shares if share))
+    elapsed = time.perf_counter() - start
+    return {
+        'ok_per_second': counts.get(200, 0) / elapsed,
+        'rejected': counts.get(429, 0),
+        'other': sum(count for status, count in counts.items() if status not in (200, 429)),
+        **histogram.summary(percentiles=(50, 95, 99)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analiz servisi yük testi")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--max-batch', type=int, default=16)
+    parser.add_argument('--batch-window-ms', type=float, default=5.0)
+    parser.add_argument('--queue-size', type=int, default=64)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    texts = [petition.text for petition in generate_corpus(
+        args.requests, seed=args.seed, length_mix={'paragraph': 0.6, '1_page': 0.4}
+    )]
+    service = AnalysisService(workers=args.workers, max_batch=args.max_batch,
+                              batch_window_ms=args.batch_window_ms, queue_size=args.queue_size)
+
+    print(f"{'eşzamanlı':>9} {'istek/sn':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'429':>5} "
+          f"{'diğer':>6} {'ort. grup':>9}")
+    with BackgroundService(service) as running:
+        for concurrency in args.concurrency:
+            batches_before, petitions_before = running.stats['batches'], running.stats['petitions']
+            row = asyncio.run(run_load(running.port, texts, concurrency))
+            batches = running.stats['batches'] - batches_before
+            average_batch = (running.stats['petitions'] - petitions_before) / batches if batches else 0.0
+            print(f"{concurrency:>9} {row['ok_per_second']:>9.1f} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} "
+                  f"{row['p99_ms']:>8.1f} {row['rejected']:>5} {row['other']:>6} {average_batch:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Analizör başlangıç / kurulum benchmark'ı
+
+Her ölçüm temiz bir alt süreçte yapılır (soğuk başlangıç):
+  - import      : src.petition_analyzer modülünün yüklenmesi
+  - kurulum     : PetitionAnalyzer() / get_analyzer()
+  - ilk istek   : kurulumdan sonraki ilk analiz
+Ayrıca aynı süreç içinde, her gönderim için yeni analizör kurmanın (eski GUI davranışı)
+paylaşılan analizörü yeniden kullanmaya göre maliyeti ölçülür.
+
+çalıştırma:  python -m benchmarks.bench_startup [--runs 5] [--submissions 200]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = ("Sayın Yetkili,\nÇankaya ilçesi Yeni Mahallesi Gül Sokağı üzerinde yaşıyorum. "
+          "Sokağımızdaki çöpler toplanmıyor, koku dayanılmaz halde.\nSaygılarımla\nAyşe Demir")
+
+COLD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from src.petition_analyzer import PetitionAnalyzer, get_analyzer
+imported = time.perf_counter()
+analyzer = {factory}
+constructed = time.perf_counter()
+analyzer.analyze_petition_creative(sys.argv[1])
+first = time.perf_counter()
+print(json.dumps({{'import': imported - start, 'construct': constructed - imported, 'first_request': first - constructed}}))
+"""
+
+FACTORIES = {
+    'PetitionAnalyzer() (tembel bileşenler)': 'PetitionAnalyzer()',
+    'get_analyzer() (ısıtılmış)': 'get_analyzer()',
+}
+
+
+def measure_cold(factory: str, runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', COLD_SCRIPT.format(factory=factory), SAMPLE],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def measure_per_submission(submissions: int) -> dict:
+    """aynı süreçte gönderim başına kurulum: eski davranış vs paylaşılan analizör"""
+    from src.emotional_momentum_tracker import EmotionalMomentumTracker
+    from src.enhanced_skeptical_validator import EnhancedSkepticalValidator
+    from src.petition_analyzer import get_analyzer
+    from src.semantic_signal import SkepticalInferenceEngine
+    from src.social_analyzer import SocialSignalAnalyzer
+    from src.validator import SkepticalValidator
+
+    def eager_construct():
+        # eski kurucu: analizör bileşenleri + motorun kullanılmayan kopyaları
+        return [SkepticalInferenceEngine(), EmotionalMomentumTracker(), SocialSignalAnalyzer(),
+                SkepticalValidator(), EnhancedSkepticalValidator(),
+                EmotionalMomentumTracker(), SocialSignalAnalyzer(), SkepticalValidator()]
+
+    get_analyzer()
+    results = {}
+    for label, construct in (('önce (her gönderimde yeni bileşenler)', eager_construct),
+                             ('sonra (get_analyzer)', get_analyzer)):
+        start = time.perf_counter()
+        for _ in range(submissions):
+            construct()
+        results[label] = (time.perf_counter() - start) / submissions
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analizör başlangıç benchmark'ı")
+    parser.add_argument('--runs', type=int, default=5, help="soğuk başlangıç tekrar sayısı")
+    parser.add_argument('--submissions', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"soğuk başlangıç (medyan, {args.runs} süreç)")
+    for label, factory in FACTORIES.items():
+        timings = measure_cold(factory, args.runs)
+        print(f"  {label:<40} import {timings['import'] * 1e3:7.1f} ms   "
+              f"kurulum {timings['construct'] * 1e3:7.2f} ms   ilk istek {timings['first_request'] * 1e3:7.2f} ms")
+
+    print(f"gönderim başına kurulum ({args.submissions} gönderim)")
+    for label, elapsed in measure_per_submission(args.submissions).items():
+        print(f"  {label:<40} {elapsed * 1e6:10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Tekrarlanabilir sentetik dilekçe korpusu.
+
+Dilekçeler kural setindeki anahtar kelime tablolarından (konu kategorileri,
+aciliyet, duygu, sosyal sinyal, talep türü) üretilir; aynı tohum (seed) her
+zaman aynı korpusu verir. Uzunluk bir paragraftan 50 sayfaya kadar, imza
+biçimi ve konu kategorisi dilekçeden dilekçeye değişir.
+
+kullanım:
+    from benchmarks.corpus import generate_corpus
+    corpus = generate_corpus(500, seed=42)   # [SyntheticPetition, ...]
+"""
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from src.pattern_registry import (
+    CORE_PATTERNS, EMOTIONAL_PATTERNS, REQUEST_TYPE_PATTERNS, SOCIAL_INDICATORS, URGENCY_KEYWORDS
+)
+
+# yaklaşık bir A4 sayfası (karakter)
+PAGE_CHARS = 3000
+
+# uzunluk sınıfı -> sayfa sayısı (paragraf: ~1/6 sayfa)
+LENGTH_CLASSES = {
+    'paragraph': 0.15,
+    '1_page': 1,
+    '5_pages': 5,
+    '20_pages': 20,
+    '50_pages': 50,
+}
+
+# varsayılan karışım: kısa dilekçeler çoğunlukta, uzun olanlar kuyrukta
+DEFAULT_LENGTH_MIX = {
+    'paragraph': 0.45,
+    '1_page': 0.35,
+    '5_pages': 0.14,
+    '20_pages': 0.05,
+    '50_pages': 0.01,
+}
+
+SIGNATURE_STYLES = ('closing_line', 'greeting', 'slash_location', 'tc_number', 'phone', 'unsigned')
+
+FIRST_NAMES = ['Ayşe', 'Mehmet', 'Fatma', 'Ali', 'Zeynep', 'Hasan', 'Elif', 'Mustafa', 'Emine', 'Barış']
+LAST_NAMES = ['Demir', 'Kaya', 'Şen', 'Yılmaz', 'Çelik', 'Öztürk', 'Aydın', 'Arslan', 'Doğan', 'Güneş']
+DISTRICTS = ['Çankaya', 'Bornova', 'Keçiören', 'Kadıköy', 'Nilüfer', 'Selçuklu', 'Karşıyaka', 'Üsküdar']
+NEIGHBORHOODS = ['Yeni', 'Cumhuriyet', 'Atatürk', 'Fatih', 'Gazi', 'Zafer', 'Kazımdirik', 'Gümüşpala']
+STREETS = ['Gül', 'Lale', 'Menekşe', 'Çınar', 'Papatya', 'Ihlamur', 'Akasya', 'Söğüt']
+AUTHORITIES = ['Belediye Başkanlığı', 'Belediyesi', 'Kaymakamlığı', 'Valiliği', 'Müdürlüğü']
+
+SENTENCE_TEMPLATES = [
+    "Mahallemizde uzun süredir {keyword} ile ilgili ciddi bir sorun yaşıyoruz",
+    "Özellikle {context} saatlerinde {keyword} durumu daha da kötüleşiyor",
+    "Defalarca başvurmamıza rağmen {keyword} konusunda herhangi bir adım atılmadı",
+    "Komşularımızla birlikte {keyword} ve {second} sorununun çözülmesini bekliyoruz",
+    "Sokağımızdaki {keyword} yüzünden günlük hayatımız olumsuz etkileniyor",
+    "Bu {problem} durum hem çocuklar hem de yaşlılar için risk oluşturuyor",
+    "Yetkililerin {keyword} konusunu yerinde incelemesini rica ediyoruz",
+]
+
+FILLER_SENTENCES = [
+    "Konuyu daha önce de telefonla ilettik ancak bir geri dönüş alamadık",
+    "Bölgede yaşayan pek çok aile aynı durumdan şikayetçi",
+    "Gerekli görülmesi halinde ek belge ve fotoğraf sunabiliriz",
+    "Daha önceki başvurularımızın numaralarını aşağıda paylaşıyorum",
+    "Sorunun kaynağı hakkında ilgili birimlerin bilgilendirilmesini istiyoruz",
+]
+
+
+@dataclass
+class SyntheticPetition:
+    text: str
+    category: str
+    length_class: str
+    signature_style: str
+    person_name: Optional[str]
+
+
+def _keywords_for(category: str) -> Dict[str, List[str]]:
+    keywords = CORE_PATTERNS['subject_categories'][category]
+    primary = keywords.get('primary_keywords', [])
+    return {
+        'primary': primary,
+        'secondary': keywords.get('secondary_keywords', []) or primary,
+        'context': keywords.get('context_keywords', []) or ['sabah', 'akşam', 'gece'],
+        'problem': keywords.get('problem_keywords', []) or ['ciddi'],
+    }
+
+
+def _flavor_phrases(rng: random.Random) -> List[str]:
+    """duygu, aciliyet, sosyal sinyal ve talep türü tablolarından cümleler"""
+    emotion = rng.choice(list(EMOTIONAL_PATTERNS))
+    urgency = rng.choice(list(URGENCY_KEYWORDS))
+    social_category = rng.choice(list(SOCIAL_INDICATORS))
+    social_keywords = rng.choice(list(SOCIAL_INDICATORS[social_category].values()))
+    request_type = rng.choice(list(REQUEST_TYPE_PATTERNS))
+    return [
+        f"Açıkçası {rng.choice(EMOTIONAL_PATTERNS[emotion])} bir durumdayız",
+        f"Konunun {rng.choice(URGENCY_KEYWORDS[urgency])} ele alınmasını istiyoruz",
+        f"Ben de {rng.choice(social_keywords)} olarak bu durumdan etkileniyorum",
+        f"Bu konuda {rng.choice(REQUEST_TYPE_PATTERNS[request_type]['keywords'])} bekliyorum",
+    ]
+
+
+def _sentence(rng: random.Random, keywords: Dict[str, List[str]]) -> str:
+    template = rng.choice(SENTENCE_TEMPLATES)
+    return template.format(
+        keyword=rng.choice(keywords['primary']),
+        second=rng.choice(keywords['secondary']),
+        context=rng.choice(keywords['context']),
+        problem=rng.choice(keywords['problem']),
+    )
+
+
+def _signature(rng: random.Random, style: str, name: str, district: str) -> Dict[str, str]:
+    """(başlık, kapanış) çifti"""
+    if style == 'greeting':
+        return {'header': f"Sayın {name}\n", 'footer': "Saygılarımla"}
+    if style == 'slash_location':
+        return {'header': "", 'footer': f"Saygılarımla\n{name} / {district}"}
+    if style == 'tc_number':
+        return {'header': "", 'footer': f"Saygılarımla\n{name} TC: {rng.randrange(10 ** 10, 10 ** 11)}"}
+    if style == 'phone':
+        return {'header': "", 'footer': f"Saygılarımla\n{name}\nTel: 0532 {rng.randrange(100, 999)} "
+                                        f"{rng.randrange(10, 99)} {rng.randrange(10, 99)}"}
+    if style == 'unsigned':
+        return {'header': "", 'footer': "Gereğini arz ederim."}
+    return {'header': "", 'footer': f"Saygılarımla\n{name}"}
+
+
+def generate_petition(rng: random.Random, category: str, length_class: str, signature_style: str) -> SyntheticPetition:
+    """tek bir sentetik dilekçe"""
+    keywords = _keywords_for(category)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    district = rng.choice(DISTRICTS)
+    address = (f"{district} ilçesi {rng.choice(NEIGHBORHOODS)} Mahallesi "
+               f"{rng.choice(STREETS)} Sokağı no {rng.randrange(1, 120)}")
+    signature = _signature(rng, signature_style, name, district)
+
+    target_chars = int(LENGTH_CLASSES[length_class] * PAGE_CHARS)
+    opening = (f"{signature['header']}Sayın {district} {rng.choice(AUTHORITIES)},\n\n"
+               f"{address} adresinde yaşıyorum.")
+    paragraphs = []
+    flavors = _flavor_phrases(rng)
+    written = len(opening)
+
+    while written < target_chars or not paragraphs:
+        sentences = [_sentence(rng, keywords) for _ in range(rng.randint(3, 6))]
+        if rng.random() < 0.5:
+            sentences.append(rng.choice(FILLER_SENTENCES))
+        if flavors and rng.random() < 0.6:
+            sentences.insert(rng.randrange(len(sentences) + 1), flavors.pop())
+        paragraph = ". ".join(sentences) + rng.choice([".", ".", "!"])
+        paragraphs.append(paragraph)
+        written += len(paragraph) + 2
+
+    text = f"{opening}\n\n" + "\n\n".join(paragraphs) + f"\n\n{signature['footer']}"
+    return SyntheticPetition(
+        text=text,
+        category=category,
+        length_class=length_class,
+        signature_style=signature_style,
+        person_name=None if signature_style == 'unsigned' else name,
+    )
+
+
+def generate_corpus(size: int, seed: int = 42, length_mix: Optional[Dict[str, float]] = None,
+                    categories: Optional[List[str]] = None) -> List[SyntheticPetition]:
+    """
+    size dilekçelik, tohuma göre tekrarlanabilir korpus
+
+    length_mix: uzunluk sınıfı -> ağırlık (varsayılan DEFAULT_LENGTH_MIX)
+    categories: kullanılacak konu kategorileri (varsayılan: kural setindeki tümü)
+    """
+    rng = random.Random(seed)
+    length_mix = length_mix or DEFAULT_LENGTH_MIX
+    categories = categories or list(CORE_PATTERNS['subject_categories'])
+    length_classes = list(length_mix)
+    weights = [length_mix[length_class] for length_class in length_classes]
+
+    return [
+        generate_petition(
+            rng,
+            category=categories[index % len(categories)],
+            length_class=rng.choices(length_classes, weights)[0],
+            signature_style=SIGNATURE_STYLES[rng.randrange(len(SIGNATURE_STYLES))],
+        )
+        for index in range(size)
+    ]
@@ -0,0 +1,213 @@
+"""
+Uçtan uca analiz benchmark'ı ve regresyon karşılaştırması.
+
+Sentetik korpus (benchmarks.corpus) üzerinde analyze_petition_creative'i
+çalıştırır; toplam ve aşama bazında (metadata['stage_timings_ms'])
+dilekçe/sn, p50/p95/p99 gecikme ve tepe bellek (RSS) raporlar. Sonuçlar
+JSON olarak kaydedilir; iki çalışma karşılaştırılıp eşiği aşan yavaşlamalar
+regresyon olarak işaretlenir.
+
+çalıştırma:
+    python -m benchmarks.harness run --docs 300 --seed 42 --output data/bench/base.json
+    python -m benchmarks.harness compare data/bench/base.json data/bench/new.json --threshold 0.10
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchmarks.corpus import generate_corpus
+
+# karşılaştırmada izlenen ölçüler ve yönleri (True: büyük değer kötü)
+COMPARED_METRICS = {
+    'p50_ms': True,
+    'p95_ms': True,
+    'p99_ms': True,
+    'docs_per_sec': False,
+}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """en yakın sıra (nearest-rank) yüzdeliği; sorted_values sıralı olmalı"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(math.ceil(q / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def latency_summary(values_ms: List[float], wall_seconds: Optional[float] = None) -> Dict:
+    values = sorted(values_ms)
+    total_ms = sum(values)
+    seconds = wall_seconds if wall_seconds is not None else total_ms / 1000
+    return {
+        'count': len(values),
+        'docs_per_sec': round(len(values) / seconds, 2) if seconds else 0.0,
+        'mean_ms': round(total_ms / len(values), 3) if values else 0.0,
+        'p50_ms': round(percentile(values, 50), 3),
+        'p95_ms': round(percentile(values, 95), 3),
+        'p99_ms': round(percentile(values, 99), 3),
+        'max_ms': round(values[-1], 3) if values else 0.0,
+    }
+
+
+def peak_rss_mb() -> Optional[float]:
+    """sürecin tepe bellek kullanımı (MB); resource modülü olmayan platformlarda None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta bayt
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def run_benchmark(docs: int = 300, seed: int = 42, warmup: int = 5) -> Dict:
+    """korpusu üret, analiz et ve rapor sözlüğünü döndür"""
+    from src.petition_analyzer import PetitionAnalyzer
+
+    corpus = generate_corpus(docs, seed=seed)
+    analyzer = PetitionAnalyzer().warm_up()
+    for petition in corpus[:warmup]:
+        analyzer.analyze_petition_creative(petition.text)
+    analyzer.analysis_history.clear()
+
+    total_ms: List[float] = []
+    stage_ms: Dict[str, List[float]] = defaultdict(list)
+    by_length: Dict[str, List[float]] = defaultdict(list)
+    corpus_chars = 0
+
+    wall_start = time.perf_counter()
+    for petition in corpus:
+        start = time.perf_counter()
+        result = analyzer.analyze_petition_creative(petition.text)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        total_ms.append(elapsed_ms)
+        by_length[petition.length_class].append(elapsed_ms)
+        for stage, value_ms in result['metadata'].get('stage_timings_ms', {}).items():
+            stage_ms[stage].append(value_ms)
+        corpus_chars += len(petition.text)
+    wall_seconds = time.perf_counter() - wall_start
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'ruleset_version': analyzer.inference_engine.patterns.version,
+            'docs': docs,
+            'seed': seed,
+            'corpus_chars': corpus_chars,
+        },
+        'total': latency_summary(total_ms, wall_seconds),
+        'stages': {stage: latency_summary(values) for stage, values in sorted(stage_ms.items())},
+        'length_classes': {length_class: latency_summary(values)
+                           for length_class, values in sorted(by_length.items())},
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def compare_reports(baseline: Dict, candidate: Dict, threshold: float = 0.10,
+                    min_ms: float = 1.0) -> List[Dict]:
+    """
+    iki raporun toplam ve aşama ölçülerini karşılaştır
+
+    her satır: {'scope', 'metric', 'baseline', 'candidate', 'change', 'regression'}
+    change göreli değişimdir; eşiği kötü yönde aşan satırlar regresyon sayılır.
+    aşamalarda yalnızca gecikmeler, taban değeri min_ms'den büyükse karşılaştırılır
+    (milisaniye altı ölçümler gürültüden ibarettir)
+    """
+    scopes = [('total', baseline.get('total', {}), candidate.get('total', {}))]
+    for stage in sorted(set(baseline.get('stages', {})) & set(candidate.get('stages', {}))):
+        scopes.append((f"stage:{stage}", baseline['stages'][stage], candidate['stages'][stage]))
+
+    rows = []
+    for scope, old, new in scopes:
+        for metric, higher_is_worse in COMPARED_METRICS.items():
+            if metric not in old or metric not in new or not old[metric]:
+                continue
+            if scope != 'total' and (not higher_is_worse or old[metric] < min_ms):
+                continue
+            change = (new[metric] - old[metric]) / old[metric]
+            worse = change if higher_is_worse else -change
+            rows.append({
+                'scope': scope,
+                'metric': metric,
+                'baseline': old[metric],
+                'candidate': new[metric],
+                'change': round(change, 4),
+                'regression': worse > threshold,
+            })
+    return rows
+
+
+def _print_report(report: Dict):
+    meta = report['meta']
+    print(f"kural seti: {meta['ruleset_version']}  dilekçe: {meta['docs']}  seed: {meta['seed']}  "
+          f"karakter: {meta['corpus_chars']}")
+    print(f"tepe RSS: {report['peak_rss_mb']} MB")
+    header = f"  {'kapsam':<34}{'dil/sn':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    print(header)
+    rows = [('toplam', report['total'])]
+    rows += [(f"aşama {stage}", summary) for stage, summary in report['stages'].items()]
+    rows += [(f"uzunluk {length_class}", summary) for length_class, summary in report['length_classes'].items()]
+    for label, summary in rows:
+        print(f"  {label:<34}{summary['docs_per_sec']:>10}{summary['p50_ms']:>10}"
+              f"{summary['p95_ms']:>10}{summary['p99_ms']:>10}")
+
+
+def _load(path: str) -> Dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Dilekçe analizi benchmark'ı")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="korpusu analiz et ve raporla")
+    run_parser.add_argument('--docs', type=int, default=300)
+    run_parser.add_argument('--seed', type=int, default=42)
+    run_parser.add_argument('--output', help="raporun kaydedileceği JSON dosyası")
+
+    compare_parser = commands.add_parser('compare', help="iki raporu karşılaştır")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="regresyon sayılacak göreli kötüleşme (0.10 = %%10)")
+    compare_parser.add_argument('--min-ms', type=float, default=1.0,
+                                help="bu değerin altındaki aşama gecikmeleri karşılaştırılmaz")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        report = run_benchmark(args.docs, args.seed)
+        _print_report(report)
+        if args.output:
+            directory = os.path.dirname(args.output)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"rapor kaydedildi: {args.output}")
+        return 0
+
+    rows = compare_reports(_load(args.baseline), _load(args.candidate), args.threshold, args.min_ms)
+    regressions = [row for row in rows if row['regression']]
+    for row in rows:
+        marker = "REGRESYON" if row['regression'] else ""
+        print(f"  {row['scope']:<34}{row['metric']:<14}{row['baseline']:>10}{row['candidate']:>10}"
+              f"{row['change']:>+9.1%}  {marker}")
+    print(f"{len(regressions)} regresyon (eşik %{args.threshold * 100:g})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
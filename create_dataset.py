@@ -1,7 +1,69 @@
+import argparse
 import os
-import re
-from src.petition_analyzer import PetitionAnalyzer
-import pandas as pd
+from itertools import islice
+from typing import Dict, Iterator, Optional
+
+from src.dataset_checkpoint import CheckpointError, DatasetCheckpoint, content_hash
+from src.dataset_writer import open_dataset_writer
+from src.petition_analyzer import get_analyzer, is_failed_result
+
+# train_data.txt kayıt ayracı (result_sinks.append_training_text ile aynı)
+RECORD_SEPARATOR = "=" * 50
+
+
+def iter_documents(file_path: str) -> Iterator[Dict]:
+    """
+    Belirtilen formattaki metin dosyasını satır satır okur ve her bir dilekçeyi
+    yapısal bir şekilde (dosya adı, tarih, metin olarak) tek tek üretir.
+    dosyanın tamamı belleğe alınmaz
+
+    kayıt formatı:
+        Dosya: <ad>
+        Tarih: <tarih>
+        ==================================================
+        <metin> (bir sonraki ayraç satırına ya da dosya sonuna kadar)
+    """
+    name = date = None
+    state = 'search'
+    body = []
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip('\n')
+
+            if state == 'body':
+                if not line.startswith(RECORD_SEPARATOR):
+                    body.append(line)
+                    continue
+                text = "\n".join(body).strip()
+                if text:
+                    yield {"dosya": name, "tarih": date, "metin": text}
+                body = []
+                state = 'search'
+                continue
+
+            if state == 'date':
+                if line.startswith("Tarih: ") and line[len("Tarih: "):].strip():
+                    date = line[len("Tarih: "):].strip()
+                    state = 'separator'
+                    continue
+                state = 'search'
+            elif state == 'separator':
+                if line == RECORD_SEPARATOR:
+                    state = 'body'
+                    continue
+                state = 'search'
+
+            # başlık aranıyor (ya da yarım kalan başlığın bu satırı yeni bir başlık olabilir)
+            if "Dosya: " in line and line.split("Dosya: ", 1)[1].strip():
+                name = line.split("Dosya: ", 1)[1].strip()
+                state = 'date'
+
+    if state == 'body':
+        text = "\n".join(body).strip()
+        if text:
+            yield {"dosya": name, "tarih": date, "metin": text}
+
 
 def process_data(file_path):
     """
@@ -10,87 +72,131 @@ def process_data(file_path):
 
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            full_text = f.read()
+        return list(iter_documents(file_path))
     except FileNotFoundError:
         print(f"Hata: '{file_path}' dosyası bulunamadı.")
         return []
 
-    pattern = re.compile(
-        r"Dosya: (.+?)\n"
-        r"Tarih: (.+?)\n"
-        r"={50}\n"
-        r"(.*?)"
-        r"(?=\n={50}|$)", re.DOTALL
-    )
-    matches = pattern.findall(full_text)
-
-    documents = []
-    for match in matches:
-        if match[2].strip():
-            documents.append({
-                "dosya": match[0].strip(),
-                "tarih": match[1].strip(),
-                "metin": match[2].strip()
-            })
-    return documents
-
-
-def create_training_dataset(folder_path: str, output_filename: str):
+
+def create_training_dataset(folder_path: str, output_filename: str, workers: int = None,
+                            batch_size: int = 1000, chunk_size: int = 500, detect_campaigns: bool = True,
+                            resume: bool = False, checkpoint_dir: Optional[str] = None):
     """
     Ham metin dosyasını okur, her bir metni analiz eder ve makine öğrenmesi
-    modellerini eğitmek için yapısal bir veri seti (DataFrame) oluşturur.
+    modellerini eğitmek için yapısal bir veri seti oluşturur.
+
+    dilekçeler dosyadan akış halinde okunur ve batch_size'lık gruplar halinde paralel
+    analiz edilir. her grubun satırları kontrol noktasına (bkz. DatasetCheckpoint) kalıcı
+    olarak yazılır; çıktı dosyası en sonda kontrol noktasından chunk_size satırlık
+    parçalarla üretilir: bellek kullanımı veri seti boyutundan bağımsızdır.
+    çıktı biçimi dosya uzantısından seçilir (.xlsx, .jsonl, .csv, .parquet)
+    workers: paralel analiz için işçi süreç sayısı (varsayılan: çekirdek sayısı)
+    detect_campaigns: her grupta yakın kopya kampanya dilekçelerini bul; üyeler temsilcinin
+    kategori / duygu / sosyal analizini kullanır (isim ve adres her dilekçeden ayrıca çıkarılır)
+    resume: yarıda kalan çalışmaya devam et; manifest ile yazılmış satırların tutarlılığı
+    doğrulanır, daha önce işlenmiş dokümanlar (içerik özetine göre) atlanır. False ise
+    kontrol noktası sıfırlanır
+    checkpoint_dir: kontrol noktası klasörü (varsayılan: '<çıktı>.checkpoint')
+
+    dönüş: yazılan satır sayısı (dilekçe bulunamazsa None)
     """
     train_data_path = os.path.join(folder_path, "train_data.txt")
+    if not os.path.exists(train_data_path):
+        print(f"Hata: '{train_data_path}' dosyası bulunamadı.")
+        return None
 
-    # verileri yapısal olarak oku ve ayır
-    documents = process_data(train_data_path)
-
-    if not documents:
+    # verileri yapısal olarak ve akış halinde oku
+    documents = iter_documents(train_data_path)
+
+    # süreç genelinde paylaşılan analizörü al
+    analyzer = get_analyzer()
+    checkpoint = DatasetCheckpoint(checkpoint_dir or output_filename + ".checkpoint", output_filename,
+                                   analyzer.cache_version).start(resume)
+    if resume and checkpoint.rows_written + checkpoint.failed:
+        print(f"Devam ediliyor: {checkpoint.rows_written} kayıt yazılmış, "
+              f"{checkpoint.rows_written + checkpoint.failed} dilekçe atlanacak")
+
+    seen = 0
+    analyzed = 0
+    campaign_ids = set()
+    campaign_petitions = 0
+
+    while True:
+        batch = list(islice(documents, batch_size))
+        if not batch:
+            break
+        seen += len(batch)
+
+        # önceki çalışmalarda işlenmiş dokümanlar yeniden analiz edilmez
+        hashes = [content_hash(doc['metin']) for doc in batch]
+        pending = [(doc, text_hash) for doc, text_hash in zip(batch, hashes) if not checkpoint.is_completed(text_hash)]
+        if not pending:
+            continue
+
+        # grup çekirdekler arasında paralel analiz edilir, sonuçlar girdi sırasıyla döner
+        analysis_results = analyzer.analyze_batch([doc['metin'] for doc, _ in pending], workers=workers,
+                                                  detect_campaigns=detect_campaigns)
+
+        # her dilekçenin sonucunu orijinal veriyle birleştir
+        rows = []
+        for (doc, text_hash), analysis_result in zip(pending, analysis_results):
+            if is_failed_result(analysis_result):
+                print(f"Uyarı: '{doc['dosya']}' analiz edilemedi: {analysis_result['error']['message']}")
+                rows.append((text_hash, None))
+                continue
+
+            campaign = analysis_result['metadata'].get('campaign')
+            if campaign:
+                campaign_ids.add(campaign['campaign_id'])
+                campaign_petitions += 1
+
+            # orijinal metin ve analiz sonucunu birleştirerek tam bir kayıt oluştur
+            rows.append((text_hash, {
+                'dosya_adi': doc['dosya'],
+                'tarih': doc['tarih'],
+                'ham_metin': doc['metin'],   # makine öğrenmesi için girdi - feature
+                **analysis_result           # makine öğrenmesi için çıktılar - labels
+            }))
+
+        # grup kalıcı olarak yazıldıktan sonra manifeste işlenir
+        checkpoint.commit(rows)
+        analyzed += len(pending)
+        print(f"Analiz ediliyor: {analyzed} dilekçe işlendi")
+
+    if not seen:
         print("İşlenecek dilekçe bulunamadı.")
         return None
 
-    print(f"Toplam {len(documents)} dilekçe bulundu ve yapısal olarak ayrıştırıldı.")
-
-    # PetitionAnalyzer'dan bir nesne oluştur
-    analyzer = PetitionAnalyzer()
-
-    labeled_data = []
-
-    # her dilekçeyi analiz et ve sonuçları orijinal veriyle birleştir
-    for i, doc in enumerate(documents, 1):
-        print(f"Analiz ediliyor: {i}/{len(documents)} ({doc['dosya']})")
+    if campaign_ids:
+        print(f"Kampanya: {len(campaign_ids)} kampanyada {campaign_petitions} yakın kopya dilekçe bulundu")
 
-        analysis_result = analyzer.analyze_petition_creative(doc['metin'])
-
-        # orijinal metin ve analiz sonucunu birleştirerek tam bir kayıt oluştur
-        final_record = {
-            'dosya_adi': doc['dosya'],
-            'tarih': doc['tarih'],
-            'ham_metin': doc['metin'],   # makine öğrenmesi için girdi - feature
-            **analysis_result           # makine öğrenmesi için çıktılar - labels
-        }
-        labeled_data.append(final_record)
-
-    # etiketli veri setini dataframe dönüştür
-    df = pd.DataFrame(labeled_data)
-    df.to_excel(output_filename, index=False)
-    print(f"\nAnaliz tamamlandı! Eğitim veri seti '{output_filename}' dosyasına kaydedildi.")
-
-    return df
+    with open_dataset_writer(output_filename, chunk_size=chunk_size) as writer:
+        writer.write_many(checkpoint.iter_rows())
 
+    print(f"\nAnaliz tamamlandı! {writer.rows_written} kayıt '{output_filename}' dosyasına kaydedildi.")
+    return writer.rows_written
 
 
 if __name__ == "__main__":
     TRAINING_FILES_FOLDER = "data"
     OUTPUT_EXCEL_FILE = "data/train_dataset.xlsx"
 
-    training_df = create_training_dataset(
-        folder_path=TRAINING_FILES_FOLDER,
-        output_filename=OUTPUT_EXCEL_FILE
-    )
+    parser = argparse.ArgumentParser(description="train_data.txt'den eğitim veri seti üretir")
+    parser.add_argument('--folder', default=TRAINING_FILES_FOLDER)
+    parser.add_argument('--output', default=OUTPUT_EXCEL_FILE)
+    parser.add_argument('--resume', action='store_true',
+                        help="yarıda kalan çalışmaya kontrol noktasından devam et")
+    args = parser.parse_args()
 
-    # head
-    if training_df is not None:
-        print("\n--- veri seti ön izlemesi ---")
-        print(training_df.head())
\ No newline at end of file
+    try:
+        written_rows = create_training_dataset(
+            folder_path=args.folder,
+            output_filename=args.output,
+            resume=args.resume
+        )
+    except CheckpointError as error:
+        print(f"Hata: {error}\n--resume olmadan çalıştırarak baştan başlayabilirsiniz.")
+        written_rows = None
+
+    if written_rows:
+        print(f"\n--- veri seti: {args.output} ({written_rows} satır) ---")
@@ -0,0 +1,48 @@
+"""
+Klasördeki dilekçeleri (PDF / .txt, alt klasörler dahil) GUI olmadan analiz eder
+ve sonuçları GUI ile aynı hedeflere yazar (sonuç deposu, train_data.txt, excel).
+
+çalıştırma:  python ingest.py <klasör> [--data-dir data] [--workers 4] [--queue-size 8]
+                              [--max-pages 200] [--profile full] [--detect-campaigns]
+"""
+import argparse
+import sys
+
+from src.analysis_profiles import PROFILES
+from src.ingestion import ProgressPrinter, ingest_directory, iter_input_files
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Dilekçe klasörlerinin toplu analizi")
+    parser.add_argument('directory', help="PDF / .txt dosyalarının bulunduğu klasör")
+    parser.add_argument('--data-dir', default="data", help="sonuçların yazılacağı veri klasörü")
+    parser.add_argument('--workers', type=int, default=None, help="işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--queue-size', type=int, default=None, help="havuzda bekleyen en fazla dosya")
+    parser.add_argument('--max-pages', type=int, default=None, help="PDF başına okunan en fazla sayfa")
+    parser.add_argument('--profile', default='full', choices=list(PROFILES))
+    parser.add_argument('--detect-campaigns', action='store_true',
+                        help="yakın kopya (kampanya) dilekçeleri tespit et (yalnızca 'full' profil)")
+    parser.add_argument('--campaign-batch', type=int, default=256,
+                        help="kampanya tespitinde birlikte analiz edilen en fazla dosya")
+    args = parser.parse_args(argv)
+
+    total = sum(1 for _ in iter_input_files(args.directory))
+    if not total:
+        print(f"'{args.directory}' içinde .pdf / .txt dosyası bulunamadı.")
+        return 1
+
+    print(f"{total} dosya işlenecek -> '{args.data_dir}'")
+    printer = ProgressPrinter(total)
+    report = ingest_directory(args.directory, args.data_dir, workers=args.workers, queue_size=args.queue_size,
+                              max_pages=args.max_pages, profile=args.profile, progress=printer.update,
+                              detect_campaigns=args.detect_campaigns, campaign_batch=args.campaign_batch)
+
+    print(f"\nTamamlandı: {report.written} dosya kaydedildi, {len(report.failed)} hata, "
+          f"{report.elapsed_seconds:.1f} sn ({report.throughput:.2f} dosya/sn)")
+    for path, message in report.failed:
+        print(f"  Hata: {path}: {message}")
+    return 0 if not report.failed else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,144 +1,293 @@
 import os
-import json
+import queue
+import threading
 import tkinter as tk
-from tkinter import filedialog, scrolledtext, messagebox
+from tkinter import filedialog, scrolledtext, messagebox, ttk
 from datetime import datetime
-import pandas as pd
 import sys
 
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.petition_analyzer import PetitionAnalyzer
-from src.utils import pdf_to_text, format_result_summary
+from src.excel_dataset import StagedExcelDataset
+from src.gui_jobs import AnalysisJob, AnalysisWorker, BatchAnalysisJob, write_batch_to_sinks, write_to_sinks
+from src.ingestion import SUPPORTED_EXTENSIONS, iter_input_files
+from src.petition_analyzer import PetitionAnalyzer, get_analyzer
+from src.result_cache import ResultCache
+from src.result_sinks import EXCEL_DATASET_NAME, RESULTS_DIR_NAME, RESULTS_PREFIX, TRAIN_DATA_NAME
+from src.results_store import JsonlResultsStore
+from src.utils import format_result_summary
 
 # ayarlar ve sabit değerler
 DATA_FOLDER = "data"
-TRAIN_DATA_FILE = os.path.join(DATA_FOLDER, "train_data.txt")
+TRAIN_DATA_FILE = os.path.join(DATA_FOLDER, TRAIN_DATA_NAME)
+# eski tek dosyalık sonuç dizisi (ilk açılışta sonuç deposuna taşınır)
 JSON_RESULTS_FILE = os.path.join(DATA_FOLDER, "petition_analyze_results.json")
+RESULTS_DIR = os.path.join(DATA_FOLDER, RESULTS_DIR_NAME)
+EXCEL_DATASET_FILE = os.path.join(DATA_FOLDER, EXCEL_DATASET_NAME)
+# bekleyen satırlar çalışma kitabına bu aralıkla yazılır
+EXCEL_COMPACTION_INTERVAL_MS = 5 * 60 * 1000
+# aynı dilekçe (ör. yeniden gönderilen PDF) tekrar analiz edilmez
+RESULT_CACHE_FILE = os.path.join(DATA_FOLDER, "cache", "analysis_cache.sqlite")
+RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# arayüzün iş mesajlarını yoklama aralığı
+JOB_POLL_INTERVAL_MS = 30
+JOB_CLOSE_TIMEOUT_SECONDS = 10
+# toplu işlerde dosyaları paralel işleyen süreç sayısı (None: çekirdek sayısı)
+BATCH_WORKERS = None
+
+results_store = None
+excel_dataset = None
+result_cache = None
+
+# arka plan işleri: CPU yoğun adımlar tek işçili süreçte, kayıt iş parçacığında (bkz. src/gui_jobs.py)
+analysis_worker = AnalysisWorker()
+job_messages = queue.Queue()
+current_job = None
+# sonuç tablosundaki satırların sonuçları (satır seçilince özet gösterilir)
+row_results = {}
+# hedeflere yazma (iş parçacığı) ile excel sıkıştırma (ana iş parçacığı) aynı anda yapılmaz
+persistence_lock = threading.Lock()
 
 
 def setup_project_structure():
-    """klasör kontolü."""
+    """klasör kontolü ve sonuç deposunun hazırlanması."""
+    global results_store, excel_dataset, result_cache
     os.makedirs(DATA_FOLDER, exist_ok=True)
+    results_store = JsonlResultsStore(RESULTS_DIR, prefix=RESULTS_PREFIX)
+    excel_dataset = StagedExcelDataset(EXCEL_DATASET_FILE)
+    result_cache = ResultCache(disk_path=RESULT_CACHE_FILE, max_disk_bytes=RESULT_CACHE_MAX_BYTES)
+
+    migrated = results_store.migrate_json_array(JSON_RESULTS_FILE)
+    if migrated:
+        print(f"{migrated} eski sonuç '{RESULTS_DIR}' deposuna taşındı.")
+
+
+def get_gui_analyzer() -> PetitionAnalyzer:
+    """süreç genelinde paylaşılan, ısıtılmış analizör; sonuç önbelleği bağlanmış olarak"""
+    analyzer = get_analyzer()
+    if analyzer.result_cache is None:
+        analyzer.result_cache = result_cache
+    return analyzer
+
+
+def persist_result(result: dict, text: str, source_name: str):
+    """sonucu üç hedefe yazar; yazma işçi süreçte yapılır (iş parçacığında çağrılır)"""
+    with persistence_lock:
+        analysis_worker.call(write_to_sinks, DATA_FOLDER, result, text, source_name)
+
+
+def persist_batch(items: list):
+    """toplu işin sonuçlarını hedeflere tek seferde yazar (iş parçacığında çağrılır)"""
+    with persistence_lock:
+        analysis_worker.call(write_batch_to_sinks, DATA_FOLDER, items)
+
+
+def start_job(source_name: str, pdf_path: str = None, text: str = None):
+    """analiz ve kayıt işlemleri arka planda başlar; arayüz poll_job_messages ile güncellenir"""
+    global current_job
+    current_job = AnalysisJob(source_name, job_messages, analysis_worker, get_gui_analyzer(), persist_result,
+                              pdf_path=pdf_path, text=text)
+    add_result_row(source_name, source_name, status="işleniyor")
+    set_busy(True)
+    status_label.config(text=f"'{source_name}' işleniyor...", fg="black")
+    current_job.start()
+
+
+def start_batch_job(files: list):
+    """(yol, kaynak adı) dosyalarını paralel işler; her dosya tabloda bir satırdır"""
+    global current_job
+    batch_name = f"toplu_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    current_job = BatchAnalysisJob(batch_name, job_messages, files, get_gui_analyzer(), persist_batch,
+                                   workers=BATCH_WORKERS)
+    for _, source_name in files:
+        add_result_row(f"{batch_name}/{source_name}", source_name)
+    set_busy(True)
+    status_label.config(text=f"{len(files)} dosya işleniyor...", fg="black")
+    current_job.start()
+
+
+def poll_job_messages():
+    """işin mesajlarını ana iş parçacığında uygula (Tk yalnızca burada güncellenir)"""
+    global current_job
+    try:
+        while True:
+            message = job_messages.get_nowait()
+            if current_job is None or message.source_name != current_job.source_name:
+                continue
+            if message.kind == 'progress':
+                show_progress(message.text, message.fraction)
+            elif message.kind == 'file':
+                update_result_row(f"{message.source_name}/{message.file}", message.text, message.result)
+            elif message.kind == 'done':
+                if message.result is not None:
+                    update_result_row(message.source_name, "tamam", message.result)
+                    show_result(message.result)
+                status_label.config(text=message.text, fg="green")
+                current_job = None
+                set_busy(False)
+            elif message.kind == 'cancelled':
+                mark_unfinished_rows(message.source_name, "iptal")
+                status_label.config(text=message.text, fg="black")
+                current_job = None
+                set_busy(False)
+            elif message.kind == 'error':
+                mark_unfinished_rows(message.source_name, "hata")
+                current_job = None
+                set_busy(False)
+                status_label.config(text=f"Hata: {message.text}", fg="red")
+                messagebox.showerror("Hata", message.text)
+    except queue.Empty:
+        pass
+    root.after(JOB_POLL_INTERVAL_MS, poll_job_messages)
+
+
+def show_progress(text: str, fraction):
+    """fraction None ise ilerleme çubuğu belirsiz modda döner"""
+    status_label.config(text=text, fg="black")
+    if fraction is None:
+        if str(progress_bar.cget("mode")) != "indeterminate":
+            progress_bar.config(mode="indeterminate")
+            progress_bar.start(15)
+    else:
+        progress_bar.stop()
+        progress_bar.config(mode="determinate", value=fraction * 100)
 
 
-def save_to_json(result: dict):
-    """sonucu json olarak kayıt eder."""
-    if os.path.exists(JSON_RESULTS_FILE):
-        with open(JSON_RESULTS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    else:
-        data = []
-    data.append(result)
-    with open(JSON_RESULTS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+def show_result(result: dict):
+    result_text.config(state=tk.NORMAL)
+    result_text.delete('1.0', tk.END)
+    summary_output = format_result_summary(result)
+    result_text.insert(tk.END, summary_output)
+    result_text.config(state=tk.DISABLED)
 
 
-def save_to_training_data(text: str, base_filename: str):
-    """çıkarılan metni txt dosyasına kayıt eder"""
-    with open(TRAIN_DATA_FILE, "a", encoding="utf-8") as f_train:
-        f_train.write(f"\n\n{'=' * 50}\n")
-        f_train.write(f"Dosya: {base_filename}\n")
-        f_train.write(f"Tarih: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f_train.write(f"{'=' * 50}\n")
-        f_train.write(text.strip())
-        f_train.write("\n")
+def add_result_row(row_id: str, source_name: str, status: str = "bekliyor"):
+    """aynı kaynak yeniden işlenirse eski satırın yerini alır"""
+    if results_table.exists(row_id):
+        results_table.delete(row_id)
+        row_results.pop(row_id, None)
+    results_table.insert("", tk.END, iid=row_id, values=(source_name, status, "", "", ""))
+    results_table.see(row_id)
 
 
-def process_text_and_update_ui(text: str, source_name: str):
-    """analiz ve kayıt işlemleri"""
-    if not text.strip():
-        messagebox.showwarning("Uyarı", "İşlenecek metin bulunamadı.")
+def update_result_row(row_id: str, status: str, result: dict = None):
+    """satırın durumunu ve (varsa) sonucun ana alanlarını güncelle"""
+    if not results_table.exists(row_id):
         return
+    values = list(results_table.item(row_id, "values"))
+    values[1] = status
+    if result is not None:
+        info = result.get('extracted_information', {})
+        values[2:] = [info.get('subject_category', ''), info.get('urgency_level', ''), info.get('person_name', '')]
+        row_results[row_id] = result
+    results_table.item(row_id, values=values)
 
-    # analiz
-    analyzer = PetitionAnalyzer()
-    result = analyzer.analyze_petition_creative(text)
-    result["kaynak_dosya"] = source_name
 
-    # sonuçları json olarak kayıt etme
-    save_to_json(result)
+def mark_unfinished_rows(job_name: str, status: str):
+    """biten iş sonucu beklenen satırları (tek dosya ya da toplu işin dosyaları) kapat"""
+    for row_id in results_table.get_children():
+        if (row_id == job_name or row_id.startswith(job_name + "/")) and \
+                results_table.set(row_id, "durum") in ("bekliyor", "işleniyor"):
+            results_table.set(row_id, "durum", status)
 
-    #eğitim verisine ekle
-    save_to_training_data(text, source_name)
 
-    append_to_excel_dataset(result, text, source_name)
+def show_selected_row(_event=None):
+    selection = results_table.selection()
+    if selection and selection[0] in row_results:
+        show_result(row_results[selection[0]])
 
-    # arayüzü güncelle
-    result_text.config(state=tk.NORMAL)
-    result_text.delete('1.0', tk.END)
-    summary_output = format_result_summary(result)
-    print(result)
-    result_text.insert(tk.END, summary_output)
-    result_text.config(state=tk.DISABLED)
 
-    status_label.config(
-        text=f"işlem başarılı: '{source_name}' işlendi ve kaydedildi.",
-        fg="green"
-    )
+def set_busy(busy: bool):
+    """iş sürerken yeni iş başlatılamaz, yalnızca iptal edilebilir"""
+    for button in (pdf_button, folder_button, text_button):
+        button.config(state=tk.DISABLED if busy else tk.NORMAL)
+    cancel_button.config(state=tk.NORMAL if busy else tk.DISABLED)
+    if not busy:
+        progress_bar.stop()
+        progress_bar.config(mode="determinate", value=0)
+
+
+def cancel_job():
+    if current_job is not None:
+        current_job.cancel()
+        status_label.config(text=f"'{current_job.source_name}' iptal ediliyor...", fg="black")
 
 
 def handle_pdf_selection():
-    """Pdf seçme ve işleme mantığı."""
-    path = filedialog.askopenfilename(filetypes=[("PDF Dosyaları", "*.pdf")])
-    if not path:
+    """Pdf seçme ve işleme mantığı. birden çok dosya seçilirse toplu işlenir."""
+    paths = filedialog.askopenfilenames(filetypes=[("PDF Dosyaları", "*.pdf"), ("Metin Dosyaları", "*.txt")])
+    if not paths:
         return
-    try:
-        text = pdf_to_text(path)
-        base_filename = os.path.splitext(os.path.basename(path))[0]
-        process_text_and_update_ui(text, base_filename)
-    except Exception as e:
-        messagebox.showerror("Hata", f"PDF okunurken bir hata oluştu:\n{e}")
+    files = [(path, os.path.splitext(os.path.basename(path))[0]) for path in paths]
+    if len(files) == 1 and paths[0].lower().endswith('.pdf'):
+        # tek PDF: sayfa sayfa ilerleme gösterilir
+        start_job(files[0][1], pdf_path=paths[0])
+    else:
+        start_batch_job(files)
+
+
+def handle_folder_selection():
+    """klasördeki (alt klasörler dahil) tüm .pdf / .txt dosyalarını toplu işler."""
+    folder = filedialog.askdirectory()
+    if not folder:
+        return
+    files = [(path, os.path.splitext(os.path.relpath(path, folder))[0]) for path in iter_input_files(folder)]
+    if not files:
+        messagebox.showwarning("Uyarı", f"Klasörde {' / '.join(SUPPORTED_EXTENSIONS)} dosyası bulunamadı.")
+        return
+    start_batch_job(files)
 
 
 def handle_text_input():
     """metin kutusundan veri işleme mantığı."""
     text = input_text.get("1.0", tk.END)
+    if not text.strip():
+        messagebox.showwarning("Uyarı", "İşlenecek metin bulunamadı.")
+        return
     # metin girdisi için benzersiz bir isim oluştur
     source_name = f"metin_girdisi_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    process_text_and_update_ui(text, source_name)
-
-def append_to_excel_dataset(result: dict, text: str, source_name: str):
-    """
-    Yeni analiz sonucunu 'training_dataset.xlsx' dosyasına yeni bir satır olarak ekler.
-    Dosya yoksa oluşturur.
-    """
-    excel_path = os.path.join(DATA_FOLDER, "training_dataset.xlsx")
-
-    # yeni kayıt verisini hazırla
-    new_record = {
-        'dosya_adi': source_name,
-        'tarih': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'ham_metin': text.strip(),
-        **result  # analiz sonucundaki tüm anahtarları ayrı sütunlar olarak aç
-    }
-    new_row_df = pd.DataFrame([new_record])
-
-    # mevcut excel dosyasını oku ve yeni satırı ekle
-    try:
-        if os.path.exists(excel_path):
-            # Dosya varsa, oku ve sonuna ekle
-            existing_df = pd.read_excel(excel_path)
-            updated_df = pd.concat([existing_df, new_row_df], ignore_index=True)
-        else:
-            # dosya yoksa, bu yeni satır ilk veri olarak yazılacak
-            updated_df = new_row_df
-
-        # güncellenmiş dataframei tekrar excele yaz
-        updated_df.to_excel(excel_path, index=False)
+    start_job(source_name, text=text)
 
+def compact_excel_dataset(show_status: bool = True):
+    """ara kayıt günlüğünden 'training_dataset.xlsx' dosyasını üretir."""
+    try:
+        with persistence_lock:
+            rows = excel_dataset.compact()
     except Exception as e:
         # dosya başka bir programda açıksa veya başka bir hata olursa hata göster
         messagebox.showerror("Excel Yazma Hatası", f"Eğitim veriseti güncellenemedi:\n{e}")
+        return
+    if show_status:
+        status_label.config(text=f"Excel veri seti güncellendi: {rows} satır.", fg="green")
+
+
+def schedule_excel_compaction():
+    """bekleyen satır varsa çalışma kitabını periyodik olarak güncelle."""
+    if excel_dataset.pending_rows:
+        compact_excel_dataset(show_status=False)
+    root.after(EXCEL_COMPACTION_INTERVAL_MS, schedule_excel_compaction)
 
 
+def on_close():
+    """kapanışta süren işi iptal et, bekleyen satırları çalışma kitabına yaz."""
+    if current_job is not None:
+        current_job.cancel()
+        # kayıt aşamasındaki iş yazmayı bitirsin
+        current_job.join(timeout=JOB_CLOSE_TIMEOUT_SECONDS)
+    analysis_worker.terminate()
+    if excel_dataset.pending_rows:
+        compact_excel_dataset(show_status=False)
+    result_cache.close()
+    root.destroy()
+
 
 if __name__ == "__main__":
     setup_project_structure()
 
     root = tk.Tk()
     root.title("Dilekçe Analiz Aracı")
-    root.geometry("800x600")
+    root.geometry("1000x650")
 
     main_frame = tk.Frame(root, padx=10, pady=10)
     main_frame.pack(fill=tk.BOTH, expand=True)
@@ -147,9 +296,11 @@ if __name__ == "__main__":
     left_frame = tk.Frame(main_frame, width=380)
     left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
 
-    tk.Label(left_frame, text="1. PDF Dosyası Seçin:", font=("Helvetica", 10, "bold")).pack(anchor="w")
+    tk.Label(left_frame, text="1. PDF Dosyaları Seçin:", font=("Helvetica", 10, "bold")).pack(anchor="w")
     pdf_button = tk.Button(left_frame, text="PDF Seç ve İşle", command=handle_pdf_selection)
-    pdf_button.pack(fill=tk.X, pady=(5, 20))
+    pdf_button.pack(fill=tk.X, pady=(5, 0))
+    folder_button = tk.Button(left_frame, text="Klasör Seç ve İşle", command=handle_folder_selection)
+    folder_button.pack(fill=tk.X, pady=(5, 20))
 
     tk.Label(left_frame, text="2. Veya Metni Buraya Yapıştırın:", font=("Helvetica", 10, "bold")).pack(anchor="w")
     input_text = scrolledtext.ScrolledText(left_frame, height=15, wrap=tk.WORD)
@@ -158,16 +309,43 @@ if __name__ == "__main__":
     text_button = tk.Button(left_frame, text="Metni İşle", command=handle_text_input)
     text_button.pack(fill=tk.X, pady=(5, 0))
 
+    excel_button = tk.Button(left_frame, text="Excel Veri Setini Güncelle", command=compact_excel_dataset)
+    excel_button.pack(fill=tk.X, pady=(5, 0))
+
+    progress_bar = ttk.Progressbar(left_frame, mode="determinate", maximum=100)
+    progress_bar.pack(fill=tk.X, pady=(15, 0))
+    cancel_button = tk.Button(left_frame, text="İptal", command=cancel_job, state=tk.DISABLED)
+    cancel_button.pack(fill=tk.X, pady=(5, 0))
+
     # sonuç Ekranı
     right_frame = tk.Frame(main_frame, width=380)
     right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
 
+    tk.Label(right_frame, text="İşlenen Dosyalar:", font=("Helvetica", 10, "bold")).pack(anchor="w")
+    results_table = ttk.Treeview(right_frame, columns=("dosya", "durum", "kategori", "aciliyet", "ad"),
+                                 show="headings", height=8)
+    for column, heading, width in (("dosya", "Dosya", 140), ("durum", "Durum", 70), ("kategori", "Kategori", 110),
+                                   ("aciliyet", "Aciliyet", 60), ("ad", "Ad Soyad", 100)):
+        results_table.heading(column, text=heading)
+        results_table.column(column, width=width, stretch=column == "dosya")
+    results_table.pack(fill=tk.X, pady=5)
+    results_table.bind("<<TreeviewSelect>>", show_selected_row)
+
     tk.Label(right_frame, text="Analiz Sonucu:", font=("Helvetica", 10, "bold")).pack(anchor="w")
-    result_text = scrolledtext.ScrolledText(right_frame, height=20, wrap=tk.WORD, state=tk.DISABLED)
+    result_text = scrolledtext.ScrolledText(right_frame, height=12, wrap=tk.WORD, state=tk.DISABLED)
     result_text.pack(fill=tk.BOTH, expand=True, pady=5)
 
     # alt taraf durum etiketi
     status_label = tk.Label(root, text="İşlem için bir dosya seçin veya metin girin.", bd=1, relief=tk.SUNKEN, anchor="w")
     status_label.pack(side=tk.BOTTOM, fill=tk.X)
 
+    # analizörü ve işçi süreci pencere açıldıktan hemen sonra ısıt; ilk istek kurulum maliyeti ödemesin
+    root.after_idle(get_gui_analyzer)
+    root.after_idle(lambda: threading.Thread(target=analysis_worker.warm_up, daemon=True).start())
+    root.after(JOB_POLL_INTERVAL_MS, poll_job_messages)
+
+    # excel veri seti zamanlanmış olarak ve kapanışta güncellenir
+    root.after(EXCEL_COMPACTION_INTERVAL_MS, schedule_excel_compaction)
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
     root.mainloop()
\ No newline at end of file
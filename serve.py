@@ -0,0 +1,42 @@
+"""
+Dilekçe analizörünü yerel bir HTTP servisi olarak çalıştırır (bkz. src/analysis_service.py).
+
+çalıştırma:  python serve.py [--host 127.0.0.1] [--port 8080] [--workers 4]
+                             [--max-batch 16] [--batch-window-ms 5] [--queue-size 256]
+
+örnek:       curl -s localhost:8080/analyze -d '{"text": "...", "profile": "summary"}'
+"""
+import argparse
+import asyncio
+
+from src.analysis_service import AnalysisService
+
+
+async def _serve(args):
+    service = AnalysisService(workers=args.workers, max_batch=args.max_batch,
+                              batch_window_ms=args.batch_window_ms, queue_size=args.queue_size)
+    await service.start(args.host, args.port)
+    print(f"Analiz servisi http://{args.host}:{service.port} adresinde ({service.workers} işçi süreç)")
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel dilekçe analiz servisi")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None, help="işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--max-batch', type=int, default=16, help="bir mikro gruptaki en fazla dilekçe")
+    parser.add_argument('--batch-window-ms', type=float, default=5.0, help="mikro grup toplama penceresi")
+    parser.add_argument('--queue-size', type=int, default=256, help="bekleyen en fazla dilekçe (dolunca 429, daha büyük gruplar 413)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Analiz geçmişi: sabit kapasiteli özet halkası ve akan (streaming) toplamlar.
+
+Tam sonuç sözlükleri saklanmaz. Her analizden küçük bir özet çıkarılır ve
+son `maxlen` özet bir halka tamponda tutulur; eskiler kendiliğinden düşer.
+İstatistiklerin ihtiyaç duyduğu sayaçlar (güven ortalaması, kategori
+dağılımı, çıkarım yöntemi sayıları) kayıt anında güncellenir: istatistik
+çağrısı geçmişi gezmez, bellek kullanımı yalnızca kapasiteye bağlıdır.
+"""
+from collections import Counter, defaultdict, deque
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+
+class AnalysisSummary(NamedTuple):
+    """tek bir analizin geçmişte tutulan özeti"""
+    timestamp: float
+    processing_time_seconds: float
+    confidence_level: Optional[float]
+    subject_category: Optional[str]
+    urgency_level: Optional[str]
+    person_name: Optional[str]
+    quality_score: Optional[float]
+    overall_validity: Optional[bool]
+    cache_hit: bool
+
+
+def summarize_result(result: Dict) -> AnalysisSummary:
+    """doğrulama / güven alanı olmayan profil sonuçlarında bu alanlar None olur"""
+    metadata = result['metadata']
+    extraction = result.get('extracted_information', {})
+    validation = result.get('validation_report', {})
+    return AnalysisSummary(
+        timestamp=metadata['analysis_timestamp'],
+        processing_time_seconds=metadata['processing_time_seconds'],
+        confidence_level=metadata.get('confidence_level'),
+        subject_category=extraction.get('subject_category'),
+        urgency_level=extraction.get('urgency_level'),
+        person_name=extraction.get('person_name'),
+        quality_score=validation.get('quality_score'),
+        overall_validity=bool(validation['overall_validity']) if 'overall_validity' in validation else None,
+        cache_hit=bool(metadata.get('cache', {}).get('hit')),
+    )
+
+
+class AnalysisHistory:
+    """
+    maxlen: halkada tutulan en fazla özet sayısı
+
+    len() halkadaki özet sayısını, total ise clear() sonrasındaki tüm kayıtları verir;
+    toplamlar halkadan düşen analizleri de kapsar
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self._recent: deque = deque(maxlen=max(0, maxlen))
+        self._reset_aggregates()
+
+    def _reset_aggregates(self):
+        self.total = 0
+        self._confidence_sum = 0.0
+        self._confidence_count = 0
+        self._categories: Counter = Counter()
+        self._name_methods: Dict[str, int] = defaultdict(int)
+        self._category_methods: Dict[str, int] = defaultdict(int)
+
+    @property
+    def maxlen(self) -> int:
+        return self._recent.maxlen
+
+    def append(self, result: Dict):
+        """tam sonucu özetle, halkaya ekle ve toplamları güncelle"""
+        summary = summarize_result(result)
+        self._recent.append(summary)
+
+        self.total += 1
+        if summary.confidence_level is not None:
+            self._confidence_sum += summary.confidence_level
+            self._confidence_count += 1
+        if summary.subject_category:
+            self._categories[summary.subject_category] += 1
+
+        extraction_methods = result.get('extracted_information', {}).get('extraction_methods', {})
+        if 'name' in extraction_methods:
+            for method, candidates in extraction_methods['name'].get('extraction_methods', {}).items():
+                if candidates:
+                    self._name_methods[method] += 1
+        if 'category' in extraction_methods:
+            self._category_methods[extraction_methods['category'].get('classification_method', 'unknown')] += 1
+
+    def clear(self):
+        """halkayı ve toplamları sıfırla"""
+        self._recent.clear()
+        self._reset_aggregates()
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def __iter__(self) -> Iterator[AnalysisSummary]:
+        return iter(self._recent)
+
+    def recent(self, count: Optional[int] = None) -> List[AnalysisSummary]:
+        """en yeni count özet (eskiden yeniye)"""
+        summaries = list(self._recent)
+        return summaries if count is None else summaries[-count:] if count > 0 else []
+
+    def average_confidence(self) -> float:
+        return round(self._confidence_sum / self._confidence_count, 3) if self._confidence_count else 0.0
+
+    def category_distribution(self) -> Dict:
+        total = sum(self._categories.values())
+        return {
+            category: {
+                'count': count,
+                'percentage': round(count / total * 100, 1)
+            }
+            for category, count in self._categories.most_common()
+        }
+
+    def extraction_method_stats(self) -> Dict:
+        return {
+            'name_extraction_methods': dict(self._name_methods),
+            # adres yöntemleri hiçbir zaman sayılmadı; anahtar çıktı biçimi için korunur
+            'address_extraction_methods': {},
+            'category_extraction_methods': dict(self._category_methods),
+        }
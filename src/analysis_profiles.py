@@ -0,0 +1,188 @@
+"""
+Analiz profilleri: bir çağrının sonuçta hangi alanlara ihtiyaç duyduğu.
+
+Her profil, sonuç sözlüğündeki alanları noktalı yol olarak bildirir
+('extracted_information.person_name', 'creative_insights.risk_assessment').
+FIELD_ARTIFACTS her alanın aşama grafiğindeki hangi artifact'lere ihtiyaç
+duyduğunu söyler; analizör yalnızca bu artifact'leri geçişli olarak üreten
+aşamaları çalıştırır (bkz. stage_graph). Bildirilmeyen ayrıntı hesaplanmaz,
+sonuçtan da çıkarılır (project).
+
+  - summary  : GUI özeti (format_result_summary) için gereken alanlar
+  - standard : tüm karar alanları; cümle bazlı duygu akışı, yöntem
+               ayrıntıları ve ilk doğrulama raporu olmadan
+  - full     : sonucun tamamı (varsayılan, eski davranış)
+
+ölçülen hızlanmalar (full'a göre; 80 dokümanlık sentetik korpus,
+python -m benchmarks.bench_profiles):
+  - summary  : paragraf 1.33x, 1 sayfa 1.27x, 5 sayfa 1.22x, 20 sayfa 1.37x,
+               50 sayfa 1.12x (adres, kurum, sosyal profil ve doğrulama atlanır)
+  - standard : ~1.0x, ölçüm gürültüsü içinde (atlanan ayrıntılar: cümle akışı,
+               eşleşme listeleri, ilk doğrulama; toplam sürenin %1'inden az)
+isim çıkarımı tüm profillerde gerekir ve sürenin çoğunu oluşturur.
+"""
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+# çıkarım aşamalarının artifact'leri (bkz. PetitionAnalyzer.stage_graph)
+_EXTRACTION_ARTIFACTS = ('name', 'address', 'institution', 'category', 'urgency', 'request_type')
+
+# sonuç alanı -> üretilmesi için gereken aşama grafiği artifact'leri.
+# bir alan istendiğinde onu kapsayan / onun kapsadığı tüm girişlerin artifact'leri hesaplanır
+FIELD_ARTIFACTS: Dict[str, Tuple[str, ...]] = {
+    'extracted_information.person_name': ('name',),
+    'extracted_information.address_info': ('address',),
+    'extracted_information.institution': ('institution',),
+    'extracted_information.subject_category': ('category',),
+    'extracted_information.urgency_level': ('urgency',),
+    'extracted_information.request_type': ('request_type',),
+    'extracted_information.extraction_methods': _EXTRACTION_ARTIFACTS,
+    'extracted_information.cross_validation_score': _EXTRACTION_ARTIFACTS,
+    'extracted_information.extraction_details': _EXTRACTION_ARTIFACTS,
+    'metadata.confidence_level': _EXTRACTION_ARTIFACTS + ('enhanced_validation', 'emotional'),
+    'emotional_intelligence': ('emotional',),
+    'social_intelligence': ('social',),
+    'validation_report.primary_validation': ('primary_validation',),
+    'validation_report.enhanced_validation': ('enhanced_validation',),
+    'validation_report.overall_validity': ('enhanced_validation',),
+    'validation_report.quality_score': ('enhanced_validation',),
+    'validation_report.red_flags': ('enhanced_validation',),
+    'validation_report.confidence_adjustment': ('enhanced_validation',),
+    'creative_insights.citizen_urgency_profile': ('urgency', 'emotional'),
+    'creative_insights.communication_style_analysis': ('name', 'emotional', 'social'),
+    'creative_insights.predicted_satisfaction_level': ('enhanced_validation',),
+    'creative_insights.institutional_response_recommendation': ('urgency', 'emotional'),
+    'creative_insights.risk_assessment': ('urgency', 'emotional'),
+    'actionable_recommendations': ('urgency',),
+}
+
+_RESULT_SECTIONS = ('metadata', 'extracted_information', 'emotional_intelligence', 'social_intelligence',
+                    'validation_report', 'creative_insights', 'actionable_recommendations')
+_EXTRACTED_FIELDS = ('person_name', 'address_info', 'institution', 'subject_category', 'urgency_level',
+                     'request_type', 'extraction_methods', 'cross_validation_score', 'extraction_details')
+
+
+def _covers(fields: FrozenSet[str], path: str) -> bool:
+    """path ya da onun bir üst / alt yolu kümede mi"""
+    if path in fields:
+        return True
+    prefix = path + '.'
+    for field in fields:
+        if field.startswith(prefix) or path.startswith(field + '.'):
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class AnalysisProfile:
+    """
+    name: profil adı (metadata['profile'])
+    fields: sonuçta istenen alanlar; None ise tüm alanlar
+    """
+    name: str
+    fields: Optional[FrozenSet[str]] = None
+
+    @property
+    def is_full(self) -> bool:
+        return self.fields is None
+
+    @cached_property
+    def artifacts(self) -> FrozenSet[str]:
+        """istenen alanlar için aşama grafiğinden hesaplanması gereken artifact'ler"""
+        if self.fields is None:
+            return frozenset(artifact for artifacts in FIELD_ARTIFACTS.values() for artifact in artifacts)
+        return frozenset(
+            artifact
+            for field, artifacts in FIELD_ARTIFACTS.items() if _covers(self.fields, field)
+            for artifact in artifacts
+        )
+
+    @property
+    def cache_tag(self) -> str:
+        """önbellek anahtarına giren profil kimliği (aynı ada sahip farklı alan kümeleri karışmaz)"""
+        return 'full' if self.fields is None else f"{self.name}:{','.join(sorted(self.fields))}"
+
+    @classmethod
+    def for_fields(cls, fields: Iterable[str], name: str = 'custom') -> 'AnalysisProfile':
+        """
+        verilen alanlar için profil; çıplak çıkarım alanı adları ('subject_category')
+        extracted_information altında aranır
+        """
+        resolved = set()
+        for field in fields:
+            if field.split('.')[0] not in _RESULT_SECTIONS and field.split('.')[0] in _EXTRACTED_FIELDS:
+                field = f"extracted_information.{field}"
+            if field.split('.')[0] not in _RESULT_SECTIONS:
+                raise ValueError(f"bilinmeyen sonuç alanı: {field!r}")
+            resolved.add(field)
+        return cls(name, frozenset(resolved))
+
+    def wants(self, path: str) -> bool:
+        """path (ya da bir alt alanı) sonuçta yer alacak mı (hesaplanmalı mı)"""
+        return self.fields is None or _covers(self.fields, path)
+
+    def project(self, result: Dict) -> Dict:
+        """sonuçtan yalnızca bildirilen alanları bırak (metadata her zaman kalır)"""
+        if self.fields is None:
+            return result
+        return {
+            key: value if key == 'metadata' else self._project_section(key, value)
+            for key, value in result.items() if key == 'metadata' or self.wants(key)
+        }
+
+    def _project_section(self, path: str, value):
+        if path in self.fields or not isinstance(value, dict):
+            return value
+        return {
+            key: self._project_section(f"{path}.{key}", item)
+            for key, item in value.items() if self.wants(f"{path}.{key}")
+        }
+
+
+SUMMARY_FIELDS = frozenset({
+    'extracted_information.person_name',
+    'extracted_information.subject_category',
+    'extracted_information.urgency_level',
+    'extracted_information.request_type',
+    'emotional_intelligence.dominant_emotion',
+    'creative_insights.institutional_response_recommendation',
+    'creative_insights.risk_assessment',
+})
+
+STANDARD_FIELDS = SUMMARY_FIELDS | frozenset({
+    'metadata.confidence_level',
+    'extracted_information.address_info',
+    'extracted_information.institution',
+    'extracted_information.cross_validation_score',
+    'extracted_information.extraction_details',
+    'emotional_intelligence.momentum_analysis.final_momentum',
+    'emotional_intelligence.momentum_analysis.dominant_overall',
+    'emotional_intelligence.momentum_analysis.emotional_stability',
+    'emotional_intelligence.emotional_stability',
+    'emotional_intelligence.predicted_citizen_state',
+    'social_intelligence',
+    'validation_report.enhanced_validation',
+    'validation_report.overall_validity',
+    'validation_report.quality_score',
+    'validation_report.red_flags',
+    'validation_report.confidence_adjustment',
+    'creative_insights',
+    'actionable_recommendations',
+})
+
+PROFILES = {
+    'summary': AnalysisProfile('summary', SUMMARY_FIELDS),
+    'standard': AnalysisProfile('standard', STANDARD_FIELDS),
+    'full': AnalysisProfile('full'),
+}
+
+
+def get_profile(profile) -> AnalysisProfile:
+    """profil adı ya da AnalysisProfile nesnesi -> AnalysisProfile"""
+    if isinstance(profile, AnalysisProfile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"bilinmeyen analiz profili: {profile!r} (seçenekler: {', '.join(PROFILES)})") from None
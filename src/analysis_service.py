@@ -0,0 +1,392 @@
+"""
+Yerel asyncio HTTP analiz servisi (yalnızca standart kütüphane).
+
+uç noktalar:
+    POST /analyze        {"text": "...", "profile": "full"}       -> analiz sonucu
+    POST /analyze_batch  {"texts": ["...", ...], "profile": ...}  -> {"results": [...]}
+    GET  /health                                                  -> kuyruk ve toplama istatistikleri
+
+İstekler tek bir sınırlı kuyruğa dilekçe olarak girer. Toplayıcı (batcher)
+kuyruktan ilk dilekçeyi aldıktan sonra batch_window_ms boyunca (ya da
+max_batch dolana kadar) gelen dilekçeleri aynı mikro gruba ekler ve grubu
+önceden ısıtılmış süreç havuzuna gönderir; eşzamanlı istekler böylece tek
+bir süreçler arası çağrıda analiz edilir. Havuzda aynı anda en fazla
+workers grup bulunur: işçiler meşgulken kuyruk dolar ve yeni istekler
+429 (Retry-After) ile reddedilir, bekleme süresi sınırsız büyümez. Kuyruk
+kapasitesinden büyük gruplar yeniden denemeyle de sığamayacağından 413 alır.
+Bir işçi çökerse havuz yeniden kurulur (health: pool_restarts).
+"""
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.analysis_profiles import get_profile
+from src.petition_analyzer import failed_result, get_analyzer, init_worker, is_failed_result
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 429: 'Too Many Requests', 500: 'Internal Server Error'}
+
+
+def _analyze_service_batch(texts: Sequence[str], profile: str) -> List[Dict]:
+    """işçi süreçte bir mikro grubu analiz et; hata veren dilekçe yerine hata kaydı döner"""
+    analyzer = get_analyzer()
+    results = []
+    for text in texts:
+        try:
+            results.append(analyzer.analyze_petition_creative(text, profile=profile))
+        except Exception as error:
+            results.append(failed_result(error))
+    return results
+
+
+def _warm_worker() -> int:
+    return os.getpid()
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class AnalysisService:
+    """
+    workers: işçi süreç sayısı (varsayılan: çekirdek sayısı)
+    max_batch: bir mikro gruptaki en fazla dilekçe
+    batch_window_ms: ilk dilekçeden sonra gruba ekleme için beklenen en uzun süre
+    queue_size: bekleyen en fazla dilekçe; dolunca istekler 429 ile, daha büyük gruplar 413 ile reddedilir
+    max_body_bytes: istek gövdesi sınırı (413)
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_batch: int = 16, batch_window_ms: float = 5.0,
+                 queue_size: int = 256, max_body_bytes: int = 8 * 1024 * 1024):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch = max(1, max_batch)
+        self.batch_window = batch_window_ms / 1000.0
+        self.queue_size = max(1, queue_size)
+        self.max_body_bytes = max_body_bytes
+        self.port: Optional[int] = None
+        self.stats = {
+            'requests': 0,
+            'rejected': 0,
+            'petitions': 0,
+            'batches': 0,
+            'failed_petitions': 0,
+            'pool_restarts': 0,
+        }
+        self._queue: Optional[asyncio.Queue] = None
+        self._arrival: Optional[asyncio.Event] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight = set()
+        self._connections = set()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> 'AnalysisService':
+        """havuzu ısıt, toplayıcıyı ve sunucuyu başlat (port=0: boş bir port seçilir)"""
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._arrival = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.workers)
+        await self._start_pool()
+
+        self._batcher = asyncio.create_task(self._run_batcher())
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def _start_pool(self):
+        loop = asyncio.get_running_loop()
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker)
+        # tüm işçileri ilk istekten önce başlat: analizör kurulumu istek süresine yansımasın
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _warm_worker) for _ in range(self.workers)))
+
+    async def _restart_pool(self, broken: ProcessPoolExecutor):
+        """çöken işçi havuzu bozar (sonraki tüm işler BrokenProcessPool alır); havuzu yeniden kur"""
+        if self._pool is not broken:
+            return  # aynı çökmeyi gören başka bir grup havuzu zaten yeniledi
+        self.stats['pool_restarts'] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+        await self._start_pool()
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        # açık kalan (keep-alive) bağlantılar kapatılır
+        for connection in self._connections:
+            connection.cancel()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, return_exceptions=True)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def health(self) -> Dict:
+        batches = self.stats['batches']
+        return {
+            'status': 'ok',
+            'workers': self.workers,
+            'queue': {'size': self._queue.qsize() if self._queue else 0, 'capacity': self.queue_size},
+            'average_batch_size': round(self.stats['petitions'] / batches, 2) if batches else 0.0,
+            **self.stats,
+        }
+
+    # --- analiz kuyruğu ---
+
+    async def analyze_many(self, texts: Sequence[str], profile: str = 'full') -> List[Dict]:
+        """
+        dilekçeleri kuyruğa al ve sonuçları bekle
+
+        kuyruk kapasitesinden büyük grup hiçbir zaman sığamaz (413); kuyrukta o an
+        yer yoksa hiçbiri alınmaz ve istemci yeniden denemeye yönlendirilir (429)
+        """
+        if len(texts) > self.queue_size:
+            raise HttpError(413, f"grup en fazla {self.queue_size} dilekçe içerebilir")
+        if self._queue.maxsize - self._queue.qsize() < len(texts):
+            self.stats['rejected'] += 1
+            raise HttpError(429, "analiz kuyruğu dolu", {'Retry-After': '1'})
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._queue.put_nowait((text, profile, future))
+            futures.append(future)
+        self._arrival.set()
+        return list(await asyncio.gather(*futures))
+
+    async def _run_batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # bir işçi boşalmadan kuyruktan alınmaz: işçiler meşgulken kuyruk dolar (geri basınç)
+            await self._slots.acquire()
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                # kuyruk öğesi wait_for iptaliyle kaybolmasın diye yalnızca varış sinyali beklenir
+                self._arrival.clear()
+                try:
+                    await asyncio.wait_for(self._arrival.wait(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[str, str, asyncio.Future]]):
+        """mikro grubu profillerine göre böl ve havuzda analiz et"""
+        try:
+            by_profile: Dict[str, List[Tuple[str, str, asyncio.Future]]] = {}
+            for item in batch:
+                by_profile.setdefault(item[1], []).append(item)
+            for profile, items in by_profile.items():
+                try:
+                    results = await self._analyze_on_pool([text for text, _, _ in items], profile)
+                except Exception as error:
+                    results = [failed_result(error) for _ in items]
+                self.stats['batches'] += 1
+                self.stats['petitions'] += len(items)
+                for (_, _, future), result in zip(items, results):
+                    if is_failed_result(result):
+                        self.stats['failed_petitions'] += 1
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._slots.release()
+
+    async def _analyze_on_pool(self, texts: List[str], profile: str) -> List[Dict]:
+        """
+        grubu havuzda analiz et; havuz bozuksa yenilenir ve grup bir kez daha denenir
+
+        havuzu önceki bir grup çökertmiş olabilir; grup yeni havuzu da çökertirse hata kaydı alır
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = self._pool
+            try:
+                return await loop.run_in_executor(pool, _analyze_service_batch, texts, profile)
+            except BrokenProcessPool:
+                await self._restart_pool(pool)
+                if attempt:
+                    raise
+
+    # --- HTTP ---
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        try:
+            while True:
+                try:
+                    method, path, headers, body = await self._read_request(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except HttpError as error:
+                    await self._write_response(writer, error.status, {'error': str(error)}, keep_alive=False)
+                    break
+
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                extra_headers: Dict[str, str] = {}
+                try:
+                    status, payload = 200, await self._route(method, path, body)
+                except HttpError as error:
+                    status, payload, extra_headers = error.status, {'error': str(error)}, error.headers
+                except Exception as error:
+                    status, payload = 500, {'error': f"{type(error).__name__}: {error}"}
+                await self._write_response(writer, status, payload, keep_alive, extra_headers)
+                if not keep_alive:
+                    break
+        finally:
+            self._connections.discard(connection)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str], bytes]:
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.LimitOverrunError:
+            raise HttpError(413, "istek başlığı çok büyük")
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, path, _ = lines[0].split(' ', 2)
+        except ValueError:
+            raise HttpError(400, "geçersiz istek satırı")
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            raise HttpError(400, "geçersiz Content-Length")
+        if length < 0:
+            raise HttpError(400, "geçersiz Content-Length")
+        if length > self.max_body_bytes:
+            raise HttpError(413, f"istek gövdesi {self.max_body_bytes} baytı aşıyor")
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), path.split('?', 1)[0], headers, body
+
+    async def _route(self, method: str, path: str, body: bytes) -> Dict:
+        if path == '/health':
+            if method != 'GET':
+                raise HttpError(405, "yalnızca GET")
+            return self.health()
+        if path not in ('/analyze', '/analyze_batch'):
+            raise HttpError(404, f"bilinmeyen uç nokta: {path}")
+        if method != 'POST':
+            raise HttpError(405, "yalnızca POST")
+
+        self.stats['requests'] += 1
+        try:
+            request = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError):
+            raise HttpError(400, "gövde geçerli bir JSON değil")
+        if not isinstance(request, dict):
+            raise HttpError(400, "gövde bir JSON nesnesi olmalı")
+        profile = request.get('profile', 'full')
+        try:
+            get_profile(profile)
+        except ValueError as error:
+            raise HttpError(400, str(error))
+
+        if path == '/analyze':
+            text = request.get('text')
+            if not isinstance(text, str) or not text.strip():
+                raise HttpError(400, "'text' boş olmayan bir metin olmalı")
+            result = (await self.analyze_many([text], profile))[0]
+            if is_failed_result(result):
+                raise HttpError(500, f"{result['error']['type']}: {result['error']['message']}")
+            return result
+
+        texts = request.get('texts')
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise HttpError(400, "'texts' metin listesi olmalı")
+        return {'results': await self.analyze_many(texts, profile)}
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, status: int, payload: Dict, keep_alive: bool,
+                              extra_headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        headers = {
+            'Content-Type': 'application/json; charset=utf-8',
+            'Content-Length': str(len(body)),
+            'Connection': 'keep-alive' if keep_alive else 'close',
+            **(extra_headers or {}),
+        }
+        head = f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in headers.items()
+        ) + "\r\n"
+        writer.write(head.encode('latin-1') + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+class BackgroundService:
+    """
+    servisi ayrı bir iş parçacığında, kendi olay döngüsünde çalıştırır (testler ve yük testi için)
+
+        with BackgroundService(AnalysisService(workers=2), port=0) as service:
+            ... http://127.0.0.1:{service.port}/analyze
+    """
+
+    def __init__(self, service: AnalysisService, host: str = '127.0.0.1', port: int = 0):
+        self.service = service
+        self.host = host
+        self.port = port
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    def __enter__(self) -> AnalysisService:
+        self._thread = threading.Thread(target=self._run, name='analysis-service', daemon=True)
+        self._thread.start()
+        self._started.wait()
+        if self._error is not None:
+            raise self._error
+        return self.service
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        asyncio.run_coroutine_threadsafe(self.service.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self.service.start(self.host, self.port))
+        except BaseException as error:
+            self._error = error
+            self._started.set()
+            self._loop.close()
+            return
+        self._started.set()
+        self._loop.run_forever()
+        self._loop.close()
@@ -0,0 +1,288 @@
+"""
+Uzun girdilerde doğrusal süreli pattern eşleştirme.
+
+Kural setindeki bazı pattern aileleri Python'un geri izlemeli (backtracking)
+motorunda girdi uzunluğuyla karesel büyür:
+
+  - run + sonek     : ([A-ZÇĞİÖŞÜ][a-zçğıöşü\\s]+)\\s+(?:belediyesi|Belediyesi)
+                      (gövde sınıfı boşluk içerdiği için her başlangıç noktası
+                      tüm cümleyi tarayıp geri izler)
+  - tembel önek     : (?:yaşadığım|oturduğum|ikametgahım).*?([A-Z..][a-z..]+\\s+[A-Z..][a-z..]+)
+  - bağlamsal adres : yaşıyor.*?([A-Z..][a-z..\\s/,-]+(?:mahallesi|...).*?)(?:\\.|,|$)
+
+Bu modül pattern metnini ayrıştırır ve aynı findall sonucunu doğrusal sürede
+üreten bir eşleştirici döndürür. Karakter sınıfı, sonek ve sonlandırıcı
+testleri yine derlenmiş re nesneleriyle yapılır (bayraklar aynen korunur);
+yalnızca "en uzun gövde / en soldaki başlangıç" araması, metin bir kez
+taranarak (boşluk + sonek konumları önceden toplanır) yapılır.
+
+Desteklenmeyen biçimdeki patternler için compile_bounded düz re.compile
+sonucunu döndürür.
+"""
+import re
+import sys
+from bisect import bisect_right
+from typing import List, Optional, Pattern, Tuple, Union
+
+_CLASS = r'\[(?:\\.|[^\]\\])+\]'
+
+# ([baş][gövde]+)<devam>
+_RUN_SUFFIX_SHAPE = re.compile(rf'^\((?P<head>{_CLASS})(?P<body>{_CLASS})\+\)(?P<trailer>.+)$', re.DOTALL)
+# <önek>.*?([baş][gövde]+\s+<devam>)
+_LAZY_NAME_SHAPE = re.compile(
+    rf'^(?P<prefix>[^.*?+()\[\]\\]+|\(\?:[^()\[\]\\.*?+]+\))\.\*\?'
+    rf'\((?P<head>{_CLASS})(?P<body>{_CLASS})\+(?P<trailer>\\s\+{_CLASS}[^()|]*)\)$',
+    re.DOTALL
+)
+# <önek>.*?([baş][gövde]+(?:sonek).*?)(?:sonlandırıcı)
+_LAZY_TAIL_SHAPE = re.compile(
+    rf'^(?P<prefix>[^.*?+()\[\]\\]+)\.\*\?'
+    rf'\((?P<head>{_CLASS})(?P<body>{_CLASS})\+(?P<trailer>\(\?:[^()]+\))\.\*\?\)'
+    rf'(?P<terminator>\(\?:[^()]+\))$',
+    re.DOTALL
+)
+
+_WHITESPACE = ' \t\n\r\f\v'
+
+
+def _split_alternatives(group: str) -> Optional[List[str]]:
+    """'(?:a|b)' -> ['a', 'b']; iç içe grup varsa None"""
+    if not (group.startswith('(?:') and group.endswith(')')):
+        return None
+    inner = group[3:-1]
+    if '(' in inner or ')' in inner:
+        return None
+    return inner.split('|')
+
+
+def _cannot_start_with_whitespace(rest: str, flags: int) -> bool:
+    """devam ifadesinin ilk atomu boşlukla eşleşemiyorsa True"""
+    if rest.startswith('['):
+        match = re.match(_CLASS, rest)
+        if not match:
+            return False
+        first = re.compile(match.group(), flags)
+        return not any(first.match(char) for char in _WHITESPACE)
+    if rest.startswith('(?:'):
+        end = rest.find(')')
+        alternatives = _split_alternatives(rest[:end + 1]) if end > 0 else None
+        return bool(alternatives) and all(
+            _cannot_start_with_whitespace(alternative, flags) for alternative in alternatives
+        )
+    return bool(rest) and rest[0].isalpha()
+
+
+def _distinct_literals(prefix: str) -> bool:
+    """önek alternatifleri birbirinin öneki değilse her konumda en fazla biri eşleşir"""
+    alternatives = _split_alternatives(prefix) if prefix.startswith('(?:') else [prefix]
+    if not alternatives or not all(alternatives):
+        return False
+    lowered = [alternative.casefold() for alternative in alternatives]
+    return not any(a != b and b.startswith(a) for a in lowered for b in lowered)
+
+
+class _RunScanner:
+    """
+    (baş)(gövde)+ ardından devam ifadesi gelen en soldaki eşleşmeyi bulur
+
+    gövdenin bittiği e konumu için devam ifadesinin (trailer) e'de eşleşip
+    eşleşmediği yalnızca e'ye bağlıdır. metin başına bir kez, geçerli e
+    konumları aralıklar halinde toplanır:
+      - '\\s+<rest>' biçimi: <rest>'ten önceki her boşluk dizisi [b, w) -> e ∈ [b, w-1]
+      - diğer biçimler: devamın eşleştiği her konum -> e ∈ [b, b]
+    bir gövde dizisinde (run) açgözlü gövde en büyük geçerli e'yi seçer; bu da
+    ikili arama ile bulunur. böylece her karakter sabit sayıda kez taranır
+    """
+
+    def __init__(self, head: str, body: str, trailer: str, flags: int):
+        self.head = re.compile(head, flags)
+        self.body_run = re.compile(f'{body}+', flags)
+        self.trailer = re.compile(trailer, flags)
+
+        rest = trailer[3:] if trailer.startswith(r'\s+') else None
+        if rest and _cannot_start_with_whitespace(rest, flags):
+            self._gaps = re.compile(rf'(?<!\s)\s+(?={rest})', flags)
+            self._spaced = True
+        else:
+            self._gaps = re.compile(f'(?={trailer})', flags)
+            self._spaced = False
+
+    def valid_ends(self, text: str) -> Tuple[List[int], List[int]]:
+        """(aralık başları, aralıktaki son geçerli e) listeleri"""
+        starts, lasts = [], []
+        for match in self._gaps.finditer(text):
+            starts.append(match.start())
+            lasts.append(match.end() - 1 if self._spaced else match.start())
+        return starts, lasts
+
+    def first(self, text: str, lo: int, ends: Tuple[List[int], List[int]]) -> Optional[Tuple[int, int, int]]:
+        """lo'dan itibaren en soldaki eşleşme: (başlangıç, gövde sonu, devam sonu) ya da None"""
+        starts, lasts = ends
+        if not starts:
+            return None
+
+        cursor = lo
+        while True:
+            run = self.body_run.search(text, cursor)
+            if run is None:
+                return None
+            run_start, run_end = run.span()
+            if starts[0] > run_end:
+                cursor = run_end
+                continue
+
+            index = bisect_right(starts, run_end) - 1
+            body_end = min(lasts[index], run_end)
+            low = max(lo, run_start - 1)
+            high = body_end - 2
+
+            if high >= low:
+                head = self.head.search(text, low, high + 1)
+                if head is not None:
+                    trailer = self.trailer.match(text, body_end)
+                    return head.start(), body_end, trailer.end()
+
+            if index == len(starts) - 1 and lasts[index] < run_end:
+                # son geçerli konum geride kaldı
+                return None
+            cursor = max(run_end, cursor + 1)
+
+
+class BoundedPattern:
+    """
+    doğrusal süreli findall sağlayan re.Pattern benzeri nesne
+
+    findall dışındaki öznitelikler (search, finditer, ...) derlenmiş özgün
+    pattern'e yönlendirilir; bunlar için süre garantisi yoktur
+    """
+
+    def __init__(self, regex: Pattern):
+        self._regex = regex
+
+    @property
+    def pattern(self) -> str:
+        return self._regex.pattern
+
+    @property
+    def flags(self) -> int:
+        return self._regex.flags
+
+    def __getattr__(self, name):
+        if name == '_regex':
+            raise AttributeError(name)
+        return getattr(self._regex, name)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._regex.pattern!r})"
+
+    def findall(self, string: str, pos: int = 0, endpos: int = sys.maxsize) -> List[str]:
+        if endpos < len(string):
+            string = string[:max(endpos, 0)]
+        return self._findall(string, max(pos, 0))
+
+    def _findall(self, text: str, pos: int) -> List[str]:
+        raise NotImplementedError
+
+
+class RunSuffixPattern(BoundedPattern):
+    """([baş][gövde]+)<devam> - grup yalnızca baş + gövde"""
+
+    def __init__(self, regex: Pattern, head: str, body: str, trailer: str):
+        super().__init__(regex)
+        self._scanner = _RunScanner(head, body, trailer, regex.flags)
+
+    def _findall(self, text: str, pos: int) -> List[str]:
+        ends = self._scanner.valid_ends(text)
+        found = []
+        while True:
+            match = self._scanner.first(text, pos, ends)
+            if match is None:
+                return found
+            start, body_end, pos = match
+            found.append(text[start:body_end])
+
+
+class LazyPrefixPattern(BoundedPattern):
+    """
+    <önek>.*?(<run + devam>)[.*?)(sonlandırıcı)]
+
+    önekten sonra en soldaki run eşleşmesi aranır; DOTALL yoksa aradaki metin
+    satır sonu içeremez. ardışık önekler aynı sonucu paylaştığı için son sorgu
+    saklanır (art arda gelen öneklerde metin yeniden taranmaz)
+    """
+
+    def __init__(self, regex: Pattern, prefix: str, head: str, body: str, trailer: str,
+                 terminator: Optional[str] = None):
+        super().__init__(regex)
+        flags = regex.flags
+        self._prefix = re.compile(prefix, flags)
+        self._scanner = _RunScanner(head, body, trailer, flags)
+        self._terminator = re.compile(terminator, flags) if terminator else None
+        self._dotall = bool(flags & re.DOTALL)
+
+    def _findall(self, text: str, pos: int) -> List[str]:
+        ends = self._scanner.valid_ends(text)
+        if not ends[0]:
+            return []
+
+        found = []
+        cached_lo, cached = None, None
+        newline = -1
+        prefix = self._prefix.search(text, pos)
+
+        while prefix is not None:
+            lo = prefix.end()
+            if cached_lo is not None and cached_lo <= lo and (cached is None or cached[0] >= lo):
+                match = cached
+            else:
+                match = self._scanner.first(text, lo, ends)
+                cached_lo, cached = lo, match
+            if match is None:
+                prefix = self._prefix.search(text, prefix.start() + 1)
+                continue
+
+            start, _, trailer_end = match
+            if not self._dotall:
+                if newline < lo:
+                    newline = text.find('\n', lo)
+                    if newline < 0:
+                        newline = len(text)
+                if start > newline:
+                    prefix = self._prefix.search(text, prefix.start() + 1)
+                    continue
+
+            if self._terminator is None:
+                found.append(text[start:trailer_end])
+                pos = trailer_end
+            else:
+                terminator = self._terminator.search(text, trailer_end)
+                found.append(text[start:terminator.start()])
+                pos = terminator.end()
+            prefix = self._prefix.search(text, pos)
+
+        return found
+
+
+def compile_bounded(pattern: str, flags: int = 0) -> Union[Pattern, BoundedPattern]:
+    """
+    pattern biçimi tanınıyorsa doğrusal süreli eşleştirici, değilse re.compile sonucu
+
+    yalnızca gövde sınıfı boşluk içeren run patternleri sarılır: gövdesi tek
+    kelimeyle sınırlı olanlar re motorunda zaten doğrusal çalışır
+    """
+    regex = re.compile(pattern, flags)
+
+    shape = _LAZY_TAIL_SHAPE.match(pattern)
+    if shape and flags & re.DOTALL and _distinct_literals(shape['prefix']):
+        return LazyPrefixPattern(regex, shape['prefix'], shape['head'], shape['body'], shape['trailer'],
+                                 shape['terminator'])
+
+    shape = _LAZY_NAME_SHAPE.match(pattern)
+    if shape and _distinct_literals(shape['prefix']):
+        return LazyPrefixPattern(regex, shape['prefix'], shape['head'], shape['body'], shape['trailer'])
+
+    shape = _RUN_SUFFIX_SHAPE.match(pattern)
+    if shape and re.compile(shape['body'], flags).match(' '):
+        return RunSuffixPattern(regex, shape['head'], shape['body'], shape['trailer'])
+
+    return regex
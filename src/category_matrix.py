@@ -0,0 +1,174 @@
+"""
+Konu kategorisi puanlamasının seyrek matris hali (toplu yeniden etiketleme için).
+
+Kategori tabloları bir kez anahtar kelime × kategori matrislerine derlenir:
+    weights       birincil = 3, ikincil = 2 (aynı kelime listede tekrar ederse toplanır)
+    context       bağlam kelimesi göstergesi
+    problem       problem kelimesi göstergesi
+    multiplicity  kelimenin kategorinin tüm listelerindeki geçiş sayısı (yakınlık bonusu)
+Bir doküman grubu, terim sayısı matrisi (doküman × kelime) ve cümle matrisi
+(cümle × kelime) ile bu matrislerin çarpımı olarak puanlanır.
+
+PetitionAnalyzer._ultra_comprehensive_category_classification ile birebir aynı
+puanları üretir: taban puan ve bonuslar tam sayı / yarım katları olduğundan
+toplama sırası sonucu değiştirmez, çarpanlar ise aynı sırayla uygulanır.
+"""
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+from scipy import sparse
+
+from src.keyword_index import KeywordHits
+from src.pattern_registry import CORE_PATTERNS, PROXIMITY_COMBOS
+
+PRIMARY_WEIGHT = 3.0
+SECONDARY_WEIGHT = 2.0
+CONTEXT_MULTIPLIER = 0.2
+PROBLEM_MULTIPLIER = 0.15
+
+
+class CategoryMatrix:
+    """
+    subject_categories: kategori -> {'primary_keywords': [...], 'secondary_keywords': [...], ...}
+    proximity_combos: cümle içi kombinasyon bonusu veren kelime grupları
+    """
+
+    def __init__(self, subject_categories: Optional[Dict[str, Dict[str, List[str]]]] = None,
+                 proximity_combos: Sequence[Sequence[str]] = PROXIMITY_COMBOS):
+        subject_categories = subject_categories or CORE_PATTERNS['subject_categories']
+        self.categories = list(subject_categories)
+
+        vocabulary: Dict[str, int] = {}
+        for keywords_dict in subject_categories.values():
+            for keyword_list in keywords_dict.values():
+                if isinstance(keyword_list, list):
+                    for keyword in keyword_list:
+                        vocabulary.setdefault(keyword, len(vocabulary))
+        for combo in proximity_combos:
+            for keyword in combo:
+                vocabulary.setdefault(keyword, len(vocabulary))
+        self.vocabulary = vocabulary
+        self.keywords = list(vocabulary)
+
+        entries = {'weights': [], 'context': [], 'problem': [], 'multiplicity': []}
+        for column, keywords_dict in enumerate(subject_categories.values()):
+            for keyword in keywords_dict.get('primary_keywords', []):
+                entries['weights'].append((vocabulary[keyword], column, PRIMARY_WEIGHT))
+            for keyword in keywords_dict.get('secondary_keywords', []):
+                entries['weights'].append((vocabulary[keyword], column, SECONDARY_WEIGHT))
+            for keyword in keywords_dict.get('context_keywords', []):
+                entries['context'].append((vocabulary[keyword], column, 1.0))
+            for keyword in keywords_dict.get('problem_keywords', []):
+                entries['problem'].append((vocabulary[keyword], column, 1.0))
+            for keyword_list in keywords_dict.values():
+                if isinstance(keyword_list, list):
+                    for keyword in keyword_list:
+                        entries['multiplicity'].append((vocabulary[keyword], column, 1.0))
+
+        shape = (len(vocabulary), len(self.categories))
+        self.weights = _sparse(entries['weights'], shape)
+        self.context = _sparse(entries['context'], shape)
+        self.problem = _sparse(entries['problem'], shape)
+        self.multiplicity = _sparse(entries['multiplicity'], shape)
+        self.combos = _sparse([(vocabulary[keyword], index, 1.0)
+                               for index, combo in enumerate(proximity_combos) for keyword in set(combo)],
+                              (len(vocabulary), len(proximity_combos)))
+
+    def count_matrix(self, hits_list: Sequence[KeywordHits]) -> sparse.csr_matrix:
+        """doküman × kelime terim sayıları (hits.count ile aynı: örtüşmeyen eşleşmeler)"""
+        rows, columns, counts = [], [], []
+        for row, hits in enumerate(hits_list):
+            for keyword in hits.positions:
+                column = self.vocabulary.get(keyword)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+                    counts.append(hits.count(keyword))
+        return sparse.csr_matrix((counts, (rows, columns)), shape=(len(hits_list), len(self.vocabulary)),
+                                 dtype=np.float64)
+
+    def sentence_matrix(self, sentence_keywords_list: Sequence[List[Set[str]]]):
+        """
+        (cümle × kelime gösterge matrisi, cümlenin doküman indeksi)
+
+        sentence_keywords_list: her doküman için DocumentContext.sentence_keywords
+        """
+        rows, columns, owners = [], [], []
+        for document, sentence_keywords in enumerate(sentence_keywords_list):
+            for found_in_sentence in sentence_keywords:
+                row = len(owners)
+                owners.append(document)
+                for keyword in found_in_sentence:
+                    column = self.vocabulary.get(keyword)
+                    if column is not None:
+                        rows.append(row)
+                        columns.append(column)
+        matrix = sparse.csr_matrix((np.ones(len(rows)), (rows, columns)), shape=(len(owners), len(self.vocabulary)))
+        return matrix, np.asarray(owners, dtype=np.int64)
+
+    def score(self, counts: sparse.csr_matrix, sentences: sparse.csr_matrix,
+              sentence_owner: np.ndarray) -> np.ndarray:
+        """doküman × kategori toplam puanları"""
+        base = (counts @ self.weights).toarray()
+        present = (counts > 0).astype(np.float64)
+        context = (present @ self.context).toarray()
+        problem = (present @ self.problem).toarray()
+
+        scores = base.copy()
+        boost = (base > 0) & (context > 0)
+        scores[boost] *= 1 + context[boost] * CONTEXT_MULTIPLIER
+        boost = (base > 0) & (problem > 0)
+        scores[boost] *= 1 + problem[boost] * PROBLEM_MULTIPLIER
+
+        return scores + self._proximity_bonus(sentences, sentence_owner, counts.shape[0])
+
+    def _proximity_bonus(self, sentences: sparse.csr_matrix, sentence_owner: np.ndarray,
+                         documents: int) -> np.ndarray:
+        """cümlede kategoriden birden fazla kelime varsa: 0.5 * kelime sayısı + eşleşen kombinasyon sayısı"""
+        found = (sentences @ self.multiplicity).toarray()
+        combo_hits = np.asarray(((sentences @ self.combos) > 0).sum(axis=1), dtype=np.float64)
+        per_sentence = np.where(found > 1, found * 0.5 + combo_hits, 0.0)
+
+        bonus = np.zeros((documents, len(self.categories)))
+        np.add.at(bonus, sentence_owner, per_sentence)
+        return bonus
+
+    def classify(self, scores: np.ndarray) -> List[Dict]:
+        """
+        her satır için _ultra_comprehensive_category_classification(details=False) ile aynı sözlük
+        """
+        results = []
+        for row in scores:
+            category_scores = {category: float(score) for category, score in zip(self.categories, row) if score > 0}
+            result = {
+                'primary_category': None,
+                'confidence': 0.0,
+                'all_categories': category_scores,
+                'category_details': {},
+                'classification_method': 'ultra_comprehensive'
+            }
+            if category_scores:
+                primary_category = max(category_scores, key=category_scores.get)
+                max_score = category_scores[primary_category]
+                total_all_scores = sum(category_scores.values())
+                result.update({
+                    'primary_category': primary_category,
+                    'confidence': min(max_score / max(total_all_scores, 1), 1.0),
+                    'score_distribution': {cat: score / total_all_scores for cat, score in category_scores.items()}
+                })
+            results.append(result)
+        return results
+
+    def classify_hits(self, hits_list: Sequence[KeywordHits],
+                      sentence_keywords_list: Sequence[List[Set[str]]]) -> List[Dict]:
+        """taranmış dokümanları tek matris çarpımıyla sınıflandır"""
+        sentences, sentence_owner = self.sentence_matrix(sentence_keywords_list)
+        return self.classify(self.score(self.count_matrix(hits_list), sentences, sentence_owner))
+
+
+def _sparse(entries, shape) -> sparse.csr_matrix:
+    """(satır, sütun, değer) girdilerinden CSR matris; tekrar eden girdiler toplanır"""
+    if not entries:
+        return sparse.csr_matrix(shape, dtype=np.float64)
+    rows, columns, values = zip(*entries)
+    return sparse.coo_matrix((values, (rows, columns)), shape=shape, dtype=np.float64).tocsr()
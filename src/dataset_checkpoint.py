@@ -0,0 +1,162 @@
+"""
+Uzun veri seti üretimleri için devam ettirilebilir kontrol noktası.
+
+Kontrol noktası klasöründe iki dosya bulunur:
+    rows.jsonl     : analiz edilip yazılmış satırlar (yalnızca ekleme)
+    manifest.jsonl : ilk satır başlık (çıktı, algoritma sürümü), sonraki her satır
+                     bir doküman: {"hash", "status": "written" | "failed", "end"}
+
+Her grupta önce satırlar rows.jsonl'e yazılıp diske indirilir, ardından
+manifest satırları eklenir; "end" satırın rows.jsonl'deki bitiş ofsetidir.
+Bu sırayla bir çökme en fazla manifestte olmayan satırlar bırakır: devam
+ederken rows.jsonl son kaydedilen ofsete kırpılır ve o dokümanlar yeniden
+analiz edilir. Dokümanlar içerik özetiyle (normalleştirilmiş metnin
+sha256'sı) anahtarlanır; aynı metin birden fazla kez geçiyorsa her geçiş
+ayrı sayılır.
+"""
+import hashlib
+import json
+import os
+import shutil
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.result_cache import normalize_text
+
+MANIFEST_NAME = "manifest.jsonl"
+ROWS_NAME = "rows.jsonl"
+
+
+class CheckpointError(ValueError):
+    """manifest ile satır dosyası tutarsız ya da başka bir çalışmaya ait"""
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+class DatasetCheckpoint:
+    """
+    directory: kontrol noktası klasörü
+    output: üretilecek veri seti (başlıkta saklanır, devam ederken karşılaştırılır)
+    version: analiz sürümü; farklı sürümle üretilmiş satırlara devam edilmez
+    """
+
+    def __init__(self, directory: str, output: str, version: str):
+        self.directory = directory
+        self.output = output
+        self.version = version
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self.rows_path = os.path.join(directory, ROWS_NAME)
+        # tamamlanmış dokümanlar: içerik özeti -> geçiş sayısı
+        self.completed: Counter = Counter()
+        self.rows_written = 0
+        self.failed = 0
+        self._rows_end = 0
+
+    def start(self, resume: bool = False) -> 'DatasetCheckpoint':
+        """
+        resume=False: klasörü sıfırla ve yeni çalışma başlat
+        resume=True : manifesti oku, satır dosyasıyla tutarlılığı doğrula ve kaldığı yerden devam et
+        """
+        if resume and os.path.exists(self.manifest_path):
+            self._load_and_verify()
+        else:
+            if os.path.isdir(self.directory):
+                shutil.rmtree(self.directory)
+            os.makedirs(self.directory)
+            header = {'output': os.path.abspath(self.output), 'version': self.version}
+            self._append(self.manifest_path, [(json.dumps(header, ensure_ascii=False) + '\n').encode('utf-8')])
+            open(self.rows_path, 'wb').close()
+        return self
+
+    def is_completed(self, text_hash: str) -> bool:
+        """doküman daha önceki bir çalışmada işlendiyse bir geçişi tüket ve True döndür"""
+        if self.completed[text_hash] > 0:
+            self.completed[text_hash] -= 1
+            return True
+        return False
+
+    def commit(self, rows: List[Tuple[str, Optional[Dict]]]):
+        """
+        bir grubun sonuçlarını kalıcı yap: (içerik özeti, satır) çiftleri; satır None ise
+        doküman analiz edilemedi demektir ve yeniden denenmez
+        """
+        lines, entries = [], []
+        for text_hash, row in rows:
+            if row is None:
+                entries.append({'hash': text_hash, 'status': 'failed'})
+                continue
+            line = (json.dumps(row, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+            lines.append(line)
+            self._rows_end += len(line)
+            entries.append({'hash': text_hash, 'status': 'written', 'end': self._rows_end})
+
+        self._append(self.rows_path, lines)
+        self._append(self.manifest_path, [(json.dumps(entry) + '\n').encode('utf-8') for entry in entries])
+        self.rows_written += len(lines)
+        self.failed += len(entries) - len(lines)
+
+    def iter_rows(self) -> Iterator[Dict]:
+        """yazılmış tüm satırlar, yazılma sırasıyla"""
+        with open(self.rows_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+
+    def _load_and_verify(self):
+        with open(self.manifest_path, 'rb') as f:
+            lines = f.readlines()
+        # yarım kalan son manifest satırı yazılmamış sayılır
+        if lines and not lines[-1].endswith(b'\n'):
+            lines.pop()
+        if not lines:
+            raise CheckpointError(f"'{self.manifest_path}' başlığı okunamadı")
+
+        header = json.loads(lines[0])
+        if header.get('output') != os.path.abspath(self.output):
+            raise CheckpointError(f"kontrol noktası başka bir çıktıya ait: {header.get('output')}")
+        if header.get('version') != self.version:
+            raise CheckpointError(
+                f"kontrol noktası farklı bir analiz sürümüyle üretilmiş ({header.get('version')} != {self.version})"
+            )
+
+        end = 0
+        for line in lines[1:]:
+            entry = json.loads(line)
+            self.completed[entry['hash']] += 1
+            if entry['status'] == 'written':
+                end = entry['end']
+                self.rows_written += 1
+            else:
+                self.failed += 1
+
+        size = os.path.getsize(self.rows_path) if os.path.exists(self.rows_path) else -1
+        if size < end:
+            raise CheckpointError(
+                f"'{self.rows_path}' manifestten kısa ({size} < {end} bayt); kontrol noktası kullanılamaz"
+            )
+        # manifeste geçmeden kalan satırlar atılır, o dokümanlar yeniden analiz edilir
+        with open(self.rows_path, 'rb+') as f:
+            f.truncate(end)
+            counted = sum(1 for _ in f)
+            if end:
+                f.seek(end - 1)
+                if f.read(1) != b'\n':
+                    raise CheckpointError(f"'{self.rows_path}' manifestteki ofsette satır sonu yok")
+        if counted != self.rows_written:
+            raise CheckpointError(
+                f"manifestte {self.rows_written} satır var, '{self.rows_path}' {counted} satır içeriyor"
+            )
+        self._rows_end = end
+
+        # yarım manifest satırı atıldıysa dosyayı da kırp
+        with open(self.manifest_path, 'rb+') as f:
+            f.truncate(sum(len(line) for line in lines))
+
+    @staticmethod
+    def _append(path: str, lines: List[bytes]):
+        """satırları ekle ve diske indir (sonraki dosyaya geçmeden önce kalıcı olsun)"""
+        with open(path, 'ab') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,243 @@
+"""
+Parça parça diske yazan veri seti yazıcıları.
+
+Kayıtlar bellekte yalnızca bir parça (chunk_size satır) kadar tutulur; parça
+dolunca dosyaya eklenir. Böylece bellek kullanımı veri seti boyutundan
+bağımsızdır ve çalışma yarıda kesilse bile o ana kadar yazılan satırlar kalır.
+
+Tablo biçimlerinin sütunları, DataFrame(rows) gibi tüm kayıtlardaki anahtarların
+birleşimidir (ilk görülme sırasıyla); bir kayıtta olmayan sütun boş kalır.
+
+Desteklenen biçimler (dosya uzantısından seçilir):
+  .jsonl   : her satır bir JSON kaydı (iç içe alanlar korunur)
+  .csv     : pandas.to_csv ile aynı hücre biçimi; yeni sütun gelirse başlık yeniden yazılır
+  .xlsx    : openpyxl write-only çalışma kitabı (satırlar geçici dosyada biriktirilir)
+  .parquet : pyarrow gerekir (isteğe bağlı bağımlılık)
+"""
+import csv
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+def _cell_value(value):
+    """tablo biçimleri için hücre değeri: iç içe yapılar DataFrame.to_excel'deki gibi str() olarak yazılır"""
+    if isinstance(value, (dict, list, tuple, set)):
+        return str(value)
+    return value
+
+
+class ChunkedDatasetWriter:
+    """
+    temel yazıcı: kayıtları biriktirir, parça dolunca _write_rows ile diske ekler
+
+    sütunlar tüm kayıtların anahtar birleşimidir; yeni anahtarlar sona eklenir, kaydında
+    olmayan sütunlar boş bırakılır (tablo biçimleri için). bağlam yöneticisi olarak kullanılabilir
+    """
+
+    def __init__(self, path: str, chunk_size: int = 500):
+        self.path = path
+        self.chunk_size = max(1, chunk_size)
+        self.columns: Optional[List[str]] = None
+        self._column_set = set()
+        self.rows_written = 0
+        self._buffer: List[Dict] = []
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, record: Dict):
+        if self.columns is None:
+            self.columns = []
+        for key in record:
+            if key not in self._column_set:
+                self._column_set.add(key)
+                self.columns.append(key)
+        self._buffer.append(record)
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def write_many(self, records: Iterable[Dict]):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        self._write_rows(self._buffer)
+        self.rows_written += len(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        self.flush()
+        self._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _tabular_rows(self, records: List[Dict]) -> List[List]:
+        return [[_cell_value(record.get(column)) for column in self.columns] for record in records]
+
+    def _write_rows(self, records: List[Dict]):
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+
+class JsonlDatasetWriter(ChunkedDatasetWriter):
+    """her kayıt bir JSON satırı; iç içe alanlar olduğu gibi kalır"""
+
+    def __init__(self, path: str, chunk_size: int = 500):
+        super().__init__(path, chunk_size)
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def _write_rows(self, records: List[Dict]):
+        for record in records:
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str))
+            self._file.write('\n')
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class CsvDatasetWriter(ChunkedDatasetWriter):
+    """
+    başlık ilk parçanın sütunlarıyla yazılır; sonraki bir parçada yeni sütun görülürse dosya
+    genişletilmiş başlıkla yeniden yazılır (önceki satırlarda yeni sütunlar boş kalır)
+    """
+
+    def __init__(self, path: str, chunk_size: int = 500):
+        super().__init__(path, chunk_size)
+        self._header: Optional[List[str]] = None
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file)
+
+    def _write_rows(self, records: List[Dict]):
+        if self._header is None:
+            self._header = list(self.columns)
+            self._writer.writerow(self._header)
+        elif len(self.columns) > len(self._header):
+            self._rewrite_header()
+        self._writer.writerows(
+            ['' if value is None else value for value in row] for row in self._tabular_rows(records)
+        )
+        self._file.flush()
+
+    def _rewrite_header(self):
+        self._file.close()
+        temporary_path = f"{self.path}.tmp"
+        with open(self.path, encoding='utf-8', newline='') as source, \
+                open(temporary_path, 'w', encoding='utf-8', newline='') as target:
+            next(csv.reader(source))
+            csv.writer(target).writerow(self.columns)
+            shutil.copyfileobj(source, target)
+        os.replace(temporary_path, self.path)
+        self._header = list(self.columns)
+        self._file = open(self.path, 'a', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file)
+
+    def _close(self):
+        self._file.close()
+
+
+class _SpooledDatasetWriter(ChunkedDatasetWriter):
+    """
+    başlığı sonradan değiştirilemeyen biçimler: parçalar geçici dosyada biriktirilir,
+    tablo kapanışta kesinleşen sütunlarla parça parça yazılır (bellekte yine tek parça)
+    """
+
+    def __init__(self, path: str, chunk_size: int = 500):
+        super().__init__(path, chunk_size)
+        self._spool = tempfile.TemporaryFile()
+
+    def _write_rows(self, records: List[Dict]):
+        pickle.dump(records, self._spool, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _spooled_chunks(self) -> Iterator[List[Dict]]:
+        self._spool.seek(0)
+        while True:
+            try:
+                yield pickle.load(self._spool)
+            except EOFError:
+                return
+
+    def _close(self):
+        try:
+            if self.columns is not None:
+                self._write_table(self._spooled_chunks())
+        finally:
+            self._spool.close()
+
+    def _write_table(self, chunks: Iterator[List[Dict]]):
+        raise NotImplementedError
+
+
+class ExcelDatasetWriter(_SpooledDatasetWriter):
+    """openpyxl write-only modu: satırlar bellekte tutulmaz, çalışma kitabına akıtılır"""
+
+    def __init__(self, path: str, chunk_size: int = 500):
+        super().__init__(path, chunk_size)
+        from openpyxl import Workbook
+
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet()
+
+    def _write_table(self, chunks: Iterator[List[Dict]]):
+        self._sheet.append(self.columns)
+        for records in chunks:
+            for row in self._tabular_rows(records):
+                self._sheet.append(row)
+
+    def _close(self):
+        super()._close()
+        self._workbook.save(self.path)
+
+
+class ParquetDatasetWriter(_SpooledDatasetWriter):
+    """her parça ayrı bir row group olarak yazılır; tüm sütunlar metin"""
+
+    def __init__(self, path: str, chunk_size: int = 500):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as error:
+            raise ImportError("Parquet çıktısı için 'pyarrow' kurulmalı: pip install pyarrow") from error
+
+        super().__init__(path, chunk_size)
+        self._pyarrow = pyarrow
+        self._parquet = pyarrow.parquet
+
+    def _write_table(self, chunks: Iterator[List[Dict]]):
+        pa = self._pyarrow
+        schema = pa.schema([(column, pa.string()) for column in self.columns])
+        with self._parquet.ParquetWriter(self.path, schema) as writer:
+            for records in chunks:
+                columns = list(zip(*self._tabular_rows(records)))
+                arrays = [pa.array([None if value is None else str(value) for value in column], pa.string())
+                          for column in columns]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+
+WRITERS = {
+    '.jsonl': JsonlDatasetWriter,
+    '.csv': CsvDatasetWriter,
+    '.xlsx': ExcelDatasetWriter,
+    '.parquet': ParquetDatasetWriter,
+}
+
+
+def open_dataset_writer(path: str, chunk_size: int = 500) -> ChunkedDatasetWriter:
+    """dosya uzantısına göre uygun yazıcıyı aç"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f"Desteklenmeyen veri seti biçimi: '{extension}' ({', '.join(WRITERS)})")
+    return WRITERS[extension](path, chunk_size)
@@ -0,0 +1,123 @@
+"""
+Dilekçe başına bir kez kurulan doküman bağlamı.
+
+Küçük harfe çevirme, anahtar kelime taraması, satır / cümle / kelime
+sınırları gibi normalizasyonlar her katmanda yeniden yapılmak yerine burada
+bir kez (ilk ihtiyaç anında) hesaplanır ve tüm katmanlara aynı nesne geçirilir.
+Satır, cümle ve kelimeler metnin kopyaları olarak değil, orijinal metin
+üzerindeki (start, end) ofsetleri olarak tutulur.
+"""
+from bisect import bisect_left
+from functools import cached_property
+from typing import List, Optional, Set, Tuple
+
+from src.keyword_index import KeywordAutomaton, KeywordHits, get_keyword_index
+from src.pattern_registry import get_pattern_registry
+
+Span = Tuple[int, int]
+
+# Türkçe büyük I / İ dönüşümü: str.lower() 'İ' harfini iki karaktere ('i̇') çevirir
+_TURKISH_UPPER = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+
+def turkish_lower(text: str) -> str:
+    """Türkçe kurallarıyla küçük harfe çevir (uzunluk korunur, ofsetler değişmez)"""
+    return text.translate(_TURKISH_UPPER).lower()
+
+
+def _strip_span(text: str, start: int, end: int) -> Optional[Span]:
+    """aralığın başındaki ve sonundaki boşlukları at; boş kalırsa None"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return (start, end) if start < end else None
+
+
+class DocumentContext:
+    """
+    tek bir dilekçenin paylaşılan analiz bağlamı
+
+    tüm alanlar tembel hesaplanır ve önbelleğe alınır: her normalizasyon
+    doküman başına en fazla bir kez yapılır
+    """
+
+    def __init__(self, text: str, keyword_index: Optional[KeywordAutomaton] = None):
+        self.text = text
+        self._keyword_index = keyword_index
+        self._patterns = get_pattern_registry()
+
+    @cached_property
+    def lower(self) -> str:
+        """Türkçe küçük harfli metin (orijinal metinle aynı uzunlukta)"""
+        return turkish_lower(self.text)
+
+    @cached_property
+    def hits(self) -> KeywordHits:
+        """tüm anahtar kelime tablolarının tek geçişli tarama sonucu"""
+        index = self._keyword_index or get_keyword_index()
+        return index.scan(self.lower)
+
+    @cached_property
+    def token_spans(self) -> List[Span]:
+        """kelime sınırları"""
+        return [match.span() for match in self._patterns.token.finditer(self.text)]
+
+    @cached_property
+    def line_spans(self) -> List[Span]:
+        """satır ofsetleri (text.split('\\n') ile aynı satırlar, boş satırlar dahil)"""
+        spans = []
+        start = 0
+        while True:
+            end = self.text.find('\n', start)
+            if end == -1:
+                spans.append((start, len(self.text)))
+                return spans
+            spans.append((start, end))
+            start = end + 1
+
+    @cached_property
+    def piece_spans(self) -> List[Span]:
+        """noktalama ile ayrılmış, baş/son boşlukları atılmış boş olmayan parçalar"""
+        spans = []
+        for match in self._patterns.sentence_piece.finditer(self.text):
+            span = _strip_span(self.text, match.start(), match.end())
+            if span:
+                spans.append(span)
+        return spans
+
+    @cached_property
+    def sentence_spans(self) -> List[List[Span]]:
+        """akıllı cümleler - her cümle, parçalarının ofsetleri (kısa parçalar öncekine eklenir)"""
+        token_starts = [start for start, _ in self.token_spans]
+        sentences = []
+        for start, end in self.piece_spans:
+            token_count = bisect_left(token_starts, end) - bisect_left(token_starts, start)
+            if token_count < 5 and sentences:
+                sentences[-1].append((start, end))
+            else:
+                sentences.append([(start, end)])
+        return sentences
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """akıllı cümlelerin metinleri"""
+        return [". ".join(self.text[start:end] for start, end in pieces)
+                for pieces in self.sentence_spans]
+
+    @cached_property
+    def sentence_keywords(self) -> List[Set[str]]:
+        """her akıllı cümlede geçen anahtar kelimeler"""
+        return self.hits.keywords_by_span(self.sentence_spans)
+
+    def prepare(self) -> 'DocumentContext':
+        """küçük harf, anahtar kelime taraması ve cümle sınırlarını şimdi hesapla (ölçüm için)"""
+        self.sentence_keywords
+        return self
+
+    def strip_span(self, span: Span) -> Optional[Span]:
+        """aralığın baş/son boşluklarını at; boş kalırsa None"""
+        return _strip_span(self.text, span[0], span[1])
+
+    def span_text(self, span: Span) -> str:
+        return self.text[span[0]:span[1]]
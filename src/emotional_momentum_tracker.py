@@ -1,4 +1,59 @@
-from typing import List, Dict
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Sequence, Set
+
+import numpy as np
+
+from src.document_context import DocumentContext
+from src.pattern_registry import EMOTIONAL_PATTERNS
+
+# momentumu izlenen duygular; dizilerin son ekseni ve sözlüklerin sırası
+EMOTIONS = ('anger', 'desperation', 'politeness', 'frustration')
+
+
+@dataclass
+class EmotionalFlowBatch:
+    """
+    bir doküman grubunun momentum dizileri (cümle ekseni en uzun dokümana göre doldurulur)
+
+    lengths: (D,) doküman başına cümle sayısı
+    sentence_emotions: (D, S, 4) cümle duyguları; doldurma konumlarında 0
+    momentum: (D, S, 4) cümleden sonraki birikmiş momentum; doldurma konumlarında son değer
+    final_momentum: (D, 4)
+    stability: (D,) durgunluk skoru
+
+    sentence_emotions / momentum, include_flow=False ile hesaplandıysa None'dır
+    """
+    lengths: np.ndarray
+    sentence_emotions: Optional[np.ndarray]
+    momentum: Optional[np.ndarray]
+    final_momentum: np.ndarray
+    stability: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def to_dict(self, index: int, include_flow: bool = True) -> Dict:
+        """index'teki doküman için calculate_emotional_flow ile aynı sözlük"""
+        final_momentum = dict(zip(EMOTIONS, self.final_momentum[index].tolist()))
+        result = {}
+        if include_flow:
+            if self.momentum is None:
+                raise ValueError("cümle akışı hesaplanmadı (include_flow=False)")
+            emotions = self.sentence_emotions[index, :self.lengths[index]]
+            momentum = self.momentum[index, :self.lengths[index]]
+            result['sentence_flow'] = [{
+                'sentence_index': i,
+                'emotions': dict(zip(EMOTIONS, emotions[i].tolist())),
+                'cumulative_momentum': dict(zip(EMOTIONS, momentum[i].tolist())),
+                'dominant_emotion': EMOTIONS[int(np.argmax(emotions[i]))]
+            } for i in range(len(emotions))]
+        result.update({
+            'final_momentum': final_momentum,
+            'dominant_overall': max(final_momentum, key=final_momentum.get),
+            'emotional_stability': float(self.stability[index])
+        })
+        return result
 
 
 class EmotionalMomentumTracker:
@@ -7,26 +62,7 @@ class EmotionalMomentumTracker:
     """
 
     def __init__(self):
-        self.emotional_patterns = {
-            'anger_escalation': [
-                'artık', 'yeter', 'bıktım', 'dayanamıyorum', 'sınırım', 'öfke'
-            ],
-            'desperation_signals': [
-                'çaresiz', 'yardım', 'rica', 'lutfen', 'yapalım', 'umut' 'ne olur', 'yalvarıyorum', 'son çare', 'mecbur', 'imdat'
-            ],
-            'politeness_markers': [
-                'saygı', 'nazik', 'kibarca', 'mümkün', 'uygun', 'teşekkür','hürmet', 'şükran', 'minnettar', 'efendim', 'lütfederseniz'
-            ],
-            'frustration_buildup': [
-                'tekrar', 'yine', 'gene', 'defalarca', 'kaçıncı', 'sürekli', 'hala', 'halen', 'ısrarla', 'kaç kere', 'defalarca'
-            ],
-            'positive_feedback': [
-                'memnun', 'başarılı', 'harika', 'çözüldü', 'elinize sağlık'
-            ],
-            'veiled_threats': [
-                'hukuki', 'yasal', 'mahkeme', 'dava', 'CİMER', 'şikayet', 'hakkımı'
-            ]
-        }
+        self.emotional_patterns = EMOTIONAL_PATTERNS
 
         self.momentum_weights = {
             'anger': {'decay': 0.8, 'amplify': 1.4},
@@ -35,19 +71,51 @@ class EmotionalMomentumTracker:
             'frustration': {'decay': 0.85, 'amplify': 1.3}
         }
 
-    def calculate_emotional_flow(self, sentences: List[str]) -> Dict:
-        """Cümle bazında duygusal momentum hesaplama"""
+        # toplu hesap için: anahtar kelime -> duygu başına liste geçiş sayısı
+        self._decay = np.array([self.momentum_weights[emotion]['decay'] for emotion in EMOTIONS])
+        self._amplify = np.array([self.momentum_weights[emotion]['amplify'] for emotion in EMOTIONS])
+        self._keyword_emotions: Dict[str, np.ndarray] = {}
+        for emotion, keywords in self.emotional_patterns.items():
+            emotion_key = emotion.split('_')[0]
+            if emotion_key not in EMOTIONS:
+                continue
+            for keyword, multiplicity in Counter(keywords).items():
+                row = self._keyword_emotions.setdefault(keyword, np.zeros(len(EMOTIONS)))
+                row[EMOTIONS.index(emotion_key)] += multiplicity
+
+    def calculate_emotional_flow(self, sentences: List[str], context: Optional[DocumentContext] = None,
+                                 include_flow: bool = True) -> Dict:
+        """
+        Cümle bazında duygusal momentum hesaplama
+
+        context: cümleleri üreten doküman bağlamı; verilirse cümle başına anahtar
+        kelimeler doküman taramasından alınır, verilmezse cümleler tek tek taranır
+        include_flow: False ise cümle bazlı akış (sentence_flow) kurulmaz; son momentum,
+        baskın duygu ve durgunluk skoru aynı kalır
+        """
+        if context is not None:
+            sentence_keywords = context.sentence_keywords
+        else:
+            sentence_keywords = [set(DocumentContext(sentence).hits.positions) for sentence in sentences]
+
         emotional_flow = []
         current_momentum = {'anger': 0.0, 'desperation': 0.0, 'politeness': 0.0, 'frustration': 0.0}
+        # durgunluk skoru için cümleler arası değişim, akış tutulmadan biriktirilir
+        previous_emotions = None
+        total_variation = 0
+        sentence_count = 0
 
-        for i, sentence in enumerate(sentences):
-            sentence_lower = sentence.lower()
+        for i, found_in_sentence in enumerate(sentence_keywords):
             sentence_emotions = {'anger': 0.0, 'desperation': 0.0, 'politeness': 0.0, 'frustration': 0.0}
 
             # Her duygu için kelimeleri say
             for emotion, keywords in self.emotional_patterns.items():
                 emotion_key = emotion.split('_')[0]
-                count = sum(1 for keyword in keywords if keyword in sentence_lower)
+                # momentum yalnızca ağırlığı tanımlı dört duygu için izlenir
+                # (veiled_threats / positive_feedback akışa girmez)
+                if emotion_key not in self.momentum_weights:
+                    continue
+                count = sum(1 for keyword in keywords if keyword in found_in_sentence)
 
                 if count > 0:
                     # Momentum katsayısıyla çarp
@@ -62,35 +130,116 @@ class EmotionalMomentumTracker:
                         sentence_emotions[emotion]
                 )
 
-            emotional_flow.append({
-                'sentence_index': i,
-                'emotions': sentence_emotions.copy(),
-                'cumulative_momentum': current_momentum.copy(),
-                'dominant_emotion': max(sentence_emotions, key=sentence_emotions.get)
-            })
+            if previous_emotions is not None:
+                total_variation += self._sentence_variation(previous_emotions, sentence_emotions)
+            previous_emotions = sentence_emotions
+            sentence_count += 1
 
-        return {
+            if include_flow:
+                emotional_flow.append({
+                    'sentence_index': i,
+                    'emotions': sentence_emotions.copy(),
+                    'cumulative_momentum': current_momentum.copy(),
+                    'dominant_emotion': max(sentence_emotions, key=sentence_emotions.get)
+                })
+
+        result = {
             'sentence_flow': emotional_flow,
             'final_momentum': current_momentum,
             'dominant_overall': max(current_momentum, key=current_momentum.get),
-            'emotional_stability': self._calculate_stability(emotional_flow)
+            'emotional_stability': self._calculate_stability(total_variation, sentence_count)
         }
-
-    def _calculate_stability(self, flow: List[Dict]) -> float:
+        if not include_flow:
+            del result['sentence_flow']
+        return result
+
+    def emotion_counts(self, sentence_keywords: Sequence[Set[str]]) -> np.ndarray:
+        """cümle × duygu sayı matrisi (S, 4): cümlede geçen, duygunun listesindeki kelime sayısı"""
+        counts = np.zeros((len(sentence_keywords), len(EMOTIONS)))
+        for row, found_in_sentence in enumerate(sentence_keywords):
+            for keyword in found_in_sentence:
+                emotions = self._keyword_emotions.get(keyword)
+                if emotions is not None:
+                    counts[row] += emotions
+        return counts
+
+    def calculate_emotional_flow_batch(self, sentence_keywords_list: Sequence[Sequence[Set[str]]],
+                                       include_flow: bool = True) -> EmotionalFlowBatch:
+        """
+        doküman grubunun duygusal momentumu (calculate_emotional_flow ile birebir aynı sayılar)
+
+        sentence_keywords_list: her doküman için DocumentContext.sentence_keywords
+        include_flow: False ise cümle bazlı diziler tutulmaz; yalnızca son momentum ve durgunluk
+
+        bellek: doküman sayısı × en uzun doküman × 4 float (include_flow ile üç katı);
+        çok büyük gruplar parça parça verilmeli
+        """
+        lengths = np.array([len(sentence_keywords) for sentence_keywords in sentence_keywords_list], dtype=np.int64)
+        counts = np.zeros((len(lengths), int(lengths.max(initial=0)), len(EMOTIONS)))
+        for document, sentence_keywords in enumerate(sentence_keywords_list):
+            counts[document, :lengths[document]] = self.emotion_counts(sentence_keywords)
+        return self.momentum_recurrence(counts, lengths, include_flow)
+
+    def momentum_recurrence(self, counts: np.ndarray, lengths: np.ndarray,
+                            include_flow: bool = True) -> EmotionalFlowBatch:
+        """
+        azalma / güçlenme özyinelemesi, tüm dokümanlar için cümle cümle
+
+        counts: (D, S, 4) doldurulmuş sayı dizisi; lengths: (D,) gerçek cümle sayıları
+        dokümanlar uzunluğa göre azalan sıralanır: her adımda yalnızca hâlâ cümlesi olan
+        dokümanlar (bir ön ek) hesaplanır, doldurma konumları için iş yapılmaz. işlemler
+        calculate_emotional_flow ile aynı sırada yapılır (kayan nokta eşitliği)
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        order = np.argsort(-lengths, kind='stable')
+        counts = counts[order]
+        sorted_lengths = lengths[order]
+        documents, steps, _ = counts.shape
+
+        current = np.zeros((documents, len(EMOTIONS)))
+        previous = np.zeros((documents, len(EMOTIONS)))
+        total_variation = np.zeros(documents)
+        sentence_emotions = np.zeros(counts.shape) if include_flow else None
+        momentum = np.zeros(counts.shape) if include_flow else None
+        # adım başına cümlesi olan doküman sayısı
+        active_counts = np.searchsorted(-sorted_lengths, -np.arange(steps), side='left')
+
+        for step in range(steps):
+            active = active_counts[step]
+            count = counts[:active, step]
+            emotions = np.where(count > 0, count + current[:active] * self._amplify, 0.0)
+            current[:active] = current[:active] * self._decay + emotions
+
+            if step:
+                change = np.abs(emotions - previous[:active])
+                total_variation[:active] += (((change[:, 0] + change[:, 1]) + change[:, 2]) + change[:, 3]) \
+                    / len(EMOTIONS)
+            previous[:active] = emotions
+            if include_flow:
+                sentence_emotions[:active, step] = emotions
+                momentum[:active, step] = current[:active]
+                # bitmiş dokümanlarda momentum son değerinde kalır
+                momentum[active:, step] = current[active:]
+
+        restore = np.argsort(order, kind='stable')
+        stability = np.array([self._calculate_stability(variation, int(length))
+                              for variation, length in zip(total_variation[restore].tolist(), lengths)],
+                             dtype=np.float64)
+        if include_flow:
+            sentence_emotions, momentum = sentence_emotions[restore], momentum[restore]
+        return EmotionalFlowBatch(lengths, sentence_emotions, momentum, current[restore], stability)
+
+    @staticmethod
+    def _sentence_variation(prev_emotions: Dict, curr_emotions: Dict) -> float:
+        """Cümleler arası değişim miktarı"""
+        return sum(abs(curr_emotions[e] - prev_emotions[e]) for e in curr_emotions) / len(curr_emotions)
+
+    def _calculate_stability(self, total_variation: float, sentence_count: int) -> float:
         """durgunluk skoru ne kadar fazlaysa o kadar durgun"""
-        if len(flow) < 2:
+        if sentence_count < 2:
             return 1.0
 
-        variations = []
-        for i in range(1, len(flow)):
-            prev_emotions = flow[i - 1]['emotions']
-            curr_emotions = flow[i]['emotions']
-
-            # Cümleler arası değişim miktarı
-            variation = sum(abs(curr_emotions[e] - prev_emotions[e]) for e in curr_emotions) / len(curr_emotions)
-            variations.append(variation)
-
-        avg_variation = sum(variations) / len(variations)
+        avg_variation = total_variation / (sentence_count - 1)
         stability = max(0, 1 - (avg_variation / 5))
 
         return round(stability, 3)
\ No newline at end of file
@@ -1,6 +1,10 @@
-import re
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from src.document_context import DocumentContext
+from src.keyword_index import KeywordHits
+from src.pattern_registry import (
+    ADDRESS_CONTEXT_REQUIREMENTS, CATEGORY_RULES, CONSISTENCY_INDICATORS, get_pattern_registry
+)
 
 
 class EnhancedSkepticalValidator:
@@ -11,18 +15,21 @@ class EnhancedSkepticalValidator:
     """
 
     def __init__(self):
+        # derlenmiş patternler pattern kaydından paylaşılır
+        self.patterns = get_pattern_registry().validator_patterns['enhanced']
+
         self.validation_rules = {
             'name_validation': {
                 'min_length': 3,
                 'max_length': 50,
-                'required_pattern': r'^[A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞIİÖŞÜ\s]+$',
-                'forbidden_patterns': [r'\d', r'[!@#$%^&*()]'],
-                'turkish_name_bonus': [r'[çğıöşüÇĞIİÖŞÜ]']
+                'required_pattern': self.patterns['required_name'],
+                'forbidden_patterns': self.patterns['forbidden'],
+                'turkish_name_bonus': self.patterns['turkish_name_bonus']
             },
             'address_validation': {
                 'location_keywords': ['mahalle', 'sokak', 'cadde', 'bulvar', 'köy', 'ilçe', 'il', 'mah.', 'sok.', 'cd.', 'blv.'],
-                'suspicious_patterns': [r'\d{5,}', r'[!@#$%^&*()]'],
-                'context_requirements': ['yaşa', 'ikamet', 'otur', 'ev', 'daire']
+                'suspicious_patterns': self.patterns['address_suspicious'],
+                'context_requirements': ADDRESS_CONTEXT_REQUIREMENTS
             },
             'consistency_checks': {
                 'tone_consistency': True,
@@ -32,420 +39,27 @@ class EnhancedSkepticalValidator:
         }
 
 
-        self.category_rules = {
-            "internet_telekomünikasyon": {
-                "keywords": [
-                    "internet",
-                    "wifi",
-                    "adsl",
-                    "fiber",
-                    "modem",
-                    "router",
-                    "bağlantı kesintisi",
-                    "türk telekom",
-                    "vodafone",
-                    "turkcell",
-                    "superonline",
-                    "millenicom"
-                ],
-                "negative_keywords": [
-                    "su",
-                    "kanalizasyon",
-                    "elektrik",
-                    "doğalgaz"
-                ],
-                "priority_score": 10.0
-            },
-            "su_kanalizasyon": {
-                "keywords": [
-                    "su",
-                    "kanalizasyon",
-                    "atık",
-                    "pis",
-                    "tıkanık",
-                    "akıt",
-                    "sızıntı",
-                    "taşma",
-                    "koku",
-                    "kirli",
-                    "içme suyu",
-                    "şebeke",
-                    "kesinti",
-                    "basınç",
-                    "kaçak",
-                    "rögar",
-                    "menhol",
-                    "boru",
-                    "vana",
-                    "sayaç",
-                    "fatura",
-                    "musluk",
-                    "lavabo",
-                    "banyo",
-                    "mutfak",
-                    "tuvalet",
-                    "bahçe",
-                    "sokak",
-                    "kanal",
-                    "drenaj",
-                    "yağmur",
-                    "kesik",
-                    "akmıyor",
-                    "gelmıyor",
-                    "düşük",
-                    "yüksek",
-                    "bulanık",
-                    "kokulu",
-                    "sıcak",
-                    "soğuk",
-                    "donmuş"
-                ],
-                "negative_keywords": [
-                    "internet",
-                    "telefon",
-                    "elektrik",
-                    "gaz"
-                ],
-                "priority_score": 9.0
-            },
-            "elektrik": {
-                "keywords": [
-                    "elektrik",
-                    "güç kesintisi",
-                    "elektrik kesintisi",
-                    "şalt",
-                    "pano",
-                    "kablo",
-                    "aydınlatma",
-                    "ampul",
-                    "priz",
-                    "ışık",
-                    "lamba",
-                    "karanlık",
-                    "loş",
-                    "projektör",
-                    "led",
-                    "sokak lambası",
-                    "direk",
-                    "yanmıyor",
-                    "söndü",
-                    "bozuk",
-                    "kesiyor"
-                ],
-                "negative_keywords": [
-                    "su",
-                    "internet",
-                    "gaz"
-                ],
-                "priority_score": 9.0
-            },
-            "guvenlik": {
-                "keywords": [
-                    "güvenlik",
-                    "suç",
-                    "hırsızlık",
-                    "saldırı",
-                    "tehdit",
-                    "korku",
-                    "emniyet",
-                    "polis",
-                    "bekçi",
-                    "kamera",
-                    "uyuşturucu",
-                    "sarhoş",
-                    "kavga",
-                    "bıçak",
-                    "silah",
-                    "yaralama",
-                    "darp",
-                    "gasp",
-                    "kapkaç",
-                    "dolandırıcılık",
-                    "tehlikeli",
-                    "riskli",
-                    "güvensiz",
-                    "korkutucu",
-                    "şüpheli",
-                    "suçlu",
-                    "illegal"
-                ],
-                "negative_keywords": [],
-                "priority_score": 10.0
-            },
-            "saglik_hijyen": {
-                "keywords": [
-                    "sağlık",
-                    "hijyen",
-                    "dezenfekte",
-                    "steril",
-                    "mikrop",
-                    "bakteri",
-                    "virüs",
-                    "hastalık",
-                    "bulaşıcı",
-                    "hastane",
-                    "sağlık ocağı",
-                    "eczane",
-                    "ambulans",
-                    "doktor",
-                    "hemşire",
-                    "tıbbi",
-                    "tedavi",
-                    "ilaç",
-                    "acil",
-                    "hasta",
-                    "yaralı",
-                    "enfeksiyon",
-                    "zehirlenme",
-                    "toksik"
-                ],
-                "negative_keywords": [],
-                "priority_score": 9.5
-            },
-            "yapim_insaat": {
-                "keywords": [
-                    "inşaat",
-                    "yapım",
-                    "bina",
-                    "yapı",
-                    "köprü",
-                    "beton",
-                    "çimento",
-                    "demir",
-                    "tuğla",
-                    "proje",
-                    "müteahhit",
-                    "vinç",
-                    "gecikmeli",
-                    "yarıda",
-                    "durmuş",
-                    "tamamlanmamış",
-                    "eksik",
-                    "hatalı",
-                    "duran",
-                    "terk edilmiş",
-                    "çöken",
-                    "çatlayan",
-                    "tehlike",
-                    "risk"
-                ],
-                "negative_keywords": [],
-                "priority_score": 8.5
-            },
-            "yol_ulasim": {
-                "keywords": [
-                    "yol",
-                    "asfalt",
-                    "kaldırım",
-                    "çukur",
-                    "bozuk",
-                    "tamir",
-                    "trafik",
-                    "kavşak",
-                    "otobüs",
-                    "durak",
-                    "otopark",
-                    "kaza",
-                    "tehlike",
-                    "trafik kazası",
-                    "çökme",
-                    "çatlak",
-                    "delik",
-                    "kaygan",
-                    "tehlikeli",
-                    "kapali",
-                    "engelli",
-                    "tıkalı"
-                ],
-                "negative_keywords": [],
-                "priority_score": 8.0
-            },
-            "arıza": {
-                "keywords": [
-                    "asansör arızalı",
-                    "yürüyen merdiven çalışmıyor",
-                    "bozuk",
-                    "aktif değil",
-                    "arıza",
-                    "baz istasyonu"
-                ],
-                "negative_keywords": [],
-                "priority_score": 8.0
-            },
-            "cevre_temizlik": {
-                "keywords": [
-                    "çöp",
-                    "atık",
-                    "temizlik",
-                    "hijyen",
-                    "kirli",
-                    "pis",
-                    "koku",
-                    "böcek",
-                    "fare",
-                    "haşere",
-                    "konteyner",
-                    "çöp kutusu",
-                    "ilaçlama",
-                    "dolu",
-                    "taşan",
-                    "saçılmış",
-                    "leş",
-                    "pislik",
-                    "berbat",
-                    "iğrenç"
-                ],
-                "negative_keywords": [],
-                "priority_score": 7.5
-            },
-            "okul_sorunu": {
-                "keywords": [
-                    "kaloriferler yanmıyor",
-                    "montla ders işliyor",
-                    "sınıflar soğuk",
-                    "sınıflar kirli",
-                    "sınıflar kalabalık",
-                    "şiddet",
-                    "psikolojik şiddet",
-                    "zorbalığa uğrama",
-                    "öğretmen zorbalığı",
-                    "akran zorbalığı"
-                ],
-                "negative_keywords": [],
-                "priority_score": 7.0
-            },
-            "faturalandırma_sorunu": {
-                "keywords": [
-                    "olağandışı artış",
-                    "haksız ödeme",
-                    "vergi kaçırma",
-                    "yüksek mebla",
-                    "servis bedeli",
-                    "yeniden ölçüm",
-                    "yeniden faturalandırma",
-                    "kaçak kullanım"
-                ],
-                "negative_keywords": [],
-                "priority_score": 7.0
-            },
-            "gurultu_rahatsizlik": {
-                "keywords": [
-                    "gürültü",
-                    "ses",
-                    "bağırma",
-                    "müzik",
-                    "hoparlör",
-                    "rahatsız",
-                    "uyku",
-                    "huzur",
-                    "yüksek",
-                    "aşırı",
-                    "dayanılmaz",
-                    "sürekli",
-                    "geç saatte",
-                    "uygunsuz",
-                    "yasak"
-                ],
-                "negative_keywords": [],
-                "priority_score": 6.5
-            },
-            "park_yesil_alan": {
-                "keywords": [
-                    "park",
-                    "bahçe",
-                    "yeşil",
-                    "ağaç",
-                    "çiçek",
-                    "oyun alanı",
-                    "çocuk parkı",
-                    "bank",
-                    "sulama",
-                    "budama",
-                    "bakım",
-                    "kurumuş",
-                    "kesilmiş",
-                    "harap",
-                    "bakımsız",
-                    "kirli",
-                    "tahrip"
-                ],
-                "negative_keywords": [],
-                "priority_score": 6.0
-            },
-            "kargo_sorunu": {
-                "keywords": [
-                    "kargo",
-                    "elime ulaşmadı",
-                    "kargo takip",
-                    "yolda",
-                    "ptt",
-                    "yurtiçi kargo",
-                    "mng",
-                    "ups",
-                    "sürat kargo",
-                    "kurye",
-                    "kargo şubesine ulaşamıyorum",
-                    "kargom hasarlı"
-                ],
-                "negative_keywords": [],
-                "priority_score": 5.5
-            },
-            "telefon-sorunu": {
-                "keywords": [
-                    "şebeke",
-                    "telefon çekmiyor",
-                    "ulaşamıyorum",
-                    "sesini alamıyorum",
-                    "çekmiyor",
-                    "arama",
-                    "arayamıyorum"
-                ],
-                "negative_keywords": [],
-                "priority_score": 5.0
-            },
-            "pazaryeri_sorunu": {
-                "keywords": [
-                    "pazar yeri",
-                    "sebze meyve pazarı",
-                    "pazaryeri düzenlemesi",
-                    "pazaryeri taşıması"
-                ],
-                "negative_keywords": [],
-                "priority_score": 4.0
-            }
-
-        }
+        self.category_rules = CATEGORY_RULES
 
         # Gerçek olmayan isim kalıpları algoritma isim gördüğü için çıkarmak için eklendi
-        self.fake_name_patterns = [
-            r'.*kesinti.*',
-            r'.*sorun.*',
-            r'.*arıza.*',
-            r'.*problem.*',
-            r'.*talep.*',
-            r'.*şikayet.*',
-            r'.*başvuru.*',
-            r'internet.*',
-            r'elektrik.*',
-            r'su.*',
-            r'.*hizmet.*'
-        ]
+        self.fake_name_patterns = self.patterns['fake_name']
 
     def preprocess_and_validate(self, extraction_result: Dict, original_text: str) -> Dict:
         """Ana doğrulama fonksiyonu : ön işleme ve doğrulama"""
+        context = DocumentContext(original_text)
 
         # ön işleme (çıkarım hatalarını düzelt)
-        preprocessed_result = self._preprocess_extraction(extraction_result, original_text)
+        preprocessed_result = self._preprocess_extraction(extraction_result, original_text, context.hits)
 
         # mevcut doğrulama sistemi
-        validation_results = self.validate_extraction(preprocessed_result, original_text)
+        validation_results = self.validate_extraction(preprocessed_result, original_text, context)
 
         # düzeltilmiş sonucu dahil et
         validation_results['corrected_extraction'] = preprocessed_result
 
         return validation_results
 
-    def _preprocess_extraction(self, extraction: Dict, original_text: str) -> Dict:
+    def _preprocess_extraction(self, extraction: Dict, original_text: str, hits: KeywordHits) -> Dict:
         """Çıkarım sonuçlarını ön işleme"""
         corrected = extraction.copy()
 
@@ -456,7 +70,7 @@ class EnhancedSkepticalValidator:
 
         # kategori düzeltmesi
         if 'subject_category' in corrected:
-            corrected_category = self._correct_category_extraction(corrected['subject_category'], original_text)
+            corrected_category = self._correct_category_extraction(corrected['subject_category'], hits)
             corrected['subject_category'] = corrected_category
 
         # adres düzeltmesi
@@ -471,7 +85,7 @@ class EnhancedSkepticalValidator:
 
         # sahte isim kontrolü
         for pattern in self.fake_name_patterns:
-            if re.search(pattern, extracted_name.lower()):
+            if pattern.search(extracted_name.lower()):
                 # Gerçek isim aramaya geç
                 real_names = self._find_real_names_in_text(original_text)
                 if real_names:
@@ -485,8 +99,7 @@ class EnhancedSkepticalValidator:
         """metinde gerçek isimleri bul"""
 
         # türkçe isim kalıpları
-        name_pattern = r'\b[A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞIİÖŞÜ]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞIİÖŞÜ]+)*\b'
-        potential_names = re.findall(name_pattern, text)
+        potential_names = self.patterns['real_name'].findall(text)
 
         real_names = []
         for name in potential_names:
@@ -499,11 +112,9 @@ class EnhancedSkepticalValidator:
 
         return real_names
 
-    def _correct_category_extraction(self, extracted_category: str, original_text: str) -> str:
+    def _correct_category_extraction(self, extracted_category: str, hits: KeywordHits) -> str:
         """kategori çıkarımını düzelt"""
 
-        text_lower = original_text.lower()
-
         # her kategori için skor hesapla
         category_scores = {}
 
@@ -512,12 +123,12 @@ class EnhancedSkepticalValidator:
 
             #  anahtar kelimeler
             for keyword in rules['keywords']:
-                if keyword in text_lower:
+                if keyword in hits:
                     score += rules['priority_score']
 
             # anahtar kelimeler negatif
             for neg_keyword in rules['negative_keywords']:
-                if neg_keyword in text_lower:
+                if neg_keyword in hits:
                     score -= rules['priority_score'] * 0.5
 
             category_scores[category] = score
@@ -535,15 +146,10 @@ class EnhancedSkepticalValidator:
         """adres çıkarımını düzelt"""
 
         # tarih ve zaman ifadeleri içerenşüpheli adres kalıpları
-        suspicious_patterns = [
-            r'sabahından bu yana',
-            r'\d+\s+(eylül|ocak|şubat|mart|nisan|mayıs|haziran|temmuz|ağustos|ekim|kasım|aralık)',
-            r'bu yana',
-            r'dan beri'
-        ]
+        suspicious_patterns = self.patterns['address_correction']
 
         for pattern in suspicious_patterns:
-            if re.search(pattern, extracted_address.lower()):
+            if pattern.search(extracted_address.lower()):
                 # gerçek adres bilgisini bul
                 real_address = self._find_real_address_in_text(original_text)
                 return real_address if real_address else extracted_address
@@ -554,21 +160,22 @@ class EnhancedSkepticalValidator:
         """Metinde gerçek adresi bul"""
 
         # adres kalıpları
-        address_patterns = [
-            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)*)\s+(mahalle|sokak|cadde|bulvar)',
-            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+Mahallesi',
-            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+(daire|apartman|blok)',
-        ]
+        address_patterns = self.patterns['real_address']
 
         for pattern in address_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 return match.group().strip()
 
         return None
 
-    def validate_extraction(self, extraction_result: Dict, original_text: str) -> Dict:
+    def validate_extraction(self, extraction_result: Dict, original_text: str,
+                            context: Optional[DocumentContext] = None) -> Dict:
         """mevcut doğrulama sistemi"""
+        if context is None:
+            context = DocumentContext(original_text)
+        hits = context.hits
+
         validation_results = {
             'overall_validity': True,
             'confidence_adjustment': 1.0,
@@ -592,7 +199,7 @@ class EnhancedSkepticalValidator:
 
 
         if 'address_info' in extraction_result and extraction_result['address_info']:
-            address_validation = self._validate_address(extraction_result['address_info'], original_text)
+            address_validation = self._validate_address(extraction_result['address_info'], hits)
             validation_results['validation_details']['address'] = address_validation
 
             if not address_validation['is_valid']:
@@ -601,7 +208,7 @@ class EnhancedSkepticalValidator:
 
         # kategori doğrulaması
         if 'subject_category' in extraction_result:
-            category_validation = self._validate_category(extraction_result['subject_category'], original_text)
+            category_validation = self._validate_category(extraction_result['subject_category'], hits)
             validation_results['validation_details']['category'] = category_validation
 
             if not category_validation['is_valid']:
@@ -609,7 +216,7 @@ class EnhancedSkepticalValidator:
                 validation_results['confidence_adjustment'] *= 0.7
 
         # tutarlılık kontrolü
-        consistency_check = self._check_consistency(extraction_result, original_text)
+        consistency_check = self._check_consistency(extraction_result, hits)
         validation_results['validation_details']['consistency'] = consistency_check
 
         if not consistency_check['is_consistent']:
@@ -625,7 +232,7 @@ class EnhancedSkepticalValidator:
 
         return validation_results
 
-    def _validate_category(self, category: str, original_text: str) -> Dict:
+    def _validate_category(self, category: str, hits: KeywordHits) -> Dict:
         """kategori doğrulaması"""
 
         if category not in self.category_rules:
@@ -636,13 +243,12 @@ class EnhancedSkepticalValidator:
             }
 
         rules = self.category_rules[category]
-        text_lower = original_text.lower()
 
         #  kanıt sayısı
-        positive_evidence = sum(1 for keyword in rules['keywords'] if keyword in text_lower)
+        positive_evidence = sum(1 for keyword in rules['keywords'] if keyword in hits)
 
         # negatif kanıt sayısı
-        negative_evidence = sum(1 for neg_keyword in rules['negative_keywords'] if neg_keyword in text_lower)
+        negative_evidence = sum(1 for neg_keyword in rules['negative_keywords'] if neg_keyword in hits)
 
         is_valid = positive_evidence > 0 and negative_evidence == 0
 
@@ -684,26 +290,26 @@ class EnhancedSkepticalValidator:
             issues.append(f"Uzunluk uygunsuz: {len(name)}")
 
         # kural ve kalıp  kontrolü
-        if not re.match(rules['required_pattern'], name):
+        if not rules['required_pattern'].match(name):
             is_valid = False
             issues.append("Türkçe isim formatına uymuyor")
 
         # sahte isim kontrolü
         for pattern in self.fake_name_patterns:
-            if re.search(pattern, name.lower()):
+            if pattern.search(name.lower()):
                 is_valid = False
                 issues.append("Sahte isim kalıbı tespit edildi")
 
         # yasak karakter kontrolü
         for forbidden in rules['forbidden_patterns']:
-            if re.search(forbidden, name):
+            if forbidden.search(name):
                 is_valid = False
-                issues.append(f"Yasak karakter: {forbidden}")
+                issues.append(f"Yasak karakter: {forbidden.pattern}")
 
 
         turkish_bonus = 0
         for bonus_pattern in rules['turkish_name_bonus']:
-            if re.search(bonus_pattern, name):
+            if bonus_pattern.search(name):
                 turkish_bonus += 0.1
 
         return {
@@ -713,7 +319,7 @@ class EnhancedSkepticalValidator:
             'confidence': max(0.3, 1.0 - len(issues) * 0.2 + turkish_bonus)
         }
 
-    def _validate_address(self, address: str, context: str) -> Dict:
+    def _validate_address(self, address: str, context: KeywordHits) -> Dict:
         """adres doğrulaması"""
         rules = self.validation_rules['address_validation']
 
@@ -727,14 +333,14 @@ class EnhancedSkepticalValidator:
             issues.append("Adres anahtar kelimeleri eksik")
 
         # zaman ifadeleri şüpheli pattern kontrolü - algoritma zaman verilerini isimle karıştırdığı için güncelleme
-        time_patterns = [r'sabahından', r'bu yana', r'\d+\s+(eylül|ocak|şubat)', r'dan beri']
+        time_patterns = self.patterns['address_time']
         for pattern in time_patterns:
-            if re.search(pattern, address.lower()):
+            if pattern.search(address.lower()):
                 is_valid = False
-                issues.append(f"Adres yerine zaman ifadesi: {pattern}")
+                issues.append(f"Adres yerine zaman ifadesi: {pattern.pattern}")
 
         # bağlam ve mantık kontrolü
-        context_support = any(req in context.lower() for req in rules['context_requirements'])
+        context_support = any(req in context for req in rules['context_requirements'])
         if not context_support:
             issues.append("Adres bilgisi bağlamda desteklenmiyor")
 
@@ -745,14 +351,13 @@ class EnhancedSkepticalValidator:
             'confidence': max(0.2, 1.0 - len(issues) * 0.3)
         }
 
-    def _check_consistency(self, extraction: Dict, original_text: str) -> Dict:
+    def _check_consistency(self, extraction: Dict, hits: KeywordHits) -> Dict:
         """tutarlılık kontrolü """
         issues = []
 
         # ton tutarlılığı çıkarımı
-        text_lower = original_text.lower()
-        formal_indicators = sum(1 for word in ['saygı', 'arz', 'gereği', 'takdir'] if word in text_lower)
-        informal_indicators = sum(1 for word in ['ya', 'yani', 'işte'] if word in text_lower)
+        formal_indicators = sum(1 for word in CONSISTENCY_INDICATORS['formal'] if word in hits)
+        informal_indicators = sum(1 for word in CONSISTENCY_INDICATORS['informal'] if word in hits)
 
         if formal_indicators > 0 and informal_indicators > 0:
             issues.append("Dil tutarsızlığı: Formal ve günlük dil karışımı")
@@ -762,13 +367,13 @@ class EnhancedSkepticalValidator:
             category = extraction['subject_category']
             if category in self.category_rules:
                 expected_keywords = self.category_rules[category]['keywords']
-                found_keywords = [kw for kw in expected_keywords if kw in text_lower]
+                found_keywords = [kw for kw in expected_keywords if kw in hits]
 
                 if len(found_keywords) == 0:
                     issues.append(f"Kategori-içerik tutarsızlığı: {category} kategorisi ama ilgili anahtar kelime yok")
 
         # mantıksal tutarlılık
-        if 'acil' in text_lower and 'uygun gördüğünüzde' in text_lower:
+        if 'acil' in hits and 'uygun gördüğünüzde' in hits:
             issues.append("Mantık tutarsızlığı: Acil ama esnek zaman talebi")
 
         return {
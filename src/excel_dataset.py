@@ -0,0 +1,129 @@
+"""
+Ara kayıt günlüğü + sıkıştırma ile Excel eğitim veri seti.
+
+GUI'de her dilekçe için tüm çalışma kitabını okuyup yeniden yazmak yerine
+satırlar yalnızca ekleme yapılan bir JSONL günlüğüne yazılır (sabit maliyet).
+.xlsx dosyası, istendiğinde ya da zamanlanmış olarak compact() ile günlükten
+baştan, write-only çalışma kitabıyla akış halinde üretilir.
+
+Bekleyen satırlar günlükten hesaplanır: sıkıştırma, çalışma kitabına aktardığı
+günlük boyutunu staging dizinine işaretler; işaretten sonraki satırlar bekleyendir.
+Böylece başka bir süreçte (ör. GUI'nin işçi süreci) yazılan ya da çökmeden önce
+kalan satırlar da bir sonraki sıkıştırmada çalışma kitabına girer.
+
+Not: .xlsx türetilmiş bir çıktıdır; elle yapılan değişiklikler bir sonraki
+sıkıştırmada günlükteki kayıtlarla değiştirilir.
+"""
+import json
+import os
+from typing import Dict, Iterable, Iterator, Optional
+
+from src.dataset_writer import open_dataset_writer
+from src.results_store import JsonlResultsStore
+
+COMPACTED_MARKER = "compacted.json"
+
+
+class StagedExcelDataset:
+    """
+    excel_path: üretilecek çalışma kitabı
+    staging_dir: ara kayıt günlüğünün dizini (varsayılan: '<excel adı>_staging')
+    """
+
+    def __init__(self, excel_path: str, staging_dir: Optional[str] = None,
+                 max_segment_bytes: int = 64 * 1024 * 1024):
+        self.excel_path = excel_path
+        self.staging_dir = staging_dir or os.path.splitext(excel_path)[0] + "_staging"
+        self.log = JsonlResultsStore(self.staging_dir, prefix="rows", max_segment_bytes=max_segment_bytes,
+                                     rotate_daily=False)
+        self._marker_path = os.path.join(self.staging_dir, COMPACTED_MARKER)
+        self._seeded = False
+
+    def append(self, record: Dict):
+        """satırı ara kayıt günlüğüne ekle (çalışma kitabına dokunmaz)"""
+        self._seed_from_existing_workbook()
+        self.log.append(record)
+
+    def append_many(self, records: Iterable[Dict]):
+        """satırları ara kayıt günlüğüne tek seferde ekle"""
+        self._seed_from_existing_workbook()
+        self.log.append_many(records)
+
+    @property
+    def pending_rows(self) -> int:
+        """son sıkıştırmadan beri günlüğe eklenen satır sayısı (yalnızca işaretten sonraki kısım okunur)"""
+        compacted = self._compacted_bytes() if os.path.exists(self.excel_path) else 0
+        pending = 0
+        offset = 0
+        for path in self.log.segments():
+            size = os.path.getsize(path)
+            if offset + size > compacted:
+                with open(path, 'rb') as f:
+                    f.seek(max(0, compacted - offset))
+                    pending += f.read().count(b'\n')
+            offset += size
+        return pending
+
+    def iter_rows(self) -> Iterator[Dict]:
+        self._seed_from_existing_workbook()
+        return self.log.iter_results()
+
+    def compact(self, chunk_size: int = 1000) -> int:
+        """
+        çalışma kitabını günlükten baştan üret
+
+        önce geçici dosyaya yazılır, sonra atomik olarak yerine taşınır: yarıda kalan
+        bir sıkıştırma mevcut .xlsx dosyasını bozmaz. dönüş: yazılan satır sayısı
+        """
+        self._seed_from_existing_workbook()
+
+        # bu noktadan sonra eklenen satırlar bir sonraki sıkıştırmada da bekleyen sayılır
+        log_bytes = self._log_bytes()
+        temporary_path = self.excel_path + ".tmp.xlsx"
+        with open_dataset_writer(temporary_path, chunk_size=chunk_size) as writer:
+            for record in self.log.iter_results():
+                writer.write(record)
+        os.replace(temporary_path, self.excel_path)
+
+        temporary_marker = self._marker_path + ".tmp"
+        with open(temporary_marker, 'w', encoding='utf-8') as f:
+            json.dump({'log_bytes': log_bytes}, f)
+        os.replace(temporary_marker, self._marker_path)
+        return writer.rows_written
+
+    def _log_bytes(self) -> int:
+        return sum(os.path.getsize(path) for path in self.log.segments())
+
+    def _compacted_bytes(self) -> int:
+        """son sıkıştırmanın çalışma kitabına aktardığı günlük boyutu (işaret yoksa 0)"""
+        try:
+            with open(self._marker_path, encoding='utf-8') as f:
+                return int(json.load(f)['log_bytes'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+
+    def _seed_from_existing_workbook(self):
+        """
+        günlük boşken var olan bir .xlsx bulunursa satırları bir kez günlüğe aktar
+
+        (günlükten önceki sürümle oluşturulmuş veri seti kaybolmasın)
+        """
+        if self._seeded:
+            return
+        self._seeded = True
+
+        if self.log.segments() or not os.path.exists(self.excel_path):
+            return
+
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(self.excel_path, read_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if not header:
+                return
+            for row in rows:
+                self.log.append({column: value for column, value in zip(header, row) if column is not None})
+        finally:
+            workbook.close()
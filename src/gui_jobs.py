@@ -0,0 +1,310 @@
+"""
+GUI analiz işleri: okuma, analiz ve kayıt Tk ana iş parçacığının dışında.
+
+Her iş (AnalysisJob) ayrı bir iş parçacığında yürür; CPU yoğun adımlar (PDF
+sayfalarının okunması, analiz) ise tek işçili, önceden ısıtılmış bir süreç
+havuzunda (AnalysisWorker) çalışır. Böylece uzun düzenli ifade çağrıları
+GIL'i Tk'den almaz. İş, ilerlemeyi ve sonucu JobMessage olarak bir kuyruğa
+yazar; arayüz kuyruğu root.after ile yoklar ve hiçbir Tk çağrısı ana iş
+parçacığı dışında yapılmaz.
+
+İptal: okuma sayfa grupları arasında, analiz ise işçi süreç sonlandırılarak
+kesilir (bir sonraki iş için havuz yeniden kurulur). Kayıt başladıktan sonra
+iş yarıda bırakılmaz; hedeflere ya hep ya hiç yazılır.
+
+Çok dosyalı işler (BatchAnalysisJob) dosyaları bir süreç havuzunda paralel
+okur; önbellekte sonucu olmayan metinler aynı havuzda analiz edilir. Her
+dosyanın durumu ayrı bir mesajla bildirilir, sonuçlar iş sonunda hedeflere
+tek seferde yazılır.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.ingestion import read_file
+from src.petition_analyzer import failed_result, get_analyzer, init_worker, is_failed_result
+from src.result_sinks import ResultSinks
+from src.utils import extract_page_range, pdf_page_count
+
+# PDF okunurken işçiye tek seferde verilen sayfa sayısı (ilerleme / iptal aralığı)
+PAGES_PER_STEP = 8
+# işçi sonucunu beklerken iptalin kontrol edilme aralığı (saniye)
+CANCEL_POLL_SECONDS = 0.05
+
+# işçi süreçteki hedefler, veri klasörü başına bir kez kurulur
+_worker_sinks: Dict[str, ResultSinks] = {}
+
+
+class JobCancelled(Exception):
+    pass
+
+
+@dataclass
+class JobMessage:
+    """
+    kind: 'progress' | 'file' | 'done' | 'error' | 'cancelled'
+    fraction: ilerleme (0-1); None ise belirsiz (ör. analiz sürerken)
+    file: 'file' mesajlarında durumu bildirilen dosyanın kaynak adı
+    """
+    kind: str
+    source_name: str
+    text: str = ''
+    fraction: Optional[float] = None
+    result: Optional[Dict] = None
+    file: Optional[str] = None
+
+
+def _analyze_text(text: str, profile) -> Dict:
+    """işçi süreçte: süreç genelindeki analizörle analiz (önbellek ana süreçte)"""
+    return get_analyzer().analyze_petition_creative(text, profile=profile)
+
+
+def _warm_worker() -> bool:
+    return True
+
+
+def write_to_sinks(data_folder: str, result: Dict, text: str, source_name: str):
+    """
+    işçi süreçte: sonucu veri klasörünün hedeflerine yaz
+
+    büyük bir sonucun json kodlaması tek bir C çağrısıdır ve GIL'i bırakmaz
+    (200 sayfada ~120 ms); Tk sürecinde yapılmamalı.
+    """
+    _sinks_for(data_folder).write(result, text, source_name)
+
+
+def write_batch_to_sinks(data_folder: str, items: Sequence[Tuple[Dict, str, str]]):
+    """işçi süreçte: (sonuç, metin, kaynak adı) kayıtlarını hedeflere tek seferde yaz"""
+    _sinks_for(data_folder).write_batch(items)
+
+
+def _sinks_for(data_folder: str) -> ResultSinks:
+    sinks = _worker_sinks.get(data_folder)
+    if sinks is None:
+        sinks = _worker_sinks[data_folder] = ResultSinks(data_folder)
+    return sinks
+
+
+class AnalysisWorker:
+    """tek işçili süreç havuzu; iptalde işçi sonlandırılır ve havuz bir sonraki işte yeniden kurulur"""
+
+    def __init__(self):
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        """işçi süreci başlat ve analizörünü kur (pencere açıldıktan sonra çağrılır)"""
+        self.call(_warm_worker)
+
+    def call(self, function: Callable, *args, cancelled: Optional[threading.Event] = None) -> Any:
+        """function(*args) sonucunu işçide hesapla; cancelled kurulursa işçiyi sonlandır ve JobCancelled"""
+        pending = self._get_pool().apply_async(function, args)
+        while True:
+            try:
+                return pending.get(CANCEL_POLL_SECONDS)
+            except multiprocessing.TimeoutError:
+                if cancelled is not None and cancelled.is_set():
+                    self.terminate()
+                    raise JobCancelled()
+
+    def terminate(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                # spawn: Tk ve iş parçacıkları olan süreç fork edilmez
+                self._pool = multiprocessing.get_context('spawn').Pool(1, initializer=init_worker)
+            return self._pool
+
+
+class AnalysisJob(threading.Thread):
+    """
+    bir dilekçenin okunması, analizi ve kaydı
+
+    pdf_path / text: kaynak (biri verilmeli)
+    analyzer: önbelleği ve istatistikleri tutan (ana süreçteki) analizör
+    persist(result, text, source_name): sonucu hedeflere yazar (iş parçacığında çağrılır, iptal edilmez;
+        ağır yazımlar worker.call(write_to_sinks, ...) ile işçiye verilmeli); hata fırlatırsa 'error' mesajı
+    """
+
+    def __init__(self, source_name: str, messages: queue.Queue, worker: AnalysisWorker, analyzer,
+                 persist: Callable[[Dict, str, str], None], pdf_path: Optional[str] = None,
+                 text: Optional[str] = None):
+        super().__init__(name=f"analysis-{source_name}", daemon=True)
+        self.source_name = source_name
+        self.messages = messages
+        self.worker = worker
+        self.analyzer = analyzer
+        self.persist = persist
+        self.pdf_path = pdf_path
+        self.text = text
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        try:
+            text = self._read() if self.pdf_path else self.text
+            if not text.strip():
+                self._post('error', text="İşlenecek metin bulunamadı.")
+                return
+
+            self._post('progress', text="Analiz ediliyor...")
+            result = self.analyzer.analyze_petition_creative(text, compute=self._compute)
+            self._check_cancelled()
+
+            self._post('progress', text="Kaydediliyor...", fraction=1.0)
+            result["kaynak_dosya"] = self.source_name
+            self.persist(result, text, self.source_name)
+            self._post('done', text=f"işlem başarılı: '{self.source_name}' işlendi ve kaydedildi.", result=result)
+        except JobCancelled:
+            self._post('cancelled', text=f"'{self.source_name}' işlemi iptal edildi.")
+        except Exception as error:
+            self._post('error', text=f"{type(error).__name__}: {error}")
+
+    def _read(self) -> str:
+        total = self.worker.call(pdf_page_count, self.pdf_path, cancelled=self.cancelled)
+        parts = []
+        for start in range(0, total, PAGES_PER_STEP):
+            self._check_cancelled()
+            self._post('progress', text=f"PDF okunuyor: sayfa {start + 1}/{total}", fraction=start / total)
+            stop = min(start + PAGES_PER_STEP, total)
+            parts.extend(self.worker.call(extract_page_range, self.pdf_path, start, stop, cancelled=self.cancelled))
+        return ''.join(parts)
+
+    def _compute(self, text: str, profile) -> Dict:
+        return self.worker.call(_analyze_text, text, profile, cancelled=self.cancelled)
+
+    def _check_cancelled(self):
+        if self.cancelled.is_set():
+            raise JobCancelled()
+
+    def _post(self, kind: str, text: str = '', fraction: Optional[float] = None, result: Optional[Dict] = None):
+        self.messages.put(JobMessage(kind, self.source_name, text, fraction, result))
+
+
+class BatchAnalysisJob(threading.Thread):
+    """
+    birden çok dosyanın paralel okunması ve analizi; kayıt iş sonunda bir kez
+
+    files: (yol, kaynak adı) çiftleri (.pdf / .txt)
+    persist_batch(items): [(sonuç, metin, kaynak adı)] kayıtlarını hedeflere yazar; iptal edilen
+        işte o ana kadar biten dosyalar yazılır
+    workers: havuzdaki süreç sayısı (varsayılan: çekirdek sayısı, en fazla dosya sayısı)
+
+    her dosya bittiğinde 'file' mesajı (text: 'tamam' | 'hata: ...', result: sonuç) gönderilir;
+    önbellekte bulunan dosyalar yeniden analiz edilmez, yeni sonuçlar analyzer'ın önbelleğine ve
+    istatistiklerine eklenir
+    """
+
+    def __init__(self, source_name: str, messages: queue.Queue, files: Sequence[Tuple[str, str]], analyzer,
+                 persist_batch: Callable[[List[Tuple[Dict, str, str]]], None], workers: Optional[int] = None,
+                 max_pages: Optional[int] = None, profile: str = 'full'):
+        super().__init__(name=f"batch-{source_name}", daemon=True)
+        self.source_name = source_name
+        self.messages = messages
+        self.files = list(files)
+        self.analyzer = analyzer
+        self.persist_batch = persist_batch
+        self.workers = max(1, min(workers or os.cpu_count() or 1, len(self.files)))
+        self.max_pages = max_pages
+        self.profile = profile
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        items: List[Tuple[Dict, str, str]] = []
+        failed = 0
+        try:
+            try:
+                for source_name, text, result in self._analyze_files():
+                    if is_failed_result(result):
+                        failed += 1
+                        self._post('file', text=f"hata: {result['error']['message']}", file=source_name)
+                    else:
+                        result["kaynak_dosya"] = source_name
+                        items.append((result, text, source_name))
+                        self._post('file', text="tamam", result=result, file=source_name)
+                    done = len(items) + failed
+                    self._post('progress', text=f"{done}/{len(self.files)} dosya işlendi, hata: {failed}",
+                               fraction=done / len(self.files))
+            except JobCancelled:
+                self._persist(items)
+                self._post('cancelled', text=f"Toplu işlem iptal edildi: {len(items)} dosya kaydedildi.")
+                return
+
+            self._persist(items)
+            self._post('done', text=f"Toplu işlem tamamlandı: {len(items)} dosya kaydedildi, {failed} hata.")
+        except Exception as error:
+            self._post('error', text=f"{type(error).__name__}: {error}")
+
+    def _analyze_files(self):
+        """
+        (kaynak adı, metin, sonuç) üçlüleri, bitiş sırasıyla; iptalde havuz sonlandırılır
+
+        okunan her metin önce önbellekte aranır; yalnızca bulunamayanlar işçilere gönderilir
+        """
+        source_names = dict(self.files)
+        analyzed: queue.Queue = queue.Queue()
+        pool = multiprocessing.get_context('spawn').Pool(self.workers, initializer=init_worker)
+        try:
+            reads = pool.imap_unordered(partial(read_file, max_pages=self.max_pages),
+                                        [path for path, _ in self.files])
+            unread, analyzing = len(self.files), 0
+            while unread or analyzing:
+                self._check_cancelled()
+                if unread:
+                    try:
+                        path, text, result = reads.next(CANCEL_POLL_SECONDS)
+                    except multiprocessing.TimeoutError:
+                        pass
+                    else:
+                        unread -= 1
+                        if result is None:
+                            result = self.analyzer.cached_result(text, self.profile)
+                        if result is not None:
+                            yield source_names[path], text, result
+                        else:
+                            analyzing += 1
+                            pool.apply_async(
+                                _analyze_text, (text, self.profile),
+                                callback=lambda result, path=path, text=text: analyzed.put((path, text, result)),
+                                error_callback=lambda error, path=path, text=text:
+                                    analyzed.put((path, text, failed_result(error)))
+                            )
+                try:
+                    # okuma sürerken bekleme reads.next'te yapılır
+                    path, text, result = analyzed.get_nowait() if unread else analyzed.get(timeout=CANCEL_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+                analyzing -= 1
+                if not is_failed_result(result):
+                    self.analyzer.record_result(result)
+                    self.analyzer.cache_result(text, result, self.profile)
+                yield source_names[path], text, result
+        finally:
+            pool.terminate()
+
+    def _persist(self, items: List[Tuple[Dict, str, str]]):
+        if items:
+            self._post('progress', text=f"{len(items)} dosya kaydediliyor...", fraction=1.0)
+            self.persist_batch(items)
+
+    def _check_cancelled(self):
+        if self.cancelled.is_set():
+            raise JobCancelled()
+
+    def _post(self, kind: str, text: str = '', fraction: Optional[float] = None, result: Optional[Dict] = None,
+              file: Optional[str] = None):
+        self.messages.put(JobMessage(kind, self.source_name, text, fraction, result, file))
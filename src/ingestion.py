@@ -0,0 +1,218 @@
+"""
+Klasörlerdeki PDF / metin dosyalarının GUI'siz toplu analizi.
+
+Her dosya bir işçi süreçte okunur (PDF sayfaları ya da düz metin) ve aynı
+süreçte analiz edilir; farklı dosyaların okuma ve analiz adımları işçiler
+arasında üst üste biner. Havuza aynı anda en fazla queue_size dosya verilir
+(sınırlı kuyruk): klasör ne kadar büyük olursa olsun bellekte yalnızca o
+kadar metin / sonuç bulunur. Biten sonuçlar ana süreçte, bitiş sırasıyla
+mevcut hedeflere (ResultSinks) yazılır.
+
+Kampanya tespiti (detect_campaigns) yakın kopyaları bir arada görmeyi gerektirir:
+bu modda dosyalar campaign_batch'lik gruplar halinde okunur ve her grup
+PetitionAnalyzer.analyze_batch(detect_campaigns=True) ile analiz edilir. Kampanyalar
+yalnızca aynı grup içindeki dosyalar arasında bulunur; bellek yine grup boyutuyla sınırlıdır.
+"""
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from src.petition_analyzer import failed_result, get_analyzer, init_worker, is_failed_result
+from src.result_sinks import ResultSinks
+from src.utils import iter_pdf_pages
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.txt')
+
+
+def iter_input_files(directory: str) -> Iterator[str]:
+    """klasördeki (alt klasörler dahil) .pdf / .txt dosyaları, yol sırasıyla"""
+    for current, folders, files in os.walk(directory):
+        folders.sort()
+        for name in sorted(files):
+            if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield os.path.join(current, name)
+
+
+def read_document(path: str, max_pages: Optional[int] = None) -> str:
+    """
+    dosyanın metni: PDF'ler sayfa sayfa, .txt dosyaları UTF-8 olarak okunur
+
+    okunamayan (bozuk / şifreli) PDF'lerin hatası çağırana iletilir; pdf_to_text gibi boş metne
+    çevrilmez, böylece hata kaydında asıl neden görünür
+    """
+    if path.lower().endswith('.pdf'):
+        return ''.join(iter_pdf_pages(path, 0, max_pages))
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def read_file(path: str, max_pages: Optional[int]) -> Tuple[str, str, Optional[Dict]]:
+    """
+    işçi süreçte: (yol, metin, hata kaydı); dosya okunabildiyse ve boş değilse hata kaydı None
+
+    hata fırlatmaz, böylece süreç havuzlarında sonucun hangi dosyaya ait olduğu kaybolmaz
+    """
+    try:
+        text = read_document(path, max_pages)
+    except Exception as error:
+        return path, '', failed_result(error)
+    if not text.strip():
+        return path, text, failed_result(ValueError("işlenecek metin bulunamadı"))
+    return path, text, None
+
+
+def _ingest_file(path: str, max_pages: Optional[int], profile: str) -> Tuple[str, str, Dict]:
+    """işçi süreçte: dosyayı oku ve analiz et. boş metin ve hatalar hata kaydı olarak döner"""
+    path, text, failure = read_file(path, max_pages)
+    if failure is not None:
+        return path, text, failure
+    try:
+        return path, text, get_analyzer().analyze_petition_creative(text, profile=profile)
+    except Exception as error:
+        return path, '', failed_result(error)
+
+
+def _ingest_campaign_batches(paths: List[str], workers: int, campaign_batch: int, max_pages: Optional[int],
+                             record: Callable[[str, str, Dict], None]):
+    """dosyaları gruplar halinde oku ve her grubu kampanya tespitiyle toplu analiz et"""
+    analyzer = get_analyzer()
+    reader = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        pending_paths = iter(paths)
+        while True:
+            batch = list(islice(pending_paths, campaign_batch))
+            if not batch:
+                break
+            if reader is not None:
+                documents = list(reader.map(read_file, batch, [max_pages] * len(batch)))
+            else:
+                documents = [read_file(path, max_pages) for path in batch]
+
+            readable = [(path, text) for path, text, failure in documents if failure is None]
+            results = iter(analyzer.analyze_batch([text for _, text in readable], workers=workers,
+                                                  detect_campaigns=True))
+            for path, text, failure in documents:
+                record(path, text, failure if failure is not None else next(results))
+    finally:
+        if reader is not None:
+            reader.shutdown()
+
+
+@dataclass
+class IngestionReport:
+    total: int = 0
+    written: int = 0
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """saniyede işlenen dosya"""
+        done = self.written + len(self.failed)
+        return done / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class ProgressPrinter:
+    """
+    işlenen dosya, hız ve tahmini kalan süre satırı
+
+    terminalde tek satır yerinde güncellenir; çıktı bir dosyaya / günlüğe gidiyorsa
+    en fazla interval saniyede bir yeni satır yazılır
+    """
+
+    def __init__(self, total: int, stream: TextIO = sys.stderr, interval: float = 5.0):
+        self.total = total
+        self.stream = stream
+        self.interval = interval
+        self.start = time.perf_counter()
+        self._last_print = 0.0
+        self._inline = stream.isatty()
+
+    def update(self, done: int, failed: int):
+        now = time.perf_counter()
+        if done < self.total and not self._inline and now - self._last_print < self.interval:
+            return
+        self._last_print = now
+        elapsed = now - self.start
+        rate = done / elapsed if elapsed else 0.0
+        remaining = (self.total - done) / rate if rate else 0.0
+        line = (f"[{done}/{self.total}] {rate:.2f} dosya/sn, hata: {failed}, "
+                f"geçen: {_format_duration(elapsed)}, kalan: ~{_format_duration(remaining)}")
+        if self._inline:
+            self.stream.write("\r" + line + ("\n" if done >= self.total else ""))
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+def ingest_directory(directory: str, data_folder: str, workers: Optional[int] = None,
+                     queue_size: Optional[int] = None, max_pages: Optional[int] = None, profile: str = 'full',
+                     progress: Optional[Callable[[int, int], None]] = None, detect_campaigns: bool = False,
+                     campaign_batch: int = 256) -> IngestionReport:
+    """
+    klasördeki tüm .pdf / .txt dosyalarını analiz et ve data_folder'daki hedeflere yaz
+
+    workers: işçi süreç sayısı (varsayılan: çekirdek sayısı); 1 ise bu süreçte sırayla çalışır
+    queue_size: havuzda aynı anda bekleyen en fazla dosya (varsayılan: workers * 2)
+    max_pages: PDF başına okunan en fazla sayfa
+    progress(tamamlanan, hatalı): her dosya bittiğinde çağrılır
+    detect_campaigns: yakın kopya (kampanya) dilekçeleri campaign_batch'lik gruplar içinde tespit et;
+    sonuçların metadata['campaign'] alanı doldurulur. yalnızca 'full' profille kullanılabilir
+
+    okunamayan / analiz edilemeyen dosyalar toplu işi durdurmaz, rapora eklenir
+    """
+    if detect_campaigns and profile != 'full':
+        raise ValueError("kampanya tespiti yalnızca 'full' profille kullanılabilir")
+    paths = list(iter_input_files(directory))
+    report = IngestionReport(total=len(paths))
+    sinks = ResultSinks(data_folder)
+    workers = workers or os.cpu_count() or 1
+    queue_size = max(1, queue_size or workers * 2)
+    start = time.perf_counter()
+
+    def record(path: str, text: str, result: Dict):
+        if is_failed_result(result):
+            report.failed.append((path, result['error']['message']))
+        else:
+            source_name = os.path.splitext(os.path.relpath(path, directory))[0]
+            sinks.write(result, text, source_name)
+            report.written += 1
+        if progress:
+            progress(report.written + len(report.failed), len(report.failed))
+
+    try:
+        if detect_campaigns:
+            _ingest_campaign_batches(paths, workers, max(1, campaign_batch), max_pages, record)
+        elif workers <= 1:
+            for path in paths:
+                record(*_ingest_file(path, max_pages, profile))
+        else:
+            pending_paths = iter(paths)
+            pending = set()
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+                while True:
+                    # kuyruğu doldur: havuza queue_size'dan fazla dosya verilmez
+                    for path in pending_paths:
+                        pending.add(pool.submit(_ingest_file, path, max_pages, profile))
+                        if len(pending) >= queue_size:
+                            break
+                    if not pending:
+                        break
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        record(*future.result())
+    finally:
+        sinks.close()
+        report.elapsed_seconds = time.perf_counter() - start
+
+    return report
@@ -0,0 +1,275 @@
+"""
+Tek geçişli çoklu anahtar kelime eşleştirici (Aho-Corasick).
+
+Kural setindeki bütün anahtar kelime tabloları (konu kategorileri, talep türü,
+aciliyet, duygu, sosyal sinyal, doğrulayıcı kuralları ...) tek bir otomatta
+toplanır. Doküman bir kez taranır; her katman `text.count(kw)` / `kw in text`
+yerine bu taramanın sonucunu (KeywordHits) sorgular. Böylece anahtar kelime
+katmanlarının maliyeti metin uzunluğuyla doğrusal olur.
+"""
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque, namedtuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from src.pattern_registry import (
+    ADDRESS_CONTEXT_REQUIREMENTS, CATEGORY_RULES, CONSISTENCY_INDICATORS, CORE_PATTERNS, EMOTIONAL_PATTERNS,
+    NAME_LINE_MARKERS, PROXIMITY_COMBOS, REPETITION_PATTERNS, REQUEST_TYPE_PATTERNS, SOCIAL_INDICATORS, URGENCY_KEYWORDS
+)
+
+# katman, kategori ve ağırlık sınıfı etiketi
+KeywordTag = namedtuple('KeywordTag', ['layer', 'category', 'weight_class'])
+
+# tek bir eşleşme: [start, end) ofsetleri, anahtar kelime ve etiketleri
+KeywordHit = namedtuple('KeywordHit', ['start', 'end', 'keyword', 'tags'])
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick otomatı
+
+    geçişler DFA olarak önceden hesaplanır: tarama sırasında karakter başına
+    tek bir sözlük araması yapılır, başarısızlık zincirinde gezinilmez
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._terminal: List[Optional[str]] = [None]
+        self._transitions: List[Dict[str, int]] = []
+        self._outputs: List[Tuple[str, ...]] = []
+        self._keywords: frozenset = frozenset()
+        self.tags: Dict[str, List[KeywordTag]] = defaultdict(list)
+
+    def add(self, keyword: str, tag: Optional[KeywordTag] = None):
+        """anahtar kelime ekle (aynı kelime farklı etiketlerle tekrar eklenebilir)"""
+        if self._transitions:
+            raise RuntimeError("Otomat derlendikten sonra anahtar kelime eklenemez")
+        if not keyword:
+            return
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._terminal.append(None)
+            state = next_state
+        self._terminal[state] = keyword
+
+        if tag is not None and tag not in self.tags[keyword]:
+            self.tags[keyword].append(tag)
+
+    def build(self) -> 'KeywordAutomaton':
+        """başarısızlık bağlantılarını ve DFA geçişlerini hesapla"""
+        state_count = len(self._goto)
+        fail = [0] * state_count
+        transitions: List[Dict[str, int]] = [{} for _ in range(state_count)]
+        outputs: List[Tuple[str, ...]] = [()] * state_count
+
+        transitions[0] = dict(self._goto[0])
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            outputs[state] = (self._terminal[state],) if self._terminal[state] else ()
+
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                fail[child] = transitions[fail[state]].get(char, 0)
+                own = (self._terminal[child],) if self._terminal[child] else ()
+                outputs[child] = own + outputs[fail[child]]
+                queue.append(child)
+
+            # eksik geçişler başarısızlık durumundan devralınır
+            if state:
+                merged = dict(transitions[fail[state]])
+                merged.update(self._goto[state])
+                transitions[state] = merged
+
+        self._transitions = transitions
+        self._outputs = outputs
+        self._keywords = frozenset(keyword for keyword in self._terminal if keyword)
+        return self
+
+    @property
+    def keywords(self) -> frozenset:
+        return self._keywords
+
+    def scan(self, text: str) -> 'KeywordHits':
+        """metni bir kez tara, tüm eşleşmeleri ofsetleriyle döndür"""
+        if not self._transitions:
+            self.build()
+
+        transitions = self._transitions
+        outputs = self._outputs
+        positions: Dict[str, List[int]] = defaultdict(list)
+
+        state = 0
+        for index, char in enumerate(text):
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                end = index + 1
+                for keyword in outputs[state]:
+                    positions[keyword].append(end - len(keyword))
+
+        return KeywordHits(text, dict(positions), self)
+
+
+class KeywordHits:
+    """
+    tek bir taramanın sonucu
+
+    count / in sorguları str.count ve `in` ile aynı sonucu verir; otomatta
+    olmayan bir kelime sorulursa doğrudan metne bakılır
+    """
+
+    def __init__(self, text: str, positions: Dict[str, List[int]], automaton: KeywordAutomaton):
+        self.text = text
+        self.positions = positions
+        self._automaton = automaton
+        self._indexed = automaton.keywords
+        self._counts: Dict[str, int] = {}
+
+    def __contains__(self, keyword: str) -> bool:
+        if keyword in self._indexed:
+            return keyword in self.positions
+        return keyword in self.text
+
+    def count(self, keyword: str) -> int:
+        """örtüşmeyen eşleşme sayısı (str.count ile aynı)"""
+        if keyword not in self._indexed:
+            return self.text.count(keyword)
+
+        cached = self._counts.get(keyword)
+        if cached is None:
+            cached = 0
+            next_free = 0
+            for start in self.positions.get(keyword, ()):
+                if start >= next_free:
+                    cached += 1
+                    next_free = start + len(keyword)
+            self._counts[keyword] = cached
+        return cached
+
+    def starts(self, keyword: str) -> List[int]:
+        return self.positions.get(keyword, [])
+
+    def any_within(self, keywords: Iterable[str], start: int, end: int) -> bool:
+        """anahtar kelimelerden biri tamamen [start, end) aralığında geçiyor mu"""
+        for keyword in keywords:
+            if keyword not in self._indexed:
+                if keyword in self.text[start:end]:
+                    return True
+                continue
+            starts = self.positions.get(keyword)
+            if not starts:
+                continue
+            index = bisect_left(starts, start)
+            if index < len(starts) and starts[index] + len(keyword) <= end:
+                return True
+        return False
+
+    def iter_hits(self, layer: Optional[str] = None) -> Iterator[KeywordHit]:
+        """eşleşmeleri ofset sırasıyla dolaş; layer verilirse o katmanın etiketleriyle süz"""
+        hits = []
+        for keyword, starts in self.positions.items():
+            tags = self._automaton.tags.get(keyword, [])
+            if layer is not None:
+                tags = [tag for tag in tags if tag.layer == layer]
+                if not tags:
+                    continue
+            for start in starts:
+                hits.append(KeywordHit(start, start + len(keyword), keyword, tags))
+        hits.sort(key=lambda hit: (hit.start, hit.end))
+        return iter(hits)
+
+    def keywords_by_span(self, spans: Sequence[Sequence[Tuple[int, int]]]) -> List[Set[str]]:
+        """
+        her span grubu (ör. bir cümlenin parçaları) için tamamen içinde kalan anahtar kelimeler
+
+        spans: [[(start, end), ...], ...] - gruplar ve parçalar ofset sırasında olmalı
+        """
+        piece_starts = []
+        piece_ends = []
+        piece_group = []
+        for group_index, group in enumerate(spans):
+            for start, end in group:
+                piece_starts.append(start)
+                piece_ends.append(end)
+                piece_group.append(group_index)
+
+        grouped: List[Set[str]] = [set() for _ in spans]
+        if not piece_starts:
+            return grouped
+
+        for keyword, starts in self.positions.items():
+            length = len(keyword)
+            for start in starts:
+                piece = bisect_right(piece_starts, start) - 1
+                if piece >= 0 and start + length <= piece_ends[piece]:
+                    grouped[piece_group[piece]].add(keyword)
+        return grouped
+
+
+def _iter_keyword_tables() -> Iterable[Tuple[str, KeywordTag]]:
+    """kural setindeki tüm anahtar kelime tabloları, etiketleriyle"""
+    for category, keywords_dict in CORE_PATTERNS['subject_categories'].items():
+        for weight_class, keywords in keywords_dict.items():
+            for keyword in keywords:
+                yield keyword, KeywordTag('category', category, weight_class.replace('_keywords', ''))
+
+    for indicator in CORE_PATTERNS['location_hierarchy']['address_indicators']:
+        yield indicator, KeywordTag('address', 'address_indicators', 'indicator')
+
+    for clue in CORE_PATTERNS['person_identity']['context_clues']:
+        yield clue, KeywordTag('name', 'context_clues', 'clue')
+    for marker_type, markers in NAME_LINE_MARKERS.items():
+        for marker in markers:
+            yield marker, KeywordTag('name', 'line_markers', marker_type)
+
+    for request_type, config in REQUEST_TYPE_PATTERNS.items():
+        for keyword in config['keywords']:
+            yield keyword, KeywordTag('request_type', request_type, config['weight'])
+
+    for level, keywords in URGENCY_KEYWORDS.items():
+        for keyword in keywords:
+            yield keyword, KeywordTag('urgency', level, 'keywords')
+    for keyword in REPETITION_PATTERNS:
+        yield keyword, KeywordTag('urgency', 'repetition', 'keywords')
+
+    for combo_index, combo in enumerate(PROXIMITY_COMBOS):
+        for keyword in combo:
+            yield keyword, KeywordTag('proximity', combo_index, 'combo')
+
+    for emotion, keywords in EMOTIONAL_PATTERNS.items():
+        for keyword in keywords:
+            yield keyword, KeywordTag('emotion', emotion.split('_')[0], emotion)
+
+    for category, subcategories in SOCIAL_INDICATORS.items():
+        for subcategory, keywords in subcategories.items():
+            for keyword in keywords:
+                yield keyword, KeywordTag('social', category, subcategory)
+
+    for category, rules in CATEGORY_RULES.items():
+        for keyword in rules['keywords']:
+            yield keyword, KeywordTag('category_rules', category, 'keywords')
+        for keyword in rules['negative_keywords']:
+            yield keyword, KeywordTag('category_rules', category, 'negative_keywords')
+
+    for indicator_type, keywords in CONSISTENCY_INDICATORS.items():
+        for keyword in keywords:
+            yield keyword, KeywordTag('consistency', indicator_type, 'indicator')
+
+    for keyword in ADDRESS_CONTEXT_REQUIREMENTS:
+        yield keyword, KeywordTag('validation', 'address_context', 'requirement')
+
+
+@lru_cache(maxsize=None)
+def get_keyword_index() -> KeywordAutomaton:
+    """süreç genelinde paylaşılan, tüm tablolardan kurulmuş otomat"""
+    automaton = KeywordAutomaton()
+    for keyword, tag in _iter_keyword_tables():
+        automaton.add(keyword, tag)
+    return automaton.build()
+
@@ -0,0 +1,164 @@
+"""
+Kampanya dilekçeleri için yakın kopya tespiti (MinHash + LSH).
+
+Kampanya dilekçelerinin çoğu aynı metnin kopyasıdır; yalnızca imza, isim ya
+da adres satırı değişir. Birebir özet (result_cache) bunları yakalayamaz.
+
+  - her dilekçe, küçük harfe çevrilmiş kelimelerin shingle_size'lık
+    kaydırmalı gruplarına (shingle) ayrılır
+  - num_perm hash fonksiyonuyla MinHash imzası çıkarılır: iki imzanın aynı
+    olan konumlarının oranı Jaccard benzerliğinin tahminidir
+  - imza bantlara bölünür (LSH); en az bir bandı aynı olan dilekçeler aday
+    çifttir. böylece tüm çiftler karşılaştırılmaz, süre doküman sayısıyla
+    yaklaşık doğrusal büyür
+  - dilekçeler girdi sırasıyla gezilir; bir kampanyaya bağlanmamış dilekçe
+    temsilci olur ve henüz bağlanmamış adaylarından temsilciyle benzerliği
+    eşiği geçenler kampanyasına katılır
+
+Üyeler aday zinciriyle değil, doğrudan temsilciyle karşılaştırılır: her biri
+küçük bir düzenleme olan A, B, C, ... dizisinde C'nin A'ya benzerliği eşiğin
+altındaysa C, A'nın kampanyasına girmez (kampanya üyeleri temsilcinin
+katmanlarını devralır, bkz. PetitionAnalyzer.analyze_batch). Kampanyanın
+temsilcisi girdi sırasındaki ilk dilekçedir.
+"""
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.document_context import turkish_lower
+
+_HASH_SHIFT = np.uint64(32)
+
+
+@dataclass
+class Campaign:
+    """yakın kopya dilekçe grubu; indeksler girdi sırasına göredir"""
+    campaign_id: int
+    representative: int
+    members: List[int]
+    # üye indeksi -> temsilciyle tahmini Jaccard benzerliği
+    similarities: Dict[int, float] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.members) + 1
+
+    def to_dict(self) -> Dict:
+        return {
+            'campaign_id': self.campaign_id,
+            'representative': self.representative,
+            'members': list(self.members),
+            'size': self.size,
+            'similarities': dict(self.similarities),
+        }
+
+
+def choose_bands(num_perm: int, threshold: float):
+    """
+    (bant, satır) çifti: LSH'nin S-eğrisi eşiği (1/b)^(1/r), verilen eşiğin
+    altındaki en büyük değer olacak şekilde seçilir (yanlış negatif yerine
+    fazladan aday tercih edilir, adaylar zaten doğrulanır)
+    """
+    best = (num_perm, 1)
+    best_threshold = 0.0
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        curve = (1.0 / bands) ** (1.0 / rows)
+        if best_threshold < curve <= threshold:
+            best, best_threshold = (bands, rows), curve
+    return best
+
+
+class NearDuplicateDetector:
+    """
+    threshold: aynı kampanyaya bağlanmak için gereken tahmini Jaccard benzerliği
+    num_perm: MinHash imza uzunluğu
+    shingle_size: shingle başına kelime sayısı
+    seed: hash parametreleri (aynı seed aynı imzaları üretir)
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold 0 ile 1 arasında olmalı")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+
+        rng = np.random.default_rng(seed)
+        # çarp-kaydır hash ailesi: ((a * x + b) mod 2^64) >> 32, a tek sayı
+        self._a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        """kelime gruplarının 32 bitlik özetleri (tekil)"""
+        words = turkish_lower(text).split()
+        size = self.shingle_size
+        if len(words) <= size:
+            grams = [' '.join(words)] if words else []
+        else:
+            grams = [' '.join(words[index:index + size]) for index in range(len(words) - size + 1)]
+        return np.unique(np.fromiter((zlib.crc32(gram.encode('utf-8')) for gram in grams),
+                                     dtype=np.uint64, count=len(grams)))
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """num_perm uzunluğunda MinHash imzası; boş metin için None"""
+        shingles = self.shingles(text)
+        if not len(shingles):
+            return None
+        with np.errstate(over='ignore'):
+            hashed = (np.outer(self._a, shingles) + self._b[:, None]) >> _HASH_SHIFT
+        return hashed.min(axis=1)
+
+    @staticmethod
+    def similarity(first: np.ndarray, second: np.ndarray) -> float:
+        """iki imzadan tahmini Jaccard benzerliği"""
+        return float(np.count_nonzero(first == second)) / len(first)
+
+    def find_campaigns(self, texts: Sequence[str]) -> List[Campaign]:
+        """en az iki dilekçeden oluşan kampanyalar, temsilci sırasına göre"""
+        signatures = [self.signature(text) for text in texts]
+
+        # dilekçe -> LSH kovaları (aynı kovadakiler aday çifttir)
+        candidate_buckets: List[List[List[int]]] = [[] for _ in texts]
+        for band in range(self.bands):
+            columns = slice(band * self.rows, (band + 1) * self.rows)
+            buckets: Dict[bytes, List[int]] = {}
+            for index, signature in enumerate(signatures):
+                if signature is not None:
+                    buckets.setdefault(signature[columns].tobytes(), []).append(index)
+            for bucket in buckets.values():
+                if len(bucket) > 1:
+                    for index in bucket:
+                        candidate_buckets[index].append(bucket)
+
+        assigned: List[Optional[int]] = [None] * len(texts)
+        campaigns = []
+        for representative, signature in enumerate(signatures):
+            if signature is None or assigned[representative] is not None:
+                continue
+            assigned[representative] = representative
+            similarities = {}
+            checked = set()
+            for bucket in candidate_buckets[representative]:
+                for index in bucket:
+                    # girdi sırasıyla gezildiği için bağlanmamış aday her zaman temsilciden sonradır
+                    if assigned[index] is not None or index in checked:
+                        continue
+                    checked.add(index)
+                    similarity = self.similarity(signature, signatures[index])
+                    if similarity >= self.threshold:
+                        assigned[index] = representative
+                        similarities[index] = round(similarity, 4)
+            if similarities:
+                campaigns.append(Campaign(
+                    campaign_id=len(campaigns),
+                    representative=representative,
+                    members=sorted(similarities),
+                    similarities=dict(sorted(similarities.items())),
+                ))
+        return campaigns
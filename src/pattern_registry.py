@@ -0,0 +1,1139 @@
+"""
+Pattern kaydı: kural setinin tamamı (regex aileleri ve anahtar kelime tabloları).
+
+Regex aileleri süreç başına bir kez derlenir; analizör ve doğrulayıcı örnekleri
+aynı derlenmiş nesneleri paylaşır, böylece her çağrıda re modülünün küçük iç
+önbelleğine güvenilmez. Kural setinin sürümü (RULESET_VERSION + içerik parmak
+izi) sonuç metadata'sına yazılır.
+
+İmza, adres ve kurum aileleri tüm doküman üzerinde çalıştığı için
+bounded_regex ile derlenir: uzun girdilerde karesel geri izleme yapan
+biçimler doğrusal süreli eşleştiriciyle değiştirilir (findall sonucu aynıdır).
+"""
+import hashlib
+import json
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, Pattern, Tuple
+
+from src.bounded_regex import compile_bounded
+
+
+# kural setinde bir pattern / anahtar kelime değiştiğinde artırılmalı
+RULESET_VERSION = "rules-1.0"
+
+
+# çekirdek pattern kütüphanesi
+CORE_PATTERNS = {
+    'person_identity': {
+        'signature_patterns': [
+
+            r'saygılarım(?:la|ızla)[,\s]*([A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞİÖŞÜ\s]{3,50})$',
+            r'saygılarımla[,\s\n]+([A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞİÖŞÜ\s]{3,50})$',
+            r'hürmetlerimi\s+sunarım[,\s]*([A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞİÖŞÜ\s]{3,50})$',
+            r'iyi\s+çalışmalar\s+dilerim[,\s]*([A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞİÖŞÜ\s]{3,50})$',
+
+            r'(?:ben|adım|ismim)\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)+)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)(?:\s+olarak|\s+adına)',
+            r'(?:adım|ismim|ben)\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+            r'benim\s+adım\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s*/\s*([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+/\s*([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s*-\s*([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+(?:yaşıyorum|ikamet|oturuyorum)',
+            r'(?:yaşadığım|oturduğum|ikametgahım).*?([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+(?:vatandaşınız|sakiniyim)',
+            r'vatandaşınız\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s*$',
+            r'^([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)$',
+
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+tc:?\s*\d{11}',
+            r'tc:?\s*\d{11}\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+(?:tel|telefon|gsm):?\s*[\d\s\-\(\)]+',
+
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+(?:emekli|öğretmen|memur|işçi|esnaf|doktor)',
+            r'(?:emekli|öğretmen|memur|işçi|esnaf|doktor)\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+        ],
+
+        'context_clues': [
+            'vatandaşınız', 'sakiniyim', 'mukim', 'ikamet', 'adına', 'ben', 'benim',
+            'yaşıyorum', 'oturuyorum', 'adım', 'ismim', 'tc', 'kimlik', 'telefon'
+        ],
+
+        'validation_patterns': [
+            r'[A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][A-Z]*[a-zçğıöşü]+',
+        ],
+
+        # pozisyonel ağırlıklar
+        'position_weights': {
+            'document_start': 1.2,  # dokümanın başı
+            'document_end': 1.5,    # dokümanın sonu - imza
+            'after_greeting': 1.3,  # selamlamadan sonra
+            'before_signature': 1.4 # imzadan önce
+        }
+    },
+
+    #  konum analizi
+    'location_hierarchy': {
+        'district_patterns': [
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+(?:ilçesi|İlçesi)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:ilçesi|İlçesi|ilçesine|ilçemiz)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+/[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+merkez\s+ilçe',
+        ],
+
+        'neighborhood_patterns': [
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:mahallesi|Mahallesi|mah\.|mh\.)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+(?:köyü|Köyü|kasabası)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:beldesi|Beldesi)',
+        ],
+
+        'street_patterns': [
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:caddesi|Caddesi|cad\.|cd\.)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:sokağı|Sokağı|sok\.|sk\.)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:bulvarı|Bulvarı|blv\.)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:meydanı|Meydanı)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:apartmanı|Apartmanı|sitesi|Sitesi)',
+            r'(\d+\.?\s+sokak)',
+            r'(\d+\.\s+cadde)',
+        ],
+
+        'address_indicators': [
+            'yaşadığım', 'ikamet', 'oturduğum', 'evim', 'adresim', 'ikametgah',
+            'mukim', 'yaşıyor', 'bulunan', 'meskun'
+        ]
+    },
+
+    # kurum kuruluş tespiti
+    'authority_recognition': {
+        'primary_authorities': [
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:belediyesi|Belediyesi)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:büyükşehir|Büyükşehir)\s+(?:belediyesi|Belediyesi)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:Valiliği|Valiliğine|valiliği)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:Kaymakamlığı|Kaymakamlığına|kaymakamlığı)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:İl\s+Özel\s+İdaresi|il\s+özel\s+idaresi)',
+
+        ],
+
+        'secondary_authorities': [
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:müdürlüğü|Müdürlüğü)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:başkanlığı|Başkanlığı)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:Daire\s+Başkanlığı|daire\s+başkanlığı)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:Şube\s+Müdürlüğü|şube\s+müdürlüğü)',
+        ],
+
+        'authority_titles': [
+            r'sayın\s+([^,\n]{5,50})(?:,|\n)',
+            r'muhterem\s+([^,\n]{5,50})(?:,|\n)',
+            r'değerli\s+([^,\n]{5,50})(?:,|\n)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:belediye\s+başkanı|mayor)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü\s]+)\s+(?:vali|kaymakam|müdür|başkan)',
+        ]
+    },
+
+    # konu kategorileri
+    'subject_categories': {
+
+        'yol_ulasim': {
+            'primary_keywords': [
+                'yol', 'asfalt', 'kaldırım', 'çukur', 'bozuk', 'tamir',
+                'parke', 'kaya', 'toprak', 'stabilize', 'macadam'
+            ],
+            'secondary_keywords': [
+                'trafik', 'kavşak', 'işaret', 'geçit', 'otobüs', 'durak',
+                'park', 'otopark', 'araç', 'bisiklet', 'yürüyüş', 'kaza',
+                'tehlike', 'güvenlik', 'ışık', 'sinyal', 'rampa', 'köprü'
+            ],
+            'context_keywords': [
+                'geçiş', 'ulaşım', 'yürüme', 'araç', 'trafik', 'güzergah',
+                'rota', 'mesafe', 'erişim', 'bağlantı', 'kavşak'
+            ],
+            'problem_keywords': [
+                'çökme', 'çatlak', 'delik', 'kaygan', 'tehlikeli', 'dar',
+                'kapali', 'engelli', 'tıkalı', 'bozuk', 'yamuk', 'trafik kazası', 'trafik ışığı'
+            ]
+        },
+
+
+        'su_kanalizasyon': {
+            'primary_keywords': [
+                'su', 'kanalizasyon', 'atık', 'pis', 'tıkanık', 'akıt',
+                'sızıntı', 'taşma', 'koku', 'pis', 'kirli'
+            ],
+            'secondary_keywords': [
+                'içme suyu', 'şebeke', 'kesinti', 'basınç', 'kaçak',
+                'rögar', 'menhol', 'boru', 'vana', 'sayaç', 'fatura'
+            ],
+            'context_keywords': [
+                'musluk', 'lavabo', 'banyo', 'mutfak', 'tuvalet',
+                'bahçe', 'sokak', 'kanal', 'drenaj', 'yağmur'
+            ],
+            'problem_keywords': [
+                'kesik', 'akmıyor', 'gelmıyor', 'düşük', 'yüksek',
+                'bulanık', 'kokulu', 'sıcak', 'soğuk', 'donmuş'
+            ]
+        },
+
+
+        'cevre_temizlik': {
+            'primary_keywords': [
+                'çöp', 'atık', 'temizlik', 'hijyen', 'kirli', 'pis',
+                'koku', 'böcek', 'fare', 'haşere', 'bakterı', 'kaldırım', 'su birikintisi'
+            ],
+            'secondary_keywords': [
+                'konteyner', 'çöp kutusu', 'toplama', 'süpürme', 'yıkama',
+                'dezenfekte', 'ilaçlama', 'fumigasyon', 'temizleme'
+            ],
+            'context_keywords': [
+                'sokak', 'cadde', 'park', 'bahçe', 'meydan', 'pazar',
+                'okul', 'hastane', 'market', 'ev', 'apartman'
+            ],
+            'problem_keywords': [
+                'dolu', 'taşan', 'saçılmış', 'kokulu', 'yanık',
+                'çürük', 'leş', 'pislik', 'berbat', 'iğrenç'
+            ]
+        },
+
+
+        'gurultu_rahatsizlik': {
+            'primary_keywords': [
+                'gürültü', 'ses', 'bağırma', 'çığlık', 'patırtı',
+                'müzik', 'hoparlör', 'megafon', 'davul', 'zurna', 'güvensiz ortam', 'tedirgin'
+            ],
+            'secondary_keywords': [
+                'rahatsız', 'uyku', 'dinlenme', 'huzur', 'sessizlik',
+                'konser', 'düğün', 'eğlence', 'parti', 'kutlama'
+            ],
+            'context_keywords': [
+                'gece', 'sabah', 'öğle', 'akşam', 'hafta sonu',
+                'tatil', 'bayram', 'festival', 'şenlik', 'organizasyon'
+            ],
+            'problem_keywords': [
+                'yüksek', 'aşırı', 'dayanılmaz', 'sürekli', 'devamlı',
+                'saatlerce', 'geç', 'erken', 'uygunsuz', 'yasak','güvensiz ortam', 'tedirgin'
+            ]
+        },
+
+
+        'aydinlatma': {
+            'primary_keywords': [
+                'ışık', 'lamba', 'aydınlatma', 'karanlık', 'loş',
+                'ampul', 'projektör', 'reflektör', 'led', 'neon'
+            ],
+            'secondary_keywords': [
+                'sokak lambası', 'park lambası', 'güvenlik', 'aydınlık',
+                'parlaklık', 'enerji', 'elektrik', 'kablo', 'direk'
+            ],
+            'context_keywords': [
+                'sokak', 'cadde', 'park', 'meydan', 'köprü', 'alt geçit',
+                'otopark', 'bahçe', 'yol', 'kaldırım', 'merdiven'
+            ],
+            'problem_keywords': [
+                'yanmıyor', 'söndü', 'bozuk', 'kırık', 'eksik',
+                'yetersiz', 'zayıf', 'titrek', 'kesiyor', 'gidiyor'
+            ]
+        },
+
+
+        'park_yesil_alan': {
+            'primary_keywords': [
+                'park', 'bahçe', 'yeşil', 'ağaç', 'çiçek', 'çimen',
+                'çim', 'peyzaj', 'bitki', 'fidanlık', 'orman'
+            ],
+            'secondary_keywords': [
+                'oyun alanı', 'çocuk parkı', 'bank', 'oturma', 'gölge',
+                'sulama', 'budama', 'bakım', 'düzenleme', 'çevre'
+            ],
+            'context_keywords': [
+                'dinlenme', 'spor', 'yürüyüş', 'koşu', 'bisiklet',
+                'çocuk', 'aile', 'rekreasyon', 'piknik', 'doğa'
+            ],
+            'problem_keywords': [
+                'kurumuş', 'ölmüş', 'kesilmiş', 'harap', 'bakımsız',
+                'kirli', 'pislik', 'zarar', 'tahrip', 'yıkım'
+            ]
+        },
+
+
+        'guvenlik': {
+            'primary_keywords': [
+                'güvenlik', 'suç', 'hırsızlık', 'saldırı', 'tehdit',
+                'korku', 'emniyet', 'polis', 'bekçi', 'kamera'
+            ],
+            'secondary_keywords': [
+                'uyuşturucu', 'sarhoş', 'kavga', 'bıçak', 'silah',
+                'yaralama', 'darp', 'gasp', 'kapkaç', 'dolandırıcılık'
+            ],
+            'context_keywords': [
+                'sokak', 'park', 'otopark', 'alt geçit', 'köprü',
+                'meydan', 'pazar', 'okul', 'hastane', 'terminal'
+            ],
+            'problem_keywords': [
+                'tehlikeli', 'riskli', 'güvensiz', 'korkutucu',
+                'şüpheli', 'suçlu', 'zararlı', 'yasaklı', 'illegal',
+            ]
+        },
+
+
+        'yapim_insaat': {
+            'primary_keywords': [
+                'inşaat', 'yapım', 'inşa', 'bina', 'yapı', 'köprü',
+                'yol', 'beton', 'çimento', 'demir', 'tuğla', 'taş'
+            ],
+            'secondary_keywords': [
+                'proje', 'planlama', 'tasarım', 'mimar', 'mühendis',
+                'müteahhit', 'işçi', 'makine', 'vinç', 'kamyon'
+            ],
+            'context_keywords': [
+                'gecikmeli', 'yarıda', 'durmuş', 'tamamlanmamış',
+                'eksik', 'hatalı', 'kusurlu', 'standart', 'kalite'
+            ],
+            'problem_keywords': [
+                'duran', 'terk edilmiş', 'yarım', 'hatalı', 'çöken',
+                'çatlayan', 'zarar', 'tehlike', 'risk', 'sorunlu'
+            ]
+        },
+
+
+        'saglik_hijyen': {
+            'primary_keywords': [
+                'sağlık', 'hijyen', 'temizlik', 'dezenfekte', 'steril',
+                'mikrop', 'bakteri', 'virüs', 'hastalık', 'bulaşıcı'
+            ],
+            'secondary_keywords': [
+                'hastane', 'sağlık ocağı', 'eczane', 'ambulans',
+                'doktor', 'hemşire', 'tıbbi', 'tedavi', 'ilaç'
+            ],
+            'context_keywords': [
+                'acil', 'hasta', 'yaralı', 'rahatsız', 'ağrı',
+                'enfeksiyon', 'zehirlenme', 'alerji', 'grip', 'ateş'
+            ],
+            'problem_keywords': [
+                'kirli', 'pis', 'kokulu', 'tehlikeli', 'zararlı',
+                'bulaşık', 'enfekte', 'toksik', 'zehirli', 'riskli'
+            ]
+        },
+
+
+        'egitim': {
+            'primary_keywords': [
+                'okul', 'eğitim', 'öğretim', 'öğrenci', 'öğretmen',
+                'müdür', 'dersane', 'kurs', 'anaokulu', 'kreş'
+            ],
+            'secondary_keywords': [
+                'sınıf', 'ders', 'kitap', 'defter', 'kalem', 'tahta',
+                'projeksiyon', 'laboratuvar'
+            ]
+        },
+
+        'elektrik-ariza': {
+            'primary_keywords': [
+                'elektrik kesintisi', 'kesinti', 'elektrikler yok', 'karanlıkta oturuyoruz', 'elektirkli cihaz',
+                'elektrik', 'televizyon', 'buzdolabı', 'makinalar çalışmıyor', 'kreş', 'şarj', 'telefon şarjı',
+            ],
+            'secondary_keywords': [
+                 'çocukar ödevini yapamıyor', 'telefon şarjı', 'ışık ihtiyacı', 'cihazlar çalışmıyor', 'elektrikli',
+
+            ]
+        },
+        'internet-sorunu': {
+            'primary_keywords': [
+                'internet', 'bağlantı', 'hız', 'mbps', 'internet yavaş',
+                'internet altyapısı'
+            ],
+            'secondary_keywords': [
+                 'whatsapp', 'instagram', 'mobil uygulama', 'twitter', 'x uygulaması'
+            ]
+        },
+        'telefon-sorunu': {
+            'primary_keywords': [
+                 'şebeke', 'telefon çekmiyor', 'ulaşamıyorum', 'sesini alamıyorum','çekmiyor'
+                , 'arama', 'arayamıyorum'
+            ],
+            'secondary_keywords': [
+                'arama yapma', 'baz istasyonu'
+            ]
+        },
+        'arıza': {
+            'primary_keywords': [
+                'asansör arızalı', 'yürüyen merdiven çalışmıyor', 'bozuk', 'aktif değil', 'arıza', 'bozuk'
+            ],
+            'secondary_keywords': [
+                'arama yapma', 'baz istasyonu', 'aramam ulaşmıyor'
+            ]
+        },
+        'faturalandırma_sorunu': {
+            'primary_keywords': [
+                'olağandışı artış', 'haksız ödeme', 'vergi kaçırma', 'yüksek mebla', 'servis bedeli', 'kullanımsal olmayan'
+            ],
+            'secondary_keywords': [
+                'yeniden ölçüm', 'yeniden faturalandırma', 'tekrar inceleme', 'soruşturma', 'kaçak kullanım'
+            ]
+        },
+        'okul_sorunu': {
+            'primary_keywords': [
+                'kaloriferler yanmıyor', 'montla ders işliyor', 'sınıflar soğuk', 'sınıflar kirli', 'sınıflar kalabalık',
+                'kış ayları', 'şiddet', 'psikolojik şiddet'
+            ],
+            'secondary_keywords': [
+                'tramvatik davranışlar', 'zorbalığa uğrama', 'öğretmen zorbalığı', 'akran zorbalığı', 'uyum sağlayamama'
+            ]
+        },
+        'kargo_sorunu': {
+            'primary_keywords': [
+                'kargo', 'elime ulaşmadı', 'kargo takip sistemi', 'yolda', 'ptt','yurtiçi kargo', 'mng', 'ups','sürat kargo'
+                , 'kurye'
+            ],
+            'secondary_keywords': [
+                'hala yolda', 'kargo şubesi', 'kargo şubesine ulaşamıyorum', 'kurye kargoma zarar', 'kargo hasarı', 'kargom hasarlı'
+            ]
+        },
+        'pazaryeri_sorunu': {
+            'primary_keywords': [
+                'hafta sonları kurulan', 'pazar yeri', 'sebze meyve pazarı', 'pazaryeri düzenlemesi', 'pazaryeri taşıması',
+                'kullanımsal olmayan'
+            ]
+        }
+    }
+}
+
+
+# isim çıkarımında kullanılan yardımcı patternler
+NAME_EXTRACTION_PATTERNS = {
+    'sentence_split': r'[.!?]+',
+    'sentence_piece': r'[^.!?]+',
+    # kelime sınırları: boşluk ve cümle sonu işaretleri dışındaki karakter dizileri
+    'token': r'[^\s.!?]+',
+    'name_candidate': r'\b[A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+\b',
+    'greeting_name': r'(?:sayın|muhterem)\s+([A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞİÖŞÜ\s]+?)(?:[,\n]|$)',
+
+    # "isim / lokasyon"  şeklinde  formatlar
+    'slash_patterns': [
+        r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s*/\s*([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+        r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s*-\s*([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
+        r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+/[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)'
+    ],
+
+    'tc_patterns': [
+        r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+(?:tc|TC|T\.C\.):?\s*\d{11}',
+        r'(?:tc|TC|T\.C\.):?\s*\d{11}\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)'
+    ],
+
+    'phone_patterns': [
+        r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+(?:tel|telefon|gsm|cep):?\s*[\d\s\-\(\)]+',
+        r'(?:tel|telefon|gsm|cep):?\s*[\d\s\-\(\)]+\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)'
+    ]
+}
+
+# konumsal isim aramasında satır işaretçileri
+NAME_LINE_MARKERS = {
+    # bu kelimeleri içeren son satırlar iletişim satırı sayılır, isim aranmaz
+    'contact': ['telefon', 'tel:', 'gsm:', 'e-mail', '@', 'http'],
+    # bu kelimeleri içeren ilk satırlarda hitap sonrası isim aranır
+    'greeting': ['sayın', 'muhterem']
+}
+
+# bağlamsal adres araması: adres göstergesi + bu kalıp
+CONTEXTUAL_ADDRESS_SUFFIX = r'.*?([A-ZÇĞİÖŞÜ][a-zçğıöşü\s/,-]+(?:mahallesi|sokağı|caddesi|bulvarı|ilçesi).*?)(?:\.|,|$)'
+
+# doğrulayıcı patternleri
+VALIDATOR_PATTERNS = {
+    'skeptical': {
+        'required_name': r'^[A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞİÖŞÜ\s]+$',
+        'forbidden': [r'\d', r'[!@#$%^&*()]'],
+        'turkish_name_bonus': [r'[çğıöşüÇĞIİÖŞÜ]'],
+        'address_suspicious': [r'\d{5,}', r'[!@#$%^&*()]']
+    },
+
+    'enhanced': {
+        'required_name': r'^[A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞIİÖŞÜ\s]+$',
+        'forbidden': [r'\d', r'[!@#$%^&*()]'],
+        'turkish_name_bonus': [r'[çğıöşüÇĞIİÖŞÜ]'],
+        'address_suspicious': [r'\d{5,}', r'[!@#$%^&*()]'],
+
+        # Gerçek olmayan isim kalıpları algoritma isim gördüğü için çıkarmak için eklendi
+        'fake_name': [
+            r'.*kesinti.*',
+            r'.*sorun.*',
+            r'.*arıza.*',
+            r'.*problem.*',
+            r'.*talep.*',
+            r'.*şikayet.*',
+            r'.*başvuru.*',
+            r'internet.*',
+            r'elektrik.*',
+            r'su.*',
+            r'.*hizmet.*'
+        ],
+
+        # türkçe isim kalıbı
+        'real_name': r'\b[A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞIİÖŞÜ]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞIİÖŞÜ]+)*\b',
+
+        'real_address': [
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)*)\s+(mahalle|sokak|cadde|bulvar)',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+Mahallesi',
+            r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+(daire|apartman|blok)',
+        ],
+
+        # tarih ve zaman ifadeleri içeren şüpheli adres kalıpları
+        'address_correction': [
+            r'sabahından bu yana',
+            r'\d+\s+(eylül|ocak|şubat|mart|nisan|mayıs|haziran|temmuz|ağustos|ekim|kasım|aralık)',
+            r'bu yana',
+            r'dan beri'
+        ],
+
+        'address_time': [r'sabahından', r'bu yana', r'\d+\s+(eylül|ocak|şubat)', r'dan beri']
+    }
+}
+
+
+# anahtar kelime tabloları
+# (tek geçişli anahtar kelime taraması için src/keyword_index.py bu tabloların hepsinden tek bir otomat kurar)
+
+# talep türü sınıflandırması
+REQUEST_TYPE_PATTERNS = {
+    'acil_cozum_talebi': {
+        'keywords': ['acil', 'hemen', 'derhal', 'çözülmesini', 'giderilmesini', 'yapılmasını'],
+        'weight': 3.0
+    },
+    'normal_cozum_talebi': {
+        'keywords': ['çözülmesini', 'giderilmesini', 'yapılmasını', 'düzeltilmesini', 'tamir'],
+        'weight': 2.0
+    },
+    'bilgi_talebi': {
+        'keywords': ['bilgi', 'açıklama', 'ne zaman', 'nasıl', 'neden', 'öğrenmek', 'soruyorum'],
+        'weight': 2.0
+    },
+    'denetim_talebi': {
+        'keywords': ['denetim', 'kontrol', 'inceleme', 'araştırma', 'müfettiş'],
+        'weight': 2.5
+    },
+    'sikayet': {
+        'keywords': ['şikayetim', 'şikayet', 'rahatsızım', 'memnun değilim', 'eleştirim'],
+        'weight': 2.0
+    },
+    'oneri': {
+        'keywords': ['önerim', 'öneriyorum', 'teklif', 'öneri', 'fikrim', 'tavsiye'],
+        'weight': 1.5
+    },
+    'tesekkur_takdir': {
+        'keywords': ['teşekkür', 'sağ ol', 'minnettarım', 'takdir', 'memnunum', 'övgü'],
+        'weight': 1.0
+    },
+    'hukuki_tehdit': {
+        'keywords': ['hukuki', 'yasal', 'mahkeme', 'dava', 'avukat', 'hakkımı arayacağım'],
+        'weight': 3.0
+    }
+}
+
+# aciliyet seviyeleri
+URGENCY_KEYWORDS = {
+    'critical': ['acil', 'hemen', 'derhal', 'ivedi', 'can', 'tehlike', 'ölüm'],
+    'high': ['bir an önce', 'çok önemli', 'yakın zamanda', 'mümkün olan'],
+    'medium': ['uygun gördüğünüzde', 'zamanınız olduğunda', 'müsait'],
+    'low': ['fırsat bulduğunuzda', 'boş vakit', 'acele yok']
+}
+
+# tekrarlama etkisi
+REPETITION_PATTERNS = ['tekrar', 'yine', 'gene', 'defalarca', 'sürekli']
+
+# cümle içi yakınlık için özel kombinasyon bonusları
+PROXIMITY_COMBOS = [
+    ['bozuk', 'tamir', 'onar'],
+    ['kirli', 'temiz', 'hijyen']
+]
+
+# duygusal momentum
+EMOTIONAL_PATTERNS = {
+    'anger_escalation': [
+        'artık', 'yeter', 'bıktım', 'dayanamıyorum', 'sınırım', 'öfke'
+    ],
+    'desperation_signals': [
+        'çaresiz', 'yardım', 'rica', 'lutfen', 'yapalım', 'umut' 'ne olur', 'yalvarıyorum', 'son çare', 'mecbur', 'imdat'
+    ],
+    'politeness_markers': [
+        'saygı', 'nazik', 'kibarca', 'mümkün', 'uygun', 'teşekkür','hürmet', 'şükran', 'minnettar', 'efendim', 'lütfederseniz'
+    ],
+    'frustration_buildup': [
+        'tekrar', 'yine', 'gene', 'defalarca', 'kaçıncı', 'sürekli', 'hala', 'halen', 'ısrarla', 'kaç kere', 'defalarca'
+    ],
+    'positive_feedback': [
+        'memnun', 'başarılı', 'harika', 'çözüldü', 'elinize sağlık'
+    ],
+    'veiled_threats': [
+        'hukuki', 'yasal', 'mahkeme', 'dava', 'CİMER', 'şikayet', 'hakkımı'
+    ]
+}
+
+# sosyal sinyaller
+SOCIAL_INDICATORS = {
+    'family_status': {
+        'has_family': [
+            'çocuk', 'çocuğ', 'bebek', 'aile', 'eş', 'karı', 'koca',
+            'anne', 'baba', 'oğl', 'kız', 'evlat', 'torun',
+            'yeğen', 'kardeş', 'akraba', 'evli'
+        ],
+        'single_indicators': [
+            'tek başına', 'yalnız', 'kimsem yok', 'tek kişi', 'bekar', 'dul'
+        ],
+        'elderly_indicators': [
+            'yaşlı', 'emekli', 'büyük', 'ihtiyar', 'nine', 'dede',  '65 yaş', 'kıdemli', 'yaşlılık'
+        ]
+    },
+
+    'economic_status': {
+        'financial_stress': [
+            'para', 'maaş', 'geçim', 'borç', 'kredi', 'fatura',
+            'pahalı', 'masraf', 'bütçe', 'ekonomik',
+            'icra', 'haciz', 'yoksulluk', 'işsiz', 'kıt kanaat'
+        ],
+        'property_ownership': [
+            'ev sahibi', 'malik', 'mülk', 'apartman', 'daire',
+            'kiracı', 'kira', 'emlak', 'arsa', 'dükkan', 'tapu'
+        ],
+        'employment_status': [
+            'çalışan', 'işsiz', 'esnaf', 'memur', 'işçi', 'serbest meslek'
+        ]
+    },
+
+    'education_level': {
+        'high_education': [
+            'üniversite', 'doktor', 'mühendis', 'öğretmen','avukat',
+            'araştırma', 'proje', 'analiz', 'değerlendirme',  'akademik'
+        ],
+        'formal_language': [
+            'müsaade', 'takdir', 'arz', 'istirham', 'maruzat',
+            'gereği', 'münasip', 'tensib',  'bilvekale', 'tarafıma', 'tebliğ'
+        ]
+    },
+
+    'civic_engagement': {
+        'active_citizen': [
+            'hak', 'görev', 'sorumluluk', 'demokrasi', 'katılım',
+            'önceden', 'defalarca', 'takip', 'başvuru', 'dilekçe', 'vatandaş'
+        ],
+        'community_awareness': [
+            'mahalle', 'komşu', 'herkes', 'tüm', 'genel', 'ortak',  'kamuoyu', 'sakinleri', 'hepimiz'
+        ]
+    },
+    'health_status': {
+        'has_health_issue': [
+            'hasta', 'engelli', 'rapor', 'ilaç', 'tedavi', 'ameliyat',
+            'kronik', 'rahatsızlık', 'sakat', 'malul'
+        ]
+    }
+}
+
+# gelişmiş doğrulayıcı kategori kuralları
+CATEGORY_RULES = {
+    "internet_telekomünikasyon": {
+        "keywords": [
+            "internet",
+            "wifi",
+            "adsl",
+            "fiber",
+            "modem",
+            "router",
+            "bağlantı kesintisi",
+            "türk telekom",
+            "vodafone",
+            "turkcell",
+            "superonline",
+            "millenicom"
+        ],
+        "negative_keywords": [
+            "su",
+            "kanalizasyon",
+            "elektrik",
+            "doğalgaz"
+        ],
+        "priority_score": 10.0
+    },
+    "su_kanalizasyon": {
+        "keywords": [
+            "su",
+            "kanalizasyon",
+            "atık",
+            "pis",
+            "tıkanık",
+            "akıt",
+            "sızıntı",
+            "taşma",
+            "koku",
+            "kirli",
+            "içme suyu",
+            "şebeke",
+            "kesinti",
+            "basınç",
+            "kaçak",
+            "rögar",
+            "menhol",
+            "boru",
+            "vana",
+            "sayaç",
+            "fatura",
+            "musluk",
+            "lavabo",
+            "banyo",
+            "mutfak",
+            "tuvalet",
+            "bahçe",
+            "sokak",
+            "kanal",
+            "drenaj",
+            "yağmur",
+            "kesik",
+            "akmıyor",
+            "gelmıyor",
+            "düşük",
+            "yüksek",
+            "bulanık",
+            "kokulu",
+            "sıcak",
+            "soğuk",
+            "donmuş"
+        ],
+        "negative_keywords": [
+            "internet",
+            "telefon",
+            "elektrik",
+            "gaz"
+        ],
+        "priority_score": 9.0
+    },
+    "elektrik": {
+        "keywords": [
+            "elektrik",
+            "güç kesintisi",
+            "elektrik kesintisi",
+            "şalt",
+            "pano",
+            "kablo",
+            "aydınlatma",
+            "ampul",
+            "priz",
+            "ışık",
+            "lamba",
+            "karanlık",
+            "loş",
+            "projektör",
+            "led",
+            "sokak lambası",
+            "direk",
+            "yanmıyor",
+            "söndü",
+            "bozuk",
+            "kesiyor"
+        ],
+        "negative_keywords": [
+            "su",
+            "internet",
+            "gaz"
+        ],
+        "priority_score": 9.0
+    },
+    "guvenlik": {
+        "keywords": [
+            "güvenlik",
+            "suç",
+            "hırsızlık",
+            "saldırı",
+            "tehdit",
+            "korku",
+            "emniyet",
+            "polis",
+            "bekçi",
+            "kamera",
+            "uyuşturucu",
+            "sarhoş",
+            "kavga",
+            "bıçak",
+            "silah",
+            "yaralama",
+            "darp",
+            "gasp",
+            "kapkaç",
+            "dolandırıcılık",
+            "tehlikeli",
+            "riskli",
+            "güvensiz",
+            "korkutucu",
+            "şüpheli",
+            "suçlu",
+            "illegal"
+        ],
+        "negative_keywords": [],
+        "priority_score": 10.0
+    },
+    "saglik_hijyen": {
+        "keywords": [
+            "sağlık",
+            "hijyen",
+            "dezenfekte",
+            "steril",
+            "mikrop",
+            "bakteri",
+            "virüs",
+            "hastalık",
+            "bulaşıcı",
+            "hastane",
+            "sağlık ocağı",
+            "eczane",
+            "ambulans",
+            "doktor",
+            "hemşire",
+            "tıbbi",
+            "tedavi",
+            "ilaç",
+            "acil",
+            "hasta",
+            "yaralı",
+            "enfeksiyon",
+            "zehirlenme",
+            "toksik"
+        ],
+        "negative_keywords": [],
+        "priority_score": 9.5
+    },
+    "yapim_insaat": {
+        "keywords": [
+            "inşaat",
+            "yapım",
+            "bina",
+            "yapı",
+            "köprü",
+            "beton",
+            "çimento",
+            "demir",
+            "tuğla",
+            "proje",
+            "müteahhit",
+            "vinç",
+            "gecikmeli",
+            "yarıda",
+            "durmuş",
+            "tamamlanmamış",
+            "eksik",
+            "hatalı",
+            "duran",
+            "terk edilmiş",
+            "çöken",
+            "çatlayan",
+            "tehlike",
+            "risk"
+        ],
+        "negative_keywords": [],
+        "priority_score": 8.5
+    },
+    "yol_ulasim": {
+        "keywords": [
+            "yol",
+            "asfalt",
+            "kaldırım",
+            "çukur",
+            "bozuk",
+            "tamir",
+            "trafik",
+            "kavşak",
+            "otobüs",
+            "durak",
+            "otopark",
+            "kaza",
+            "tehlike",
+            "trafik kazası",
+            "çökme",
+            "çatlak",
+            "delik",
+            "kaygan",
+            "tehlikeli",
+            "kapali",
+            "engelli",
+            "tıkalı"
+        ],
+        "negative_keywords": [],
+        "priority_score": 8.0
+    },
+    "arıza": {
+        "keywords": [
+            "asansör arızalı",
+            "yürüyen merdiven çalışmıyor",
+            "bozuk",
+            "aktif değil",
+            "arıza",
+            "baz istasyonu"
+        ],
+        "negative_keywords": [],
+        "priority_score": 8.0
+    },
+    "cevre_temizlik": {
+        "keywords": [
+            "çöp",
+            "atık",
+            "temizlik",
+            "hijyen",
+            "kirli",
+            "pis",
+            "koku",
+            "böcek",
+            "fare",
+            "haşere",
+            "konteyner",
+            "çöp kutusu",
+            "ilaçlama",
+            "dolu",
+            "taşan",
+            "saçılmış",
+            "leş",
+            "pislik",
+            "berbat",
+            "iğrenç"
+        ],
+        "negative_keywords": [],
+        "priority_score": 7.5
+    },
+    "okul_sorunu": {
+        "keywords": [
+            "kaloriferler yanmıyor",
+            "montla ders işliyor",
+            "sınıflar soğuk",
+            "sınıflar kirli",
+            "sınıflar kalabalık",
+            "şiddet",
+            "psikolojik şiddet",
+            "zorbalığa uğrama",
+            "öğretmen zorbalığı",
+            "akran zorbalığı"
+        ],
+        "negative_keywords": [],
+        "priority_score": 7.0
+    },
+    "faturalandırma_sorunu": {
+        "keywords": [
+            "olağandışı artış",
+            "haksız ödeme",
+            "vergi kaçırma",
+            "yüksek mebla",
+            "servis bedeli",
+            "yeniden ölçüm",
+            "yeniden faturalandırma",
+            "kaçak kullanım"
+        ],
+        "negative_keywords": [],
+        "priority_score": 7.0
+    },
+    "gurultu_rahatsizlik": {
+        "keywords": [
+            "gürültü",
+            "ses",
+            "bağırma",
+            "müzik",
+            "hoparlör",
+            "rahatsız",
+            "uyku",
+            "huzur",
+            "yüksek",
+            "aşırı",
+            "dayanılmaz",
+            "sürekli",
+            "geç saatte",
+            "uygunsuz",
+            "yasak"
+        ],
+        "negative_keywords": [],
+        "priority_score": 6.5
+    },
+    "park_yesil_alan": {
+        "keywords": [
+            "park",
+            "bahçe",
+            "yeşil",
+            "ağaç",
+            "çiçek",
+            "oyun alanı",
+            "çocuk parkı",
+            "bank",
+            "sulama",
+            "budama",
+            "bakım",
+            "kurumuş",
+            "kesilmiş",
+            "harap",
+            "bakımsız",
+            "kirli",
+            "tahrip"
+        ],
+        "negative_keywords": [],
+        "priority_score": 6.0
+    },
+    "kargo_sorunu": {
+        "keywords": [
+            "kargo",
+            "elime ulaşmadı",
+            "kargo takip",
+            "yolda",
+            "ptt",
+            "yurtiçi kargo",
+            "mng",
+            "ups",
+            "sürat kargo",
+            "kurye",
+            "kargo şubesine ulaşamıyorum",
+            "kargom hasarlı"
+        ],
+        "negative_keywords": [],
+        "priority_score": 5.5
+    },
+    "telefon-sorunu": {
+        "keywords": [
+            "şebeke",
+            "telefon çekmiyor",
+            "ulaşamıyorum",
+            "sesini alamıyorum",
+            "çekmiyor",
+            "arama",
+            "arayamıyorum"
+        ],
+        "negative_keywords": [],
+        "priority_score": 5.0
+    },
+    "pazaryeri_sorunu": {
+        "keywords": [
+            "pazar yeri",
+            "sebze meyve pazarı",
+            "pazaryeri düzenlemesi",
+            "pazaryeri taşıması"
+        ],
+        "negative_keywords": [],
+        "priority_score": 4.0
+    }
+}
+
+# tutarlılık kontrolü göstergeleri
+CONSISTENCY_INDICATORS = {
+    'formal': ['saygı', 'arz', 'gereği', 'takdir'],
+    'informal': ['ya', 'yani', 'işte'],
+    'urgent': ['acil'],
+    'flexible': ['uygun gördüğünüzde']
+}
+
+# adres doğrulamasında bağlam desteği
+ADDRESS_CONTEXT_REQUIREMENTS = ['yaşa', 'ikamet', 'otur', 'ev', 'daire']
+
+
+def _compile_all(patterns: List[str], flags: int = 0) -> List[Pattern]:
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+def _compile_all_bounded(patterns: List[str], flags: int = 0) -> List[Pattern]:
+    """tüm doküman üzerinde çalışan aileler için: desteklenen biçimler doğrusal süreli eşleştirilir"""
+    return [compile_bounded(pattern, flags) for pattern in patterns]
+
+
+class PatternRegistry:
+    """
+    Derlenmiş pattern aileleri
+
+    doğrudan oluşturulmaz, get_pattern_registry() ile paylaşılan örnek alınır
+    """
+
+    def __init__(self):
+        self.core_patterns = CORE_PATTERNS
+
+        person_identity = CORE_PATTERNS['person_identity']
+        self.signature_patterns = _compile_all_bounded(person_identity['signature_patterns'],
+                                                      re.IGNORECASE | re.MULTILINE)
+        self.identity_validation_patterns = _compile_all(person_identity['validation_patterns'])
+
+        # adres bileşenleri (address_indicators düz anahtar kelime listesidir)
+        self.location_patterns = {
+            level: _compile_all_bounded(patterns, re.IGNORECASE)
+            for level, patterns in CORE_PATTERNS['location_hierarchy'].items()
+            if level != 'address_indicators'
+        }
+        self.contextual_address_patterns = {
+            indicator: compile_bounded(indicator + CONTEXTUAL_ADDRESS_SUFFIX, re.IGNORECASE | re.DOTALL)
+            for indicator in CORE_PATTERNS['location_hierarchy']['address_indicators']
+        }
+
+        self.authority_patterns = {
+            authority_type: _compile_all_bounded(patterns, re.IGNORECASE)
+            for authority_type, patterns in CORE_PATTERNS['authority_recognition'].items()
+        }
+
+        self.sentence_split = re.compile(NAME_EXTRACTION_PATTERNS['sentence_split'])
+        self.sentence_piece = re.compile(NAME_EXTRACTION_PATTERNS['sentence_piece'])
+        self.token = re.compile(NAME_EXTRACTION_PATTERNS['token'])
+        self.name_candidate = re.compile(NAME_EXTRACTION_PATTERNS['name_candidate'])
+        self.greeting_name = re.compile(NAME_EXTRACTION_PATTERNS['greeting_name'], re.IGNORECASE)
+        self.slash_patterns = _compile_all(NAME_EXTRACTION_PATTERNS['slash_patterns'])
+        self.tc_patterns = _compile_all(NAME_EXTRACTION_PATTERNS['tc_patterns'], re.IGNORECASE)
+        self.phone_patterns = _compile_all(NAME_EXTRACTION_PATTERNS['phone_patterns'], re.IGNORECASE)
+
+        self.validator_patterns = {
+            validator: self._compile_validator_family(family)
+            for validator, family in VALIDATOR_PATTERNS.items()
+        }
+
+        self.version = f"{RULESET_VERSION}+{self._fingerprint()}"
+
+    @staticmethod
+    def _compile_validator_family(family: Dict) -> Dict:
+        compiled = {}
+        for name, value in family.items():
+            flags = re.IGNORECASE if name == 'real_address' else 0
+            if isinstance(value, list):
+                compiled[name] = _compile_all(value, flags)
+            else:
+                compiled[name] = re.compile(value, flags)
+        return compiled
+
+    @staticmethod
+    def _fingerprint() -> str:
+        """kural içeriğinin kısa özeti - aynı sürüm adıyla farklı kurallar karışmasın"""
+        payload = json.dumps(
+            [CORE_PATTERNS, NAME_EXTRACTION_PATTERNS, NAME_LINE_MARKERS, CONTEXTUAL_ADDRESS_SUFFIX, VALIDATOR_PATTERNS,
+             REQUEST_TYPE_PATTERNS, URGENCY_KEYWORDS, REPETITION_PATTERNS, PROXIMITY_COMBOS,
+             EMOTIONAL_PATTERNS, SOCIAL_INDICATORS, CATEGORY_RULES, CONSISTENCY_INDICATORS,
+             ADDRESS_CONTEXT_REQUIREMENTS],
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:10]
+
+    def iter_patterns(self) -> Iterator[Tuple[str, Pattern]]:
+        """tüm derlenmiş patternleri (aile adı, pattern) olarak dolaşır"""
+        for pattern in self.signature_patterns:
+            yield 'signature', pattern
+        for pattern in self.identity_validation_patterns:
+            yield 'identity_validation', pattern
+        for level, patterns in self.location_patterns.items():
+            for pattern in patterns:
+                yield f'location.{level}', pattern
+        for pattern in self.contextual_address_patterns.values():
+            yield 'contextual_address', pattern
+        for authority_type, patterns in self.authority_patterns.items():
+            for pattern in patterns:
+                yield f'authority.{authority_type}', pattern
+        yield 'name.sentence_split', self.sentence_split
+        yield 'name.sentence_piece', self.sentence_piece
+        yield 'name.token', self.token
+        yield 'name.candidate', self.name_candidate
+        yield 'name.greeting', self.greeting_name
+        for family in ('slash_patterns', 'tc_patterns', 'phone_patterns'):
+            for pattern in getattr(self, family):
+                yield f'name.{family}', pattern
+        for validator, family in self.validator_patterns.items():
+            for name, value in family.items():
+                for pattern in (value if isinstance(value, list) else [value]):
+                    yield f'validator.{validator}.{name}', pattern
+
+
+@lru_cache(maxsize=None)
+def get_pattern_registry() -> PatternRegistry:
+    """süreç genelinde paylaşılan pattern kaydı"""
+    return PatternRegistry()
@@ -1,12 +1,39 @@
-import re
-from collections import defaultdict, Counter
-from typing import Dict, List
-
+import copy
+import hashlib
+import os
+from collections import defaultdict, deque, Counter
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Set
+
+from src.analysis_history import AnalysisHistory
+from src.analysis_profiles import AnalysisProfile, get_profile
+from src.document_context import DocumentContext
 from src.emotional_momentum_tracker import EmotionalMomentumTracker
 from src.enhanced_skeptical_validator import EnhancedSkepticalValidator
+from src.keyword_index import KeywordAutomaton, KeywordHits, get_keyword_index
+from src.pattern_registry import PROXIMITY_COMBOS, REPETITION_PATTERNS, REQUEST_TYPE_PATTERNS, URGENCY_KEYWORDS
+from src.result_cache import ResultCache, normalize_text
+from src.result_model import AnalysisResult, pack_results, unpack_result
 from src.semantic_signal import SkepticalInferenceEngine
 from src.validator import SkepticalValidator
 from src.social_analyzer import SocialSignalAnalyzer
+from src.stage_graph import Stage, StageGraph
+from src.stage_metrics import StageLatencyStats, StageTimer
+
+# analiz algoritmasının sürümü: kural dışı bir değişiklik sonuçları etkiliyorsa artırılmalı
+ALGORITHM_VERSION = "rbcd-v2.0_ULTRA"
+
+# gelişmiş doğrulamanın ürettiği validation_report alanları
+_ENHANCED_VALIDATION_FIELDS = ('enhanced_validation', 'overall_validity', 'quality_score',
+                               'red_flags', 'confidence_adjustment')
+
+
+@lru_cache(maxsize=None)
+def _shared_component(component_class):
+    """katman bileşenleri analizden sonra durum tutmaz: süreç başına tek örnek yeterli"""
+    return component_class()
 
 
 class PetitionAnalyzer:
@@ -14,17 +41,25 @@ class PetitionAnalyzer:
      Ana Yaratıcı Dilekçe Analizörü
     tüm alhoritmaları süpheci yaklaşımları birleştiren master sınıf
 
+    katman bileşenleri ilk kullanımda kurulur ve tüm analizörler arasında paylaşılır;
+    kurucu yalnızca analizöre özel istatistikleri hazırlar
+
+    result_cache: verilirse aynı (normalleştirilmiş) metin ve sürüm için sonuç yeniden hesaplanmaz
+    history_size: analysis_history'de tutulan en fazla analiz özeti (bkz. AnalysisHistory)
+    stage_executor: verilirse bir dokümanın birbirinden bağımsız aşamaları bu executor'da
+    paralel çalışır (iş parçacığı tabanlı olmalı, bkz. stage_graph)
     """
 
-    def __init__(self):
-        self.inference_engine = SkepticalInferenceEngine()
-        self.emotional_tracker = EmotionalMomentumTracker()
-        self.social_analyzer = SocialSignalAnalyzer()
-        self.validator = SkepticalValidator()
-        self.enhanced_validator = EnhancedSkepticalValidator()
+    _layer_components = ('inference_engine', 'emotional_tracker', 'social_analyzer',
+                         'validator', 'enhanced_validator', 'keyword_index')
 
-        # Analiz istatistikleri
-        self.analysis_history = []
+    def __init__(self, result_cache: Optional[ResultCache] = None, history_size: int = 1000,
+                 stage_executor: Optional[Executor] = None):
+        self.result_cache = result_cache
+        self.stage_executor = stage_executor
+
+        # Analiz istatistikleri: son analizlerin özetleri ve akan toplamlar
+        self.analysis_history = AnalysisHistory(maxlen=history_size)
         self.performance_metrics = {
             'total_analyzed': 0,
             'high_confidence_results': 0,
@@ -33,8 +68,153 @@ class PetitionAnalyzer:
             'successful_name_extractions': 0,
             'successful_subject_extractions': 0
         }
+        # aşama bazlı süre histogramları (metadata['stage_timings_ms'] kaynaklı)
+        self.stage_latency = StageLatencyStats()
+        # toplu analizde bulunan yakın kopya kampanyaları
+        self.campaign_metrics = {
+            'campaigns_detected': 0,
+            'campaign_petitions': 0,
+            'reused_analyses': 0
+        }
+
+    @cached_property
+    def inference_engine(self) -> SkepticalInferenceEngine:
+        return _shared_component(SkepticalInferenceEngine)
+
+    @cached_property
+    def emotional_tracker(self) -> EmotionalMomentumTracker:
+        return _shared_component(EmotionalMomentumTracker)
+
+    @cached_property
+    def social_analyzer(self) -> SocialSignalAnalyzer:
+        return _shared_component(SocialSignalAnalyzer)
+
+    @cached_property
+    def validator(self) -> SkepticalValidator:
+        return _shared_component(SkepticalValidator)
+
+    @cached_property
+    def enhanced_validator(self) -> EnhancedSkepticalValidator:
+        return _shared_component(EnhancedSkepticalValidator)
+
+    @cached_property
+    def keyword_index(self) -> KeywordAutomaton:
+        """tüm anahtar kelime tablolarından kurulmuş tek otomat"""
+        return get_keyword_index()
+
+    @cached_property
+    def category_matrix(self):
+        """kategori tablolarının seyrek matrisleri (yalnızca toplu sınıflandırmada; scipy gerekir)"""
+        from src.category_matrix import CategoryMatrix
+
+        return _shared_component(CategoryMatrix)
+
+    def warm_up(self) -> 'PetitionAnalyzer':
+        """tüm bileşenleri, derlenmiş patternleri ve otomatı önceden kur (istatistiklere dokunmaz)"""
+        for component in self._layer_components:
+            getattr(self, component)
+        return self
+
+    @property
+    def cache_version(self) -> str:
+        """önbellek anahtarına giren sürüm: algoritma + kural seti"""
+        return f"{ALGORITHM_VERSION}|{self.inference_engine.patterns.version}"
+
+    def analyze_petition_creative(self, text: str, profile='full', fields: Optional[Sequence[str]] = None,
+                                  compute: Optional[Callable[[str, AnalysisProfile], Dict]] = None) -> Dict:
+        """
+        dilekçeyi analiz et; önbellek varsa aynı içerik için saklanan sonucu döndür
+
+        profile: 'summary' | 'standard' | 'full' (ya da AnalysisProfile). sonuçta yalnızca
+        profilin bildirdiği alanlar yer alır ve bu alanlara katkısı olmayan aşamalar
+        çalıştırılmaz (bkz. analysis_profiles)
+        fields: verilirse profil yerine yalnızca bu alanlar istenir, ör.
+        ['subject_category', 'urgency_level'] yalnızca ön işleme, kategori ve aciliyet aşamalarını çalıştırır
+        compute(text, profile): verilirse önbellekte olmayan dilekçe bununla analiz edilir (ör. başka
+        bir süreçteki analizör); önbellek ve istatistikler yine bu analizörde tutulur
+
+        önbellekten dönen sonucun metadata'sı (zaman damgası, süre, 'cache') bu çağrıya aittir.
+        önbellekte tam sonucun paketlenmiş hali (AnalysisResult) saklanır
+        """
+        profile = AnalysisProfile.for_fields(fields) if fields is not None else get_profile(profile)
+        if self.result_cache is None:
+            return self._compute(text, profile, compute)
+
+        import time
+        start_time = time.time()
+        key = self._cache_key(text, profile)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return self._serve_cached(cached[0], cached[1], key, start_time)
+
+        result = self._compute(text, profile, compute)
+        self._store_cached(key, profile, result)
+        return result
+
+    def cached_result(self, text: str, profile='full') -> Optional[Dict]:
+        """
+        önbellekte varsa dilekçenin sonucu (istatistiklere eklenir), yoksa None
+
+        analizi başka süreçlere dağıtan çağıranlar için: isabetler gönderilmez, eksikler
+        hesaplandıktan sonra cache_result ile önbelleğe yazılır
+        """
+        if self.result_cache is None:
+            return None
+        import time
+        start_time = time.time()
+        key = self._cache_key(text, get_profile(profile))
+        cached = self.result_cache.get(key)
+        return self._serve_cached(cached[0], cached[1], key, start_time) if cached is not None else None
+
+    def cache_result(self, text: str, result: Dict, profile='full'):
+        """başka bir süreçte hesaplanan sonucu önbelleğe yaz (istatistikler için bkz. record_result)"""
+        if self.result_cache is not None and not is_failed_result(result):
+            profile = get_profile(profile)
+            self._store_cached(self._cache_key(text, profile), profile, result)
+
+    def _cache_key(self, text: str, profile: AnalysisProfile) -> str:
+        version = self.cache_version if profile.is_full else f"{self.cache_version}|{profile.cache_tag}"
+        return self.result_cache.key(text, version)
+
+    def _store_cached(self, key: str, profile: AnalysisProfile, result: Dict):
+        result['metadata']['cache'] = {'hit': False, 'key': key}
+        self.result_cache.put(key, AnalysisResult.from_dict(result) if profile.is_full else result)
+
+    def _compute(self, text: str, profile: AnalysisProfile,
+                 compute: Optional[Callable[[str, AnalysisProfile], Dict]]) -> Dict:
+        if compute is None:
+            return self._analyze_document(text, profile=profile)
+        result = compute(text, profile)
+        self.record_result(result)
+        return result
+
+    def _serve_cached(self, result, tier: str, key: str, start_time: float) -> Dict:
+        """önbellekten gelen sonucun metadata'sını tazele ve istatistiklere ekle"""
+        import time
+        result = unpack_result(result)
+        processing_time = time.time() - start_time
+        stage_timings = {'cache_lookup': round(processing_time * 1000, 3)}
+
+        metadata = result['metadata']
+        metadata['cache'] = {
+            'hit': True,
+            'tier': tier,
+            'key': key,
+            'original_processing_time_seconds': metadata['processing_time_seconds'],
+        }
+        metadata['analysis_timestamp'] = time.time()
+        metadata['processing_time_seconds'] = round(processing_time, 4)
+        metadata['stage_timings_ms'] = stage_timings
 
-    def analyze_petition_creative(self, text: str) -> Dict:
+        self._update_performance_metrics(
+            processing_time, result.get('validation_report', {}).get('enhanced_validation'),
+            result.get('extracted_information', {}), stage_timings, cache_hit=True
+        )
+        self.analysis_history.append(result)
+        return result
+
+    def _analyze_document(self, text: str, shared: Optional[Dict] = None,
+                          profile: Optional[AnalysisProfile] = None) -> Dict:
         """
         ana yaratıcı analiz fonksiyonu
 
@@ -44,47 +224,82 @@ class PetitionAnalyzer:
         3. Sosyal sinyal analizi
         4. Çifte şüpheci doğrulama
         5. Sonuçları birleştirme ve güvenilirlik skoru
+
+        shared: kampanya temsilcisinin katmanları (bkz. _campaign_layers). verilirse kategori,
+        kurum, aciliyet, talep türü, duygu ve sosyal artifact'leri grafiğe hazır verilir; isim
+        ve adres bu dilekçeden çıkarılır, doğrulama ve sentez bu dilekçe için yapılır
+        profile: yalnızca profilin ihtiyaç duyduğu aşamalar çalışır (bkz. analysis_profiles, stage_graph)
         """
         import time
+        profile = profile or get_profile('full')
         start_time = time.time()
+        timer = StageTimer()
+
+        # istenen alanların artifact'lerini üreten aşamalar çalışır; bağımsız aşamalar
+        # (ör. isim / adres / duygu akışı) stage_executor verilmişse paralel yürür
+        values = {'text': text, 'profile': profile}
+        if shared:
+            values.update(self._shared_artifacts(shared))
+        self.stage_graph.run(profile.artifacts, values, executor=self.stage_executor, timer=timer)
+
+        with timer.stage('extraction'):
+            extraction_results = self._assemble_extraction(values)
+        # 'extraction' süresi tüm çıkarım aşamalarını kapsar (eski iç içe ölçümle aynı anlam)
+        timer.timings['extraction'] += sum(
+            seconds for stage, seconds in timer.timings.items() if stage.startswith('extraction.')
+        )
 
-        # ileri seviye ön işleme
-        sentences = self._smart_sentence_split(text)
-
-        # 1. katman : çoklu yöntem ile bilgi çıkarımı
-        extraction_results = self._ultra_comprehensive_extraction(text, sentences)
-
-        # 2. katman : duygusal momentum analizi
-        emotional_analysis = self.emotional_tracker.calculate_emotional_flow(sentences)
-
-        # 3. katman : sosyal profilleme
-        social_analysis = self.social_analyzer.analyze_social_profile(text)
-
-        # 4. katman: ilk şüpheci doğrulama
-        validation_results = self.validator.validate_extraction(extraction_results, text)
-
-        # 5. katman : gelişmiş ikinci Şüpheci Doğrulama
-        enhanced_validation = self.enhanced_validator.validate_extraction(extraction_results, text)
+        emotional_analysis = values.get('emotional')
+        social_analysis = values.get('social')
+        validation_results = values.get('primary_validation')
+        enhanced_validation = values.get('enhanced_validation')
 
         # 6.katman : yaratıcı sentez ve çıkarım
-        creative_insights = self._generate_creative_insights(
-            extraction_results, emotional_analysis, social_analysis, enhanced_validation
-        )
+        creative_insights = actionable_recommendations = None
+        with timer.stage('insights'):
+            if profile.wants('creative_insights'):
+                creative_insights = self._generate_creative_insights(
+                    extraction_results, emotional_analysis, social_analysis, enhanced_validation, profile
+                )
+            if profile.wants('actionable_recommendations'):
+                actionable_recommendations = self._generate_actionable_recommendations(
+                    extraction_results, emotional_analysis, social_analysis, creative_insights
+                )
 
         #  performans izleme
         processing_time = time.time() - start_time
-        self._update_performance_metrics(processing_time, enhanced_validation, extraction_results)
-
-        #  final sonucu birleştirme
-        final_result = {
-            "metadata": {
-                "analysis_timestamp": time.time(),
-                "processing_time_seconds": round(processing_time, 4),
-                "algorithm_version": "rbcd-v2.0_ULTRA",
-                "confidence_level": self._calculate_overall_confidence(
-                    extraction_results, enhanced_validation, emotional_analysis
-                )
-            },
+        stage_timings = timer.as_milliseconds()
+        self._update_performance_metrics(processing_time, enhanced_validation, extraction_results, stage_timings)
+
+        metadata = {
+            "analysis_timestamp": time.time(),
+            "processing_time_seconds": round(processing_time, 4),
+            "stage_timings_ms": stage_timings,
+            "algorithm_version": ALGORITHM_VERSION,
+            "ruleset_version": self.inference_engine.patterns.version,
+        }
+        if profile.wants('metadata.confidence_level'):
+            metadata["confidence_level"] = self._calculate_overall_confidence(
+                extraction_results, enhanced_validation, emotional_analysis
+            )
+        if not profile.is_full:
+            metadata["profile"] = profile.name
+
+        validation_report = {
+            "primary_validation": validation_results,
+            "enhanced_validation": enhanced_validation,
+        }
+        if enhanced_validation is not None:
+            validation_report.update({
+                "overall_validity": enhanced_validation['overall_validity'],
+                "quality_score": enhanced_validation['quality_score'],
+                "red_flags": enhanced_validation['red_flags'],
+                "confidence_adjustment": enhanced_validation['confidence_adjustment']
+            })
+
+        #  final sonucu birleştirme (profil dışındaki alanlar project ile çıkarılır)
+        final_result = profile.project({
+            "metadata": metadata,
 
             "extracted_information": extraction_results,
 
@@ -93,38 +308,324 @@ class PetitionAnalyzer:
                 "dominant_emotion": emotional_analysis['dominant_overall'],
                 "emotional_stability": emotional_analysis['emotional_stability'],
                 "predicted_citizen_state": self._predict_citizen_psychological_state(emotional_analysis)
-            },
+            } if emotional_analysis is not None else None,
 
             "social_intelligence": {
                 "citizen_profile": social_analysis['inferred_profile'],
                 "social_signals": social_analysis['detected_signals'],
                 "engagement_level": self._calculate_engagement_level(social_analysis)
-            },
+            } if social_analysis is not None else None,
 
-            "validation_report": {
-                "primary_validation": validation_results,
-                "enhanced_validation": enhanced_validation,
-                "overall_validity": enhanced_validation['overall_validity'],
-                "quality_score": enhanced_validation['quality_score'],
-                "red_flags": enhanced_validation['red_flags'],
-                "confidence_adjustment": enhanced_validation['confidence_adjustment']
-            },
+            "validation_report": validation_report,
 
             "creative_insights": creative_insights,
 
-            "actionable_recommendations": self._generate_actionable_recommendations(
-                extraction_results, emotional_analysis, social_analysis, creative_insights
-            )
-        }
+            "actionable_recommendations": actionable_recommendations
+        })
 
         # kayıt et
         self.analysis_history.append(final_result)
 
         return final_result
 
-    def _ultra_comprehensive_extraction(self, text: str, sentences: List[str]) -> Dict:
-        """ kapsamlı çoklu yöntemle bilgi çıkarımı"""
+    def analyze_batch(self, texts: Sequence[str], workers: Optional[int] = None, chunksize: int = 16,
+                      progress_callback: Optional[Callable[[int, int], None]] = None,
+                      detect_campaigns: bool = False, campaign_threshold: float = 0.8,
+                      compact: bool = False) -> List[Dict]:
+        """
+        toplu analiz: dilekçeleri süreç havuzunda paralel analiz eder
 
+        workers: işçi süreç sayısı (varsayılan: çekirdek sayısı); 1 ise bu süreçte sırayla çalışır
+        chunksize: bir işçiye tek seferde gönderilen dilekçe sayısı
+        progress_callback(tamamlanan, toplam): her parça bittiğinde çağrılır
+
+        sonuçlar girdi sırasıyla döner. hata veren dilekçe tüm toplu işi durdurmaz, yerine
+        {'error': {...}} kaydı konur (bkz. is_failed_result)
+
+        önbellek varsa isabet eden ve toplu iş içinde tekrar eden dilekçeler işçilere gönderilmez
+
+        detect_campaigns: yakın kopya dilekçeleri (yalnızca imzası / adresi farklı kampanya metinleri)
+        MinHash/LSH ile grupla; pahalı katmanlar yalnızca her kampanyanın temsilcisinde çalışır.
+        kampanyadaki dilekçelerin metadata['campaign'] alanı doldurulur
+        campaign_threshold: aynı kampanya sayılmak için gereken tahmini Jaccard benzerliği
+        compact: sonuçları sözlük yerine paketlenmiş AnalysisResult olarak döndür (çok sayıda
+        sonucu bellekte tutan çağıranlar için; to_dict() aynı sözlüğü verir)
+        """
+        if detect_campaigns:
+            results = self._analyze_batch_campaigns(texts, workers, chunksize, progress_callback, campaign_threshold)
+        else:
+            results = self._analyze_unique(texts, workers, chunksize, progress_callback)
+        return pack_results(results) if compact else results
+
+    def _analyze_unique(self, texts: Sequence[str], workers: Optional[int], chunksize: int,
+                        progress_callback: Optional[Callable[[int, int], None]]) -> List[Dict]:
+        """kampanya ayrımı yapmadan toplu analiz (önbellek varsa önce önbelleğe bakılır)"""
+        if self.result_cache is not None:
+            return self._analyze_batch_cached(texts, workers, chunksize, progress_callback)
+        return self._run_batch(texts, workers, chunksize, progress_callback)
+
+    def _analyze_batch_cached(self, texts: Sequence[str], workers: Optional[int], chunksize: int,
+                              progress_callback: Optional[Callable[[int, int], None]]) -> List[Dict]:
+        import time
+        total = len(texts)
+        version = self.cache_version
+        results: List[Optional[Dict]] = [None] * total
+
+        # anahtar -> bu anahtarı taşıyan dilekçe sıraları (yalnızca ilki analiz edilir)
+        misses: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            start_time = time.time()
+            key = self.result_cache.key(text, version)
+            if key in misses:
+                misses[key].append(index)
+                continue
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                results[index] = self._serve_cached(cached[0], cached[1], key, start_time)
+            else:
+                misses[key] = [index]
+
+        resolved = total - sum(len(indices) for indices in misses.values())
+        if progress_callback and resolved:
+            progress_callback(resolved, total)
+
+        keys = list(misses)
+        analyzed = self._run_batch(
+            [texts[misses[key][0]] for key in keys], workers, chunksize,
+            (lambda done, _: progress_callback(resolved + done, total)) if progress_callback else None
+        )
+
+        for key, result in zip(keys, analyzed):
+            first, *duplicates = misses[key]
+            if is_failed_result(result):
+                for index in misses[key]:
+                    results[index] = dict(result)
+                continue
+            result['metadata']['cache'] = {'hit': False, 'key': key}
+            self.result_cache.put(key, AnalysisResult.from_dict(result))
+            results[first] = result
+            # kopyalar önbellekten geri okunmaz: önbellek kaydı tutmamış olabilir (max_entries=0,
+            # disk sınırını aşan sonuç); yeni hesaplanan sonucun kopyası verilir
+            for index in duplicates:
+                results[index] = self._serve_cached(copy.deepcopy(result), 'batch', key, time.time())
+
+        if progress_callback and len(keys) < total - resolved:
+            progress_callback(total, total)
+        return results
+
+    def _analyze_batch_campaigns(self, texts: Sequence[str], workers: Optional[int], chunksize: int,
+                                 progress_callback: Optional[Callable[[int, int], None]],
+                                 threshold: float) -> List[Dict]:
+        """
+        iki aşamalı toplu analiz: önce kampanya temsilcileri ve tekil dilekçeler, sonra
+        temsilcinin katmanlarını yeniden kullanan kampanya üyeleri
+        """
+        from src.near_duplicates import NearDuplicateDetector
+
+        total = len(texts)
+        campaigns = NearDuplicateDetector(threshold=threshold).find_campaigns(texts)
+        campaign_of = {member: campaign for campaign in campaigns for member in campaign.members}
+        results: List[Optional[Dict]] = [None] * total
+
+        leaders = [index for index in range(total) if index not in campaign_of]
+        analyzed = self._analyze_unique(
+            [texts[index] for index in leaders], workers, chunksize,
+            (lambda done, _: progress_callback(done, total)) if progress_callback else None
+        )
+        for index, result in zip(leaders, analyzed):
+            results[index] = result
+
+        # temsilcisi analiz edilemeyen üye baştan analiz edilir
+        members = sorted(campaign_of)
+        shared = []
+        for index in members:
+            representative = results[campaign_of[index].representative]
+            shared.append(None if is_failed_result(representative) else _campaign_layers(representative))
+        analyzed = self._run_batch(
+            [texts[index] for index in members], workers, chunksize,
+            (lambda done, _: progress_callback(len(leaders) + done, total)) if progress_callback else None,
+            shared
+        )
+        for index, result in zip(members, analyzed):
+            results[index] = result
+
+        for campaign in campaigns:
+            campaign_key = hashlib.sha1(normalize_text(texts[campaign.representative]).encode('utf-8')).hexdigest()
+            for index in (campaign.representative, *campaign.members):
+                if is_failed_result(results[index]):
+                    continue
+                results[index]['metadata']['campaign'] = {
+                    'campaign_id': campaign_key[:16],
+                    'role': 'representative' if index == campaign.representative else 'member',
+                    'representative_index': campaign.representative,
+                    'size': campaign.size,
+                    'similarity': campaign.similarities.get(index, 1.0)
+                }
+
+        self.campaign_metrics['campaigns_detected'] += len(campaigns)
+        self.campaign_metrics['campaign_petitions'] += sum(campaign.size for campaign in campaigns)
+        self.campaign_metrics['reused_analyses'] += sum(layers is not None for layers in shared)
+        return results
+
+    def _run_batch(self, texts: Sequence[str], workers: Optional[int], chunksize: int,
+                   progress_callback: Optional[Callable[[int, int], None]],
+                   shared: Optional[Sequence[Optional[Dict]]] = None) -> List[Dict]:
+        """
+        önbelleksiz toplu analiz (bkz. analyze_batch)
+
+        shared: her dilekçe için temsilci katmanları ya da None (bkz. _analyze_document)
+        """
+        total = len(texts)
+        shared = shared if shared is not None else [None] * total
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, chunksize)
+        results: List[Optional[Dict]] = [None] * total
+        completed = 0
+
+        if workers <= 1 or total <= chunksize:
+            for start in range(0, total, chunksize):
+                chunk_results = _analyze_chunk(self, texts[start:start + chunksize], shared[start:start + chunksize])
+                results[start:start + len(chunk_results)] = chunk_results
+                completed += len(chunk_results)
+                if progress_callback:
+                    progress_callback(completed, total)
+            return results
+
+        # iş kuyruğu: (başlangıç, boyut, tekil). tekil işler, çöken bir parçanın tek tek
+        # yeniden denenen dilekçeleridir ve suçluyu bulmak için yalnız başına çalıştırılır
+        queue = deque((start, min(chunksize, total - start), False) for start in range(0, total, chunksize))
+        max_pending = workers * 2
+        pending = {}
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+        try:
+            while queue or pending:
+                # işçileri meşgul tutacak kadar parça gönder, hepsini birden kuyruğa atma
+                while queue and len(pending) < max_pending:
+                    start, size, isolated = queue[0]
+                    if isolated and pending:
+                        break
+                    queue.popleft()
+                    future = pool.submit(_analyze_batch_chunk, texts[start:start + size], shared[start:start + size])
+                    pending[future] = (start, size, isolated)
+                    if isolated:
+                        break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                broken = False
+                for future in done:
+                    start, size, isolated = pending.pop(future)
+                    try:
+                        chunk_results = [unpack_result(result) for result in future.result()]
+                    except BrokenProcessPool as error:
+                        broken = True
+                        if not isolated:
+                            # parçadaki dilekçeler tek tek yeniden denenecek
+                            queue.extendleft((index, 1, True) for index in reversed(range(start, start + size)))
+                            continue
+                        chunk_results = [failed_result(error)]
+                    except Exception as error:
+                        chunk_results = [failed_result(error) for _ in range(size)]
+
+                    for result in chunk_results:
+                        if not is_failed_result(result):
+                            self.record_result(result)
+                    results[start:start + size] = chunk_results
+                    completed += size
+                    if progress_callback:
+                        progress_callback(completed, total)
+
+                if broken:
+                    # bir işçi çöktü: havuzdaki diğer işler de kaybolur, yeniden kuyruğa alınır
+                    for start, size, _ in pending.values():
+                        queue.extendleft((index, 1, True) for index in reversed(range(start, start + size)))
+                    pending.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+        return results
+
+    def record_result(self, result: Dict):
+        """başka bir süreçte üretilmiş sonucu bu analizörün istatistiklerine ekle"""
+        self._update_performance_metrics(
+            result['metadata']['processing_time_seconds'],
+            result.get('validation_report', {}).get('enhanced_validation'),
+            result.get('extracted_information', {}),
+            result['metadata'].get('stage_timings_ms')
+        )
+        self.analysis_history.append(result)
+
+    @cached_property
+    def stage_graph(self) -> StageGraph:
+        """
+        analiz hattının aşamaları; artifact adları analysis_profiles.FIELD_ARTIFACTS ile aynıdır
+
+        kaynaklar: 'text' (ham metin) ve 'profile' (ayrıntı bayrakları için)
+        """
+        def extraction_details(values) -> bool:
+            return values['profile'].wants('extracted_information.extraction_methods')
+
+        return StageGraph([
+            # ileri seviye ön işleme: küçük harf, anahtar kelime taraması, satır / cümle / kelime
+            # sınırları doküman başına bir kez hesaplanır, tüm aşamalar aynı bağlamı kullanır
+            Stage('preprocessing', ('text',), ('context',), lambda values: {
+                'context': DocumentContext(values['text'], self.keyword_index).prepare()
+            }),
+            # 1. katman : çoklu yöntem ile bilgi çıkarımı
+            Stage('extraction.name', ('context',), ('name',), lambda values: {
+                'name': self.inference_engine.extract_names_comprehensive(values['context'].text, values['context'])
+            }),
+            Stage('extraction.address', ('context',), ('address',), lambda values: {
+                'address': self._extract_comprehensive_address(values['context'].text, values['context'].hits)
+            }),
+            Stage('extraction.institution', ('context',), ('institution',), lambda values: {
+                'institution': self._extract_comprehensive_institution(values['context'].text)
+            }),
+            Stage('extraction.category', ('context', 'profile'), ('category',), lambda values: {
+                'category': self._ultra_comprehensive_category_classification(
+                    values['context'].hits, values['context'].sentence_keywords, extraction_details(values)
+                )
+            }),
+            Stage('extraction.urgency', ('context',), ('urgency',), lambda values: {
+                'urgency': self._analyze_urgency_with_momentum(values['context'].text, values['context'].hits)
+            }),
+            Stage('extraction.request_type', ('context', 'profile'), ('request_type',), lambda values: {
+                'request_type': self._classify_request_type_detailed(values['context'].hits, extraction_details(values))
+            }),
+            # 2. katman : duygusal momentum analizi
+            Stage('emotional_flow', ('context', 'profile'), ('emotional',), lambda values: {
+                'emotional': self.emotional_tracker.calculate_emotional_flow(
+                    values['context'].sentences, values['context'],
+                    include_flow=values['profile'].wants('emotional_intelligence.momentum_analysis.sentence_flow')
+                )
+            }),
+            # 3. katman : sosyal profilleme
+            Stage('social_profile', ('context',), ('social',), lambda values: {
+                'social': self.social_analyzer.analyze_social_profile(values['context'].text, values['context'])
+            }),
+            # 4. katman: ilk şüpheci doğrulama (yalnızca isme bakar)
+            Stage('primary_validation', ('context', 'name'), ('primary_validation',), lambda values: {
+                'primary_validation': self.validator.validate_extraction(
+                    self._assemble_extraction(values), values['context'].text, values['context']
+                )
+            }),
+            # 5. katman : gelişmiş ikinci şüpheci doğrulama (isim, adres, kategori)
+            Stage('enhanced_validation', ('context', 'name', 'address', 'category'), ('enhanced_validation',),
+                  lambda values: {
+                      'enhanced_validation': self.enhanced_validator.validate_extraction(
+                          self._assemble_extraction(values), values['context'].text, values['context']
+                      )
+                  }),
+        ], sources=('text', 'profile'))
+
+    def _assemble_extraction(self, values: Mapping) -> Dict:
+        """
+        çıkarım artifact'lerinden extracted_information bölümü; hesaplanmamış alanlar None kalır
+
+        cross_validation_score yalnızca altı çıkarımın tamamı hesaplandığında anlamlıdır
+        (bkz. FIELD_ARTIFACTS)
+        """
         results = {
             'person_name': None,
             'address_info': None,
@@ -137,51 +638,60 @@ class PetitionAnalyzer:
             'extraction_details': {}
         }
 
-        # isim çıkarımı
-        name_extraction = self.inference_engine.extract_names_comprehensive(text)
-        if name_extraction['extracted_name']:
+        name_extraction = values.get('name')
+        if name_extraction and name_extraction['extracted_name']:
             results['person_name'] = name_extraction['extracted_name']
             results['extraction_methods']['name'] = name_extraction
             results['extraction_details']['name_confidence'] = name_extraction['confidence']
 
-        # adres Bilgisi
-        address_components = {}
-        address_extraction = self._extract_comprehensive_address(text)
-
-        if address_extraction['full_address']:
+        address_extraction = values.get('address')
+        if address_extraction and address_extraction['full_address']:
             results['address_info'] = address_extraction['full_address']
             results['extraction_methods']['address'] = address_extraction
             results['extraction_details']['address_confidence'] = address_extraction['confidence']
 
-        # kurum kuruluş tespiti
-        institution_extraction = self._extract_comprehensive_institution(text)
-        if institution_extraction['institution']:
+        institution_extraction = values.get('institution')
+        if institution_extraction and institution_extraction['institution']:
             results['institution'] = institution_extraction['institution']
             results['extraction_methods']['institution'] = institution_extraction
 
-        # konu kategorisi sınıflandırması
-        category_analysis = self._ultra_comprehensive_category_classification(text, sentences)
-        if category_analysis['primary_category']:
+        category_analysis = values.get('category')
+        if category_analysis and category_analysis['primary_category']:
             results['subject_category'] = category_analysis['primary_category']
             results['extraction_methods']['category'] = category_analysis
             results['extraction_details']['category_confidence'] = category_analysis['confidence']
 
-        # aciliyet seviyesi  duygu analizi momentum ile
-        urgency_analysis = self._analyze_urgency_with_momentum(text, sentences)
-        results['urgency_level'] = urgency_analysis['level']
-        results['extraction_methods']['urgency'] = urgency_analysis
+        urgency_analysis = values.get('urgency')
+        if urgency_analysis is not None:
+            results['urgency_level'] = urgency_analysis['level']
+            results['extraction_methods']['urgency'] = urgency_analysis
 
-        # detaylı talep türü analizi
-        request_analysis = self._classify_request_type_detailed(text)
-        results['request_type'] = request_analysis['type']
-        results['extraction_methods']['request_type'] = request_analysis
+        request_analysis = values.get('request_type')
+        if request_analysis is not None:
+            results['request_type'] = request_analysis['type']
+            results['extraction_methods']['request_type'] = request_analysis
 
         # cross validation skoru
         results['cross_validation_score'] = self._calculate_cross_validation_score(results)
 
         return results
 
-    def _extract_comprehensive_address(self, text: str) -> Dict:
+    @staticmethod
+    def _shared_artifacts(shared: Dict) -> Dict:
+        """temsilcinin metne bağlı (imzadan bağımsız) artifact'leri; isim ve adres üyeden çıkarılır"""
+        methods = shared['extraction']['extraction_methods']
+        artifacts = {
+            'institution': copy.deepcopy(methods.get('institution', {'institution': None})),
+            'category': copy.deepcopy(methods.get('category', {'primary_category': None})),
+            'emotional': copy.deepcopy(shared['emotional']),
+            'social': copy.deepcopy(shared['social']),
+        }
+        for artifact in ('urgency', 'request_type'):
+            if artifact in methods:
+                artifacts[artifact] = copy.deepcopy(methods[artifact])
+        return artifacts
+
+    def _extract_comprehensive_address(self, text: str, hits: KeywordHits) -> Dict:
         """Kapsamlı adres çıkarımı"""
 
         address_components = {
@@ -195,20 +705,19 @@ class PetitionAnalyzer:
         }
 
         #  adres bileşenlerinin çıkarımı
-        for level, patterns in self.inference_engine.core_patterns['location_hierarchy'].items():
-            if level != 'address_indicators':
-                matches = []
-                for pattern in patterns:
-                    found = re.findall(pattern, text, re.IGNORECASE)
-                    matches.extend(found)
+        for level, patterns in self.inference_engine.patterns.location_patterns.items():
+            matches = []
+            for pattern in patterns:
+                found = pattern.findall(text)
+                matches.extend(found)
 
-                if matches:
-                    # en uzun ve en detaylı eşleşmeyi al
-                    best_match = max(matches, key=lambda x: len(str(x)) if isinstance(x, str) else len(str(x[0])))
-                    if isinstance(best_match, tuple):
-                        best_match = best_match[0]
+            if matches:
+                # en uzun ve en detaylı eşleşmeyi al
+                best_match = max(matches, key=lambda x: len(str(x)) if isinstance(x, str) else len(str(x[0])))
+                if isinstance(best_match, tuple):
+                    best_match = best_match[0]
 
-                    address_components[level.replace('_patterns', '')] = best_match.strip()
+                address_components[level.replace('_patterns', '')] = best_match.strip()
 
         # adresi birleştir
         address_parts = []
@@ -225,21 +734,20 @@ class PetitionAnalyzer:
 
         # bağlamsal adres arama
         if not address_components['full_address']:
-            context_address = self._extract_contextual_address(text)
+            context_address = self._extract_contextual_address(text, hits)
             if context_address:
                 address_components.update(context_address)
 
         return address_components
 
-    def _extract_contextual_address(self, text: str) -> Dict:
+    def _extract_contextual_address(self, text: str, hits: KeywordHits) -> Dict:
         """bağlamsal adres çıkarımı"""
 
-        address_indicators = self.inference_engine.core_patterns['location_hierarchy']['address_indicators']
+        contextual_patterns = self.inference_engine.patterns.contextual_address_patterns
 
-        for indicator in address_indicators:
-            if indicator in text.lower():
-                pattern = rf'{indicator}.*?([A-ZÇĞİÖŞÜ][a-zçğıöşü\s/,-]+(?:mahallesi|sokağı|caddesi|bulvarı|ilçesi).*?)(?:\.|,|$)'
-                matches = re.findall(pattern, text, re.IGNORECASE | re.DOTALL)
+        for indicator, pattern in contextual_patterns.items():
+            if indicator in hits:
+                matches = pattern.findall(text)
 
                 if matches:
                     return {
@@ -262,9 +770,9 @@ class PetitionAnalyzer:
         }
 
         # yetkili çıkarımı
-        for authority_type, patterns in self.inference_engine.core_patterns['authority_recognition'].items():
+        for authority_type, patterns in self.inference_engine.patterns.authority_patterns.items():
             for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+                matches = pattern.findall(text)
                 if matches:
                     for match in matches:
                         if isinstance(match, tuple):
@@ -289,10 +797,14 @@ class PetitionAnalyzer:
 
         return extraction_details
 
-    def _ultra_comprehensive_category_classification(self, text: str, sentences: List[str]) -> Dict:
-        """konu sınıflandırması"""
+    def _ultra_comprehensive_category_classification(self, hits: KeywordHits, sentence_keywords: List[Set[str]],
+                                                     details: bool = True) -> Dict:
+        """
+        konu sınıflandırması
+
+        details: False ise kategori başına eşleşme listeleri (category_details) tutulmaz
+        """
 
-        text_lower = text.lower()
         category_scores = defaultdict(float)
         category_details = {}
 
@@ -311,31 +823,35 @@ class PetitionAnalyzer:
 
             # birincil keywordler  en yüksek puana sahip olanlar
             for keyword in keywords_dict.get('primary_keywords', []):
-                count = text_lower.count(keyword)
+                count = hits.count(keyword)
                 if count > 0:
-                    score_details['primary_matches'].append((keyword, count))
+                    if details:
+                        score_details['primary_matches'].append((keyword, count))
                     total_score += count * 3.0
 
             # ikincil keywordler orta ağırlıktakiler
             for keyword in keywords_dict.get('secondary_keywords', []):
-                count = text_lower.count(keyword)
+                count = hits.count(keyword)
                 if count > 0:
-                    score_details['secondary_matches'].append((keyword, count))
+                    if details:
+                        score_details['secondary_matches'].append((keyword, count))
                     total_score += count * 2.0
 
             # bağlamsal bonus hesabı
             context_score = 0
             for keyword in keywords_dict.get('context_keywords', []):
-                if keyword in text_lower:
+                if keyword in hits:
                     context_score += 1
-                    score_details['context_matches'].append(keyword)
+                    if details:
+                        score_details['context_matches'].append(keyword)
 
             # problem keywordleri özel bonus hesabı
             problem_score = 0
             for keyword in keywords_dict.get('problem_keywords', []):
-                if keyword in text_lower:
+                if keyword in hits:
                     problem_score += 1
-                    score_details['problem_matches'].append(keyword)
+                    if details:
+                        score_details['problem_matches'].append(keyword)
 
             # bağlamsal ve problem bonusları
             if total_score > 0:
@@ -345,13 +861,14 @@ class PetitionAnalyzer:
                     total_score *= (1 + problem_score * 0.15)
 
             # cümle içi yakınlık bonusu
-            proximity_bonus = self._calculate_keyword_proximity_bonus(sentences, keywords_dict)
+            proximity_bonus = self._calculate_keyword_proximity_bonus(sentence_keywords, keywords_dict)
             total_score += proximity_bonus
 
             if total_score > 0:
-                score_details['total_score'] = total_score
                 category_scores[category] = total_score
-                category_details[category] = score_details
+                if details:
+                    score_details['total_score'] = total_score
+                    category_details[category] = score_details
 
         # en yüksek skorlu kategoriyi belirle
         result = {
@@ -375,87 +892,73 @@ class PetitionAnalyzer:
 
         return result
 
-    def _calculate_keyword_proximity_bonus(self, sentences: List[str], keywords_dict: Dict) -> float:
+    def classify_categories(self, texts: Sequence[str], chunk_size: int = 1024) -> List[Dict]:
+        """
+        toplu konu sınıflandırması (ör. bir veri setini yeniden etiketlemek için)
+
+        her metin için _ultra_comprehensive_category_classification(details=False) ile birebir aynı
+        sonucu döndürür; puanlama kategori döngüsü yerine terim sayısı matrisi × ağırlık matrisi
+        çarpımıyla yapılır (bkz. category_matrix). metinler chunk_size'lık gruplar halinde
+        taranır, bellekte aynı anda yalnızca bir grubun bağlamı tutulur. istatistiklere eklenmez.
+        """
+        results = []
+        for offset in range(0, len(texts), chunk_size):
+            contexts = [DocumentContext(text, self.keyword_index) for text in texts[offset:offset + chunk_size]]
+            results.extend(self.category_matrix.classify_hits(
+                [context.hits for context in contexts], [context.sentence_keywords for context in contexts]
+            ))
+        return results
+
+    def _calculate_keyword_proximity_bonus(self, sentence_keywords: List[Set[str]], keywords_dict: Dict) -> float:
         """anahtar kelime yakınlık bonusu hesaplama"""
 
         bonus = 0.0
-        all_keywords = []
 
+        # aynı kelime birden fazla listede geçebilir, her geçiş ayrıca sayılır
+        keyword_multiplicity = Counter()
         for keyword_list in keywords_dict.values():
             if isinstance(keyword_list, list):
-                all_keywords.extend(keyword_list)
+                keyword_multiplicity.update(keyword_list)
 
         # her cümlede birden fazla anahtar kelime varsa
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            found_keywords = [kw for kw in all_keywords if kw in sentence_lower]
+        for found_in_sentence in sentence_keywords:
+            found_count = sum(keyword_multiplicity[kw] for kw in found_in_sentence if kw in keyword_multiplicity)
 
-            if len(found_keywords) > 1:
+            if found_count > 1:
                 # Çoklu anahtar kelime bonusu
-                bonus += len(found_keywords) * 0.5
+                bonus += found_count * 0.5
 
                 # özel kombinasyon bonusları
-                if any(kw in sentence_lower for kw in ['bozuk', 'tamir', 'onar']):
-                    bonus += 1.0
-                if any(kw in sentence_lower for kw in ['kirli', 'temiz', 'hijyen']):
-                    bonus += 1.0
+                for combo in PROXIMITY_COMBOS:
+                    if any(kw in found_in_sentence for kw in combo):
+                        bonus += 1.0
 
         return bonus
 
-    def _classify_request_type_detailed(self, text: str) -> Dict:
-        """detaylı talep türü sınıflandırması"""
+    def _classify_request_type_detailed(self, hits: KeywordHits, details: bool = True) -> Dict:
+        """
+        detaylı talep türü sınıflandırması
 
-        request_patterns = {
-            'acil_cozum_talebi': {
-                'keywords': ['acil', 'hemen', 'derhal', 'çözülmesini', 'giderilmesini', 'yapılmasını'],
-                'weight': 3.0
-            },
-            'normal_cozum_talebi': {
-                'keywords': ['çözülmesini', 'giderilmesini', 'yapılmasını', 'düzeltilmesini', 'tamir'],
-                'weight': 2.0
-            },
-            'bilgi_talebi': {
-                'keywords': ['bilgi', 'açıklama', 'ne zaman', 'nasıl', 'neden', 'öğrenmek', 'soruyorum'],
-                'weight': 2.0
-            },
-            'denetim_talebi': {
-                'keywords': ['denetim', 'kontrol', 'inceleme', 'araştırma', 'müfettiş'],
-                'weight': 2.5
-            },
-            'sikayet': {
-                'keywords': ['şikayetim', 'şikayet', 'rahatsızım', 'memnun değilim', 'eleştirim'],
-                'weight': 2.0
-            },
-            'oneri': {
-                'keywords': ['önerim', 'öneriyorum', 'teklif', 'öneri', 'fikrim', 'tavsiye'],
-                'weight': 1.5
-            },
-            'tesekkur_takdir': {
-                'keywords': ['teşekkür', 'sağ ol', 'minnettarım', 'takdir', 'memnunum', 'övgü'],
-                'weight': 1.0
-            },
-            'hukuki_tehdit': {
-                'keywords': ['hukuki', 'yasal', 'mahkeme', 'dava', 'avukat', 'hakkımı arayacağım'],
-                'weight': 3.0
-            }
-        }
+        details: False ise tür başına eşleşme listeleri (detailed_matches) tutulmaz
+        """
 
-        text_lower = text.lower()
         request_scores = {}
         detailed_matches = {}
 
-        for req_type, config in request_patterns.items():
+        for req_type, config in REQUEST_TYPE_PATTERNS.items():
             matches = []
             score = 0
 
             for keyword in config['keywords']:
-                if keyword in text_lower:
-                    count = text_lower.count(keyword)
-                    matches.append((keyword, count))
+                if keyword in hits:
+                    count = hits.count(keyword)
+                    if details:
+                        matches.append((keyword, count))
                     score += count * config['weight']
 
             if score > 0:
                 request_scores[req_type] = score
+            if score > 0 and details:
                 detailed_matches[req_type] = {
                     'matches': matches,
                     'score': score,
@@ -479,15 +982,22 @@ class PetitionAnalyzer:
             'classification_method': 'weighted_keyword_analysis'
         }
 
-    def _update_performance_metrics(self, processing_time: float, validation: Dict, extraction: Dict):
-        """gelişmiş peformans metrikleri güncelleme"""
+    def _update_performance_metrics(self, processing_time: float, validation: Optional[Dict], extraction: Dict,
+                                    stage_timings: Optional[Dict[str, float]] = None, cache_hit: bool = False):
+        """
+        gelişmiş peformans metrikleri güncelleme
+
+        cache_hit: önbellekten verilen sonuç; süresi yalnızca 'cache_lookup' histogramına girer,
+        'total' analiz sürelerini gösterir (isabet oranı arttıkça yüzdelikler aşağı çekilmesin)
+        """
 
         self.performance_metrics['total_analyzed'] += 1
 
-        if validation['quality_score'] > 0.7:
+        # doğrulama yapmayan profillerde (summary) doğrulama sayaçları değişmez
+        if validation is not None and validation['quality_score'] > 0.7:
             self.performance_metrics['high_confidence_results'] += 1
 
-        if not validation['overall_validity']:
+        if validation is not None and not validation['overall_validity']:
             self.performance_metrics['validation_failures'] += 1
 
         # isim çıkarım performansı
@@ -504,13 +1014,20 @@ class PetitionAnalyzer:
         new_avg = ((current_avg * (total - 1)) + processing_time) / total
         self.performance_metrics['average_processing_time'] = round(new_avg, 4)
 
+        # aşama bazlı süre histogramları (analizlerde toplam süre dahil)
+        if stage_timings:
+            self.stage_latency.record(stage_timings)
+        if not cache_hit:
+            self.stage_latency.record({'total': processing_time * 1000})
+
     def get_enhanced_system_statistics(self) -> Dict:
         """gelişmiş sistem istatistikleri"""
         total = self.performance_metrics['total_analyzed']
 
         return {
             'performance_metrics': self.performance_metrics,
-            'analysis_history_count': len(self.analysis_history),
+            'analysis_history_count': self.analysis_history.total,
+            'analysis_history_window': len(self.analysis_history),
             'success_rates': {
                 'name_extraction': round(
                     self.performance_metrics['successful_name_extractions'] / max(total, 1) * 100, 1
@@ -522,99 +1039,37 @@ class PetitionAnalyzer:
                     (1 - self.performance_metrics['validation_failures'] / max(total, 1)) * 100, 1
                 )
             },
-            'average_confidence': round(
-                sum(analysis['metadata']['confidence_level']
-                    for analysis in self.analysis_history) /
-                max(len(self.analysis_history), 1), 3
-            ) if self.analysis_history else 0.0,
+            'average_confidence': self.analysis_history.average_confidence(),
             'category_distribution': self._get_category_distribution(),
-            'extraction_method_performance': self._get_extraction_method_stats()
+            'extraction_method_performance': self._get_extraction_method_stats(),
+            'stage_latency': self.stage_latency.summary(),
+            'result_cache': self.result_cache.stats() if self.result_cache is not None else None,
+            'campaigns': dict(self.campaign_metrics)
         }
 
     def _get_category_distribution(self) -> Dict:
         """kategori dağılımı istatistikleri"""
-
-        categories = []
-        for analysis in self.analysis_history:
-            category = analysis['extracted_information'].get('subject_category')
-            if category:
-                categories.append(category)
-
-        if not categories:
-            return {}
-
-        from collections import Counter
-        category_counts = Counter(categories)
-        total = len(categories)
-
-        return {
-            category: {
-                'count': count,
-                'percentage': round(count / total * 100, 1)
-            }
-            for category, count in category_counts.most_common()
-        }
+        return self.analysis_history.category_distribution()
 
     def _get_extraction_method_stats(self) -> Dict:
         """Çıkarım yöntemleri performans istatistikleri"""
-
-        method_stats = {
-            'name_extraction_methods': defaultdict(int),
-            'address_extraction_methods': defaultdict(int),
-            'category_extraction_methods': defaultdict(int)
-        }
-
-        for analysis in self.analysis_history:
-            extraction_methods = analysis['extracted_information'].get('extraction_methods', {})
-
-            # isim çıkarım yöntemleri
-            if 'name' in extraction_methods:
-                name_methods = extraction_methods['name'].get('extraction_methods', {})
-                for method, candidates in name_methods.items():
-                    if candidates:
-                        method_stats['name_extraction_methods'][method] += 1
-
-            # kategori çıkarım yöntemleri
-            if 'category' in extraction_methods:
-                method = extraction_methods['category'].get('classification_method', 'unknown')
-                method_stats['category_extraction_methods'][method] += 1
-
-        return {key: dict(value) for key, value in method_stats.items()}
-
+        return self.analysis_history.extraction_method_stats()
 
     def _smart_sentence_split(self, text: str) -> List[str]:
         """akıllı cümle ayırma """
-        sentences = re.split(r'[.!?]+', text)
-        cleaned_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence:
-                if len(sentence.split()) < 5 and cleaned_sentences:
-                    cleaned_sentences[-1] += ". " + sentence
-                else:
-                    cleaned_sentences.append(sentence)
-        return cleaned_sentences
-
-    def _analyze_urgency_with_momentum(self, text: str, sentences: List[str]) -> Dict:
-        """momentum bazlı aciliyet analizi"""
-        urgency_keywords = {
-            'critical': ['acil', 'hemen', 'derhal', 'ivedi', 'can', 'tehlike', 'ölüm'],
-            'high': ['bir an önce', 'çok önemli', 'yakın zamanda', 'mümkün olan'],
-            'medium': ['uygun gördüğünüzde', 'zamanınız olduğunda', 'müsait'],
-            'low': ['fırsat bulduğunuzda', 'boş vakit', 'acele yok']
-        }
+        return DocumentContext(text, self.keyword_index).sentences
 
-        text_lower = text.lower()
+    def _analyze_urgency_with_momentum(self, text: str, hits: KeywordHits) -> Dict:
+        """momentum bazlı aciliyet analizi"""
         urgency_scores = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
 
-        for level, keywords in urgency_keywords.items():
+        for level, keywords in URGENCY_KEYWORDS.items():
             for keyword in keywords:
-                count = text_lower.count(keyword)
+                count = hits.count(keyword)
                 urgency_scores[level] += count
 
         # tekrarlama  etkisi
-        repetition_patterns = ['tekrar', 'yine', 'gene', 'defalarca', 'sürekli']
-        repetition_score = sum(1 for pattern in repetition_patterns if pattern in text_lower)
+        repetition_score = sum(1 for pattern in REPETITION_PATTERNS if pattern in hits)
 
         if repetition_score > 0:
             max_urgency = max(urgency_scores, key=urgency_scores.get)
@@ -657,15 +1112,20 @@ class PetitionAnalyzer:
         return round(cross_val_score, 3)
 
 
-    def _generate_creative_insights(self, extraction: Dict, emotional: Dict, social: Dict, validation: Dict) -> Dict:
-        return {
-            'citizen_urgency_profile': self._determine_urgency_profile(extraction, emotional),
-            'communication_style_analysis': self._analyze_communication_style(extraction, emotional, social),
-            'predicted_satisfaction_level': self._predict_satisfaction_level(validation, social, emotional),
-            'institutional_response_recommendation': self._generate_response_recommendation(extraction, emotional,
-                                                                                            social),
-            'risk_assessment': self._assess_escalation_risk(extraction, emotional, social, validation)
+    def _generate_creative_insights(self, extraction: Dict, emotional: Dict, social: Dict, validation: Dict,
+                                    profile: Optional[AnalysisProfile] = None) -> Dict:
+        sections = {
+            'citizen_urgency_profile': lambda: self._determine_urgency_profile(extraction, emotional),
+            'communication_style_analysis': lambda: self._analyze_communication_style(extraction, emotional, social),
+            'predicted_satisfaction_level': lambda: self._predict_satisfaction_level(validation, social, emotional),
+            'institutional_response_recommendation': lambda: self._generate_response_recommendation(
+                extraction, emotional, social
+            ),
+            'risk_assessment': lambda: self._assess_escalation_risk(extraction, emotional, social, validation)
         }
+        # profilin istemediği bölümler hesaplanmaz (girdileri de hesaplanmamış olabilir)
+        wants = (profile or get_profile('full')).wants
+        return {name: build() for name, build in sections.items() if wants(f'creative_insights.{name}')}
 
     def _determine_urgency_profile(self, extraction: Dict, emotional: Dict) -> str:
         urgency_level = extraction.get('urgency_level', 'medium')
@@ -759,4 +1219,69 @@ class PetitionAnalyzer:
         }
 
     def _calculate_engagement_level(self, social_analysis: Dict) -> str:
-        return 'moderately_engaged'
\ No newline at end of file
+        return 'moderately_engaged'
+
+
+@lru_cache(maxsize=None)
+def get_analyzer() -> PetitionAnalyzer:
+    """süreç genelinde paylaşılan, ısıtılmış analizör (GUI ve kısa ömürlü CLI çalıştırmaları için)"""
+    return PetitionAnalyzer().warm_up()
+
+
+def is_failed_result(result: Dict) -> bool:
+    """analyze_batch içinde hata vermiş dilekçenin kaydı mı"""
+    return 'error' in result
+
+
+def failed_result(error: BaseException) -> Dict:
+    """hata veren dilekçenin sonucu yerine konan kayıt (bkz. is_failed_result)"""
+    return {'error': {'type': type(error).__name__, 'message': str(error)}}
+
+
+def _campaign_layers(result: Dict) -> Dict:
+    """
+    kampanya temsilcisinin sonucundan üyelere aktarılacak katmanlar
+
+    sosyal katmanın ham skorları sonuca yazılmaz; güven skoru sentez katmanından alınır
+    """
+    return {
+        'extraction': result['extracted_information'],
+        'emotional': result['emotional_intelligence']['momentum_analysis'],
+        'social': {
+            'raw_scores': {},
+            'detected_signals': result['social_intelligence']['social_signals'],
+            'inferred_profile': result['social_intelligence']['citizen_profile'],
+            'social_confidence': result['creative_insights']['communication_style_analysis']['social_awareness']
+        }
+    }
+
+
+def _analyze_chunk(analyzer: PetitionAnalyzer, texts: Sequence[str],
+                   shared: Optional[Sequence[Optional[Dict]]] = None) -> List[Dict]:
+    """
+    parçadaki dilekçeleri sırayla analiz et; hata veren dilekçe yalnızca kendi kaydını bozar
+
+    önbellek burada kullanılmaz: isabetler analyze_batch'te ayıklanır, işçi süreçler
+    ana süreçten devraldıkları önbellek bağlantısına dokunmamalı
+    """
+    results = []
+    for text, layers in zip(texts, shared or [None] * len(texts)):
+        try:
+            results.append(analyzer._analyze_document(text, layers))
+        except Exception as error:
+            results.append(failed_result(error))
+    return results
+
+
+def init_worker():
+    """işçi süreç havuzlarının initializer'ı: analizör süreç başına bir kez kurulur"""
+    get_analyzer()
+
+
+def _analyze_batch_chunk(texts: Sequence[str], shared: Optional[Sequence[Optional[Dict]]] = None) -> List[Dict]:
+    analyzer = get_analyzer()
+    results = _analyze_chunk(analyzer, texts, shared)
+    # sonuçlar ana sürecin geçmişine eklenir, işçide birikmesin
+    analyzer.analysis_history.clear()
+    # süreçler arası aktarım paketlenmiş halde (bkz. result_model)
+    return pack_results(results)
@@ -0,0 +1,192 @@
+"""
+İçerik adresli analiz sonucu önbelleği.
+
+Kampanya dilekçeleri çoğu zaman birebir aynı ya da yalnızca boşluklarda
+farklıdır; aynı PDF de GUI'den tekrar tekrar gönderilebilir. Anahtar,
+normalleştirilmiş metnin ve kural seti / algoritma sürümünün özetidir:
+kurallar değiştiğinde eski kayıtlar kendiliğinden geçersiz kalır.
+
+İki katman:
+  - bellek : en son kullanılan max_entries sonuç (LRU)
+  - disk   : isteğe bağlı SQLite dosyası; toplam boyut max_disk_bytes'ı
+             aşınca en uzun süredir kullanılmayan kayıtlar silinir
+
+Sonuçlar pickle ile saklanır: her isabet bağımsız bir kopya döndürür ve
+önbellekteki kayıt çağıranın değişikliklerinden etkilenmez.
+
+Not: normalleştirme satır yapısını korur, yalnızca satır içi boşluk
+farklarını siler; böyle iki metin için dönen sonuç ilk analiz edilen
+varyanta aittir.
+"""
+import hashlib
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+_HORIZONTAL_WHITESPACE = re.compile(r'[^\S\n]+')
+_LINE_BREAKS = re.compile(r'\r\n?')
+
+
+def normalize_text(text: str) -> str:
+    """NFC, tek tip satır sonu, satır içi boşluk dizileri tek boşluk, baş/son boşluk yok"""
+    text = unicodedata.normalize('NFC', text)
+    text = _LINE_BREAKS.sub('\n', text)
+    lines = (_HORIZONTAL_WHITESPACE.sub(' ', line).strip() for line in text.split('\n'))
+    return '\n'.join(lines).strip('\n')
+
+
+def cache_key(text: str, version: str) -> str:
+    payload = f"{version}\0{normalize_text(text)}".encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
+
+
+class _DiskTier:
+    """anahtar -> pickle, son erişim zamanı ile; boyut sınırı aşılınca LRU tahliye"""
+
+    def __init__(self, path: str, max_bytes: int):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS results_last_access ON results(last_access)")
+        self.total_bytes, self.entries = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0), COUNT(*) FROM results"
+        ).fetchone()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key))
+            return row[0]
+
+    def put(self, key: str, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._connection.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time())
+            )
+            if previous:
+                self.total_bytes -= previous[0]
+            else:
+                self.entries += 1
+            self.total_bytes += len(value)
+            self._evict()
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes:
+            rows = self._connection.execute(
+                "SELECT key, size FROM results ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if self.total_bytes <= self.max_bytes:
+                    break
+                self._connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                self.total_bytes -= size
+                self.entries -= 1
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class ResultCache:
+    """
+    max_entries: bellek katmanındaki en fazla sonuç sayısı
+    disk_path: SQLite dosyası (None ise yalnızca bellek)
+    max_disk_bytes: disk katmanının boyut sınırı
+    """
+
+    def __init__(self, max_entries: int = 1024, disk_path: Optional[str] = None,
+                 max_disk_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max(0, max_entries)
+        self._memory: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._disk = _DiskTier(disk_path, max_disk_bytes) if disk_path else None
+
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def key(self, text: str, version: str) -> str:
+        return cache_key(text, version)
+
+    def get(self, key: str) -> Optional[Tuple[Dict, str]]:
+        """(sonucun bağımsız kopyası, katman) ya da None"""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return pickle.loads(value), 'memory'
+
+        value = self._disk.get(key) if self._disk else None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, value)
+        return pickle.loads(value), 'disk'
+
+    def put(self, key: str, result: Dict):
+        value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, value)
+        if self._disk:
+            self._disk.put(key, value)
+
+    def _remember(self, key: str, value: bytes):
+        if not self.max_entries:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = value
+        self._memory_bytes += len(value)
+        while len(self._memory) > self.max_entries:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        stats = {
+            'hits': self.hits,
+            'misses': self.misses,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'memory_entries': len(self._memory),
+            'memory_bytes': self._memory_bytes,
+        }
+        if self._disk:
+            stats['disk_entries'] = self._disk.entries
+            stats['disk_bytes'] = self._disk.total_bytes
+        return stats
+
+    def close(self):
+        if self._disk:
+            self._disk.close()
@@ -0,0 +1,261 @@
+"""
+Analiz sonucunun sıkıştırılmış, tipli modeli.
+
+_analyze_document sonucu iç içe sözlük / liste ağacıdır; en büyük parçası
+cümle başına duygu akışıdır (her cümle için iki ayrı duygu sözlüğü). Bu
+modül aynı sonucu __slots__'lu nesnelerle tutar:
+
+  - cümle başına duygu ve kümülatif momentum değerleri array('d') içinde
+    satır satır paketlenir (cümle x duygu); baskın duygu ve cümle sırası
+    saklanmaz, to_dict'te yeniden üretilir
+  - sonuçta iki kez yazılan alanlar (doğrulama özeti, baskın duygu,
+    iletişim stilindeki duygu yoğunluğu) bir kez tutulur
+
+AnalysisResult.from_dict(sonuç).to_dict() == sonuç: JSON biçimi değişmez.
+Nesneler süreçler arası aktarımda ve önbellekte kullanılır; çağırana
+dönen sonuç yine sözlüktür (analyze_batch(compact=True) hariç).
+"""
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class _SlottedRecord:
+    """alanları __slots__ ile sabit, eşitlik ve repr alan değerlerinden"""
+    __slots__ = ()
+
+    def _values(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and self._values() == other._values()
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class EmotionalFlow(_SlottedRecord):
+    """
+    duygusal momentum katmanı; cümle değerleri emotions sırasıyla paketlenir
+
+    sentence_scores[i * len(emotions) + j]: i. cümlede j. duygunun skoru
+    cumulative[i * len(emotions) + j]: i. cümleden sonraki kümülatif momentum
+    """
+    __slots__ = ('emotions', 'sentence_scores', 'cumulative', 'final_momentum',
+                 'dominant_overall', 'emotional_stability')
+
+    def __init__(self, emotions: Tuple[str, ...], sentence_scores: array, cumulative: array,
+                 final_momentum: Dict[str, float], dominant_overall: str, emotional_stability: float):
+        self.emotions = emotions
+        self.sentence_scores = sentence_scores
+        self.cumulative = cumulative
+        self.final_momentum = final_momentum
+        self.dominant_overall = dominant_overall
+        self.emotional_stability = emotional_stability
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentence_scores) // len(self.emotions) if self.emotions else 0
+
+    def sentence(self, index: int) -> Dict:
+        """tek cümlenin sentence_flow kaydı"""
+        width = len(self.emotions)
+        row = slice(index * width, (index + 1) * width)
+        emotions = dict(zip(self.emotions, self.sentence_scores[row]))
+        return {
+            'sentence_index': index,
+            'emotions': emotions,
+            'cumulative_momentum': dict(zip(self.emotions, self.cumulative[row])),
+            'dominant_emotion': max(emotions, key=emotions.get)
+        }
+
+    @classmethod
+    def from_dict(cls, momentum: Dict) -> 'EmotionalFlow':
+        flow = momentum['sentence_flow']
+        emotions = tuple(flow[0]['emotions']) if flow else tuple(momentum['final_momentum'])
+        return cls(
+            emotions,
+            array('d', (entry['emotions'][emotion] for entry in flow for emotion in emotions)),
+            array('d', (entry['cumulative_momentum'][emotion] for entry in flow for emotion in emotions)),
+            dict(momentum['final_momentum']),
+            momentum['dominant_overall'],
+            momentum['emotional_stability'],
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            'sentence_flow': [self.sentence(index) for index in range(self.sentence_count)],
+            'final_momentum': dict(self.final_momentum),
+            'dominant_overall': self.dominant_overall,
+            'emotional_stability': self.emotional_stability
+        }
+
+
+class ExtractionResult(_SlottedRecord):
+    """bilgi çıkarımı katmanı; yöntem ayrıntıları (method_scores, category_details ...) olduğu gibi"""
+    __slots__ = ('person_name', 'address_info', 'institution', 'subject_category', 'urgency_level',
+                 'request_type', 'extraction_methods', 'cross_validation_score', 'extraction_details')
+
+    def __init__(self, person_name: Optional[str], address_info: Optional[str], institution: Optional[str],
+                 subject_category: Optional[str], urgency_level: Optional[str], request_type: Optional[str],
+                 extraction_methods: Dict, cross_validation_score: float, extraction_details: Dict):
+        self.person_name = person_name
+        self.address_info = address_info
+        self.institution = institution
+        self.subject_category = subject_category
+        self.urgency_level = urgency_level
+        self.request_type = request_type
+        self.extraction_methods = extraction_methods
+        self.cross_validation_score = cross_validation_score
+        self.extraction_details = extraction_details
+
+    @classmethod
+    def from_dict(cls, extraction: Dict) -> 'ExtractionResult':
+        return cls(*(extraction[name] for name in cls.__slots__))
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class SocialProfile(_SlottedRecord):
+    """sosyal profil katmanı"""
+    __slots__ = ('citizen_profile', 'social_signals', 'engagement_level')
+
+    def __init__(self, citizen_profile: Dict, social_signals: Dict, engagement_level: str):
+        self.citizen_profile = citizen_profile
+        self.social_signals = social_signals
+        self.engagement_level = engagement_level
+
+    @classmethod
+    def from_dict(cls, social: Dict) -> 'SocialProfile':
+        return cls(social['citizen_profile'], social['social_signals'], social['engagement_level'])
+
+    def to_dict(self) -> Dict:
+        return {
+            'citizen_profile': self.citizen_profile,
+            'social_signals': self.social_signals,
+            'engagement_level': self.engagement_level
+        }
+
+
+class ValidationReport(_SlottedRecord):
+    """iki doğrulama raporu; özet alanları gelişmiş doğrulamadan türetilir"""
+    __slots__ = ('primary_validation', 'enhanced_validation')
+
+    def __init__(self, primary_validation: Dict, enhanced_validation: Dict):
+        self.primary_validation = primary_validation
+        self.enhanced_validation = enhanced_validation
+
+    @classmethod
+    def from_dict(cls, report: Dict) -> 'ValidationReport':
+        return cls(report['primary_validation'], report['enhanced_validation'])
+
+    def to_dict(self) -> Dict:
+        enhanced = self.enhanced_validation
+        return {
+            'primary_validation': self.primary_validation,
+            'enhanced_validation': enhanced,
+            'overall_validity': enhanced['overall_validity'],
+            'quality_score': enhanced['quality_score'],
+            'red_flags': enhanced['red_flags'],
+            'confidence_adjustment': enhanced['confidence_adjustment']
+        }
+
+
+class CreativeInsights(_SlottedRecord):
+    """
+    sentez katmanı; iletişim stilindeki duygu yoğunluğu son momentumun aynısıdır,
+    saklanmaz (to_dict'e momentum verilir)
+    """
+    __slots__ = ('citizen_urgency_profile', 'communication_style_analysis', 'predicted_satisfaction_level',
+                 'institutional_response_recommendation', 'risk_assessment')
+
+    def __init__(self, citizen_urgency_profile: str, communication_style_analysis: Dict,
+                 predicted_satisfaction_level: Dict, institutional_response_recommendation: Dict,
+                 risk_assessment: Dict):
+        self.citizen_urgency_profile = citizen_urgency_profile
+        self.communication_style_analysis = communication_style_analysis
+        self.predicted_satisfaction_level = predicted_satisfaction_level
+        self.institutional_response_recommendation = institutional_response_recommendation
+        self.risk_assessment = risk_assessment
+
+    @classmethod
+    def from_dict(cls, insights: Dict, final_momentum: Dict) -> 'CreativeInsights':
+        style = dict(insights['communication_style_analysis'])
+        if style.get('emotional_intensity') == final_momentum:
+            del style['emotional_intensity']
+        return cls(insights['citizen_urgency_profile'], style, *(insights[name] for name in cls.__slots__[2:]))
+
+    def to_dict(self, final_momentum: Dict) -> Dict:
+        style = self.communication_style_analysis
+        if 'emotional_intensity' not in style:
+            # anahtar sırası korunur: style, emotional_intensity, ...
+            items = list(style.items())
+            style = dict(items[:1] + [('emotional_intensity', final_momentum)] + items[1:])
+        return {
+            'citizen_urgency_profile': self.citizen_urgency_profile,
+            'communication_style_analysis': style,
+            'predicted_satisfaction_level': self.predicted_satisfaction_level,
+            'institutional_response_recommendation': self.institutional_response_recommendation,
+            'risk_assessment': self.risk_assessment
+        }
+
+
+class AnalysisResult(_SlottedRecord):
+    """_analyze_document sonucunun tamamı"""
+    __slots__ = ('metadata', 'extraction', 'emotional', 'predicted_citizen_state', 'social',
+                 'validation', 'insights', 'recommendations')
+
+    def __init__(self, metadata: Dict, extraction: ExtractionResult, emotional: EmotionalFlow,
+                 predicted_citizen_state: Dict, social: SocialProfile, validation: ValidationReport,
+                 insights: CreativeInsights, recommendations: List[Dict]):
+        self.metadata = metadata
+        self.extraction = extraction
+        self.emotional = emotional
+        self.predicted_citizen_state = predicted_citizen_state
+        self.social = social
+        self.validation = validation
+        self.insights = insights
+        self.recommendations = recommendations
+
+    @classmethod
+    def from_dict(cls, result: Dict) -> 'AnalysisResult':
+        emotional = result['emotional_intelligence']
+        momentum = emotional['momentum_analysis']
+        return cls(
+            result['metadata'],
+            ExtractionResult.from_dict(result['extracted_information']),
+            EmotionalFlow.from_dict(momentum),
+            emotional['predicted_citizen_state'],
+            SocialProfile.from_dict(result['social_intelligence']),
+            ValidationReport.from_dict(result['validation_report']),
+            CreativeInsights.from_dict(result['creative_insights'], momentum['final_momentum']),
+            result['actionable_recommendations'],
+        )
+
+    def to_dict(self) -> Dict:
+        momentum = self.emotional.to_dict()
+        return {
+            'metadata': self.metadata,
+            'extracted_information': self.extraction.to_dict(),
+            'emotional_intelligence': {
+                'momentum_analysis': momentum,
+                'dominant_emotion': self.emotional.dominant_overall,
+                'emotional_stability': self.emotional.emotional_stability,
+                'predicted_citizen_state': self.predicted_citizen_state
+            },
+            'social_intelligence': self.social.to_dict(),
+            'validation_report': self.validation.to_dict(),
+            'creative_insights': self.insights.to_dict(momentum['final_momentum']),
+            'actionable_recommendations': self.recommendations
+        }
+
+
+def pack_results(results: Sequence[Dict]) -> List:
+    """sonuç sözlüklerini AnalysisResult'a çevir; hata kayıtları olduğu gibi kalır"""
+    return [AnalysisResult.from_dict(result) if 'error' not in result else result for result in results]
+
+
+def unpack_result(result):
+    """AnalysisResult ise sözlüğe çevir, değilse (sözlük / hata kaydı) olduğu gibi döndür"""
+    return result.to_dict() if isinstance(result, AnalysisResult) else result
@@ -0,0 +1,83 @@
+"""
+Analiz sonuçlarının yazıldığı kalıcı hedefler.
+
+GUI (main.py) ve toplu aktarım (ingest.py) aynı veri klasörü düzenini kullanır:
+    <veri klasörü>/results/petition_analyze_results-*.jsonl   sonuç deposu
+    <veri klasörü>/train_data.txt                             ham metin kayıtları
+    <veri klasörü>/training_dataset.xlsx                      excel eğitim veri seti
+"""
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from src.excel_dataset import StagedExcelDataset
+from src.results_store import JsonlResultsStore
+
+TRAIN_DATA_NAME = "train_data.txt"
+RESULTS_DIR_NAME = "results"
+RESULTS_PREFIX = "petition_analyze_results"
+EXCEL_DATASET_NAME = "training_dataset.xlsx"
+
+
+def append_training_text(path: str, text: str, source_name: str):
+    """çıkarılan metni train_data.txt biçiminde dosyaya ekler (bkz. create_dataset.iter_documents)"""
+    append_training_texts(path, [(text, source_name)])
+
+
+def append_training_texts(path: str, entries: Iterable[Tuple[str, str]]):
+    """(metin, kaynak adı) kayıtlarını dosyayı bir kez açarak ekler"""
+    with open(path, "a", encoding="utf-8") as f_train:
+        for text, source_name in entries:
+            f_train.write(f"\n\n{'=' * 50}\n")
+            f_train.write(f"Dosya: {source_name}\n")
+            f_train.write(f"Tarih: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f_train.write(f"{'=' * 50}\n")
+            f_train.write(text.strip())
+            f_train.write("\n")
+
+
+def excel_record(result: Dict, text: str, source_name: str) -> Dict:
+    """excel veri setinin bir satırı: kaynak, tarih, ham metin ve sonucun tüm bölümleri"""
+    return {
+        'dosya_adi': source_name,
+        'tarih': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'ham_metin': text.strip(),
+        **result  # analiz sonucundaki tüm anahtarları ayrı sütunlar olarak aç
+    }
+
+
+class ResultSinks:
+    """
+    bir veri klasöründeki üç hedef: sonuç deposu, train_data.txt ve excel veri seti
+
+    excel satırları ara kayıt günlüğüne yazılır; çalışma kitabı close() ile bir kez üretilir
+    """
+
+    def __init__(self, data_folder: str):
+        os.makedirs(data_folder, exist_ok=True)
+        self.train_data_path = os.path.join(data_folder, TRAIN_DATA_NAME)
+        self.results_store = JsonlResultsStore(os.path.join(data_folder, RESULTS_DIR_NAME), prefix=RESULTS_PREFIX)
+        self.excel_dataset = StagedExcelDataset(os.path.join(data_folder, EXCEL_DATASET_NAME))
+        self.written = 0
+
+    def write(self, result: Dict, text: str, source_name: str):
+        result["kaynak_dosya"] = source_name
+        self.results_store.append(result)
+        append_training_text(self.train_data_path, text, source_name)
+        self.excel_dataset.append(excel_record(result, text, source_name))
+        self.written += 1
+
+    def write_batch(self, items: Sequence[Tuple[Dict, str, str]]):
+        """(sonuç, metin, kaynak adı) kayıtlarını her hedefe tek seferde yaz (hedef başına bir açılış)"""
+        for result, _, source_name in items:
+            result["kaynak_dosya"] = source_name
+        self.results_store.append_many(result for result, _, _ in items)
+        append_training_texts(self.train_data_path, [(text, source_name) for _, text, source_name in items])
+        self.excel_dataset.append_many(excel_record(result, text, source_name) for result, text, source_name in items)
+        self.written += len(items)
+
+    def close(self) -> Optional[int]:
+        """bekleyen excel satırlarını çalışma kitabına yaz; dönüş: çalışma kitabındaki satır sayısı"""
+        if not self.excel_dataset.pending_rows:
+            return None
+        return self.excel_dataset.compact()
@@ -0,0 +1,162 @@
+"""
+Yalnızca ekleme yapılan JSON Lines sonuç deposu.
+
+Her analiz sonucu, geçerli segment dosyasının sonuna tek bir satır olarak
+eklenir: kayıt maliyeti geçmişin boyutundan bağımsızdır ve yazma sırasında
+bir çökme en fazla son satırı bozar (okuyucu yarım kalan satırı atlar).
+
+Segmentler gün değiştiğinde ya da boyut sınırı aşıldığında döner:
+    <dizin>/<önek>-YYYYMMDD-NNNN.jsonl
+"""
+import json
+import os
+import re
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+
+class JsonlResultsStore:
+    """
+    segmentlere bölünmüş, yalnızca ekleme yapılan sonuç deposu
+
+    max_segment_bytes: bu boyuta ulaşan segmentten sonra yeni segment açılır
+    rotate_daily: her gün yeni bir segmentle başlanır
+    """
+
+    def __init__(self, directory: str, prefix: str = "results", max_segment_bytes: int = 64 * 1024 * 1024,
+                 rotate_daily: bool = True, fsync: bool = False,
+                 clock: Callable[[], datetime] = datetime.now):
+        self.directory = directory
+        self.prefix = prefix
+        self.max_segment_bytes = max_segment_bytes
+        self.rotate_daily = rotate_daily
+        self.fsync = fsync
+        self._clock = clock
+        self._segment_name = re.compile(rf"^{re.escape(prefix)}-(\d{{8}})-(\d{{4}})\.jsonl$")
+
+        # geçerli segment: (gün, sıra, boyut) - her eklemede dizin taranmaz
+        self._current: Optional[List] = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    def append(self, result: Dict) -> str:
+        """sonucu geçerli segmente tek satır olarak ekle, yazılan segmentin yolunu döndür"""
+        line = (json.dumps(result, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        path = self._segment_for_write(len(line))
+
+        with open(path, "ab") as f:
+            f.write(line)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        self._current[2] += len(line)
+        return path
+
+    def append_many(self, results: Iterable[Dict]) -> int:
+        """
+        sonuçları sırayla ekle; her segment dosyası bir kez açılır (fsync segment başına bir kez)
+
+        dönüş: eklenen sonuç sayısı
+        """
+        count = 0
+        handle = None
+        try:
+            for result in results:
+                line = (json.dumps(result, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+                path = self._segment_for_write(len(line))
+                if handle is None or handle.name != path:
+                    self._close_segment(handle)
+                    handle = open(path, "ab")
+                handle.write(line)
+                self._current[2] += len(line)
+                count += 1
+        finally:
+            self._close_segment(handle)
+        return count
+
+    def segments(self) -> List[str]:
+        """segment dosyaları, yazılma sırasıyla"""
+        names = sorted(name for name in os.listdir(self.directory) if self._segment_name.match(name))
+        return [os.path.join(self.directory, name) for name in names]
+
+    def iter_results(self) -> Iterator[Dict]:
+        """tüm sonuçları segment segment, satır satır dolaş (belleğe toplu yüklenmez)"""
+        for path in self.segments():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # yazma sırasında kesilmiş satır: kalan geçmiş sağlam
+                        continue
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.iter_results()
+
+    def migrate_json_array(self, json_path: str) -> int:
+        """
+        eski tek dosyalık JSON dizisini depoya taşı (bir kez)
+
+        taşınan dosya '<ad>.migrated' olarak yeniden adlandırılır, tekrar çalıştırmak bir şey yapmaz.
+        dönüş: taşınan sonuç sayısı
+        """
+        if not os.path.exists(json_path):
+            return 0
+
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = [data]
+
+        self.append_many(data)
+
+        os.replace(json_path, json_path + ".migrated")
+        return len(data)
+
+    def _segment_for_write(self, incoming_bytes: int) -> str:
+        day = self._clock().strftime("%Y%m%d") if self.rotate_daily else "00000000"
+
+        if self._current is None or self._current[0] != day:
+            self._current = self._latest_segment(day)
+
+        _, sequence, size = self._current
+        if size and size + incoming_bytes > self.max_segment_bytes:
+            self._current = [day, sequence + 1, 0]
+
+        return self._path(*self._current[:2])
+
+    def _latest_segment(self, day: str) -> List:
+        """bugünün en son segmentinden devam et (süreç yeniden başladığında)"""
+        latest = [day, 0, 0]
+        for path in self.segments():
+            match = self._segment_name.match(os.path.basename(path))
+            if match.group(1) == day and int(match.group(2)) >= latest[1]:
+                latest = [day, int(match.group(2)), os.path.getsize(path)]
+
+        if latest[2]:
+            latest[2] += self._repair_tail(self._path(day, latest[1]))
+        return latest
+
+    def _close_segment(self, handle):
+        if handle is None:
+            return
+        if self.fsync:
+            handle.flush()
+            os.fsync(handle.fileno())
+        handle.close()
+
+    @staticmethod
+    def _repair_tail(path: str) -> int:
+        """önceki çalışma yarım satır bıraktıysa satırı kapat, yeni kayıt ona eklenmesin"""
+        with open(path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) == b"\n":
+                return 0
+            f.write(b"\n")
+            return 1
+
+    def _path(self, day: str, sequence: int) -> str:
+        return os.path.join(self.directory, f"{self.prefix}-{day}-{sequence:04d}.jsonl")
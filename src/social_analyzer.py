@@ -1,5 +1,8 @@
 from collections import defaultdict
-from typing import Dict
+from typing import Dict, Optional
+
+from src.document_context import DocumentContext
+from src.pattern_registry import SOCIAL_INDICATORS
 
 
 class SocialSignalAnalyzer:
@@ -7,67 +10,13 @@ class SocialSignalAnalyzer:
     """
 
     def __init__(self):
-        self.social_indicators = {
-            'family_status': {
-                'has_family': [
-                    'çocuk', 'çocuğ', 'bebek', 'aile', 'eş', 'karı', 'koca',
-                    'anne', 'baba', 'oğl', 'kız', 'evlat', 'torun',
-                    'yeğen', 'kardeş', 'akraba', 'evli'
-                ],
-                'single_indicators': [
-                    'tek başına', 'yalnız', 'kimsem yok', 'tek kişi', 'bekar', 'dul'
-                ],
-                'elderly_indicators': [
-                    'yaşlı', 'emekli', 'büyük', 'ihtiyar', 'nine', 'dede',  '65 yaş', 'kıdemli', 'yaşlılık'
-                ]
-            },
-
-            'economic_status': {
-                'financial_stress': [
-                    'para', 'maaş', 'geçim', 'borç', 'kredi', 'fatura',
-                    'pahalı', 'masraf', 'bütçe', 'ekonomik',
-                    'icra', 'haciz', 'yoksulluk', 'işsiz', 'kıt kanaat'
-                ],
-                'property_ownership': [
-                    'ev sahibi', 'malik', 'mülk', 'apartman', 'daire',
-                    'kiracı', 'kira', 'emlak', 'arsa', 'dükkan', 'tapu'
-                ],
-                'employment_status': [
-                    'çalışan', 'işsiz', 'esnaf', 'memur', 'işçi', 'serbest meslek'
-                ]
-            },
-
-            'education_level': {
-                'high_education': [
-                    'üniversite', 'doktor', 'mühendis', 'öğretmen','avukat',
-                    'araştırma', 'proje', 'analiz', 'değerlendirme',  'akademik'
-                ],
-                'formal_language': [
-                    'müsaade', 'takdir', 'arz', 'istirham', 'maruzat',
-                    'gereği', 'münasip', 'tensib',  'bilvekale', 'tarafıma', 'tebliğ'
-                ]
-            },
-
-            'civic_engagement': {
-                'active_citizen': [
-                    'hak', 'görev', 'sorumluluk', 'demokrasi', 'katılım',
-                    'önceden', 'defalarca', 'takip', 'başvuru', 'dilekçe', 'vatandaş'
-                ],
-                'community_awareness': [
-                    'mahalle', 'komşu', 'herkes', 'tüm', 'genel', 'ortak',  'kamuoyu', 'sakinleri', 'hepimiz'
-                ]
-            },
-            'health_status': {
-                'has_health_issue': [
-                    'hasta', 'engelli', 'rapor', 'ilaç', 'tedavi', 'ameliyat',
-                    'kronik', 'rahatsızlık', 'sakat', 'malul'
-                ]
-            }
-        }
+        self.social_indicators = SOCIAL_INDICATORS
 
-    def analyze_social_profile(self, text: str) -> Dict:
+    def analyze_social_profile(self, text: str, context: Optional[DocumentContext] = None) -> Dict:
         """sosyal profil analizi"""
-        text_lower = text.lower()
+        if context is None:
+            context = DocumentContext(text)
+        hits = context.hits
 
         profile_scores = defaultdict(int)
         detected_signals = defaultdict(list)
@@ -76,7 +25,7 @@ class SocialSignalAnalyzer:
         for category, subcategories in self.social_indicators.items():
             for subcategory, keywords in subcategories.items():
                 for keyword in keywords:
-                    if keyword in text_lower:
+                    if keyword in hits:
                         profile_scores[f"{category}_{subcategory}"] += 1
                         detected_signals[f"{category}_{subcategory}"].append(keyword)
 
@@ -0,0 +1,118 @@
+"""
+Analiz hattının aşama grafiği.
+
+Her aşama adlı girdiler alır ve adlı çıktılar (artifact) üretir. Grafikten
+bir artifact istendiğinde yalnızca onu geçişli olarak üreten aşamalar
+çalışır; değeri önceden verilmiş (ör. kampanya temsilcisinden gelen)
+artifact'lerin aşamaları atlanır.
+
+Girdileri hazır olan aşamalar aynı "dalga"dadır ve birbirine bağımlı
+değildir: executor verilirse bir dalganın aşamaları executor'a birlikte
+gönderilir. Aşamalar doküman bağlamını paylaştığı için executor iş
+parçacığı tabanlı olmalıdır (ThreadPoolExecutor); süreç havuzu için
+analyze_batch kullanılır.
+"""
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from src.stage_metrics import StageTimer
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    name: aşama adı (metadata['stage_timings_ms'] anahtarı)
+    inputs: okunan artifact'ler
+    outputs: üretilen artifact'ler
+    run: girdi değerleri -> {çıktı adı: değer}
+    """
+    name: str
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    run: Callable[[Mapping[str, Any]], Dict[str, Any]]
+
+
+class StageGraph:
+    """
+    stages: aşamalar; her artifact tek bir aşama tarafından üretilir
+    sources: dışarıdan verilen artifact'ler (ör. 'text')
+    """
+
+    def __init__(self, stages: Sequence[Stage], sources: Iterable[str] = ()):
+        self.stages = {stage.name: stage for stage in stages}
+        self.sources = frozenset(sources)
+        self.producers: Dict[str, Stage] = {}
+        for stage in stages:
+            for output in stage.outputs:
+                if output in self.producers or output in self.sources:
+                    raise ValueError(f"'{output}' birden fazla kez üretiliyor")
+                self.producers[output] = stage
+        for stage in stages:
+            for name in stage.inputs:
+                if name not in self.producers and name not in self.sources:
+                    raise ValueError(f"'{stage.name}' aşamasının girdisi '{name}' hiçbir aşamada üretilmiyor")
+        # döngü kontrolü: tüm artifact'ler için plan çıkarılabilmeli
+        self.plan(self.producers)
+
+    def required_stages(self, targets: Iterable[str], available: Iterable[str] = ()) -> Set[str]:
+        """hedefleri üretmek için çalışması gereken aşamalar (hazır artifact'lerin üreticileri hariç)"""
+        available = set(available)
+        required: Set[str] = set()
+        pending = [target for target in targets if target not in available]
+        while pending:
+            artifact = pending.pop()
+            if artifact in self.sources:
+                continue
+            stage = self.producers.get(artifact)
+            if stage is None:
+                raise KeyError(f"bilinmeyen artifact: {artifact!r}")
+            if stage.name in required:
+                continue
+            required.add(stage.name)
+            pending.extend(name for name in stage.inputs if name not in available)
+        return required
+
+    def plan(self, targets: Iterable[str], available: Iterable[str] = ()) -> List[List[Stage]]:
+        """gerekli aşamaların dalgaları: bir dalgadaki aşamalar yalnızca önceki dalgalara bağlıdır"""
+        ready = set(available) | self.sources
+        remaining = [self.stages[name] for name in self.stages if name in self.required_stages(targets, available)]
+        waves = []
+        while remaining:
+            wave = [stage for stage in remaining if all(name in ready for name in stage.inputs)]
+            if not wave:
+                raise ValueError("aşama grafiğinde döngü: " + ", ".join(stage.name for stage in remaining))
+            waves.append(wave)
+            for stage in wave:
+                ready.update(stage.outputs)
+            remaining = [stage for stage in remaining if stage not in wave]
+        return waves
+
+    def run(self, targets: Iterable[str], values: Dict[str, Any], executor: Optional[Executor] = None,
+            timer: Optional[StageTimer] = None) -> Dict[str, Any]:
+        """
+        hedefleri hesapla; values yerinde güncellenir ve döndürülür
+
+        values: kaynak artifact'ler ve (varsa) önceden hesaplanmış değerler
+        executor: verilirse birden fazla aşamalı dalgalar paralel çalıştırılır
+        timer: aşama süreleri aşama adıyla kaydedilir
+        """
+        timer = timer or StageTimer()
+        for wave in self.plan(targets, values):
+            if executor is None or len(wave) == 1:
+                for stage in wave:
+                    values.update(self._run_stage(stage, values, timer))
+                continue
+            futures = [executor.submit(self._run_stage, stage, values, timer) for stage in wave]
+            for future in futures:
+                values.update(future.result())
+        return values
+
+    @staticmethod
+    def _run_stage(stage: Stage, values: Mapping[str, Any], timer: StageTimer) -> Dict[str, Any]:
+        with timer.stage(stage.name):
+            outputs = stage.run({name: values[name] for name in stage.inputs})
+        missing = set(stage.outputs) - set(outputs)
+        if missing:
+            raise RuntimeError(f"'{stage.name}' aşaması {sorted(missing)} çıktılarını üretmedi")
+        return outputs
@@ -0,0 +1,108 @@
+"""
+Analiz aşamalarının süre ölçümü ve toplanması.
+
+StageTimer tek bir analizin aşama sürelerini tutar (sonucun metadata'sına
+yazılır). LatencyHistogram süreleri sabit, logaritmik aralıklı kovalarda
+biriktirir: kaç analiz yapılırsa yapılsın bellek sabittir ve yüzdelikler
+(p50/p90/p95/p99) kova çözünürlüğü (~%19) içinde hesaplanır.
+"""
+import math
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Iterable, Optional
+
+
+class StageTimer:
+    """tek bir analizin aşama süreleri (saniye)"""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + perf_counter() - start
+
+    def as_milliseconds(self) -> Dict[str, float]:
+        return {name: round(seconds * 1000, 3) for name, seconds in self.timings.items()}
+
+
+class LatencyHistogram:
+    """
+    milisaniye cinsinden süreler için logaritmik kovalı histogram
+
+    kova sınırları: min_ms * 2^(i / buckets_per_octave)
+    """
+
+    def __init__(self, min_ms: float = 0.001, max_ms: float = 1e6, buckets_per_octave: int = 4):
+        self.min_ms = min_ms
+        self.buckets_per_octave = buckets_per_octave
+        self._bucket_count = int(math.ceil(math.log2(max_ms / min_ms) * buckets_per_octave)) + 1
+        self.counts = [0] * self._bucket_count
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_seen: Optional[float] = None
+        self.max_seen: Optional[float] = None
+
+    def record(self, value_ms: float):
+        self.counts[self._bucket_index(value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.min_seen = value_ms if self.min_seen is None else min(self.min_seen, value_ms)
+        self.max_seen = value_ms if self.max_seen is None else max(self.max_seen, value_ms)
+
+    def percentile(self, q: float) -> float:
+        """q (0-100) yüzdeliği: ilgili kovanın üst sınırı, görülen min/max ile sınırlanır"""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(math.ceil(q / 100.0 * self.count)))
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return min(max(self._upper_bound(index), self.min_seen), self.max_seen)
+        return self.max_seen
+
+    def summary(self, percentiles: Iterable[float] = (50, 90, 95, 99)) -> Dict:
+        summary = {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'min_ms': round(self.min_seen or 0.0, 3),
+            'max_ms': round(self.max_seen or 0.0, 3),
+        }
+        for q in percentiles:
+            summary[f'p{q:g}_ms'] = round(self.percentile(q), 3)
+        summary['histogram'] = {
+            f'<={self._upper_bound(index):.3f}': bucket_count
+            for index, bucket_count in enumerate(self.counts) if bucket_count
+        }
+        return summary
+
+    def _bucket_index(self, value_ms: float) -> int:
+        if value_ms <= self.min_ms:
+            return 0
+        index = int(math.ceil(math.log2(value_ms / self.min_ms) * self.buckets_per_octave))
+        return min(index, self._bucket_count - 1)
+
+    def _upper_bound(self, index: int) -> float:
+        return self.min_ms * 2 ** (index / self.buckets_per_octave)
+
+
+class StageLatencyStats:
+    """aşama adı -> LatencyHistogram"""
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, stage_timings_ms: Dict[str, float]):
+        for stage, value_ms in stage_timings_ms.items():
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram()
+            histogram.record(value_ms)
+
+    def summary(self) -> Dict[str, Dict]:
+        return {stage: histogram.summary() for stage, histogram in self.histograms.items()}
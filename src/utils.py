@@ -1,18 +1,82 @@
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional
+
 import PyPDF2
 
-def pdf_to_text(path: str) -> str:
+# paralel modda bir işçiye tek seferde verilen sayfa sayısı
+PDF_PAGES_PER_TASK = 16
+
+
+def pdf_page_count(path: str) -> int:
+    """PDF'in sayfa sayısı (sayfa içerikleri ayrıştırılmaz)"""
+    with open(path, 'rb') as f:
+        return len(PyPDF2.PdfReader(f).pages)
+
+
+def iter_pdf_pages(path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """
+    [start, stop) aralığındaki sayfaların metnini sırayla, tembel olarak üretir
+
+    metni olmayan sayfa için '' döner. dosya yalnızca iterasyon süresince açık kalır;
+    hatalar çağırana iletilir
+    """
+    with open(path, 'rb') as f:
+        pages = PyPDF2.PdfReader(f).pages
+        stop = len(pages) if stop is None else min(stop, len(pages))
+        for index in range(start, stop):
+            yield pages[index].extract_text() or ''
+
+
+def extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    """işçi süreçte bir sayfa aralığının metinleri"""
+    return list(iter_pdf_pages(path, start, stop))
+
+
+def _iter_pdf_pages_parallel(path: str, stop: int, workers: int) -> Iterator[str]:
+    """sayfa aralıklarını süreç havuzuna dağıtır, metinleri sayfa sırasıyla üretir"""
+    ranges = [(start, min(start + PDF_PAGES_PER_TASK, stop)) for start in range(0, stop, PDF_PAGES_PER_TASK)]
+    pool = ProcessPoolExecutor(max_workers=min(workers, len(ranges)))
+    try:
+        futures = [pool.submit(extract_page_range, path, start, end) for start, end in ranges]
+        for future in futures:
+            yield from future.result()
+    finally:
+        # sınır erken dolduysa kalan aralıklar çalıştırılmaz
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def pdf_to_text(path: str, max_pages: Optional[int] = None, max_bytes: Optional[int] = None,
+                workers: int = 1) -> str:
     """
     verilen yoldaki bir PDF dosyasını okur ve metin içeriğini döndürür.
+
+    max_pages: en fazla bu kadar sayfa okunur
+    max_bytes: metin UTF-8 olarak bu boyuta ulaşınca okuma durur (son sayfa kırpılır)
+    workers: 1'den büyükse ve dosya birden fazla iş parçasına bölünecek kadar uzunsa
+    sayfa aralıkları süreç havuzunda paralel çıkarılır; sonuç sıralı okumayla aynıdır
     """
     try:
-        with open(path, 'rb') as f:
-            reader = PyPDF2.PdfReader(f)
-            text = ''
-            for page in reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted
-        return text
+        stop = max_pages
+        if workers > 1:
+            stop = pdf_page_count(path) if max_pages is None else min(max_pages, pdf_page_count(path))
+        if workers > 1 and stop > PDF_PAGES_PER_TASK:
+            pages = _iter_pdf_pages_parallel(path, stop, workers)
+        else:
+            pages = iter_pdf_pages(path, 0, stop)
+
+        parts = []
+        size = 0
+        with closing(pages):
+            for extracted in pages:
+                if max_bytes is not None:
+                    encoded = extracted.encode('utf-8')
+                    if size + len(encoded) >= max_bytes:
+                        parts.append(encoded[:max_bytes - size].decode('utf-8', errors='ignore'))
+                        break
+                    size += len(encoded)
+                parts.append(extracted)
+        return ''.join(parts)
     except FileNotFoundError:
         print(f"Hata: {path} dosyası bulunamadı.")
         return ""
@@ -21,7 +85,6 @@ def pdf_to_text(path: str) -> str:
         return ""
 
 
-
 def format_result_summary(result_data):
     """
     Karmaşık JSON sonucunu alıp okunabilir bir metin özeti oluşturur.
@@ -1,26 +1,32 @@
-import re
-from typing import Dict
+from typing import Dict, Optional
 import difflib
 
+from src.document_context import DocumentContext
+from src.keyword_index import KeywordHits
+from src.pattern_registry import ADDRESS_CONTEXT_REQUIREMENTS, CONSISTENCY_INDICATORS, get_pattern_registry
+
 class SkepticalValidator:
     """
      Şüpheci Doğrulayıcı: her bulguyu şüpheyle karşılar ve çapraz doğrular.
     """
 
     def __init__(self):
+        # derlenmiş patternler pattern kaydından paylaşılır
+        patterns = get_pattern_registry().validator_patterns['skeptical']
+
         self.validation_rules = {
             'name_validation': {
                 'min_length': 3,
                 'max_length': 50,
-                'required_pattern': r'^[A-ZÇĞİÖŞÜ][a-zçğıöşüA-ZÇĞİÖŞÜ\s]+$',
-                'forbidden_patterns': [r'\d', r'[!@#$%^&*()]'],
-                'turkish_name_bonus': [r'[çğıöşüÇĞIİÖŞÜ]']
+                'required_pattern': patterns['required_name'],
+                'forbidden_patterns': patterns['forbidden'],
+                'turkish_name_bonus': patterns['turkish_name_bonus']
             },
 
             'address_validation': {
                 'location_keywords': ['mahalle', 'sokak', 'cadde', 'bulvar', 'köy', 'ilçe', 'il'],
-                'suspicious_patterns': [r'\d{5,}', r'[!@#$%^&*()]'],
-                'context_requirements': ['yaşa', 'ikamet', 'otur', 'ev', 'daire']
+                'suspicious_patterns': patterns['address_suspicious'],
+                'context_requirements': ADDRESS_CONTEXT_REQUIREMENTS
             },
 
             'consistency_checks': {
@@ -30,8 +36,13 @@ class SkepticalValidator:
             }
         }
 
-    def validate_extraction(self, extraction_result: Dict, original_text: str) -> Dict:
+    def validate_extraction(self, extraction_result: Dict, original_text: str,
+                            context: Optional[DocumentContext] = None) -> Dict:
         """çıkarım sonuçlarını doğrula"""
+        if context is None:
+            context = DocumentContext(original_text)
+        hits = context.hits
+
         validation_results = {
             'overall_validity': True,
             'confidence_adjustment': 1.0,
@@ -51,7 +62,7 @@ class SkepticalValidator:
 
         # adres doğrulaması
         if 'address' in extraction_result and extraction_result['address']:
-            address_validation = self._validate_address(extraction_result['address'], original_text)
+            address_validation = self._validate_address(extraction_result['address'], hits)
             validation_results['validation_details']['address'] = address_validation
 
             if not address_validation['is_valid']:
@@ -59,7 +70,7 @@ class SkepticalValidator:
                 validation_results['confidence_adjustment'] *= 0.8
 
         # tutarlılık kontrolü
-        consistency_check = self._check_consistency(extraction_result, original_text)
+        consistency_check = self._check_consistency(extraction_result, hits)
         validation_results['validation_details']['consistency'] = consistency_check
 
         if not consistency_check['is_consistent']:
@@ -88,20 +99,20 @@ class SkepticalValidator:
             issues.append(f"Uzunluk uygunsuz: {len(name)}")
 
         # pattern kontrolü
-        if not re.match(rules['required_pattern'], name):
+        if not rules['required_pattern'].match(name):
             is_valid = False
             issues.append("Türkçe isim formatına uymuyor")
 
         # yasak karakterler
         for forbidden in rules['forbidden_patterns']:
-            if re.search(forbidden, name):
+            if forbidden.search(name):
                 is_valid = False
-                issues.append(f"Yasak karakter: {forbidden}")
+                issues.append(f"Yasak karakter: {forbidden.pattern}")
 
         # türkçe bonusu
         turkish_bonus = 0
         for bonus_pattern in rules['turkish_name_bonus']:
-            if re.search(bonus_pattern, name):
+            if bonus_pattern.search(name):
                 turkish_bonus += 0.1
 
         return {
@@ -111,7 +122,7 @@ class SkepticalValidator:
             'confidence': max(0.3, 1.0 - len(issues) * 0.2 + turkish_bonus)
         }
 
-    def _validate_address(self, address: str, context: str) -> Dict:
+    def _validate_address(self, address: str, context: KeywordHits) -> Dict:
         """adres doğrulaması"""
         rules = self.validation_rules['address_validation']
 
@@ -126,11 +137,11 @@ class SkepticalValidator:
 
         # şüpheli pattern kontrolü
         for suspicious in rules['suspicious_patterns']:
-            if re.search(suspicious, address):
-                issues.append(f"Şüpheli pattern: {suspicious}")
+            if suspicious.search(address):
+                issues.append(f"Şüpheli pattern: {suspicious.pattern}")
 
         # bağlam kontrolü
-        context_support = any(req in context.lower() for req in rules['context_requirements'])
+        context_support = any(req in context for req in rules['context_requirements'])
         if not context_support:
             issues.append("Adres bilgisi bağlamda desteklenmiyor")
 
@@ -141,20 +152,19 @@ class SkepticalValidator:
             'confidence': max(0.2, 1.0 - len(issues) * 0.3)
         }
 
-    def _check_consistency(self, extraction: Dict, original_text: str) -> Dict:
+    def _check_consistency(self, extraction: Dict, hits: KeywordHits) -> Dict:
         """tutarlılık kontrolü"""
         issues = []
 
         # ton tutarlılığı
-        text_lower = original_text.lower()
-        formal_indicators = sum(1 for word in ['saygı', 'arz', 'gereği', 'takdir'] if word in text_lower)
-        informal_indicators = sum(1 for word in ['ya', 'yani', 'işte'] if word in text_lower)
+        formal_indicators = sum(1 for word in CONSISTENCY_INDICATORS['formal'] if word in hits)
+        informal_indicators = sum(1 for word in CONSISTENCY_INDICATORS['informal'] if word in hits)
 
         if formal_indicators > 0 and informal_indicators > 0:
             issues.append("Dil tutarsızlığı: Formal ve günlük dil karışımı")
 
         # mantıksal tutarlılık
-        if 'acil' in text_lower and 'uygun gördüğünüzde' in text_lower:
+        if 'acil' in hits and 'uygun gördüğünüzde' in hits:
             issues.append("Mantık tutarsızlığı: Acil ama esnek zaman talebi")
 
         return {
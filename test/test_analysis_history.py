@@ -0,0 +1,42 @@
+from src.analysis_history import AnalysisHistory, AnalysisSummary
+from src.petition_analyzer import PetitionAnalyzer
+
+TEXTS = [
+    "Sayın Yetkili,\nYol bozuk, tamir edilmesini talep ediyorum.\nAyşe Demir",
+    "Sokağımızdaki çöpler toplanmıyor, koku dayanılmaz halde.\nMehmet Kaya",
+    "Okulda kaloriferler yanmıyor, sınıflar soğuk.\nFatma Şen",
+]
+
+
+def test_history_is_bounded_but_aggregates_cover_every_analysis():
+    analyzer = PetitionAnalyzer(history_size=4)
+    results = [analyzer.analyze_petition_creative(text) for text in TEXTS * 3]
+
+    history = analyzer.analysis_history
+    assert len(history) == 4 and history.total == 9
+    assert all(isinstance(summary, AnalysisSummary) for summary in history)
+    assert [summary.person_name for summary in history.recent(2)] == \
+        [result['extracted_information']['person_name'] for result in results[-2:]]
+
+    statistics = analyzer.get_enhanced_system_statistics()
+    confidences = [result['metadata']['confidence_level'] for result in results]
+    assert statistics['analysis_history_count'] == 9
+    assert statistics['analysis_history_window'] == 4
+    assert statistics['average_confidence'] == round(sum(confidences) / len(confidences), 3)
+    categories = [result['extracted_information']['subject_category'] for result in results]
+    distribution = statistics['category_distribution']
+    assert sum(entry['count'] for entry in distribution.values()) == sum(1 for category in categories if category)
+    assert sum(statistics['extraction_method_performance']['category_extraction_methods'].values()) == \
+        sum('category' in result['extracted_information']['extraction_methods'] for result in results)
+
+
+def test_clear_resets_window_and_aggregates():
+    history = AnalysisHistory(maxlen=2)
+    result = PetitionAnalyzer().analyze_petition_creative(TEXTS[0])
+    for _ in range(3):
+        history.append(result)
+    history.clear()
+
+    assert len(history) == 0 and history.total == 0
+    assert history.average_confidence() == 0.0
+    assert history.category_distribution() == {}
@@ -0,0 +1,70 @@
+import pytest
+
+from src.analysis_profiles import PROFILES, get_profile
+from src.petition_analyzer import PetitionAnalyzer
+from src.result_cache import ResultCache
+from src.utils import format_result_summary
+
+TEXT = (
+    "Sayın Yetkili,\nÇankaya ilçesi Kızılay Mahallesi'nde oturuyorum. Sokağımızdaki çöpler bir haftadır "
+    "toplanmıyor, koku dayanılmaz halde ve çocuklarımız hastalanıyor. Acilen gereğinin yapılmasını rica ederim.\n"
+    "Saygılarımla\nAyşe Demir"
+)
+
+
+def _values(result, fields):
+    values = {}
+    for field in fields:
+        section, _, key = field.partition('.')
+        value = result[section]
+        for part in key.split('.') if key else []:
+            value = value[part]
+        values[field] = value
+    return values
+
+
+@pytest.mark.parametrize('name', ['summary', 'standard'])
+def test_profile_fields_match_full_analysis(name):
+    analyzer = PetitionAnalyzer()
+    full = analyzer.analyze_petition_creative(TEXT)
+    partial = analyzer.analyze_petition_creative(TEXT, profile=name)
+    fields = PROFILES[name].fields
+
+    assert partial['metadata']['profile'] == name
+    assert _values(partial, fields) == _values(full, fields)
+    assert set(partial) - {'metadata'} == {field.split('.')[0] for field in fields} - {'metadata'}
+
+
+def test_summary_skips_unrequested_stages_and_still_formats():
+    result = PetitionAnalyzer().analyze_petition_creative(TEXT, profile='summary')
+    stages = set(result['metadata']['stage_timings_ms'])
+
+    assert {'extraction.address', 'extraction.institution', 'social_profile',
+            'primary_validation', 'enhanced_validation'}.isdisjoint(stages)
+    assert 'sentence_flow' not in result.get('emotional_intelligence', {})
+    assert "Ayşe Demir" in format_result_summary(result)
+
+
+def test_profiles_are_cached_separately_and_unknown_profile_is_rejected():
+    analyzer = PetitionAnalyzer(result_cache=ResultCache())
+    summary = analyzer.analyze_petition_creative(TEXT, profile='summary')
+    full = analyzer.analyze_petition_creative(TEXT)
+
+    assert full['metadata']['cache']['hit'] is False
+    assert 'validation_report' in full and 'validation_report' not in summary
+    assert analyzer.analyze_petition_creative(TEXT, profile='summary')['metadata']['cache']['hit'] is True
+    with pytest.raises(ValueError):
+        get_profile('brief')
+
+
+@pytest.mark.parametrize('fields', [['emotional_intelligence'], ['validation_report.quality_score']])
+def test_fields_without_extraction_are_recorded_on_miss_and_hit(fields):
+    analyzer = PetitionAnalyzer(result_cache=ResultCache())
+    miss = analyzer.analyze_petition_creative(TEXT, fields=fields)
+    hit = analyzer.analyze_petition_creative(TEXT, fields=fields)
+
+    assert 'extracted_information' not in miss
+    assert (miss['metadata']['cache']['hit'], hit['metadata']['cache']['hit']) == (False, True)
+    assert _values(hit, fields) == _values(miss, fields)
+    assert analyzer.analysis_history.total == 2
+    assert [summary.cache_hit for summary in analyzer.analysis_history.recent()] == [False, True]
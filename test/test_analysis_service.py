@@ -0,0 +1,97 @@
+import asyncio
+import json
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+from benchmarks.bench_service_load import _post
+from src.analysis_service import AnalysisService, BackgroundService, HttpError
+from src.petition_analyzer import PetitionAnalyzer
+
+TEXTS = [
+    "Sayın Yetkili,\nYol bozuk, tamir edilmesini talep ediyorum.\nAyşe Demir",
+    "Sokağımızdaki çöpler bir haftadır toplanmıyor. Gereğinin yapılmasını rica ederim.\nMehmet Kaya",
+]
+
+
+async def _requests(port):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        return [
+            await _post(reader, writer, '/analyze', {'text': TEXTS[0], 'profile': 'summary'}),
+            await _post(reader, writer, '/analyze_batch', {'texts': TEXTS}),
+            await _post(reader, writer, '/analyze_batch', {'texts': TEXTS * 3}),
+            await _post(reader, writer, '/analyze', {'text': TEXTS[0], 'profile': 'brief'}),
+            await _post(reader, writer, '/analyze', {'metin': TEXTS[0]}),
+        ]
+    finally:
+        writer.close()
+
+
+def test_service_endpoints_batching_and_backpressure():
+    service = AnalysisService(workers=1, queue_size=4, batch_window_ms=20)
+    with BackgroundService(service) as running:
+        single, batch, overflow, bad_profile, missing_text = asyncio.run(_requests(running.port))
+        health = running.health()
+
+    expected = PetitionAnalyzer().analyze_petition_creative(TEXTS[1])
+    assert single[0] == 200 and single[1]['metadata']['profile'] == 'summary'
+    assert batch[0] == 200 and len(batch[1]['results']) == 2
+    assert batch[1]['results'][1]['extracted_information'] == \
+        json.loads(json.dumps(expected['extracted_information'], ensure_ascii=False))
+    # kuyruk kapasitesini aşan grup hiç sığamayacağından 413 ile reddedilir
+    assert overflow[0] == 413
+    assert bad_profile[0] == 400 and missing_text[0] == 400
+    assert health['rejected'] == 0 and health['petitions'] == 3
+    # aynı istekteki iki dilekçe tek mikro grupta analiz edilir
+    assert health['batches'] == 2
+
+
+def test_full_queue_is_rejected_with_retry_after():
+    async def scenario():
+        service = AnalysisService(queue_size=2)
+        service._queue = asyncio.Queue(maxsize=service.queue_size)
+        service._queue.put_nowait(('bekleyen', 'full', None))
+        try:
+            await service.analyze_many(TEXTS)
+        except HttpError as error:
+            return error, service.stats['rejected']
+
+    error, rejected = asyncio.run(scenario())
+    assert error.status == 429 and error.headers == {'Retry-After': '1'}
+    assert rejected == 1
+
+
+async def _raw_request(port, content_length):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        writer.write(f"POST /analyze HTTP/1.1\r\nContent-Length: {content_length}\r\n\r\n".encode('latin-1'))
+        await writer.drain()
+        return (await reader.read()).decode('utf-8').split('\r\n', 1)[0]
+    finally:
+        writer.close()
+
+
+def test_invalid_content_length_is_rejected():
+    with BackgroundService(AnalysisService(workers=1)) as running:
+        status_lines = [asyncio.run(_raw_request(running.port, value)) for value in ('abc', '-5')]
+    assert all(line.startswith("HTTP/1.1 400") for line in status_lines)
+
+
+async def _analyze_twice(port):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        return [await _post(reader, writer, '/analyze', {'text': text}) for text in TEXTS]
+    finally:
+        writer.close()
+
+
+def test_service_recovers_from_a_crashed_worker():
+    with BackgroundService(AnalysisService(workers=1, batch_window_ms=1)) as running:
+        # işçiyi öldür: havuz bozulur, sonraki istekler yeni havuzda analiz edilmeli
+        crash = running._pool.submit(os._exit, 1)
+        assert isinstance(crash.exception(timeout=30), BrokenProcessPool)
+        responses = asyncio.run(_analyze_twice(running.port))
+        health = running.health()
+
+    assert [status for status, _ in responses] == [200, 200]
+    assert health['pool_restarts'] == 1 and health['failed_petitions'] == 0
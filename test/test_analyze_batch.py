@@ -0,0 +1,38 @@
+from src.petition_analyzer import PetitionAnalyzer, is_failed_result
+
+TEXTS = [
+    "Sayın Yetkili,\nYol bozuk, tamir edilmesini talep ediyorum.\nAyşe Demir",
+    "Sokağımızdaki çöpler toplanmıyor, koku dayanılmaz halde.\nMehmet Kaya",
+    "Okulda kaloriferler yanmıyor, sınıflar soğuk.\nFatma Şen",
+    "Üç gündür su kesintisi var ve açıklama yapılmadı.\nAli Yılmaz",
+    "Mahallemizde sokak lambaları yanmıyor.\nZeynep Çelik",
+]
+
+
+def _categories(results):
+    return [result['extracted_information']['subject_category'] for result in results]
+
+
+def test_batch_matches_single_document_results_in_order():
+    expected = _categories(PetitionAnalyzer().analyze_petition_creative(text) for text in TEXTS)
+
+    progress = []
+    analyzer = PetitionAnalyzer()
+    results = analyzer.analyze_batch(TEXTS * 4, workers=2, chunksize=3,
+                                     progress_callback=lambda done, total: progress.append((done, total)))
+
+    assert _categories(results) == expected * 4
+    assert progress[-1] == (20, 20)
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+    assert analyzer.performance_metrics['total_analyzed'] == 20
+
+
+def test_failing_document_does_not_stop_the_batch():
+    texts = TEXTS[:2] + [None] + TEXTS[2:]
+    for workers in (1, 2):
+        results = PetitionAnalyzer().analyze_batch(texts, workers=workers, chunksize=2)
+
+        assert len(results) == len(texts)
+        assert is_failed_result(results[2])
+        assert results[2]['error']['type'] == 'AttributeError'
+        assert not any(is_failed_result(result) for index, result in enumerate(results) if index != 2)
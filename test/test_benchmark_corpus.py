@@ -0,0 +1,39 @@
+from benchmarks.corpus import SIGNATURE_STYLES, generate_corpus
+from benchmarks.harness import compare_reports
+from src.pattern_registry import CORE_PATTERNS
+from src.petition_analyzer import PetitionAnalyzer
+
+
+def test_corpus_is_deterministic_and_covers_categories():
+    categories = list(CORE_PATTERNS['subject_categories'])
+    corpus = generate_corpus(len(categories) * 3, seed=7, length_mix={'paragraph': 1})
+
+    assert [petition.text for petition in corpus] == [petition.text for petition in generate_corpus(
+        len(categories) * 3, seed=7, length_mix={'paragraph': 1})]
+    assert corpus[0].text != generate_corpus(1, seed=8, length_mix={'paragraph': 1})[0].text
+    assert {petition.category for petition in corpus} == set(categories)
+    assert {petition.signature_style for petition in corpus} <= set(SIGNATURE_STYLES)
+
+    long_petition = generate_corpus(1, seed=7, length_mix={'5_pages': 1})[0]
+    assert len(long_petition.text) >= 5 * 3000
+
+
+def test_corpus_documents_analyze_without_errors():
+    analyzer = PetitionAnalyzer()
+    for petition in generate_corpus(12, seed=3, length_mix={'paragraph': 1}):
+        result = analyzer.analyze_petition_creative(petition.text)
+        assert result['extracted_information']['subject_category']
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    baseline = {'total': {'p50_ms': 10.0, 'p95_ms': 20.0, 'p99_ms': 30.0, 'docs_per_sec': 100.0},
+                'stages': {'extraction': {'p50_ms': 5.0, 'p95_ms': 0.5}}}
+    candidate = {'total': {'p50_ms': 10.5, 'p95_ms': 25.0, 'p99_ms': 30.0, 'docs_per_sec': 80.0},
+                 'stages': {'extraction': {'p50_ms': 4.0, 'p95_ms': 5.0}}}
+
+    rows = compare_reports(baseline, candidate, threshold=0.10)
+    flagged = {(row['scope'], row['metric']) for row in rows if row['regression']}
+
+    assert flagged == {('total', 'p95_ms'), ('total', 'docs_per_sec')}
+    # milisaniye altı aşama gecikmesi gürültü sayılır
+    assert ('stage:extraction', 'p95_ms') not in {(row['scope'], row['metric']) for row in rows}
@@ -0,0 +1,47 @@
+import random
+import re
+import time
+
+from benchmarks.bench_adversarial_regex import ADVERSARIAL_UNITS, adversarial_text, bounded_patterns
+from src.bounded_regex import BoundedPattern, compile_bounded
+
+WORDS = [
+    'belediyesi', 'Büyükşehir Belediyesi', 'Valiliği', 'kaymakamlığı', 'İl Özel İdaresi', 'Müdürlüğü',
+    'daire başkanlığı', 'Şube Müdürlüğü', 'mahallesi', 'Mah.', 'sokağı', 'sk.', 'caddesi', 'ilçesi',
+    'İlçesi', 'sitesi', 'yaşadığım', 'oturduğum', 'ikametgahım', 'yaşıyor', 'evim', 'ikamet', 'mukim',
+    'vali', 'başkan', 'Ali', 'veli', 'IŞIK', 'ığdır', 'İzmir', 'x', 'Ç',
+]
+SEPARATORS = [' ', ' ', '  ', '\n', '\t', ', ', '. ', '/', '-', '3', '']
+
+
+def test_registry_families_match_re_findall():
+    patterns = bounded_patterns()
+    assert len(patterns) >= 25
+    originals = [re.compile(pattern.pattern, pattern.flags) for pattern in patterns]
+
+    rng = random.Random(11)
+    for _ in range(400):
+        text = ''.join(rng.choice(WORDS) + rng.choice(SEPARATORS) for _ in range(rng.randint(0, 25)))
+        pos = rng.choice([0, rng.randint(0, len(text))])
+        for bounded, original in zip(patterns, originals):
+            assert bounded.findall(text, pos) == original.findall(text, pos), (original.pattern, text)
+
+
+def test_unsupported_shapes_fall_back_to_re():
+    assert not isinstance(compile_bounded(r'(\d+\.?\s+sokak)', re.IGNORECASE), BoundedPattern)
+    # gövdesi tek kelimeyle sınırlı olan patternler re motorunda zaten doğrusal
+    assert not isinstance(compile_bounded(r'([A-Z][a-z]+)\s+(?:ilçesi)', re.IGNORECASE), BoundedPattern)
+    assert isinstance(compile_bounded(r'([A-Z][a-z\s]+)\s+(?:ilçesi)', re.IGNORECASE), BoundedPattern)
+
+
+def test_adversarial_inputs_stay_within_time_per_kb():
+    patterns = bounded_patterns()
+    size_kb = 16
+    for kind in ADVERSARIAL_UNITS:
+        text = adversarial_text(kind, size_kb)
+        start = time.perf_counter()
+        for pattern in patterns:
+            pattern.findall(text)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        # doğrusal eşleştirici ~2-3 ms/KB; re motoru aynı girdide saniyeler/KB sürer
+        assert elapsed_ms / size_kb < 30, (kind, elapsed_ms)
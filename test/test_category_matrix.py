@@ -0,0 +1,33 @@
+from benchmarks.corpus import generate_corpus
+from src.category_matrix import CategoryMatrix
+from src.document_context import DocumentContext
+from src.petition_analyzer import PetitionAnalyzer
+
+
+def test_matrix_scores_match_category_loop_exactly():
+    """toplu matris puanları kategori döngüsüyle birebir aynı (kayan nokta eşitliği)"""
+    analyzer = PetitionAnalyzer()
+    texts = [petition.text for petition in generate_corpus(120, seed=11)]
+    texts += ["", "Yol bozuk bozuk, tamir ve onarım gerekli. Kirli su, temizlik ve hijyen sorunu."]
+
+    expected = []
+    for text in texts:
+        context = DocumentContext(text, analyzer.keyword_index)
+        expected.append(analyzer._ultra_comprehensive_category_classification(
+            context.hits, context.sentence_keywords, details=False
+        ))
+
+    assert analyzer.classify_categories(texts, chunk_size=50) == expected
+    assert expected[-2]['primary_category'] is None
+
+
+def test_duplicate_keywords_accumulate_weights():
+    matrix = CategoryMatrix({
+        'a': {'primary_keywords': ['yol', 'yol'], 'secondary_keywords': ['çukur'],
+              'context_keywords': ['sokak'], 'problem_keywords': []},
+        'b': {'primary_keywords': ['su'], 'secondary_keywords': [], 'context_keywords': [], 'problem_keywords': []},
+    }, proximity_combos=[])
+    row = matrix.vocabulary['yol']
+    assert matrix.weights[row, 0] == 6.0 and matrix.multiplicity[row, 0] == 2.0
+    assert matrix.weights[matrix.vocabulary['çukur'], 0] == 2.0
+    assert matrix.context[matrix.vocabulary['sokak'], 0] == 1.0
@@ -0,0 +1,129 @@
+import csv
+import json
+import re
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from create_dataset import create_training_dataset, iter_documents
+from src.dataset_checkpoint import CheckpointError
+from src.dataset_writer import open_dataset_writer
+
+SEPARATOR = "=" * 50
+
+
+def _write_train_data(path, bodies):
+    with open(path, "w", encoding="utf-8") as f:
+        for index, body in enumerate(bodies):
+            f.write(f"\n\n{SEPARATOR}\nDosya: dilekce_{index}\nTarih: 2025-01-01 10:00:00\n{SEPARATOR}\n")
+            f.write(body.strip())
+            f.write("\n")
+
+
+def _regex_documents(path):
+    """eski process_data: dosyanın tamamı üzerinde tek DOTALL regex"""
+    pattern = re.compile(r"Dosya: (.+?)\nTarih: (.+?)\n={50}\n(.*?)(?=\n={50}|$)", re.DOTALL)
+    with open(path, encoding="utf-8") as f:
+        matches = pattern.findall(f.read())
+    return [{"dosya": m[0].strip(), "tarih": m[1].strip(), "metin": m[2].strip()} for m in matches if m[2].strip()]
+
+
+def test_iter_documents_matches_regex_reader(tmp_path):
+    path = tmp_path / "train_data.txt"
+    _write_train_data(path, [
+        "Sayın Yetkili,\n\nYol bozuk.\nAyşe Demir",
+        "",
+        "Tek satır",
+        "Çöpler toplanmıyor.\n\n\nMehmet Kaya\n",
+    ])
+
+    documents = list(iter_documents(str(path)))
+    assert documents == _regex_documents(path)
+    assert [doc["dosya"] for doc in documents] == ["dilekce_0", "dilekce_2", "dilekce_3"]
+
+
+def test_writer_flushes_in_chunks(tmp_path):
+    records = [{"dosya_adi": f"d{i}", "sonuc": {"kategori": "yol_ulasim"}, "skor": i / 10} for i in range(7)]
+
+    for extension in ("jsonl", "csv", "xlsx"):
+        path = str(tmp_path / f"veri.{extension}")
+        with open_dataset_writer(path, chunk_size=3) as writer:
+            for index, record in enumerate(records, 1):
+                writer.write(record)
+                assert writer.rows_written == index - index % 3
+        assert writer.rows_written == len(records)
+
+    with open(tmp_path / "veri.jsonl", encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == records
+
+    with open(tmp_path / "veri.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["dosya_adi", "sonuc", "skor"]
+    assert rows[1] == ["d0", "{'kategori': 'yol_ulasim'}", "0.0"]
+
+    sheet = openpyxl.load_workbook(tmp_path / "veri.xlsx").active
+    assert sheet.max_row == len(records) + 1
+    assert sheet.cell(row=8, column=1).value == "d6"
+
+
+def test_tabular_writers_use_union_of_record_keys(tmp_path):
+    records = [{"a": 1, "b": 2}, {"a": 3, "c": 4}, {"d": 5}, {"b": 6, "e": 7}]
+    expected = pd.DataFrame(records)
+
+    for extension in ("csv", "xlsx"):
+        path = str(tmp_path / f"veri.{extension}")
+        with open_dataset_writer(path, chunk_size=2) as writer:
+            writer.write_many(records)
+        written = pd.read_csv(path) if extension == "csv" else pd.read_excel(path)
+        assert list(written.columns) == ["a", "b", "c", "d", "e"]
+        pd.testing.assert_frame_equal(written, expected, check_dtype=False)
+
+
+def test_create_training_dataset_streams_to_jsonl(tmp_path):
+    _write_train_data(tmp_path / "train_data.txt", [
+        "Sayın Yetkili,\nYol bozuk, tamir edilmesini talep ediyorum.\nAyşe Demir",
+        "Sokağımızdaki çöpler toplanmıyor.\nMehmet Kaya",
+        "Okulda kaloriferler yanmıyor.\nFatma Şen",
+    ])
+    output = str(tmp_path / "veri.jsonl")
+
+    written = create_training_dataset(str(tmp_path), output, workers=1, batch_size=2, chunk_size=2)
+
+    with open(output, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert written == 3
+    assert [row["dosya_adi"] for row in rows] == ["dilekce_0", "dilekce_1", "dilekce_2"]
+    assert rows[0]["extracted_information"]["subject_category"]
+
+
+def test_resume_skips_checkpointed_documents_and_repairs_torn_rows(tmp_path, capsys):
+    bodies = [
+        "Sayın Yetkili,\nYol bozuk, tamir edilmesini talep ediyorum.\nAyşe Demir",
+        "Sokağımızdaki çöpler toplanmıyor.\nMehmet Kaya",
+        "Okulda kaloriferler yanmıyor.\nFatma Şen",
+    ]
+    _write_train_data(tmp_path / "train_data.txt", bodies)
+    output = str(tmp_path / "veri.jsonl")
+    create_training_dataset(str(tmp_path), output, workers=1, batch_size=2, detect_campaigns=False)
+
+    # ikinci grup manifeste yazılamadan çökmüş gibi: son manifest satırı yok, satır dosyasında yarım kayıt var
+    checkpoint = tmp_path / "veri.jsonl.checkpoint"
+    manifest = (checkpoint / "manifest.jsonl").read_text(encoding="utf-8").splitlines(keepends=True)
+    (checkpoint / "manifest.jsonl").write_text("".join(manifest[:-1]), encoding="utf-8")
+    with open(checkpoint / "rows.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"dosya_adi": "yar')
+    capsys.readouterr()
+
+    written = create_training_dataset(str(tmp_path), output, workers=1, batch_size=2, resume=True,
+                                      detect_campaigns=False)
+
+    assert "Analiz ediliyor: 1 dilekçe işlendi" in capsys.readouterr().out
+    with open(output, encoding="utf-8") as f:
+        assert [json.loads(line)["dosya_adi"] for line in f] == ["dilekce_0", "dilekce_1", "dilekce_2"]
+    assert written == 3
+
+    # manifestteki satırlar silinmişse devam edilmez
+    (checkpoint / "rows.jsonl").write_text("", encoding="utf-8")
+    with pytest.raises(CheckpointError):
+        create_training_dataset(str(tmp_path), output, workers=1, resume=True)
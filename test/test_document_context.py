@@ -0,0 +1,55 @@
+import cProfile
+import pstats
+
+from src import document_context
+from src.document_context import DocumentContext, turkish_lower
+from src.keyword_index import KeywordAutomaton
+from src.petition_analyzer import PetitionAnalyzer
+
+PETITION = """Sayın Yetkili,
+Kızılay Mahallesi Atatürk Caddesi üzerinde yaşıyorum. Sokağımızdaki çöpler haftalardır toplanmıyor!
+Defalarca başvurdum, yine sonuç yok. ACİL çözüm bekliyorum. Çocuklarım hasta. Gereğini arz ederim.
+Saygılarımla
+Ayşe Demir
+Tel: 0532 111 22 33"""
+
+
+def test_turkish_lower_preserves_offsets():
+    text = "İSTANBUL IŞIK ılık"
+    lowered = turkish_lower(text)
+    assert lowered == "istanbul ışık ılık"
+    assert len(lowered) == len(text)
+
+
+def test_spans_match_string_splits():
+    context = DocumentContext(PETITION)
+
+    assert [context.span_text(span) for span in context.line_spans] == PETITION.split('\n')
+
+    pieces = [piece.strip() for piece in PETITION.replace('!', '.').split('.') if piece.strip()]
+    assert [context.span_text(span) for span in context.piece_spans] == pieces
+
+    # kısa parçalar önceki cümleye eklenir
+    assert context.sentences[0].startswith("Sayın Yetkili")
+    assert all(len(sentence.split()) >= 5 for sentence in context.sentences[1:])
+
+
+def test_each_normalization_runs_once_per_document():
+    """analiz boyunca küçük harf, tarama ve sınır hesapları tek bir kez yapılmalı"""
+    analyzer = PetitionAnalyzer()
+    analyzer.analyze_petition_creative("ısınma turu")
+
+    profiler = cProfile.Profile()
+    profiler.runcall(analyzer.analyze_petition_creative, PETITION)
+    stats = pstats.Stats(profiler).stats
+
+    def calls(filename: str, funcname: str) -> int:
+        return sum(stat[1] for (path, _, name), stat in stats.items()
+                   if path == filename and name == funcname)
+
+    context_file = document_context.__file__
+    for funcname in ('turkish_lower', 'lower', 'hits', 'token_spans', 'line_spans',
+                     'piece_spans', 'sentence_spans', 'sentences', 'sentence_keywords'):
+        assert calls(context_file, funcname) == 1, funcname
+
+    assert calls(KeywordAutomaton.scan.__code__.co_filename, 'scan') == 1
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from benchmarks.corpus import generate_corpus
+from src.document_context import DocumentContext
+from src.emotional_momentum_tracker import EMOTIONS, EmotionalMomentumTracker
+from src.keyword_index import get_keyword_index
+
+
+def test_batch_recurrence_matches_sentence_loop_on_corpus():
+    """toplu NumPy özyinelemesi cümle döngüsüyle birebir aynı (kayan nokta eşitliği)"""
+    tracker = EmotionalMomentumTracker()
+    texts = [petition.text for petition in generate_corpus(150, seed=5)]
+    texts += ["", "Artık yeter, bıktım! Lütfen rica ediyorum, yardım edin. Yeter artık, dayanamıyorum."]
+    contexts = [DocumentContext(text, get_keyword_index()) for text in texts]
+
+    batch = tracker.calculate_emotional_flow_batch([context.sentence_keywords for context in contexts])
+    summary = tracker.calculate_emotional_flow_batch([context.sentence_keywords for context in contexts],
+                                                     include_flow=False)
+
+    for index, context in enumerate(contexts):
+        assert batch.to_dict(index) == tracker.calculate_emotional_flow(context.sentences, context)
+        assert summary.to_dict(index, include_flow=False) == \
+            tracker.calculate_emotional_flow(context.sentences, context, include_flow=False)
+    assert batch.final_momentum[-1, EMOTIONS.index('anger')] > 0
+    with pytest.raises(ValueError):
+        summary.to_dict(0)
+
+
+def test_padding_keeps_finished_documents_momentum():
+    tracker = EmotionalMomentumTracker()
+    counts = np.zeros((2, 3, len(EMOTIONS)))
+    counts[0, 0, 0] = 2
+    counts[1, :, 0] = 1
+    batch = tracker.momentum_recurrence(counts, np.array([1, 3]))
+
+    assert batch.final_momentum[0, 0] == 2.0
+    assert (batch.momentum[0, :, 0] == 2.0).all() and (batch.sentence_emotions[0, 1:] == 0).all()
+    assert batch.stability[0] == 1.0
+    assert batch.final_momentum[1, 0] == (1 * 0.8 + (1 + 1 * 1.4)) * 0.8 + (1 + (1 * 0.8 + (1 + 1 * 1.4)) * 1.4)
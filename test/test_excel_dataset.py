@@ -0,0 +1,59 @@
+import openpyxl
+import pandas as pd
+
+from src.excel_dataset import StagedExcelDataset
+
+
+def _rows(path):
+    sheet = openpyxl.load_workbook(path, read_only=True).active
+    return [list(row) for row in sheet.iter_rows(values_only=True)]
+
+
+def test_append_is_staged_until_compaction(tmp_path):
+    excel_path = str(tmp_path / "training_dataset.xlsx")
+    dataset = StagedExcelDataset(excel_path)
+
+    for index in range(3):
+        dataset.append({'dosya_adi': f"d{index}", 'metadata': {'confidence_level': 0.5}})
+
+    assert dataset.pending_rows == 3
+    assert not (tmp_path / "training_dataset.xlsx").exists()
+
+    assert dataset.compact() == 3
+    assert dataset.pending_rows == 0
+    assert _rows(excel_path) == [
+        ['dosya_adi', 'metadata'],
+        ['d0', "{'confidence_level': 0.5}"],
+        ['d1', "{'confidence_level': 0.5}"],
+        ['d2', "{'confidence_level': 0.5}"],
+    ]
+
+
+def test_existing_workbook_is_kept_on_first_use(tmp_path):
+    excel_path = str(tmp_path / "training_dataset.xlsx")
+    pd.DataFrame([{'dosya_adi': 'eski', 'metadata': "{'a': 1}"}]).to_excel(excel_path, index=False)
+
+    dataset = StagedExcelDataset(excel_path)
+    dataset.append({'dosya_adi': 'yeni', 'metadata': {'a': 2}})
+
+    assert dataset.compact() == 2
+    assert [row[0] for row in _rows(excel_path)] == ['dosya_adi', 'eski', 'yeni']
+
+    # yeniden açılan veri seti eski satırları tekrar aktarmaz
+    assert StagedExcelDataset(excel_path).compact() == 2
+
+
+def test_pending_rows_come_from_the_staging_log(tmp_path):
+    excel_path = str(tmp_path / "training_dataset.xlsx")
+    writer = StagedExcelDataset(excel_path)
+    writer.append_many({'dosya_adi': f"d{index}"} for index in range(3))
+
+    # başka bir süreçteki / yeniden başlatılmış örnek günlüğe yazılan satırları görür
+    reader = StagedExcelDataset(excel_path)
+    assert reader.pending_rows == 3
+    assert reader.compact() == 3
+    assert writer.pending_rows == 0 and StagedExcelDataset(excel_path).pending_rows == 0
+
+    writer.append({'dosya_adi': 'd3'})
+    assert reader.pending_rows == 1
+    assert reader.compact() == 4 and reader.pending_rows == 0
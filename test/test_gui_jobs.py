@@ -0,0 +1,90 @@
+import queue
+
+from src.gui_jobs import AnalysisJob, AnalysisWorker, BatchAnalysisJob
+from src.petition_analyzer import PetitionAnalyzer
+from src.result_cache import ResultCache
+from src.result_sinks import ResultSinks
+
+PETITION = (
+    "Sayın Yetkili,\nSokağımızdaki çöpler bir haftadır toplanmıyor. Gereğinin yapılmasını rica ederim.\n"
+    "Saygılarımla\nAyşe Demir"
+)
+
+
+def _messages(job):
+    job.start()
+    job.join(timeout=120)
+    items = []
+    while not job.messages.empty():
+        items.append(job.messages.get_nowait())
+    return items
+
+
+def test_job_analyzes_in_worker_persists_and_cancels():
+    worker = AnalysisWorker()
+    analyzer = PetitionAnalyzer()
+    persisted = []
+    try:
+        done = _messages(AnalysisJob("girdi", queue.Queue(), worker, analyzer,
+                                     lambda result, text, name: persisted.append(name), text=PETITION))
+        assert [message.kind for message in done][-1] == 'done'
+        assert persisted == ["girdi"]
+        expected = PetitionAnalyzer().analyze_petition_creative(PETITION)
+        # extraction_methods'taki aday sırası süreçlerin hash tohumuna bağlı
+        for key, value in expected['extracted_information'].items():
+            if key != 'extraction_methods':
+                assert done[-1].result['extracted_information'][key] == value
+        # sonuç ana süreçteki analizörün geçmişine işlenir
+        assert analyzer.analysis_history.total == 1
+
+        cancelled = AnalysisJob("iptal", queue.Queue(), worker, analyzer,
+                                lambda result, text, name: persisted.append(name), text=PETITION + " ek")
+        cancelled.cancel()
+        assert _messages(cancelled)[-1].kind == 'cancelled'
+        assert persisted == ["girdi"]
+    finally:
+        worker.terminate()
+
+
+def test_batch_job_reports_each_file_and_writes_sinks_once(tmp_path):
+    (tmp_path / "a.txt").write_text(PETITION, encoding="utf-8")
+    (tmp_path / "b.txt").write_text(PETITION.replace("Ayşe Demir", "Mehmet Kaya"), encoding="utf-8")
+    (tmp_path / "bos.txt").write_text(" ", encoding="utf-8")
+    files = [(str(tmp_path / name), name[:-4]) for name in ("a.txt", "b.txt", "bos.txt")]
+    sinks = ResultSinks(str(tmp_path / "data"))
+    batches = []
+
+    def persist_batch(items):
+        batches.append([source_name for _, _, source_name in items])
+        sinks.write_batch(items)
+
+    analyzer = PetitionAnalyzer()
+    messages = _messages(BatchAnalysisJob("toplu", queue.Queue(), files, analyzer, persist_batch, workers=2))
+
+    statuses = {message.file: message.text for message in messages if message.kind == 'file'}
+    assert statuses['a'] == statuses['b'] == "tamam" and statuses['bos'].startswith("hata")
+    assert messages[-1].kind == 'done'
+    assert len(batches) == 1 and sorted(batches[0]) == ['a', 'b']
+    assert analyzer.analysis_history.total == 2
+
+    stored = list(sinks.results_store.iter_results())
+    assert sorted(result['kaynak_dosya'] for result in stored) == ['a', 'b']
+    assert sinks.excel_dataset.pending_rows == 2
+    with open(sinks.train_data_path, encoding="utf-8") as f:
+        assert f.read().count("Dosya: ") == 2
+
+
+def test_batch_job_serves_cached_files_without_reanalysis(tmp_path):
+    (tmp_path / "a.txt").write_text(PETITION, encoding="utf-8")
+    (tmp_path / "b.txt").write_text(PETITION.replace("Ayşe Demir", "Mehmet Kaya"), encoding="utf-8")
+    analyzer = PetitionAnalyzer(result_cache=ResultCache())
+    analyzer.analyze_petition_creative(PETITION)
+
+    files = [(str(tmp_path / name), name[:-4]) for name in ("a.txt", "b.txt")]
+    messages = _messages(BatchAnalysisJob("toplu", queue.Queue(), files, analyzer, lambda items: None, workers=2))
+
+    hits = {message.file: message.result['metadata']['cache']['hit'] for message in messages if message.kind == 'file'}
+    assert hits == {'a': True, 'b': False}
+    # isabet ve yeni analiz geçmişe birer kez işlenir, yeni sonuç önbelleğe yazılır
+    assert analyzer.analysis_history.total == 3
+    assert analyzer.cached_result(PETITION.replace("Ayşe Demir", "Mehmet Kaya")) is not None
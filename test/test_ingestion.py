@@ -0,0 +1,95 @@
+import json
+import os
+
+import pytest
+
+from benchmarks.bench_pdf_extraction import write_text_pdf
+from create_dataset import iter_documents
+from src.ingestion import ingest_directory, iter_input_files
+
+PETITION = (
+    "Sayın Yetkili,\nSokağımızdaki çöpler bir haftadır toplanmıyor. Gereğinin yapılmasını rica ederim.\n"
+    "Saygılarımla\nAyşe Demir"
+)
+
+
+def _write_inputs(root):
+    (root / "alt").mkdir()
+    (root / "a.txt").write_text(PETITION, encoding="utf-8")
+    (root / "alt" / "b.txt").write_text(PETITION.replace("Ayşe Demir", "Mehmet Kaya"), encoding="utf-8")
+    (root / "bos.txt").write_text("  ", encoding="utf-8")
+    (root / "notlar.md").write_text(PETITION, encoding="utf-8")
+    write_text_pdf(str(root / "alt" / "c.pdf"), [PETITION])
+
+
+def test_ingest_directory_writes_all_sinks(tmp_path):
+    inputs = tmp_path / "girdi"
+    inputs.mkdir()
+    _write_inputs(inputs)
+    data = tmp_path / "data"
+
+    progress = []
+    report = ingest_directory(str(inputs), str(data), workers=1,
+                              progress=lambda done, failed: progress.append(done))
+
+    assert [os.path.basename(path) for path in iter_input_files(str(inputs))] == ["a.txt", "bos.txt", "b.txt", "c.pdf"]
+    assert report.written == 3 and [os.path.basename(path) for path, _ in report.failed] == ["bos.txt"]
+    assert progress == [1, 2, 3, 4]
+
+    results = [json.loads(line) for name in sorted(os.listdir(data / "results"))
+               for line in open(data / "results" / name, encoding="utf-8")]
+    assert sorted(result["kaynak_dosya"] for result in results) == ["a", os.path.join("alt", "b"), os.path.join("alt", "c")]
+    assert len(list(iter_documents(str(data / "train_data.txt")))) == 3
+    assert (data / "training_dataset.xlsx").exists()
+
+
+def test_parallel_ingestion_matches_sequential(tmp_path):
+    inputs = tmp_path / "girdi"
+    inputs.mkdir()
+    _write_inputs(inputs)
+
+    sequential = ingest_directory(str(inputs), str(tmp_path / "seri"), workers=1)
+    parallel = ingest_directory(str(inputs), str(tmp_path / "paralel"), workers=2, queue_size=1)
+
+    assert (parallel.written, len(parallel.failed)) == (sequential.written, len(sequential.failed))
+
+
+def test_ingest_detects_campaigns_within_batches(tmp_path):
+    letter = (
+        "Sayın Yetkili,\nMahallemizdeki yolların bozuk olması nedeniyle araçlarımız zarar görüyor ve "
+        "çocuklarımız okula giderken tehlike yaşıyor. Defalarca başvurmamıza rağmen hiçbir çalışma "
+        "yapılmadı. Yolların acilen onarılmasını talep ediyoruz.\nSaygılarımla\n"
+    )
+    inputs = tmp_path / "girdi"
+    inputs.mkdir()
+    for name, signature in (("a", "Ayşe Demir"), ("b", "Mehmet Kaya"), ("c", "Fatma Şen")):
+        (inputs / f"{name}.txt").write_text(letter + signature, encoding="utf-8")
+    (inputs / "d.txt").write_text(PETITION, encoding="utf-8")
+    (inputs / "bos.txt").write_text("  ", encoding="utf-8")
+    data = tmp_path / "data"
+
+    report = ingest_directory(str(inputs), str(data), workers=1, detect_campaigns=True, campaign_batch=3)
+
+    assert report.written == 4 and len(report.failed) == 1
+    results = {result["kaynak_dosya"]: result for name in sorted(os.listdir(data / "results"))
+               for line in open(data / "results" / name, encoding="utf-8") for result in [json.loads(line)]}
+    # kampanyalar grup içinde aranır: c ayrı gruba düştüğü için tekil kalır
+    assert [results[name]["metadata"]["campaign"]["role"] for name in ("a", "b")] == ["representative", "member"]
+    assert "campaign" not in results["c"]["metadata"] and "campaign" not in results["d"]["metadata"]
+    assert results["b"]["extracted_information"]["person_name"] == "Mehmet Kaya"
+    with pytest.raises(ValueError):
+        ingest_directory(str(inputs), str(data), detect_campaigns=True, profile='summary')
+
+
+def test_corrupt_pdf_reports_the_read_error(tmp_path):
+    inputs = tmp_path / "girdi"
+    inputs.mkdir()
+    (inputs / "a.txt").write_text(PETITION, encoding="utf-8")
+    (inputs / "bozuk.pdf").write_bytes(b"%PDF-1.4\nbu bir pdf degil")
+
+    report = ingest_directory(str(inputs), str(tmp_path / "data"), workers=1)
+
+    assert report.written == 1
+    [(path, message)] = report.failed
+    assert os.path.basename(path) == "bozuk.pdf"
+    assert message != "işlenecek metin bulunamadı"
@@ -0,0 +1,33 @@
+from src.document_context import DocumentContext
+from src.keyword_index import KeywordAutomaton, get_keyword_index
+
+
+def test_counts_match_str_count():
+    """otomat sonuçları str.count ve `in` ile birebir aynı olmalı"""
+    text = "aaaa yol yolu yollar acil acil! su suyu kesik, çöp çöpler toplanmıyor"
+    automaton = KeywordAutomaton()
+    for keyword in ['aa', 'a', 'yol', 'yollar', 'acil', 'su', 'suyu', 'çöp', 'toplan']:
+        automaton.add(keyword)
+    hits = automaton.scan(text)
+
+    for keyword in ['aa', 'a', 'yol', 'yollar', 'acil', 'su', 'suyu', 'çöp', 'toplan', 'kesik', 'yok']:
+        assert hits.count(keyword) == text.count(keyword), keyword
+        assert (keyword in hits) == (keyword in text), keyword
+
+
+def test_shared_index_tags_layers():
+    index = get_keyword_index()
+    assert index is get_keyword_index()
+
+    layers = {tag.layer for tag in index.tags['acil']}
+    assert {'urgency', 'consistency'} <= layers
+
+    hits = DocumentContext("Sokağımızdaki çöpler toplanmıyor, ACİL çözüm bekliyoruz.").hits
+    assert 'çöp' in hits
+    assert any(hit.keyword == 'çöp' for hit in hits.iter_hits('category'))
+
+
+def test_keywords_by_span():
+    hits = DocumentContext("yol bozuk. su kesik").hits
+    by_span = hits.keywords_by_span([[(0, 9)], [(11, 19)]])
+    assert 'bozuk' in by_span[0] and 'bozuk' not in by_span[1]
@@ -0,0 +1,77 @@
+from src.near_duplicates import NearDuplicateDetector, choose_bands
+from src.petition_analyzer import PetitionAnalyzer
+
+LETTER = (
+    "Sayın Yetkili,\nMahallemizdeki yolların bozuk olması nedeniyle araçlarımız zarar görüyor ve "
+    "çocuklarımız okula giderken tehlike yaşıyor. Defalarca başvurmamıza rağmen hiçbir çalışma "
+    "yapılmadı. Kaldırımlar kırık, yağmur yağınca sokaklar göle dönüyor. Yolların acilen onarılmasını "
+    "talep ediyoruz. Gereğinin yapılmasını arz ederim.\nSaygılarımla\n"
+)
+SIGNATURES = ["Ayşe Demir", "Mehmet Kaya\nÇankaya / Ankara", "Fatma Şen", "Ali Yılmaz"]
+OTHER = "Okulda kaloriferler yanmıyor, sınıflar çok soğuk ve öğrenciler hastalanıyor.\nZeynep Çelik"
+
+
+def test_signature_variants_form_one_campaign():
+    texts = [LETTER + SIGNATURES[0], OTHER, *(LETTER + signature for signature in SIGNATURES[1:])]
+
+    campaigns = NearDuplicateDetector(threshold=0.8).find_campaigns(texts)
+
+    assert len(campaigns) == 1
+    assert campaigns[0].representative == 0
+    assert campaigns[0].members == [2, 3, 4]
+    assert all(similarity >= 0.8 for similarity in campaigns[0].similarities.values())
+    assert choose_bands(128, 0.8) == (16, 8)
+
+
+def test_distinct_petitions_stay_apart():
+    texts = [
+        "Yol bozuk, tamir edilmesini talep ediyorum.\nAyşe Demir",
+        "Sokağımızdaki çöpler toplanmıyor, koku dayanılmaz halde.\nMehmet Kaya",
+        OTHER,
+        "",
+    ]
+    assert NearDuplicateDetector().find_campaigns(texts) == []
+
+
+def test_campaign_members_reuse_layers_but_keep_their_own_names():
+    texts = [LETTER + signature for signature in SIGNATURES] + [OTHER]
+    analyzer = PetitionAnalyzer()
+    results = analyzer.analyze_batch(texts, workers=1, detect_campaigns=True)
+    independent = [PetitionAnalyzer().analyze_petition_creative(text) for text in texts]
+
+    representative, *members = results[:4]
+    assert representative['metadata']['campaign']['role'] == 'representative'
+    assert 'campaign' not in results[4]['metadata']
+    for result, expected in zip(results, independent):
+        assert result['extracted_information']['person_name'] == expected['extracted_information']['person_name']
+        assert result['extracted_information']['address_info'] == expected['extracted_information']['address_info']
+    for member in members:
+        campaign = member['metadata']['campaign']
+        assert (campaign['role'], campaign['representative_index'], campaign['size']) == ('member', 0, 4)
+        assert campaign['campaign_id'] == representative['metadata']['campaign']['campaign_id']
+        assert member['extracted_information']['subject_category'] == \
+            representative['extracted_information']['subject_category']
+        assert 'emotional_flow' not in member['metadata']['stage_timings_ms']
+
+    assert analyzer.get_enhanced_system_statistics()['campaigns'] == {
+        'campaigns_detected': 1, 'campaign_petitions': 4, 'reused_analyses': 3
+    }
+
+
+def test_chained_edits_do_not_join_the_representative_campaign():
+    # her metin bir öncekinden tek kelime farklı: komşular benzer, uçtakiler temsilciye benzemez
+    words = [f"kelime{index}" for index in range(120)]
+    texts = [" ".join(words)]
+    for step in range(5):
+        words = list(words)
+        words[10 + step * 20] = f"degisik{step}"
+        texts.append(" ".join(words))
+    detector = NearDuplicateDetector(threshold=0.8)
+    signatures = [detector.signature(text) for text in texts]
+
+    campaigns = detector.find_campaigns(texts)
+
+    assert [(campaign.representative, campaign.members) for campaign in campaigns] == [(0, [1, 2]), (3, [4, 5])]
+    for campaign in campaigns:
+        for member in campaign.members:
+            assert detector.similarity(signatures[campaign.representative], signatures[member]) >= 0.8
@@ -0,0 +1,27 @@
+from src.enhanced_skeptical_validator import EnhancedSkepticalValidator
+from src.pattern_registry import get_pattern_registry, RULESET_VERSION
+from src.petition_analyzer import PetitionAnalyzer
+from src.validator import SkepticalValidator
+
+
+def test_registry_is_shared_between_instances():
+    """tüm analizör ve doğrulayıcılar aynı derlenmiş patternleri kullanmalı"""
+    registry = get_pattern_registry()
+
+    first, second = PetitionAnalyzer(), PetitionAnalyzer()
+    assert first.inference_engine.patterns is registry
+    assert second.inference_engine.core_patterns is first.inference_engine.core_patterns
+
+    skeptical_rules = SkepticalValidator().validation_rules['name_validation']
+    assert skeptical_rules['required_pattern'] is registry.validator_patterns['skeptical']['required_name']
+    assert EnhancedSkepticalValidator().fake_name_patterns is registry.validator_patterns['enhanced']['fake_name']
+
+
+def test_result_records_ruleset_version():
+    result = PetitionAnalyzer().analyze_petition_creative(
+        "Sayın Yetkili,\nÇankaya Belediyesi çöpleri toplamıyor.\nSaygılarımla\nAyşe Demir"
+    )
+
+    version = result['metadata']['ruleset_version']
+    assert version == get_pattern_registry().version
+    assert version.startswith(RULESET_VERSION + "+")
@@ -0,0 +1,24 @@
+from benchmarks.bench_pdf_extraction import legacy_pdf_to_text, synthetic_pages, write_text_pdf
+from src.utils import PDF_PAGES_PER_TASK, iter_pdf_pages, pdf_to_text
+
+
+def test_streaming_matches_legacy_and_respects_caps(tmp_path):
+    path = str(tmp_path / "dilekce.pdf")
+    write_text_pdf(path, synthetic_pages(5, seed=3))
+    pages = list(iter_pdf_pages(path))
+
+    assert len(pages) == 5
+    assert pdf_to_text(path) == legacy_pdf_to_text(path) == ''.join(pages)
+    assert pdf_to_text(path, max_pages=2) == ''.join(pages[:2])
+    capped = pdf_to_text(path, max_bytes=100)
+    assert len(capped.encode('utf-8')) <= 100 and pages[0].startswith(capped)
+    assert pdf_to_text(str(tmp_path / "yok.pdf")) == ""
+
+
+def test_parallel_page_ranges_keep_page_order(tmp_path):
+    path = str(tmp_path / "uzun.pdf")
+    write_text_pdf(path, synthetic_pages(PDF_PAGES_PER_TASK * 2 + 3, seed=4))
+
+    assert pdf_to_text(path, workers=2) == legacy_pdf_to_text(path)
+    assert pdf_to_text(path, workers=2, max_pages=PDF_PAGES_PER_TASK + 1) == \
+        ''.join(iter_pdf_pages(path, 0, PDF_PAGES_PER_TASK + 1))
@@ -0,0 +1,43 @@
+from src.petition_analyzer import PetitionAnalyzer, get_analyzer
+
+
+def test_get_analyzer_is_process_wide():
+    assert get_analyzer() is get_analyzer()
+
+
+def test_layer_components_are_shared_and_not_duplicated():
+    first, second = PetitionAnalyzer(), PetitionAnalyzer()
+
+    for component in PetitionAnalyzer._layer_components:
+        assert getattr(first, component) is getattr(second, component), component
+
+    # çıkarım motoru kendi duygu / sosyal / doğrulayıcı kopyalarını kurmamalı
+    engine = first.inference_engine
+    for attribute in ('emotional_momentum', 'social_analyzer', 'skeptical_validator'):
+        assert not hasattr(engine, attribute), attribute
+
+    # istatistikler analizöre özeldir
+    first.analyze_petition_creative("Sayın Yetkili,\nYol bozuk, tamir edilmesini talep ediyorum.\nAyşe Demir")
+    assert first.performance_metrics['total_analyzed'] == 1
+    assert second.performance_metrics['total_analyzed'] == 0
+
+
+def test_stage_timings_in_metadata_and_statistics():
+    analyzer = PetitionAnalyzer()
+    for _ in range(3):
+        result = analyzer.analyze_petition_creative(
+            "Sayın Yetkili,\nÇankaya ilçesi Yeni Mahallesi üzerinde yaşıyorum. Yol bozuk.\nAyşe Demir"
+        )
+
+    timings = result['metadata']['stage_timings_ms']
+    for stage in ('preprocessing', 'extraction', 'extraction.name', 'extraction.address',
+                  'extraction.institution', 'extraction.category', 'extraction.request_type',
+                  'extraction.urgency', 'emotional_flow', 'social_profile', 'primary_validation',
+                  'enhanced_validation', 'insights'):
+        assert timings[stage] >= 0.0, stage
+    assert timings['extraction'] >= timings['extraction.name']
+
+    stage_latency = analyzer.get_enhanced_system_statistics()['stage_latency']
+    assert stage_latency['total']['count'] == 3
+    summary = stage_latency['extraction.category']
+    assert summary['min_ms'] <= summary['p50_ms'] <= summary['p99_ms'] <= summary['max_ms']
@@ -0,0 +1,81 @@
+import os
+
+from src.petition_analyzer import PetitionAnalyzer
+from src.result_cache import ResultCache, normalize_text
+
+TEXT = "Sayın Yetkili,\nÇankaya Belediyesi çöpleri toplamıyor.\nSaygılarımla\nAyşe Demir"
+VARIANT = "Sayın   Yetkili,\r\nÇankaya Belediyesi\tçöpleri toplamıyor.  \r\nSaygılarımla\r\nAyşe Demir\r\n"
+
+
+def test_whitespace_variant_is_served_from_cache_with_fresh_metadata():
+    assert normalize_text(VARIANT) == TEXT
+    analyzer = PetitionAnalyzer(result_cache=ResultCache(max_entries=8))
+
+    first = analyzer.analyze_petition_creative(TEXT)
+    first['extracted_information']['subject_category'] = 'değiştirildi'
+    second = analyzer.analyze_petition_creative(VARIANT)
+
+    assert first['metadata']['cache']['hit'] is False
+    assert second['metadata']['cache']['hit'] is True
+    assert second['metadata']['cache']['tier'] == 'memory'
+    assert second['metadata']['analysis_timestamp'] >= first['metadata']['analysis_timestamp']
+    assert second['metadata']['stage_timings_ms'].keys() == {'cache_lookup'}
+    # önbellekteki kayıt çağıranın değişikliğinden etkilenmez
+    assert second['extracted_information']['subject_category'] != 'değiştirildi'
+
+    statistics = analyzer.get_enhanced_system_statistics()
+    assert statistics['result_cache']['hits'] == 1 and statistics['result_cache']['misses'] == 1
+    assert statistics['performance_metrics']['total_analyzed'] == 2
+
+
+def test_disk_tier_survives_restart_and_evicts_by_size(tmp_path):
+    path = os.path.join(tmp_path, "cache.sqlite")
+    cache = ResultCache(max_entries=0, disk_path=path, max_disk_bytes=10_000)
+    for index in range(50):
+        cache.put(f"key-{index}", {'payload': 'x' * 900, 'index': index})
+    assert cache.stats()['disk_bytes'] <= 10_000
+    cache.close()
+
+    reopened = ResultCache(max_entries=4, disk_path=path, max_disk_bytes=10_000)
+    assert reopened.get("key-0") is None
+    result, tier = reopened.get("key-49")
+    assert (result['index'], tier) == (49, 'disk')
+    assert reopened.get("key-49")[1] == 'memory'
+    reopened.close()
+
+
+def test_batch_analyzes_duplicates_once():
+    cache = ResultCache()
+    analyzer = PetitionAnalyzer(result_cache=cache)
+    other = "Okulda kaloriferler yanmıyor, sınıflar soğuk.\nFatma Şen"
+
+    results = analyzer.analyze_batch([TEXT, VARIANT, other, TEXT], workers=1)
+
+    assert [result['metadata']['cache']['hit'] for result in results] == [False, True, False, True]
+    assert results[1]['extracted_information'] == results[0]['extracted_information']
+    assert cache.stats()['misses'] == 2
+    assert analyzer.performance_metrics['total_analyzed'] == 4
+
+
+def test_batch_duplicates_do_not_depend_on_cache_keeping_the_entry():
+    analyzer = PetitionAnalyzer(result_cache=ResultCache(max_entries=0))
+
+    results = analyzer.analyze_batch([TEXT, VARIANT], workers=1)
+
+    assert [result['metadata']['cache']['hit'] for result in results] == [False, True]
+    assert results[1]['metadata']['cache']['tier'] == 'batch'
+    assert results[1]['extracted_information'] == results[0]['extracted_information']
+    results[1]['extracted_information']['subject_category'] = 'değiştirildi'
+    assert results[0]['extracted_information']['subject_category'] != 'değiştirildi'
+    assert analyzer.performance_metrics['total_analyzed'] == 2
+
+
+def test_cache_hits_stay_out_of_total_latency():
+    analyzer = PetitionAnalyzer(result_cache=ResultCache())
+    for _ in range(4):
+        analyzer.analyze_petition_creative(TEXT)
+
+    stage_latency = analyzer.get_enhanced_system_statistics()['stage_latency']
+    assert stage_latency['total']['count'] == 1
+    assert stage_latency['cache_lookup']['count'] == 3
+    assert analyzer.performance_metrics['total_analyzed'] == 4
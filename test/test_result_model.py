@@ -0,0 +1,35 @@
+import json
+import pickle
+
+from benchmarks.corpus import generate_corpus
+from src.petition_analyzer import PetitionAnalyzer
+from src.result_model import AnalysisResult, EmotionalFlow
+
+
+def test_round_trip_keeps_json_shape():
+    analyzer = PetitionAnalyzer()
+    corpus = generate_corpus(12, seed=5, length_mix={'paragraph': 0.5, '1_page': 0.4, '5_pages': 0.1})
+    for petition in corpus:
+        result = analyzer.analyze_petition_creative(petition.text)
+        packed = pickle.loads(pickle.dumps(AnalysisResult.from_dict(result)))
+
+        restored = packed.to_dict()
+        assert restored == result
+        assert json.dumps(restored, ensure_ascii=False) == json.dumps(result, ensure_ascii=False)
+        assert isinstance(packed.emotional, EmotionalFlow)
+        assert packed.emotional.sentence_count == len(result['emotional_intelligence']['momentum_analysis']['sentence_flow'])
+
+
+def test_packed_result_is_smaller_for_long_documents():
+    text = generate_corpus(1, seed=9, length_mix={'5_pages': 1.0})[0].text
+    result = PetitionAnalyzer().analyze_petition_creative(text)
+    assert len(pickle.dumps(AnalysisResult.from_dict(result))) < 0.7 * len(pickle.dumps(result))
+
+
+def test_compact_batch_returns_result_objects():
+    texts = ["Yol bozuk, tamir edilmesini talep ediyorum.\nAyşe Demir", None]
+    results = PetitionAnalyzer().analyze_batch(texts, workers=1, compact=True)
+
+    assert isinstance(results[0], AnalysisResult)
+    assert results[0].extraction.person_name == results[0].to_dict()['extracted_information']['person_name']
+    assert 'error' in results[1]
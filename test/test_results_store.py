@@ -0,0 +1,69 @@
+import json
+import os
+from datetime import datetime
+
+from src.results_store import JsonlResultsStore
+
+
+class _Clock:
+    def __init__(self, day):
+        self.now = datetime(2025, 1, day, 12, 0)
+
+    def __call__(self):
+        return self.now
+
+
+def test_append_rotates_by_size_and_day(tmp_path):
+    clock = _Clock(1)
+    store = JsonlResultsStore(str(tmp_path), max_segment_bytes=200, clock=clock)
+
+    for index in range(10):
+        store.append({"index": index, "metin": "x" * 40})
+    clock.now = datetime(2025, 1, 2, 9, 0)
+    store.append({"index": 10})
+
+    names = [os.path.basename(path) for path in store.segments()]
+    assert names[0] == "results-20250101-0000.jsonl"
+    assert names[-1] == "results-20250102-0000.jsonl"
+    assert len(names) > 2
+    assert all(os.path.getsize(path) <= 200 for path in store.segments())
+    assert [result["index"] for result in store.iter_results()] == list(range(11))
+
+
+def test_reopened_store_continues_after_truncated_line(tmp_path):
+    clock = _Clock(1)
+    JsonlResultsStore(str(tmp_path), clock=clock).append({"index": 0})
+    segment = JsonlResultsStore(str(tmp_path)).segments()[0]
+    with open(segment, "a", encoding="utf-8") as f:
+        f.write('{"index": 1, "yarım')
+
+    store = JsonlResultsStore(str(tmp_path), clock=clock)
+    store.append({"index": 2})
+
+    assert store.segments() == [segment]
+    assert [result["index"] for result in store.iter_results()] == [0, 2]
+
+
+def test_migrate_json_array(tmp_path):
+    legacy = tmp_path / "petition_analyze_results.json"
+    legacy.write_text(json.dumps([{"index": 0}, {"index": 1}], indent=4), encoding="utf-8")
+    store = JsonlResultsStore(str(tmp_path / "results"))
+
+    assert store.migrate_json_array(str(legacy)) == 2
+    assert store.migrate_json_array(str(legacy)) == 0
+    assert not legacy.exists()
+    assert [result["index"] for result in store] == [0, 1]
+
+
+def test_append_many_matches_single_appends(tmp_path):
+    clock = _Clock(1)
+    results = [{"index": index, "metin": "x" * 40} for index in range(10)]
+    single = JsonlResultsStore(str(tmp_path / "tek"), max_segment_bytes=200, clock=clock)
+    for result in results:
+        single.append(result)
+    batch = JsonlResultsStore(str(tmp_path / "toplu"), max_segment_bytes=200, clock=clock)
+
+    assert batch.append_many(results) == 10
+    assert [os.path.basename(path) for path in batch.segments()] == \
+        [os.path.basename(path) for path in single.segments()]
+    assert list(batch.iter_results()) == results
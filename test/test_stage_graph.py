@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.petition_analyzer import PetitionAnalyzer
+from src.stage_graph import Stage, StageGraph
+
+TEXT = (
+    "Sayın Yetkili,\nÇankaya ilçesi Kızılay Mahallesi'nde oturuyorum. Sokağımızdaki çöpler bir haftadır "
+    "toplanmıyor, koku dayanılmaz halde. Acilen gereğinin yapılmasını rica ederim.\n"
+    "Saygılarımla\nAyşe Demir"
+)
+
+
+def _without_timings(result):
+    metadata = {key: value for key, value in result['metadata'].items()
+                if key not in ('analysis_timestamp', 'processing_time_seconds', 'stage_timings_ms')}
+    return {**result, 'metadata': metadata}
+
+
+def test_requested_fields_run_only_their_stages():
+    analyzer = PetitionAnalyzer()
+    full = analyzer.analyze_petition_creative(TEXT)
+    result = analyzer.analyze_petition_creative(TEXT, fields=['subject_category', 'urgency_level'])
+
+    assert set(result['metadata']['stage_timings_ms']) - {'extraction', 'insights'} == {
+        'preprocessing', 'extraction.category', 'extraction.urgency'
+    }
+    assert result['extracted_information'] == {
+        'subject_category': full['extracted_information']['subject_category'],
+        'urgency_level': full['extracted_information']['urgency_level'],
+    }
+
+
+def test_parallel_stages_match_sequential_run():
+    sequential = PetitionAnalyzer().analyze_petition_creative(TEXT)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = PetitionAnalyzer(stage_executor=executor).analyze_petition_creative(TEXT)
+
+    assert _without_timings(parallel) == _without_timings(sequential)
+
+
+def test_graph_rejects_unknown_inputs_and_cycles():
+    def noop(values):
+        return {}
+
+    with pytest.raises(ValueError):
+        StageGraph([Stage('a', ('missing',), ('x',), noop)])
+    with pytest.raises(ValueError):
+        StageGraph([Stage('a', ('y',), ('x',), noop), Stage('b', ('x',), ('y',), noop)])
+
+    graph = StageGraph([Stage('a', ('text',), ('x',), lambda values: {'x': values['text'] + '!'}),
+                        Stage('b', ('x',), ('y',), lambda values: {'y': values['x'] * 2})], sources=('text',))
+    assert [[stage.name for stage in wave] for wave in graph.plan(['y'])] == [['a'], ['b']]
+    assert graph.run(['x'], {'text': 'hi'}) == {'text': 'hi', 'x': 'hi!'}
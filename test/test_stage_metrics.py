@@ -0,0 +1,14 @@
+from src.stage_metrics import LatencyHistogram
+
+
+def test_histogram_percentiles_within_bucket_resolution():
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(float(value))
+
+    assert histogram.count == 1000
+    assert histogram.min_seen == 1.0 and histogram.max_seen == 1000.0
+    for q, exact in ((50, 500.0), (95, 950.0), (99, 990.0)):
+        assert exact <= histogram.percentile(q) <= exact * 1.2
+    assert histogram.percentile(100) == 1000.0
+    assert sum(histogram.summary()['histogram'].values()) == 1000